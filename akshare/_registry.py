@@ -0,0 +1,1120 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Desc: 顶层接口懒加载注册表 {名称: 模块} 或 {名称: "模块:原名称"}
+本文件由 scripts/gen_lazy_registry.py 根据 akshare/_api.py 自动生成, 请勿手动修改
+"""
+
+EXPORTS = {
+    "futures_settle": ".futures.futures_settle",
+    "futures_settle_gfex": ".futures.futures_settle",
+    "futures_settle_ine": ".futures.futures_settle",
+    "futures_settle_czce": ".futures.futures_settle",
+    "futures_settle_cffex": ".futures.futures_settle",
+    "futures_settle_shfe": ".futures.futures_settle",
+    "bond_gb_zh_sina": ".bond.bond_gb_sina",
+    "bond_gb_us_sina": ".bond.bond_gb_sina",
+    "option_contract_info_ctp": ".option.option_contract_info_ctp",
+    "fx_c_swap_cm": ".fx.fx_c_swap_cm",
+    "option_current_day_sse": ".option.option_current_sse",
+    "option_current_day_szse": ".option.option_current_szse",
+    "stock_financial_analysis_indicator_em": ".stock_fundamental.stock_finance_sina",
+    "option_margin": ".option.option_margin",
+    "option_margin_symbol": ".option.option_margin",
+    "stock_hk_company_profile_em": ".stock.stock_profile_em",
+    "stock_hk_security_profile_em": ".stock.stock_profile_em",
+    "stock_hk_dividend_payout_em": ".stock.stock_profile_em",
+    "stock_hk_financial_indicator_em": ".stock.stock_profile_em",
+    "stock_hk_growth_comparison_em": ".stock.stock_hk_comparison_em",
+    "stock_hk_valuation_comparison_em": ".stock.stock_hk_comparison_em",
+    "stock_hk_scale_comparison_em": ".stock.stock_hk_comparison_em",
+    "stock_zh_growth_comparison_em": ".stock.stock_zh_comparison_em",
+    "stock_zh_valuation_comparison_em": ".stock.stock_zh_comparison_em",
+    "stock_zh_dupont_comparison_em": ".stock.stock_zh_comparison_em",
+    "stock_zh_scale_comparison_em": ".stock.stock_zh_comparison_em",
+    "bond_sh_buy_back_em": ".bond.bond_buy_back_em",
+    "bond_sz_buy_back_em": ".bond.bond_buy_back_em",
+    "bond_buy_back_hist_em": ".bond.bond_buy_back_em",
+    "stock_zh_a_gbjg_em": ".stock_fundamental.stock_gbjg_em",
+    "stock_individual_basic_info_xq": ".stock_fundamental.stock_basic_info_xq",
+    "stock_individual_basic_info_hk_xq": ".stock_fundamental.stock_basic_info_xq",
+    "stock_individual_basic_info_us_xq": ".stock_fundamental.stock_basic_info_xq",
+    "index_global_hist_sina": ".index.index_global_sina",
+    "index_global_name_table": ".index.index_global_sina",
+    "index_global_hist_em": ".index.index_global_em",
+    "index_global_spot_em": ".index.index_global_em",
+    "forex_hist_em": ".forex.forex_em",
+    "forex_spot_em": ".forex.forex_em",
+    "stock_zh_ah_spot_em": ".stock.stock_hsgt_em",
+    "stock_hsgt_sh_hk_spot_em": ".stock.stock_hsgt_em",
+    "stock_financial_us_report_em": ".stock_fundamental.stock_finance_us_em",
+    "stock_financial_us_analysis_indicator_em": ".stock_fundamental.stock_finance_us_em",
+    "futures_hist_table_em": ".futures.futures_hist_em",
+    "futures_hist_em": ".futures.futures_hist_em",
+    "stock_hold_change_cninfo": ".stock.stock_hold_control_cninfo",
+    "fund_overview_em": ".fund.fund_overview_em",
+    "fund_fee_em": ".fund.fund_fee_em",
+    "stock_value_em": ".stock_feature.stock_value_em",
+    "volatility_yz_rv": ".cal.rv",
+    "rv_from_futures_zh_minute_sina": ".cal.rv",
+    "rv_from_stock_zh_a_hist_min_em": ".cal.rv",
+    "qdii_a_index_jsl": ".qdii.qdii_jsl",
+    "qdii_e_index_jsl": ".qdii.qdii_jsl",
+    "qdii_e_comm_jsl": ".qdii.qdii_jsl",
+    "stock_news_main_cx": ".stock.stock_news_cx",
+    "spot_hog_soozhu": ".spot.spot_hog_soozhu",
+    "spot_hog_year_trend_soozhu": ".spot.spot_hog_soozhu",
+    "spot_hog_lean_price_soozhu": ".spot.spot_hog_soozhu",
+    "spot_hog_three_way_soozhu": ".spot.spot_hog_soozhu",
+    "spot_hog_crossbred_soozhu": ".spot.spot_hog_soozhu",
+    "spot_corn_price_soozhu": ".spot.spot_hog_soozhu",
+    "spot_soybean_price_soozhu": ".spot.spot_hog_soozhu",
+    "spot_mixed_feed_soozhu": ".spot.spot_hog_soozhu",
+    "stock_hk_famous_spot_em": ".stock.stock_hk_famous",
+    "macro_stock_finance": ".economic.macro_finance_ths",
+    "macro_rmb_loan": ".economic.macro_finance_ths",
+    "macro_rmb_deposit": ".economic.macro_finance_ths",
+    "stock_concept_cons_futu": ".stock_feature.stock_concept_futu",
+    "option_comm_info": ".option.option_comm_qihuo",
+    "option_comm_symbol": ".option.option_comm_qihuo",
+    "option_daily_stats_sse": ".option.option_daily_stats_sse_szse",
+    "option_daily_stats_szse": ".option.option_daily_stats_sse_szse",
+    "fund_etf_spot_ths": ".fund.fund_etf_ths",
+    "fund_etf_category_ths": ".fund.fund_etf_ths",
+    "stock_margin_account_info": ".stock_feature.stock_margin_em",
+    "spot_price_qh": ".spot.spot_price_qh",
+    "spot_price_table_qh": ".spot.spot_price_qh",
+    "macro_info_ws": ".economic.macro_info_ws",
+    "index_news_sentiment_scope": ".index.index_zh_a_scope",
+    "index_hist_fund_sw": ".index.index_research_fund_sw",
+    "index_realtime_fund_sw": ".index.index_research_fund_sw",
+    "stock_info_cjzc_em": ".stock_feature.stock_info",
+    "stock_info_global_em": ".stock_feature.stock_info",
+    "stock_info_global_ths": ".stock_feature.stock_info",
+    "stock_info_global_futu": ".stock_feature.stock_info",
+    "stock_info_global_sina": ".stock_feature.stock_info",
+    "stock_info_global_cls": ".stock_feature.stock_info",
+    "futures_contract_info_shfe": ".futures_derivative.futures_contract_info_shfe",
+    "futures_contract_info_dce": ".futures_derivative.futures_contract_info_dce",
+    "futures_contract_info_czce": ".futures_derivative.futures_contract_info_czce",
+    "futures_contract_info_gfex": ".futures_derivative.futures_contract_info_gfex",
+    "futures_contract_info_cffex": ".futures_derivative.futures_contract_info_cffex",
+    "futures_contract_info_ine": ".futures_derivative.futures_contract_info_ine",
+    "futures_stock_shfe_js": ".futures.futures_stock_js",
+    "futures_comm_js": ".futures.futures_comm_js",
+    "stock_hsgt_fund_min_em": ".stock_feature.stock_hsgt_min_em",
+    "futures_global_spot_em": ".futures.futures_hf_em",
+    "futures_global_hist_em": ".futures.futures_hf_em",
+    "stock_individual_spot_xq": ".stock.stock_xq",
+    "stock_hk_profit_forecast_et": ".stock_fundamental.stock_profit_forecast_hk_etnet",
+    "stock_zh_a_disclosure_relation_cninfo": ".stock_feature.stock_disclosure_cninfo",
+    "stock_zh_a_disclosure_report_cninfo": ".stock_feature.stock_disclosure_cninfo",
+    "stock_intraday_sina": ".stock.stock_intraday_sina",
+    "stock_zh_a_hist_tx": ".stock_feature.stock_hist_tx",
+    "stock_cyq_em": ".stock_feature.stock_cyq_em",
+    "stock_cyq_em_batch": ".stock_feature.stock_cyq_em",
+    "stock_intraday_em": ".stock.stock_intraday_em",
+    "index_us_stock_sina": ".index.index_stock_us_sina",
+    "stock_share_hold_change_bse": ".stock.stock_share_hold",
+    "stock_share_hold_change_sse": ".stock.stock_share_hold",
+    "stock_share_hold_change_szse": ".stock.stock_share_hold",
+    "stock_research_report_em": ".stock_feature.stock_research_report_em",
+    "stock_zdhtmx_em": ".stock_feature.stock_zdhtmx_em",
+    "stock_gddh_em": ".stock_feature.stock_gddh_em",
+    "stock_gsrl_gsdt_em": ".stock.stock_gsrl_em",
+    "stock_hold_management_detail_em": ".stock.stock_hold_control_em",
+    "stock_hold_management_person_em": ".stock.stock_hold_control_em",
+    "bond_cb_profile_sina": ".bond.bond_cb_sina",
+    "bond_cb_summary_sina": ".bond.bond_cb_sina",
+    "stock_sns_sseinfo": ".stock_feature.stock_sns_sseinfo",
+    "stock_irm_cninfo": ".stock_feature.stock_irm_cninfo",
+    "stock_irm_ans_cninfo": ".stock_feature.stock_irm_cninfo",
+    "fund_announcement_dividend_em": ".fund.fund_announcement_em",
+    "fund_announcement_report_em": ".fund.fund_announcement_em",
+    "fund_announcement_personnel_em": ".fund.fund_announcement_em",
+    "stock_esg_msci_sina": ".stock_feature.stock_esg_sina",
+    "stock_esg_rft_sina": ".stock_feature.stock_esg_sina",
+    "stock_esg_rate_sina": ".stock_feature.stock_esg_sina",
+    "stock_esg_zd_sina": ".stock_feature.stock_esg_sina",
+    "stock_esg_hz_sina": ".stock_feature.stock_esg_sina",
+    "fund_lof_hist_em": ".fund.fund_lof_em",
+    "fund_lof_spot_em": ".fund.fund_lof_em",
+    "fund_lof_hist_min_em": ".fund.fund_lof_em",
+    "stock_financial_abstract_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_debt_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_benefit_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_cash_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_abstract_new_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_debt_new_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_benefit_new_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_financial_cash_new_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_management_change_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_shareholder_change_ths": ".stock_fundamental.stock_finance_ths",
+    "stock_hk_index_spot_sina": ".index.index_stock_hk",
+    "stock_hk_index_daily_em": ".index.index_stock_hk",
+    "stock_hk_index_spot_em": ".index.index_stock_hk",
+    "stock_hk_index_daily_sina": ".index.index_stock_hk",
+    "bond_zh_cov_info_ths": ".bond.bond_cb_ths",
+    "stock_hk_fhpx_detail_ths": ".stock.stock_hk_fhpx_ths",
+    "stock_fhps_detail_ths": ".stock_feature.stock_fhps_ths",
+    "stock_bid_ask_em": ".stock.stock_ask_bid_em",
+    "stock_profit_forecast_ths": ".stock_fundamental.stock_profit_forecast_ths",
+    "futures_news_shmet": ".futures.futures_news_shmet",
+    "stock_zyjs_ths": ".stock_fundamental.stock_zyjs_ths",
+    "fund_etf_hist_em": ".fund.fund_etf_em",
+    "fund_etf_hist_min_em": ".fund.fund_etf_em",
+    "fund_etf_spot_em": ".fund.fund_etf_em",
+    "fund_etf_scale_sse": ".fund.fund_etf_sse",
+    "fund_etf_scale_szse": ".fund.fund_etf_szse",
+    "fund_scale_daily_szse": ".fund.fund_scale_szse",
+    "stock_ebs_lg": ".stock_feature.stock_ebs_lg",
+    "fund_stock_position_lg": ".fund.fund_position_lg",
+    "fund_balance_position_lg": ".fund.fund_position_lg",
+    "fund_linghuo_position_lg": ".fund.fund_position_lg",
+    "stock_a_congestion_lg": ".stock_feature.stock_congestion_lg",
+    "stock_a_gxl_lg": ".stock_feature.stock_gxl_lg",
+    "stock_hk_gxl_lg": ".stock_feature.stock_gxl_lg",
+    "stock_restricted_release_stockholder_em": ".stock_fundamental.stock_restricted_em",
+    "stock_restricted_release_summary_em": ".stock_fundamental.stock_restricted_em",
+    "stock_restricted_release_detail_em": ".stock_fundamental.stock_restricted_em",
+    "stock_restricted_release_queue_em": ".stock_fundamental.stock_restricted_em",
+    "stock_board_industry_summary_ths": ".stock_feature.stock_board_industry_ths",
+    "index_hog_spot_price": ".index.index_hog",
+    "bond_info_detail_cm": ".bond.bond_info_cm",
+    "bond_info_cm": ".bond.bond_info_cm",
+    "bond_info_cm_query": ".bond.bond_info_cm",
+    "index_realtime_sw": ".index.index_research_sw",
+    "index_hist_sw": ".index.index_research_sw",
+    "index_component_sw": ".index.index_research_sw",
+    "index_min_sw": ".index.index_research_sw",
+    "index_analysis_daily_sw": ".index.index_research_sw",
+    "index_analysis_weekly_sw": ".index.index_research_sw",
+    "index_analysis_monthly_sw": ".index.index_research_sw",
+    "index_analysis_week_month_sw": ".index.index_research_sw",
+    "index_option_50etf_qvix": ".index.index_option_qvix",
+    "index_option_300etf_min_qvix": ".index.index_option_qvix",
+    "index_option_300etf_qvix": ".index.index_option_qvix",
+    "index_option_50etf_min_qvix": ".index.index_option_qvix",
+    "index_option_1000index_min_qvix": ".index.index_option_qvix",
+    "index_option_1000index_qvix": ".index.index_option_qvix",
+    "index_option_100etf_min_qvix": ".index.index_option_qvix",
+    "index_option_100etf_qvix": ".index.index_option_qvix",
+    "index_option_300index_min_qvix": ".index.index_option_qvix",
+    "index_option_300index_qvix": ".index.index_option_qvix",
+    "index_option_500etf_min_qvix": ".index.index_option_qvix",
+    "index_option_500etf_qvix": ".index.index_option_qvix",
+    "index_option_50index_min_qvix": ".index.index_option_qvix",
+    "index_option_50index_qvix": ".index.index_option_qvix",
+    "index_option_cyb_min_qvix": ".index.index_option_qvix",
+    "index_option_cyb_qvix": ".index.index_option_qvix",
+    "index_option_kcb_min_qvix": ".index.index_option_qvix",
+    "index_option_kcb_qvix": ".index.index_option_qvix",
+    "fx_quote_baidu": ".fx.fx_quote_baidu",
+    "stock_buffett_index_lg": ".stock_feature.stock_buffett_index_lg",
+    "stock_hot_search_baidu": ".stock.stock_hot_search_baidu",
+    "stock_zh_vote_baidu": ".stock_feature.stock_zh_vote_baidu",
+    "stock_zh_valuation_baidu": ".stock_feature.stock_zh_valuation_baidu",
+    "stock_hk_valuation_baidu": ".stock_feature.stock_hk_valuation_baidu",
+    "stock_us_valuation_baidu": ".stock_feature.stock_us_valuation_baidu",
+    "stock_profile_cninfo": ".stock.stock_profile_cninfo",
+    "stock_ipo_summary_cninfo": ".stock.stock_ipo_summary_cninfo",
+    "stock_allotment_cninfo": ".stock.stock_allotment_cninfo",
+    "stock_sgt_reference_exchange_rate_sse": ".stock_feature.stock_hsgt_exchange_rate",
+    "stock_sgt_settlement_exchange_rate_sse": ".stock_feature.stock_hsgt_exchange_rate",
+    "stock_sgt_reference_exchange_rate_szse": ".stock_feature.stock_hsgt_exchange_rate",
+    "stock_sgt_settlement_exchange_rate_szse": ".stock_feature.stock_hsgt_exchange_rate",
+    "bond_new_composite_index_cbond": ".bond.bond_cbond",
+    "bond_composite_index_cbond": ".bond.bond_cbond",
+    "bond_available_index_cbond": ".bond.bond_cbond",
+    "bond_index_general_cbond": ".bond.bond_cbond",
+    "bond_treasury_index_cbond": ".bond.bond_cbond",
+    "stock_classify_sina": ".stock_feature.stock_classify_sina",
+    "stock_zygc_em": ".stock_fundamental.stock_zygc",
+    "currency_boc_safe": ".currency.currency_safe",
+    "option_risk_indicator_sse": ".option.option_risk_indicator_sse",
+    "news_economic_baidu": ".news.news_baidu",
+    "news_trade_notify_suspend_baidu": ".news.news_baidu",
+    "news_report_time_baidu": ".news.news_baidu",
+    "news_trade_notify_dividend_baidu": ".news.news_baidu",
+    "stock_balance_sheet_by_report_em": ".stock_feature.stock_three_report_em",
+    "stock_balance_sheet_by_yearly_em": ".stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_report_em": ".stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_quarterly_em": ".stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_yearly_em": ".stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_report_em": ".stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_quarterly_em": ".stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_yearly_em": ".stock_feature.stock_three_report_em",
+    "stock_balance_sheet_by_report_delisted_em": ".stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_report_delisted_em": ".stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_report_delisted_em": ".stock_feature.stock_three_report_em",
+    "stock_inner_trade_xq": ".stock_feature.stock_inner_trade_xq",
+    "stock_hot_deal_xq": ".stock_feature.stock_hot_xq",
+    "stock_hot_follow_xq": ".stock_feature.stock_hot_xq",
+    "stock_hot_tweet_xq": ".stock_feature.stock_hot_xq",
+    "stock_lhb_hyyyb_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_detail_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_stock_detail_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_jgmmtj_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_stock_statistic_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_stock_detail_date_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_yybph_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_jgstatistic_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_traderstatistic_em": ".stock_feature.stock_lhb_em",
+    "stock_lhb_yyb_detail_em": ".stock_feature.stock_lhb_em",
+    "index_zh_a_hist": ".index.index_zh_em",
+    "index_zh_a_hist_min_em": ".index.index_zh_em",
+    "index_code_id_map_em": ".index.index_zh_em",
+    "stock_hot_rank_detail_em": ".stock.stock_hot_rank_em",
+    "stock_hot_rank_em": ".stock.stock_hot_rank_em",
+    "stock_hot_rank_detail_realtime_em": ".stock.stock_hot_rank_em",
+    "stock_hot_rank_relate_em": ".stock.stock_hot_rank_em",
+    "stock_hot_keyword_em": ".stock.stock_hot_rank_em",
+    "stock_hot_rank_latest_em": ".stock.stock_hot_rank_em",
+    "stock_hot_up_em": ".stock.stock_hot_up_em",
+    "stock_hk_hot_rank_detail_em": ".stock.stock_hk_hot_rank_em",
+    "stock_hk_hot_rank_latest_em": ".stock.stock_hk_hot_rank_em",
+    "stock_hk_hot_rank_detail_realtime_em": ".stock.stock_hk_hot_rank_em",
+    "stock_hk_hot_rank_em": ".stock.stock_hk_hot_rank_em",
+    "index_pmi_com_cx": ".index.index_cx",
+    "index_pmi_man_cx": ".index.index_cx",
+    "index_pmi_ser_cx": ".index.index_cx",
+    "index_dei_cx": ".index.index_cx",
+    "index_ii_cx": ".index.index_cx",
+    "index_si_cx": ".index.index_cx",
+    "index_fi_cx": ".index.index_cx",
+    "index_bi_cx": ".index.index_cx",
+    "index_ci_cx": ".index.index_cx",
+    "index_awpr_cx": ".index.index_cx",
+    "index_cci_cx": ".index.index_cx",
+    "index_li_cx": ".index.index_cx",
+    "index_neaw_cx": ".index.index_cx",
+    "index_nei_cx": ".index.index_cx",
+    "index_ti_cx": ".index.index_cx",
+    "index_ai_cx": ".index.index_cx",
+    "index_neei_cx": ".index.index_cx",
+    "index_bei_cx": ".index.index_cx",
+    "index_qli_cx": ".index.index_cx",
+    "option_premium_analysis_em": ".option.option_premium_analysis_em",
+    "option_risk_analysis_em": ".option.option_risk_analysis_em",
+    "option_value_analysis_em": ".option.option_value_analysis_em",
+    "option_lhb_em": ".option.option_lhb_em",
+    "stock_gdfx_holding_analyse_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_analyse_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_top_10_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_top_10_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_detail_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_detail_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_change_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_change_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_statistics_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_statistics_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_teamwork_em": ".stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_teamwork_em": ".stock_feature.stock_gdfx_em",
+    "index_sugar_msweet": ".index.index_sugar",
+    "index_inner_quote_sugar_msweet": ".index.index_sugar",
+    "index_outer_quote_sugar_msweet": ".index.index_sugar",
+    "stock_individual_info_em": ".stock.stock_info_em",
+    "spot_hist_sge": ".spot.spot_sge",
+    "spot_symbol_table_sge": ".spot.spot_sge",
+    "spot_silver_benchmark_sge": ".spot.spot_sge",
+    "spot_golden_benchmark_sge": ".spot.spot_sge",
+    "spot_quotations_sge": ".spot.spot_sge",
+    "stock_repurchase_em": ".stock.stock_repurchase_em",
+    "stock_board_industry_cons_em": ".stock.stock_board_industry_em",
+    "stock_board_industry_hist_em": ".stock.stock_board_industry_em",
+    "stock_board_industry_hist_min_em": ".stock.stock_board_industry_em",
+    "stock_board_industry_name_em": ".stock.stock_board_industry_em",
+    "stock_board_industry_spot_em": ".stock.stock_board_industry_em",
+    "fund_scale_change_em": ".fund.fund_scale_em",
+    "fund_hold_structure_em": ".fund.fund_scale_em",
+    "fund_cf_em": ".fund.fund_fhsp_em",
+    "fund_fh_rank_em": ".fund.fund_fhsp_em",
+    "fund_fh_em": ".fund.fund_fhsp_em",
+    "online_value_artist": ".movie.artist_yien",
+    "business_value_artist": ".movie.artist_yien",
+    "video_variety_show": ".movie.video_yien",
+    "video_tv": ".movie.video_yien",
+    "stock_rank_cxg_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_cxd_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_lxsz_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_lxxd_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_cxfl_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_cxsl_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_xstp_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_xxtp_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_ljqd_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_ljqs_ths": ".stock_feature.stock_technology_ths",
+    "stock_rank_xzjp_ths": ".stock_feature.stock_technology_ths",
+    "stock_hsgt_individual_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_individual_detail_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_fund_flow_summary_em": ".stock_feature.stock_hsgt_em",
+    "fund_scale_open_sina": ".fund.fund_scale_sina",
+    "fund_scale_close_sina": ".fund.fund_scale_sina",
+    "fund_scale_structured_sina": ".fund.fund_scale_sina",
+    "fund_report_stock_cninfo": ".fund.fund_report_cninfo",
+    "fund_report_industry_allocation_cninfo": ".fund.fund_report_cninfo",
+    "fund_report_asset_allocation_cninfo": ".fund.fund_report_cninfo",
+    "bond_treasure_issue_cninfo": ".bond.bond_issue_cninfo",
+    "bond_local_government_issue_cninfo": ".bond.bond_issue_cninfo",
+    "bond_corporate_issue_cninfo": ".bond.bond_issue_cninfo",
+    "bond_cov_issue_cninfo": ".bond.bond_issue_cninfo",
+    "bond_cov_stock_issue_cninfo": ".bond.bond_issue_cninfo",
+    "stock_cg_equity_mortgage_cninfo": ".stock.stock_cg_equity_mortgage",
+    "stock_cg_lawsuit_cninfo": ".stock.stock_cg_lawsuit",
+    "stock_cg_guarantee_cninfo": ".stock.stock_cg_guarantee",
+    "stock_zh_b_spot": ".stock.stock_zh_b_sina",
+    "stock_zh_b_daily": ".stock.stock_zh_b_sina",
+    "stock_zh_b_minute": ".stock.stock_zh_b_sina",
+    "futures_comm_info": ".futures.futures_comm_qihuo",
+    "futures_fees_info": ".futures.futures_comm_ctp",
+    "stock_hold_control_cninfo": ".stock.stock_hold_control_cninfo",
+    "stock_hold_management_detail_cninfo": ".stock.stock_hold_control_cninfo",
+    "stock_hold_num_cninfo": ".stock.stock_hold_num_cninfo",
+    "stock_new_gh_cninfo": ".stock.stock_new_cninfo",
+    "stock_new_ipo_cninfo": ".stock.stock_new_cninfo",
+    "stock_dividend_cninfo": ".stock.stock_dividend_cninfo",
+    "stock_share_change_cninfo": ".stock.stock_share_changes_cninfo",
+    "stock_industry_category_cninfo": ".stock.stock_industry_cninfo",
+    "stock_industry_change_cninfo": ".stock.stock_industry_cninfo",
+    "stock_industry_pe_ratio_cninfo": ".stock.stock_industry_pe_cninfo",
+    "stock_industry_clf_hist_sw": ".stock.stock_industry_sw",
+    "stock_rank_forecast_cninfo": ".stock.stock_rank_forecast",
+    "stock_us_famous_spot_em": ".stock.stock_us_famous",
+    "stock_us_pink_spot_em": ".stock.stock_us_pink",
+    "reits_realtime_em": ".reits.reits_basic",
+    "reits_hist_em": ".reits.reits_basic",
+    "reits_hist_min_em": ".reits.reits_basic",
+    "stock_a_ttm_lyr": ".stock_feature.stock_ttm_lyr",
+    "stock_a_all_pb": ".stock_feature.stock_all_pb",
+    "macro_canada_cpi_monthly": ".economic.macro_canada",
+    "macro_canada_core_cpi_monthly": ".economic.macro_canada",
+    "macro_canada_bank_rate": ".economic.macro_canada",
+    "macro_canada_core_cpi_yearly": ".economic.macro_canada",
+    "macro_canada_cpi_yearly": ".economic.macro_canada",
+    "macro_canada_gdp_monthly": ".economic.macro_canada",
+    "macro_canada_new_house_rate": ".economic.macro_canada",
+    "macro_canada_retail_rate_monthly": ".economic.macro_canada",
+    "macro_canada_trade": ".economic.macro_canada",
+    "macro_canada_unemployment_rate": ".economic.macro_canada",
+    "futures_hog_core": ".futures_derivative.futures_hog",
+    "futures_hog_cost": ".futures_derivative.futures_hog",
+    "futures_hog_supply": ".futures_derivative.futures_hog",
+    "macro_australia_bank_rate": ".economic.macro_australia",
+    "macro_australia_unemployment_rate": ".economic.macro_australia",
+    "macro_australia_trade": ".economic.macro_australia",
+    "macro_australia_cpi_quarterly": ".economic.macro_australia",
+    "macro_australia_cpi_yearly": ".economic.macro_australia",
+    "macro_australia_ppi_quarterly": ".economic.macro_australia",
+    "macro_australia_retail_rate_monthly": ".economic.macro_australia",
+    "stock_margin_underlying_info_szse": ".stock_feature.stock_margin_szse",
+    "stock_margin_detail_szse": ".stock_feature.stock_margin_szse",
+    "stock_margin_szse": ".stock_feature.stock_margin_szse",
+    "macro_uk_gdp_yearly": ".economic.macro_uk",
+    "macro_uk_gdp_quarterly": ".economic.macro_uk",
+    "macro_uk_retail_yearly": ".economic.macro_uk",
+    "macro_uk_rightmove_monthly": ".economic.macro_uk",
+    "macro_uk_rightmove_yearly": ".economic.macro_uk",
+    "macro_uk_unemployment_rate": ".economic.macro_uk",
+    "macro_uk_halifax_monthly": ".economic.macro_uk",
+    "macro_uk_bank_rate": ".economic.macro_uk",
+    "macro_uk_core_cpi_monthly": ".economic.macro_uk",
+    "macro_uk_core_cpi_yearly": ".economic.macro_uk",
+    "macro_uk_cpi_monthly": ".economic.macro_uk",
+    "macro_uk_cpi_yearly": ".economic.macro_uk",
+    "macro_uk_halifax_yearly": ".economic.macro_uk",
+    "macro_uk_retail_monthly": ".economic.macro_uk",
+    "macro_uk_trade": ".economic.macro_uk",
+    "macro_japan_bank_rate": ".economic.macro_japan",
+    "macro_japan_core_cpi_yearly": ".economic.macro_japan",
+    "macro_japan_cpi_yearly": ".economic.macro_japan",
+    "macro_japan_head_indicator": ".economic.macro_japan",
+    "macro_japan_unemployment_rate": ".economic.macro_japan",
+    "macro_swiss_trade": ".economic.macro_swiss",
+    "macro_swiss_svme": ".economic.macro_swiss",
+    "macro_swiss_cpi_yearly": ".economic.macro_swiss",
+    "macro_swiss_gbd_yearly": ".economic.macro_swiss",
+    "macro_swiss_gbd_bank_rate": ".economic.macro_swiss",
+    "macro_swiss_gdp_quarterly": ".economic.macro_swiss",
+    "stock_board_concept_cons_em": ".stock.stock_board_concept_em",
+    "stock_board_concept_hist_em": ".stock.stock_board_concept_em",
+    "stock_board_concept_hist_min_em": ".stock.stock_board_concept_em",
+    "stock_board_concept_name_em": ".stock.stock_board_concept_em",
+    "stock_board_concept_spot_em": ".stock.stock_board_concept_em",
+    "macro_germany_gdp": ".economic.macro_germany",
+    "macro_germany_ifo": ".economic.macro_germany",
+    "macro_germany_cpi_monthly": ".economic.macro_germany",
+    "macro_germany_retail_sale_monthly": ".economic.macro_germany",
+    "macro_germany_trade_adjusted": ".economic.macro_germany",
+    "macro_germany_retail_sale_yearly": ".economic.macro_germany",
+    "macro_germany_cpi_yearly": ".economic.macro_germany",
+    "macro_germany_zew": ".economic.macro_germany",
+    "fund_aum_em": ".fund.fund_aum_em",
+    "fund_aum_trend_em": ".fund.fund_aum_em",
+    "fund_aum_hist_em": ".fund.fund_aum_em",
+    "crypto_bitcoin_cme": ".crypto.crypto_bitcoin_cme",
+    "stock_changes_em": ".stock_feature.stock_pankou_em",
+    "stock_board_change_em": ".stock_feature.stock_pankou_em",
+    "stock_zh_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_bj_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_new_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_kc_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_cy_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_sh_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_sz_a_spot_em": ".stock_feature.stock_hist_em",
+    "stock_zh_b_spot_em": ".stock_feature.stock_hist_em",
+    "stock_zh_ab_comparison_em": ".stock_feature.stock_hist_em",
+    "stock_zh_a_hist": ".stock_feature.stock_hist_em",
+    "stock_hk_spot_em": ".stock_feature.stock_hist_em",
+    "stock_hk_main_board_spot_em": ".stock_feature.stock_hist_em",
+    "stock_hk_hist": ".stock_feature.stock_hist_em",
+    "stock_us_spot_em": ".stock_feature.stock_hist_em",
+    "stock_us_hist": ".stock_feature.stock_hist_em",
+    "stock_zh_a_hist_min_em": ".stock_feature.stock_hist_em",
+    "stock_zh_a_hist_pre_min_em": ".stock_feature.stock_hist_em",
+    "stock_hk_hist_min_em": ".stock_feature.stock_hist_em",
+    "stock_us_hist_min_em": ".stock_feature.stock_hist_em",
+    "currency_boc_sina": ".currency.currency_china_bank_sina",
+    "futures_hold_pos_sina": ".futures_derivative.futures_cot_sina",
+    "stock_zh_a_gdhs": ".stock_feature.stock_gdhs",
+    "stock_zh_a_gdhs_detail_em": ".stock_feature.stock_gdhs",
+    "stock_staq_net_stop": ".stock.stock_stop",
+    "stock_zt_pool_em": ".stock_feature.stock_ztb_em",
+    "stock_zt_pool_previous_em": ".stock_feature.stock_ztb_em",
+    "stock_zt_pool_dtgc_em": ".stock_feature.stock_ztb_em",
+    "stock_zt_pool_zbgc_em": ".stock_feature.stock_ztb_em",
+    "stock_zt_pool_strong_em": ".stock_feature.stock_ztb_em",
+    "stock_zt_pool_sub_new_em": ".stock_feature.stock_ztb_em",
+    "macro_china_hk_cpi": ".economic.macro_china_hk",
+    "macro_china_hk_cpi_ratio": ".economic.macro_china_hk",
+    "macro_china_hk_trade_diff_ratio": ".economic.macro_china_hk",
+    "macro_china_hk_gbp_ratio": ".economic.macro_china_hk",
+    "macro_china_hk_building_amount": ".economic.macro_china_hk",
+    "macro_china_hk_building_volume": ".economic.macro_china_hk",
+    "macro_china_hk_gbp": ".economic.macro_china_hk",
+    "macro_china_hk_ppi": ".economic.macro_china_hk",
+    "macro_china_hk_rate_of_unemployment": ".economic.macro_china_hk",
+    "stock_qbzf_em": ".stock_feature.stock_zf_pg",
+    "stock_pg_em": ".stock_feature.stock_zf_pg",
+    "car_sale_rank_gasgoo": ".other.other_car_gasgoo",
+    "car_market_cate_cpca": ".other.other_car_cpca",
+    "car_market_fuel_cpca": ".other.other_car_cpca",
+    "car_market_segment_cpca": ".other.other_car_cpca",
+    "car_market_country_cpca": ".other.other_car_cpca",
+    "car_market_man_rank_cpca": ".other.other_car_cpca",
+    "car_market_total_cpca": ".other.other_car_cpca",
+    "index_price_cflp": ".index.index_cflp",
+    "index_volume_cflp": ".index.index_cflp",
+    "stock_market_activity_legu": ".stock_feature.stock_market_legu",
+    "index_eri": ".index.index_eri",
+    "drewry_wci_index": ".index.index_drewry",
+    "index_kq_fz": ".index.index_kq_fz",
+    "index_kq_fashion": ".index.index_kq_ss",
+    "fund_new_found_em": ".fund.fund_init_em",
+    "fund_new_found_ths": ".fund.fund_init_ths",
+    "stock_ggcg_em": ".stock_feature.stock_gdzjc_em",
+    "stock_fund_flow_concept": ".stock_feature.stock_fund_flow",
+    "stock_fund_flow_industry": ".stock_feature.stock_fund_flow",
+    "stock_fund_flow_big_deal": ".stock_feature.stock_fund_flow",
+    "stock_fund_flow_individual": ".stock_feature.stock_fund_flow",
+    "crypto_bitcoin_hold_report": ".crypto.crypto_hold",
+    "stock_lh_yyb_capital": ".stock_feature.stock_lh_yybpm",
+    "stock_lh_yyb_most": ".stock_feature.stock_lh_yybpm",
+    "stock_lh_yyb_control": ".stock_feature.stock_lh_yybpm",
+    "stock_notice_report": ".stock_fundamental.stock_notice",
+    "stock_individual_notice_report": ".stock_fundamental.stock_notice",
+    "stock_ipo_declare_em": ".stock_fundamental.stock_ipo_declare",
+    "stock_ipo_tutor_em": ".stock_fundamental.stock_ipo_tutor",
+    "stock_zcfz_em": ".stock_feature.stock_report_em",
+    "stock_zcfz_bj_em": ".stock_feature.stock_report_em",
+    "stock_lrb_em": ".stock_feature.stock_report_em",
+    "stock_xjll_em": ".stock_feature.stock_report_em",
+    "stock_yjbb_em": ".stock_feature.stock_yjbb_em",
+    "stock_board_concept_info_ths": ".stock_feature.stock_board_concept_ths",
+    "stock_board_concept_summary_ths": ".stock_feature.stock_board_concept_ths",
+    "stock_board_concept_index_ths": ".stock_feature.stock_board_concept_ths",
+    "stock_board_concept_name_ths": ".stock_feature.stock_board_concept_ths",
+    "stock_board_industry_name_ths": ".stock_feature.stock_board_industry_ths",
+    "stock_board_industry_info_ths": ".stock_feature.stock_board_industry_ths",
+    "stock_board_industry_index_ths": ".stock_feature.stock_board_industry_ths",
+    "stock_ipo_benefit_ths": ".stock_feature.stock_board_industry_ths",
+    "stock_xgsr_ths": ".stock_feature.stock_board_industry_ths",
+    "stock_fhps_em": ".stock_feature.stock_fhps_em",
+    "stock_fhps_detail_em": ".stock_feature.stock_fhps_em",
+    "bond_zh_us_rate": ".bond.bond_em",
+    "stock_profit_forecast_em": ".stock_fundamental.stock_profit_forecast_em",
+    "fund_manager_em": ".fund.fund_manager",
+    "fund_rating_sh": ".fund.fund_rating",
+    "fund_rating_zs": ".fund.fund_rating",
+    "fund_rating_ja": ".fund.fund_rating",
+    "fund_rating_all": ".fund.fund_rating",
+    "stock_margin_detail_sse": ".stock_feature.stock_margin_sse",
+    "stock_margin_sse": ".stock_feature.stock_margin_sse",
+    "stock_margin_ratio_pa": ".stock_feature.stock_margin_sse",
+    "futures_to_spot_czce": ".futures.futures_to_spot",
+    "futures_to_spot_shfe": ".futures.futures_to_spot",
+    "futures_to_spot_dce": ".futures.futures_to_spot",
+    "futures_delivery_dce": ".futures.futures_to_spot",
+    "futures_delivery_shfe": ".futures.futures_to_spot",
+    "futures_delivery_czce": ".futures.futures_to_spot",
+    "futures_delivery_match_dce": ".futures.futures_to_spot",
+    "futures_delivery_match_czce": ".futures.futures_to_spot",
+    "fund_portfolio_hold_em": ".fund.fund_portfolio_em",
+    "fund_portfolio_change_em": ".fund.fund_portfolio_em",
+    "fund_portfolio_bond_hold_em": ".fund.fund_portfolio_em",
+    "fund_portfolio_industry_allocation_em": ".fund.fund_portfolio_em",
+    "bond_deal_summary_sse": ".bond.bond_summary",
+    "bond_cash_summary_sse": ".bond.bond_summary",
+    "stock_news_em": ".news.news_stock",
+    "stock_yzxdr_em": ".stock_feature.stock_yzxdr_em",
+    "stock_dzjy_sctj": ".stock.stock_dzjy_em",
+    "stock_dzjy_mrmx": ".stock.stock_dzjy_em",
+    "stock_dzjy_mrtj": ".stock.stock_dzjy_em",
+    "stock_dzjy_hygtj": ".stock.stock_dzjy_em",
+    "stock_dzjy_yybph": ".stock.stock_dzjy_em",
+    "stock_dzjy_hyyybtj": ".stock.stock_dzjy_em",
+    "index_hist_cni": ".index.index_cni",
+    "index_all_cni": ".index.index_cni",
+    "index_detail_cni": ".index.index_cni",
+    "index_detail_hist_cni": ".index.index_cni",
+    "index_detail_hist_adjust_cni": ".index.index_cni",
+    "option_current_em": ".option.option_em",
+    "stock_zh_kcb_report_em": ".stock.stock_zh_kcb_report",
+    "futures_contract_detail": ".futures.futures_contract_detail",
+    "futures_contract_detail_em": ".futures.futures_contract_detail",
+    "hurun_rank": ".fortune.fortune_hurun",
+    "xincaifu_rank": ".fortune.fortune_xincaifu_500",
+    "forbes_rank": ".fortune.fortune_forbes_500",
+    "repo_rate_hist": ".rate.repo_rate",
+    "repo_rate_query": ".rate.repo_rate",
+    "fund_exchange_rank_em": ".fund.fund_rank_em",
+    "fund_money_rank_em": ".fund.fund_rank_em",
+    "fund_open_fund_rank_em": ".fund.fund_rank_em",
+    "fund_hk_rank_em": ".fund.fund_rank_em",
+    "fund_lcx_rank_em": ".fund.fund_rank_em",
+    "movie_boxoffice_cinema_daily": ".movie.movie_yien",
+    "movie_boxoffice_cinema_weekly": ".movie.movie_yien",
+    "movie_boxoffice_weekly": ".movie.movie_yien",
+    "movie_boxoffice_daily": ".movie.movie_yien",
+    "movie_boxoffice_monthly": ".movie.movie_yien",
+    "movie_boxoffice_realtime": ".movie.movie_yien",
+    "movie_boxoffice_yearly": ".movie.movie_yien",
+    "movie_boxoffice_yearly_first_week": ".movie.movie_yien",
+    "news_cctv": ".news.news_cctv",
+    "bond_china_close_return": ".bond.bond_china_money",
+    "macro_china_bond_public": ".bond.bond_china_money",
+    "macro_china_swap_rate": ".bond.bond_china_money",
+    "bond_china_close_return_map": ".bond.bond_china_money",
+    "futures_comex_inventory": ".futures.futures_comex_em",
+    "stock_zh_a_new": ".stock.stock_zh_a_special",
+    "stock_zh_a_st_em": ".stock.stock_zh_a_special",
+    "stock_zh_a_new_em": ".stock.stock_zh_a_special",
+    "stock_zh_a_stop_em": ".stock.stock_zh_a_special",
+    "stock_register_all_em": ".stock_fundamental.stock_register_em",
+    "stock_register_kcb": ".stock_fundamental.stock_register_em",
+    "stock_register_cyb": ".stock_fundamental.stock_register_em",
+    "stock_register_bj": ".stock_fundamental.stock_register_em",
+    "stock_register_db": ".stock_fundamental.stock_register_em",
+    "stock_register_sh": ".stock_fundamental.stock_register_em",
+    "stock_register_sz": ".stock_fundamental.stock_register_em",
+    "stock_ipo_review_em": ".stock_fundamental.stock_ipo_review",
+    "stock_ipo_ths": ".stock_fundamental.stock_ipo_ths",
+    "stock_ipo_hk_ths": ".stock_fundamental.stock_ipo_ths",
+    "stock_lhb_detail_daily_sina": ".stock_feature.stock_lhb_sina",
+    "stock_lhb_ggtj_sina": ".stock_feature.stock_lhb_sina",
+    "stock_lhb_jgmx_sina": ".stock_feature.stock_lhb_sina",
+    "stock_lhb_jgzz_sina": ".stock_feature.stock_lhb_sina",
+    "stock_lhb_yytj_sina": ".stock_feature.stock_lhb_sina",
+    "stock_zh_index_hist_csindex": ".index.index_stock_zh_csindex",
+    "stock_zh_index_value_csindex": ".index.index_stock_zh_csindex",
+    "stock_report_fund_hold": ".stock.stock_fund_hold",
+    "stock_report_fund_hold_detail": ".stock.stock_fund_hold",
+    "futures_zh_minute_sina": ".futures.futures_zh_sina",
+    "futures_zh_daily_sina": ".futures.futures_zh_sina",
+    "futures_zh_realtime": ".futures.futures_zh_sina",
+    "futures_symbol_mark": ".futures.futures_zh_sina",
+    "match_main_contract": ".futures.futures_zh_sina",
+    "futures_zh_spot": ".futures.futures_zh_sina",
+    "stock_report_disclosure": ".stock_feature.stock_yjyg_cninfo",
+    "fund_etf_hist_sina": ".fund.fund_etf_sina",
+    "fund_etf_category_sina": ".fund.fund_etf_sina",
+    "fund_etf_dividend_sina": ".fund.fund_etf_sina",
+    "tool_trade_date_hist_sina": ".tool.trade_date_hist",
+    "option_commodity_contract_table_sina": ".option.option_commodity_sina",
+    "option_commodity_contract_sina": ".option.option_commodity_sina",
+    "option_commodity_hist_sina": ".option.option_commodity_sina",
+    "stock_market_pb_lg": ".stock_feature.stock_a_pe_and_pb",
+    "stock_index_pb_lg": ".stock_feature.stock_a_pe_and_pb",
+    "stock_market_pe_lg": ".stock_feature.stock_a_pe_and_pb",
+    "stock_index_pe_lg": ".stock_feature.stock_a_pe_and_pb",
+    "stock_hk_indicator_eniu": ".stock_feature.stock_a_indicator",
+    "stock_a_high_low_statistics": ".stock_feature.stock_a_high_low",
+    "stock_a_below_net_asset_statistics": ".stock_feature.stock_a_below_net_asset_statistics",
+    "index_bloomberg_billionaires": ".fortune.fortune_bloomberg",
+    "index_bloomberg_billionaires_hist": ".fortune.fortune_bloomberg",
+    "stock_qsjy_em": ".stock_feature.stock_qsjy_em",
+    "futures_warehouse_receipt_czce": ".futures.futures_warehouse_receipt",
+    "futures_warehouse_receipt_dce": ".futures.futures_warehouse_receipt",
+    "futures_shfe_warehouse_receipt": ".futures.futures_warehouse_receipt",
+    "futures_gfex_warehouse_receipt": ".futures.futures_warehouse_receipt",
+    "stock_price_js": ".stock.stock_us_js",
+    "stock_sse_summary": ".stock.stock_summary",
+    "stock_szse_summary": ".stock.stock_summary",
+    "stock_sse_deal_daily": ".stock.stock_summary",
+    "stock_szse_area_summary": ".stock.stock_summary",
+    "stock_szse_sector_summary": ".stock.stock_summary",
+    "stock_institute_recommend": ".stock_fundamental.stock_recommend",
+    "stock_institute_recommend_detail": ".stock_fundamental.stock_recommend",
+    "stock_institute_hold_detail": ".stock_fundamental.stock_hold",
+    "stock_institute_hold": ".stock_fundamental.stock_hold",
+    "stock_info_sh_delist": ".stock.stock_info",
+    "stock_info_sz_delist": ".stock.stock_info",
+    "stock_info_a_code_name": ".stock.stock_info",
+    "stock_info_sh_name_code": ".stock.stock_info",
+    "stock_info_bj_name_code": ".stock.stock_info",
+    "stock_info_sz_name_code": ".stock.stock_info",
+    "stock_info_sz_change_name": ".stock.stock_info",
+    "stock_info_change_name": ".stock.stock_info",
+    "stock_sector_spot": ".stock.stock_industry",
+    "stock_sector_detail": ".stock.stock_industry",
+    "stock_financial_abstract": ".stock_fundamental.stock_finance_sina",
+    "stock_financial_report_sina": ".stock_fundamental.stock_finance_sina",
+    "stock_financial_analysis_indicator": ".stock_fundamental.stock_finance_sina",
+    "stock_add_stock": ".stock_fundamental.stock_finance_sina",
+    "stock_ipo_info": ".stock_fundamental.stock_finance_sina",
+    "stock_history_dividend_detail": ".stock_fundamental.stock_finance_sina",
+    "stock_history_dividend": ".stock_fundamental.stock_finance_sina",
+    "stock_circulate_stock_holder": ".stock_fundamental.stock_finance_sina",
+    "stock_restricted_release_queue_sina": ".stock_fundamental.stock_finance_sina",
+    "stock_fund_stock_holder": ".stock_fundamental.stock_finance_sina",
+    "stock_main_stock_holder": ".stock_fundamental.stock_finance_sina",
+    "stock_financial_hk_analysis_indicator_em": ".stock_fundamental.stock_finance_hk_em",
+    "stock_financial_hk_report_em": ".stock_fundamental.stock_finance_hk_em",
+    "stock_individual_fund_flow": ".stock.stock_fund_em",
+    "stock_market_fund_flow": ".stock.stock_fund_em",
+    "stock_sector_fund_flow_rank": ".stock.stock_fund_em",
+    "stock_individual_fund_flow_rank": ".stock.stock_fund_em",
+    "stock_sector_fund_flow_summary": ".stock.stock_fund_em",
+    "stock_sector_fund_flow_hist": ".stock.stock_fund_em",
+    "stock_concept_fund_flow_hist": ".stock.stock_fund_em",
+    "stock_main_fund_flow": ".stock.stock_fund_em",
+    "air_quality_hist": ".air.air_zhenqi",
+    "air_quality_rank": ".air.air_zhenqi",
+    "air_quality_watch_point": ".air.air_zhenqi",
+    "air_city_table": ".air.air_zhenqi",
+    "hf_sp_500": ".hf.hf_sp500",
+    "stock_yjyg_em": ".stock_feature.stock_yjyg_em",
+    "stock_yysj_em": ".stock_feature.stock_yjyg_em",
+    "stock_yjkb_em": ".stock_feature.stock_yjyg_em",
+    "stock_dxsyl_em": ".stock_feature.stock_dxsyl_em",
+    "stock_xgsglb_em": ".stock_feature.stock_dxsyl_em",
+    "fred_md": ".article.fred_md",
+    "fred_qd": ".article.fred_md",
+    "futures_index_ccidx": ".futures.futures_index_ccidx",
+    "futures_spot_stock": ".futures.futures_spot_stock_em",
+    "energy_oil_detail": ".energy.energy_oil_em",
+    "energy_oil_hist": ".energy.energy_oil_em",
+    "futures_foreign_detail": ".futures.futures_foreign",
+    "futures_foreign_hist": ".futures.futures_foreign",
+    "stock_tfp_em": ".stock_feature.stock_tfp_em",
+    "stock_hk_ggt_components_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_hold_stock_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_hist_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_institution_statistics_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_stock_statistics_em": ".stock_feature.stock_hsgt_em",
+    "stock_hsgt_board_rank_em": ".stock_feature.stock_hsgt_em",
+    "stock_comment_em": ".stock_feature.stock_comment_em",
+    "stock_comment_detail_zlkp_jgcyd_em": ".stock_feature.stock_comment_em",
+    "stock_comment_detail_scrd_focus_em": ".stock_feature.stock_comment_em",
+    "stock_comment_detail_zhpj_lspf_em": ".stock_feature.stock_comment_em",
+    "stock_comment_detail_scrd_desire_em": ".stock_feature.stock_comment_em",
+    "stock_analyst_detail_em": ".stock_feature.stock_analyst_em",
+    "stock_analyst_rank_em": ".stock_feature.stock_analyst_em",
+    "futures_settlement_price_sgx": ".futures.futures_settlement_price_sgx",
+    "currency_convert": ".currency.currency",
+    "currency_currencies": ".currency.currency",
+    "currency_history": ".currency.currency",
+    "currency_latest": ".currency.currency",
+    "currency_time_series": ".currency.currency",
+    "nlp_ownthink": ".nlp.nlp_interface",
+    "nlp_answer": ".nlp.nlp_interface",
+    "stock_js_weibo_nlp_time": ".stock.stock_weibo_nlp",
+    "stock_js_weibo_report": ".stock.stock_weibo_nlp",
+    "option_cffex_sz50_list_sina": ".option.option_finance_sina",
+    "option_cffex_sz50_spot_sina": ".option.option_finance_sina",
+    "option_cffex_sz50_daily_sina": ".option.option_finance_sina",
+    "option_cffex_hs300_list_sina": ".option.option_finance_sina",
+    "option_cffex_hs300_spot_sina": ".option.option_finance_sina",
+    "option_cffex_hs300_daily_sina": ".option.option_finance_sina",
+    "option_cffex_zz1000_list_sina": ".option.option_finance_sina",
+    "option_cffex_zz1000_spot_sina": ".option.option_finance_sina",
+    "option_cffex_zz1000_daily_sina": ".option.option_finance_sina",
+    "option_sse_list_sina": ".option.option_finance_sina",
+    "option_sse_expire_day_sina": ".option.option_finance_sina",
+    "option_sse_codes_sina": ".option.option_finance_sina",
+    "option_sse_spot_price_sina": ".option.option_finance_sina",
+    "option_sse_underlying_spot_price_sina": ".option.option_finance_sina",
+    "option_sse_greeks_sina": ".option.option_finance_sina",
+    "option_sse_minute_sina": ".option.option_finance_sina",
+    "option_sse_daily_sina": ".option.option_finance_sina",
+    "option_finance_minute_sina": ".option.option_finance_sina",
+    "option_minute_em": ".option.option_finance_sina",
+    "bond_zh_hs_daily": ".bond.bond_zh_sina",
+    "bond_zh_hs_spot": ".bond.bond_zh_sina",
+    "bond_zh_hs_cov_daily": ".bond.bond_zh_cov",
+    "bond_zh_hs_cov_spot": ".bond.bond_zh_cov",
+    "bond_cov_comparison": ".bond.bond_zh_cov",
+    "bond_zh_cov": ".bond.bond_zh_cov",
+    "bond_zh_cov_info": ".bond.bond_zh_cov",
+    "bond_zh_hs_cov_min": ".bond.bond_zh_cov",
+    "bond_zh_hs_cov_pre_min": ".bond.bond_zh_cov",
+    "bond_zh_cov_value_analysis": ".bond.bond_zh_cov",
+    "bond_cb_jsl": ".bond.bond_convert",
+    "bond_cb_adj_logs_jsl": ".bond.bond_convert",
+    "bond_cb_index_jsl": ".bond.bond_convert",
+    "bond_cb_redeem_jsl": ".bond.bond_convert",
+    "fund_open_fund_daily_em": ".fund.fund_em",
+    "fund_open_fund_info_em": ".fund.fund_em",
+    "fund_open_fund_info_em_bundle": ".fund.fund_em",
+    "fund_open_fund_info_em_batch": ".fund.fund_em",
+    "fund_etf_fund_daily_em": ".fund.fund_em",
+    "fund_etf_fund_info_em": ".fund.fund_em",
+    "fund_financial_fund_daily_em": ".fund.fund_em",
+    "fund_financial_fund_info_em": ".fund.fund_em",
+    "fund_name_em": ".fund.fund_em",
+    "fund_info_index_em": ".fund.fund_em",
+    "fund_graded_fund_daily_em": ".fund.fund_em",
+    "fund_graded_fund_info_em": ".fund.fund_em",
+    "fund_money_fund_daily_em": ".fund.fund_em",
+    "fund_money_fund_info_em": ".fund.fund_em",
+    "fund_value_estimation_em": ".fund.fund_em",
+    "fund_hk_fund_hist_em": ".fund.fund_em",
+    "fund_purchase_em": ".fund.fund_em",
+    "migration_area_baidu": ".event.migration",
+    "migration_scale_baidu": ".event.migration",
+    "currency_pair_map": ".fx.currency_investing",
+    "option_hist_yearly_czce": ".option.option_czce",
+    "rate_interbank": ".interest_rate.interbank_rate_em",
+    "macro_fx_sentiment": ".economic.macro_other",
+    "macro_euro_gdp_yoy": ".economic.macro_euro",
+    "macro_euro_cpi_mom": ".economic.macro_euro",
+    "macro_euro_cpi_yoy": ".economic.macro_euro",
+    "macro_euro_current_account_mom": ".economic.macro_euro",
+    "macro_euro_employment_change_qoq": ".economic.macro_euro",
+    "macro_euro_industrial_production_mom": ".economic.macro_euro",
+    "macro_euro_manufacturing_pmi": ".economic.macro_euro",
+    "macro_euro_ppi_mom": ".economic.macro_euro",
+    "macro_euro_retail_sales_mom": ".economic.macro_euro",
+    "macro_euro_sentix_investor_confidence": ".economic.macro_euro",
+    "macro_euro_services_pmi": ".economic.macro_euro",
+    "macro_euro_trade_balance": ".economic.macro_euro",
+    "macro_euro_unemployment_rate_mom": ".economic.macro_euro",
+    "macro_euro_zew_economic_sentiment": ".economic.macro_euro",
+    "macro_euro_lme_holding": ".economic.macro_euro",
+    "macro_euro_lme_stock": ".economic.macro_euro",
+    "macro_bank_australia_interest_rate": ".economic.macro_bank",
+    "macro_bank_brazil_interest_rate": ".economic.macro_bank",
+    "macro_bank_china_interest_rate": ".economic.macro_bank",
+    "macro_bank_english_interest_rate": ".economic.macro_bank",
+    "macro_bank_euro_interest_rate": ".economic.macro_bank",
+    "macro_bank_india_interest_rate": ".economic.macro_bank",
+    "macro_bank_japan_interest_rate": ".economic.macro_bank",
+    "macro_bank_newzealand_interest_rate": ".economic.macro_bank",
+    "macro_bank_russia_interest_rate": ".economic.macro_bank",
+    "macro_bank_switzerland_interest_rate": ".economic.macro_bank",
+    "macro_bank_usa_interest_rate": ".economic.macro_bank",
+    "index_yw": ".index.index_yw",
+    "index_csindex_all": ".index.index_csindex",
+    "index_stock_info": ".index.index_cons",
+    "index_stock_cons": ".index.index_cons",
+    "index_stock_cons_sina": ".index.index_cons",
+    "index_stock_cons_csindex": ".index.index_cons",
+    "index_stock_cons_weight_csindex": ".index.index_cons",
+    "stock_a_code_to_symbol": ".index.index_cons",
+    "stock_account_statistics_em": ".stock_feature.stock_account_em",
+    "futures_rule": ".futures.futures_rule",
+    "stock_sy_profile_em": ".stock_feature.stock_sy_em",
+    "stock_sy_yq_em": ".stock_feature.stock_sy_em",
+    "stock_sy_jz_em": ".stock_feature.stock_sy_em",
+    "stock_sy_em": ".stock_feature.stock_sy_em",
+    "stock_sy_hy_em": ".stock_feature.stock_sy_em",
+    "stock_gpzy_pledge_ratio_em": ".stock_feature.stock_gpzy_em",
+    "stock_gpzy_profile_em": ".stock_feature.stock_gpzy_em",
+    "stock_gpzy_distribute_statistics_bank_em": ".stock_feature.stock_gpzy_em",
+    "stock_gpzy_distribute_statistics_company_em": ".stock_feature.stock_gpzy_em",
+    "stock_gpzy_industry_data_em": ".stock_feature.stock_gpzy_em",
+    "stock_gpzy_pledge_ratio_detail_em": ".stock_feature.stock_gpzy_em",
+    "stock_gpzy_individual_pledge_ratio_detail_em": ".stock_feature.stock_gpzy_em",
+    "stock_jgdy_tj_em": ".stock_feature.stock_jgdy_em",
+    "stock_jgdy_detail_em": ".stock_feature.stock_jgdy_em",
+    "futures_main_sina": ".futures_derivative.futures_index_sina",
+    "futures_display_main_sina": ".futures_derivative.futures_index_sina",
+    "macro_cnbs": ".economic.marco_cnbs",
+    "spot_goods": ".index.index_spot",
+    "energy_carbon_domestic": ".energy.energy_carbon",
+    "energy_carbon_bj": ".energy.energy_carbon",
+    "energy_carbon_eu": ".energy.energy_carbon",
+    "energy_carbon_gz": ".energy.energy_carbon",
+    "energy_carbon_hb": ".energy.energy_carbon",
+    "energy_carbon_sz": ".energy.energy_carbon",
+    "amac_manager_info": ".fund.fund_amac",
+    "amac_member_info": ".fund.fund_amac",
+    "amac_member_sub_info": ".fund.fund_amac",
+    "amac_aoin_info": ".fund.fund_amac",
+    "amac_fund_account_info": ".fund.fund_amac",
+    "amac_fund_info": ".fund.fund_amac",
+    "amac_fund_sub_info": ".fund.fund_amac",
+    "amac_futures_info": ".fund.fund_amac",
+    "amac_manager_cancelled_info": ".fund.fund_amac",
+    "amac_securities_info": ".fund.fund_amac",
+    "amac_fund_abs": ".fund.fund_amac",
+    "amac_manager_classify_info": ".fund.fund_amac",
+    "amac_person_fund_org_list": ".fund.fund_amac",
+    "amac_person_bond_org_list": ".fund.fund_amac",
+    "sw_index_third_cons": ".index.index_sw",
+    "sw_index_first_info": ".index.index_sw",
+    "sw_index_second_info": ".index.index_sw",
+    "sw_index_third_info": ".index.index_sw",
+    "article_epu_index": ".article.epu_index",
+    "air_quality_hebei": ".air.air_hebei",
+    "sunrise_daily": ".air.sunrise_tad",
+    "sunrise_monthly": ".air.sunrise_tad",
+    "stock_zh_a_tick_tx_js": ".stock.stock_zh_a_tick_tx",
+    "stock_zh_index_daily": ".index.index_stock_zh",
+    "stock_zh_index_spot_sina": ".index.index_stock_zh",
+    "stock_zh_index_spot_em": ".index.index_stock_zh",
+    "stock_zh_index_daily_tx": ".index.index_stock_zh",
+    "stock_zh_index_daily_em": ".index.index_stock_zh",
+    "futures_foreign_commodity_realtime": ".futures.futures_hq_sina",
+    "futures_foreign_commodity_subscribe_exchange_symbol": ".futures.futures_hq_sina",
+    "futures_hq_subscribe_exchange_symbol": ".futures.futures_hq_sina",
+    "article_ff_crr": ".article.ff_factor",
+    "article_oman_rv": ".article.risk_rv",
+    "article_oman_rv_short": ".article.risk_rv",
+    "article_rlab_rv": ".article.risk_rv",
+    "bank_fjcf_table_detail": ".bank.bank_cbirc_2020",
+    "stock_zh_kcb_spot": ".stock.stock_zh_kcb_sina",
+    "stock_zh_kcb_daily": ".stock.stock_zh_kcb_sina",
+    "stock_zh_a_spot": ".stock.stock_zh_a_sina",
+    "stock_zh_a_daily": ".stock.stock_zh_a_sina",
+    "stock_zh_a_minute": ".stock.stock_zh_a_sina",
+    "stock_zh_a_cdr_daily": ".stock.stock_zh_a_sina",
+    "stock_zh_ah_spot": ".stock.stock_zh_ah_tx",
+    "stock_zh_ah_daily": ".stock.stock_zh_ah_tx",
+    "stock_zh_ah_name": ".stock.stock_zh_ah_tx",
+    "crypto_js_spot": ".economic.macro_other",
+    "option_finance_board": ".option.option_finance",
+    "option_finance_sse_underlying": ".option.option_finance",
+    "stock_us_daily": ".stock.stock_us_sina",
+    "stock_us_spot": ".stock.stock_us_sina",
+    "get_us_stock_name": ".stock.stock_us_sina",
+    "stock_hk_daily": ".stock.stock_hk_sina",
+    "stock_hk_spot": ".stock.stock_hk_sina",
+    "futures_spot_sys": ".futures_derivative.futures_spot_sys",
+    "macro_cons_gold": ".economic.macro_constitute",
+    "macro_cons_silver": ".economic.macro_constitute",
+    "macro_cons_opec_month": ".economic.macro_constitute",
+    "macro_usa_eia_crude_rate": ".economic.macro_usa",
+    "macro_usa_non_farm": ".economic.macro_usa",
+    "macro_usa_unemployment_rate": ".economic.macro_usa",
+    "macro_usa_adp_employment": ".economic.macro_usa",
+    "macro_usa_core_pce_price": ".economic.macro_usa",
+    "macro_usa_cpi_monthly": ".economic.macro_usa",
+    "macro_usa_cpi_yoy": ".economic.macro_usa",
+    "macro_usa_crude_inner": ".economic.macro_usa",
+    "macro_usa_gdp_monthly": ".economic.macro_usa",
+    "macro_usa_initial_jobless": ".economic.macro_usa",
+    "macro_usa_lmci": ".economic.macro_usa",
+    "macro_usa_api_crude_stock": ".economic.macro_usa",
+    "macro_usa_building_permits": ".economic.macro_usa",
+    "macro_usa_business_inventories": ".economic.macro_usa",
+    "macro_usa_cb_consumer_confidence": ".economic.macro_usa",
+    "macro_usa_core_cpi_monthly": ".economic.macro_usa",
+    "macro_usa_core_ppi": ".economic.macro_usa",
+    "macro_usa_current_account": ".economic.macro_usa",
+    "macro_usa_durable_goods_orders": ".economic.macro_usa",
+    "macro_usa_trade_balance": ".economic.macro_usa",
+    "macro_usa_spcs20": ".economic.macro_usa",
+    "macro_usa_services_pmi": ".economic.macro_usa",
+    "macro_usa_rig_count": ".economic.macro_usa",
+    "macro_usa_retail_sales": ".economic.macro_usa",
+    "macro_usa_real_consumer_spending": ".economic.macro_usa",
+    "macro_usa_ppi": ".economic.macro_usa",
+    "macro_usa_pmi": ".economic.macro_usa",
+    "macro_usa_personal_spending": ".economic.macro_usa",
+    "macro_usa_pending_home_sales": ".economic.macro_usa",
+    "macro_usa_nfib_small_business": ".economic.macro_usa",
+    "macro_usa_new_home_sales": ".economic.macro_usa",
+    "macro_usa_nahb_house_market_index": ".economic.macro_usa",
+    "macro_usa_michigan_consumer_sentiment": ".economic.macro_usa",
+    "macro_usa_exist_home_sales": ".economic.macro_usa",
+    "macro_usa_export_price": ".economic.macro_usa",
+    "macro_usa_factory_orders": ".economic.macro_usa",
+    "macro_usa_house_price_index": ".economic.macro_usa",
+    "macro_usa_house_starts": ".economic.macro_usa",
+    "macro_usa_import_price": ".economic.macro_usa",
+    "macro_usa_industrial_production": ".economic.macro_usa",
+    "macro_usa_ism_non_pmi": ".economic.macro_usa",
+    "macro_usa_ism_pmi": ".economic.macro_usa",
+    "macro_usa_job_cuts": ".economic.macro_usa",
+    "macro_usa_cftc_nc_holding": ".economic.macro_usa",
+    "macro_usa_cftc_c_holding": ".economic.macro_usa",
+    "macro_usa_cftc_merchant_currency_holding": ".economic.macro_usa",
+    "macro_usa_cftc_merchant_goods_holding": ".economic.macro_usa",
+    "macro_usa_cme_merchant_goods_holding": ".economic.macro_usa",
+    "macro_usa_phs": ".economic.macro_usa",
+    "macro_china_bank_financing": ".economic.macro_china",
+    "macro_china_insurance_income": ".economic.macro_china",
+    "macro_china_mobile_number": ".economic.macro_china",
+    "macro_china_vegetable_basket": ".economic.macro_china",
+    "macro_china_agricultural_product": ".economic.macro_china",
+    "macro_china_agricultural_index": ".economic.macro_china",
+    "macro_china_energy_index": ".economic.macro_china",
+    "macro_china_commodity_price_index": ".economic.macro_china",
+    "macro_global_sox_index": ".economic.macro_china",
+    "macro_china_yw_electronic_index": ".economic.macro_china",
+    "macro_china_construction_index": ".economic.macro_china",
+    "macro_china_construction_price_index": ".economic.macro_china",
+    "macro_china_lpi_index": ".economic.macro_china",
+    "macro_china_bdti_index": ".economic.macro_china",
+    "macro_china_bsi_index": ".economic.macro_china",
+    "macro_china_cpi_monthly": ".economic.macro_china",
+    "macro_china_cpi_yearly": ".economic.macro_china",
+    "macro_china_m2_yearly": ".economic.macro_china",
+    "macro_china_fx_reserves_yearly": ".economic.macro_china",
+    "macro_china_cx_pmi_yearly": ".economic.macro_china",
+    "macro_china_pmi_yearly": ".economic.macro_china",
+    "macro_china_daily_energy": ".economic.macro_china",
+    "macro_china_non_man_pmi": ".economic.macro_china",
+    "macro_china_rmb": ".economic.macro_china",
+    "macro_china_gdp_yearly": ".economic.macro_china",
+    "macro_china_shrzgm": ".economic.macro_china",
+    "macro_china_ppi_yearly": ".economic.macro_china",
+    "macro_china_cx_services_pmi_yearly": ".economic.macro_china",
+    "macro_china_market_margin_sh": ".economic.macro_china",
+    "macro_china_market_margin_sz": ".economic.macro_china",
+    "macro_china_au_report": ".economic.macro_china",
+    "macro_china_exports_yoy": ".economic.macro_china",
+    "macro_china_hk_market_info": ".economic.macro_china",
+    "macro_china_imports_yoy": ".economic.macro_china",
+    "macro_china_trade_balance": ".economic.macro_china",
+    "macro_china_shibor_all": ".economic.macro_china",
+    "macro_china_industrial_production_yoy": ".economic.macro_china",
+    "macro_china_gyzjz": ".economic.macro_china",
+    "macro_china_lpr": ".economic.macro_china",
+    "macro_china_new_house_price": ".economic.macro_china",
+    "macro_china_enterprise_boom_index": ".economic.macro_china",
+    "macro_china_national_tax_receipts": ".economic.macro_china",
+    "macro_china_new_financial_credit": ".economic.macro_china",
+    "macro_china_fx_gold": ".economic.macro_china",
+    "macro_china_money_supply": ".economic.macro_china",
+    "macro_china_stock_market_cap": ".economic.macro_china",
+    "macro_china_cpi": ".economic.macro_china",
+    "macro_china_gdp": ".economic.macro_china",
+    "macro_china_ppi": ".economic.macro_china",
+    "macro_china_pmi": ".economic.macro_china",
+    "macro_china_gdzctz": ".economic.macro_china",
+    "macro_china_hgjck": ".economic.macro_china",
+    "macro_china_czsr": ".economic.macro_china",
+    "macro_china_whxd": ".economic.macro_china",
+    "macro_china_wbck": ".economic.macro_china",
+    "macro_china_xfzxx": ".economic.macro_china",
+    "macro_china_reserve_requirement_ratio": ".economic.macro_china",
+    "macro_china_consumer_goods_retail": ".economic.macro_china",
+    "macro_china_society_electricity": ".economic.macro_china",
+    "macro_china_society_traffic_volume": ".economic.macro_china",
+    "macro_china_postal_telecommunicational": ".economic.macro_china",
+    "macro_china_international_tourism_fx": ".economic.macro_china",
+    "macro_china_passenger_load_factor": ".economic.macro_china",
+    "macro_china_freight_index": ".economic.macro_china",
+    "macro_china_central_bank_balance": ".economic.macro_china",
+    "macro_china_insurance": ".economic.macro_china",
+    "macro_china_supply_of_money": ".economic.macro_china",
+    "macro_china_foreign_exchange_gold": ".economic.macro_china",
+    "macro_china_retail_price_index": ".economic.macro_china",
+    "macro_china_real_estate": ".economic.macro_china",
+    "macro_china_qyspjg": ".economic.macro_china",
+    "macro_china_fdi": ".economic.macro_china",
+    "macro_shipping_bci": ".economic.macro_china",
+    "macro_shipping_bcti": ".economic.macro_china",
+    "macro_shipping_bdi": ".economic.macro_china",
+    "macro_shipping_bpi": ".economic.macro_china",
+    "macro_china_urban_unemployment": ".economic.macro_china",
+    "macro_china_nbs_nation": ".economic.macro_china_nbs",
+    "macro_china_nbs_region": ".economic.macro_china_nbs",
+    "fx_pair_quote": ".fx.fx_quote",
+    "fx_spot_quote": ".fx.fx_quote",
+    "fx_swap_quote": ".fx.fx_quote",
+    "bond_spot_quote": ".bond.bond_china",
+    "bond_spot_deal": ".bond.bond_china",
+    "bond_china_yield": ".bond.bond_china",
+    "option_hist_dce": ".option.option_commodity",
+    "option_hist_czce": ".option.option_commodity",
+    "option_hist_shfe": ".option.option_commodity",
+    "option_vol_gfex": ".option.option_commodity",
+    "option_hist_gfex": ".option.option_commodity",
+    "option_vol_shfe": ".option.option_commodity",
+    "futures_inventory_99": ".futures.futures_inventory_99",
+    "futures_inventory_em": ".futures.futures_inventory_em",
+    "bond_debt_nafmii": ".bond.bond_nafmii",
+    "qhkc_tool_foreign": ".qhkc_web.qhkc_tool",
+    "qhkc_tool_gdp": ".qhkc_web.qhkc_tool",
+    "get_qhkc_index": ".qhkc_web.qhkc_index",
+    "get_qhkc_index_trend": ".qhkc_web.qhkc_index",
+    "get_qhkc_index_profit_loss": ".qhkc_web.qhkc_index",
+    "get_qhkc_fund_money_change": ".qhkc_web.qhkc_fund",
+    "get_qhkc_fund_bs": ".qhkc_web.qhkc_fund",
+    "get_qhkc_fund_position": ".qhkc_web.qhkc_fund",
+    "futures_spot_price_daily": ".futures.futures_basis",
+    "futures_spot_price": ".futures.futures_basis",
+    "futures_spot_price_previous": ".futures.futures_basis",
+    "get_rank_sum_daily": ".futures.cot",
+    "get_rank_sum": ".futures.cot",
+    "get_rank_sum_batch": ".futures.cot",
+    "get_shfe_rank_table": ".futures.cot",
+    "get_rank_table_czce": ".futures.cot",
+    "get_dce_rank_table": ".futures.cot",
+    "get_cffex_rank_table": ".futures.cot",
+    "futures_dce_position_rank": ".futures.cot",
+    "futures_dce_position_rank_other": ".futures.cot",
+    "futures_gfex_position_rank": ".futures.cot",
+    "get_receipt": ".futures.receipt",
+    "get_roll_yield_bar": ".futures.futures_roll_yield",
+    "get_roll_yield": ".futures.futures_roll_yield",
+    "get_roll_yield_panel": ".futures.futures_roll_yield",
+    "roll_yield_from_panel": ".futures.futures_roll_yield",
+    "get_cffex_daily": ".futures.futures_daily_bar",
+    "get_czce_daily": ".futures.futures_daily_bar",
+    "get_shfe_daily": ".futures.futures_daily_bar",
+    "get_dce_daily": ".futures.futures_daily_bar",
+    "get_futures_daily": ".futures.futures_daily_bar",
+    "get_futures_daily_batch": ".futures.futures_daily_bar",
+    "get_ine_daily": ".futures.futures_daily_bar",
+    "get_gfex_daily": ".futures.futures_daily_bar",
+    "futures_hist_daily_cffex": ".futures.futures_daily_bar",
+    "fund_individual_basic_info_xq": ".fund.fund_xq",
+    "fund_individual_achievement_xq": ".fund.fund_xq",
+    "fund_individual_analysis_xq": ".fund.fund_xq",
+    "fund_individual_profit_probability_xq": ".fund.fund_xq",
+    "fund_individual_detail_info_xq": ".fund.fund_xq",
+    "fund_individual_detail_hold_xq": ".fund.fund_xq",
+    "AkshareException": ".exceptions",
+    "APIError": ".exceptions",
+    "DataParsingError": ".exceptions",
+    "InvalidParameterError": ".exceptions",
+    "NetworkError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "pro_api": ".pro.data_pro",
+    "set_token": ".utils.token_process",
+    "get_token": ".utils.token_process",
+    "compact_dtypes": ".utils.schema",
+    "register_schema": ".utils.schema",
+    "set_compact_dtypes": ".utils.schema",
+    "set_output_format": ".utils.output",
+    "set_parse_workers": ".utils.parse_pool",
+    "get_trade_calendar": ".utils.trade_calendar",
+}
+
+# NOTE(akshare): 第三方可选依赖, 未安装时访问会抛出 AttributeError
+OPTIONAL_EXPORTS = {
+    "xt_api": "akqmt",
+}
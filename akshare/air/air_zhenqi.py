@@ -17,7 +17,7 @@ import pandas as pd
 import requests
 from py_mini_racer import MiniRacer
 
-from ..utils import demjson
+from ..utils import relaxed_json
 
 
 def _get_js_path(name: str = None, module_file: str = None) -> str:
@@ -134,7 +134,7 @@ def air_quality_watch_point(
     }
     r = requests.post(url, data=payload, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(ctx.call("decode_result", data_text))
+    data_json = relaxed_json.decode(ctx.call("decode_result", data_text))
     temp_df = pd.DataFrame(data_json["rows"])
     return temp_df
 
@@ -208,7 +208,7 @@ def air_quality_hist(
     params = {"param": ctx.call("encode_param", need)}
     r = requests.post(url, data=params, headers=headers)
     temp_text = ctx.call("decryptData", r.text)
-    data_json = demjson.decode(ctx.call("b.decode", temp_text))
+    data_json = relaxed_json.decode(ctx.call("b.decode", temp_text))
     temp_df = pd.DataFrame(data_json["result"]["data"]["rows"])
     temp_df.index = temp_df["time"]
     del temp_df["time"]
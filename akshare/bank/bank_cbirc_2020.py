@@ -16,6 +16,7 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
 from .cons import cbirc_headers_without_cookie_2020
 
 
@@ -123,7 +124,7 @@ def bank_fjcf_table_detail(
     :rtype: pandas.DataFrame
     """
     id_list = bank_fjcf_page_url(page=page, item=item, begin=begin)["docId"]
-    big_df = pd.DataFrame()
+    big_list = []
     for item in id_list:
         url = f"https://www.nfra.gov.cn/cn/static/data/DocInfo/SelectByDocId/data_docId={item}.json"
         res = requests.get(url)
@@ -160,11 +161,12 @@ def bank_fjcf_table_detail(
             table_list.append(res.json()["data"]["publishDate"])
             table_df = pd.DataFrame(table_list)
             table_df.columns = ["内容"]
-            big_df = pd.concat(objs=[big_df, table_df.T], ignore_index=True)
+            big_list.append(table_df.T)
             # 解决有些页面缺少字段的问题, 都放到 try 里面
         except:  # noqa: E722
             warnings.warn(f"{item} 不是表格型数据，将跳过采集")
             continue
+    big_df = concat_pages(big_list)
     if big_df.empty:
         return pd.DataFrame()
     big_df.columns = [
@@ -10,6 +10,8 @@ import pandas as pd
 
 import requests
 
+from ..utils.kline import parse_klines
+
 
 def bond_sh_buy_back_em() -> pd.DataFrame:
     """
@@ -182,23 +184,26 @@ def bond_buy_back_hist_em(symbol: str = "204001"):
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+        ],
+        dtypes={"日期": "str", "-": "str"},
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -211,12 +216,6 @@ def bond_buy_back_hist_em(symbol: str = "204001"):
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
     return temp_df
 
 
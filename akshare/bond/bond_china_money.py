@@ -10,6 +10,7 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -335,14 +336,15 @@ def macro_china_bond_public() -> pd.DataFrame:
     r = requests.post(url, data=payload, headers=headers)
     data_json = r.json()
     total_page = int(data_json["data"]["pageTotalSize"]) + 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         payload.update({"pageNo": page})
         r = requests.post(url, data=payload, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["records"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "债券全称",
         "债券类型",
@@ -11,7 +11,7 @@ import pandas as pd
 import requests
 import time
 
-from ..utils import demjson
+from ..utils import relaxed_json
 
 
 def bond_cb_index_jsl() -> pd.DataFrame:
@@ -23,7 +23,7 @@ def bond_cb_index_jsl() -> pd.DataFrame:
     """
     url = "https://www.jisilu.cn/webapi/cb/index_history/"
     r = requests.get(url)
-    data_dict = demjson.decode(r.text)["data"]
+    data_dict = relaxed_json.decode(r.text)["data"]
     temp_df = pd.DataFrame(data_dict)
     return temp_df
 
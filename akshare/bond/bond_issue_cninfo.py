@@ -8,23 +8,8 @@ http://webapi.cninfo.com.cn/#/thematicStatistics
 
 import pandas as pd
 import requests
-import py_mini_racer
 
-from ..datasets import get_ths_js
-
-
-def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+from ..utils.js_pool import js_call
 
 
 def bond_treasure_issue_cninfo(
@@ -41,10 +26,7 @@ def bond_treasure_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1120"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
@@ -137,10 +119,7 @@ def bond_local_government_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1121"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
@@ -233,10 +212,7 @@ def bond_corporate_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1122"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
@@ -333,10 +309,7 @@ def bond_cov_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1123"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
@@ -486,10 +459,7 @@ def bond_cov_stock_issue_cninfo() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1124"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
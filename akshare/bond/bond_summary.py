@@ -6,11 +6,11 @@ Desc: 上登债券信息网-债券成交概览
 http://bond.sse.com.cn/data/statistics/overview/turnover/
 """
 
-from io import BytesIO
-
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def bond_cash_summary_sse(date: str = "20210111") -> pd.DataFrame:
     """
@@ -32,7 +32,7 @@ def bond_cash_summary_sse(date: str = "20210111") -> pd.DataFrame:
         "TRADE_DATE": f"{date[:4]}-{date[4:6]}-{date[6:]}",
     }
     r = requests.get(url, params=params, headers=headers)
-    temp_df = pd.read_excel(BytesIO(r.content), engine="xlrd")
+    temp_df = read_excel(r.content, engine="xlrd")
     temp_df.columns = [
         "债券现货",
         "托管只数",
@@ -67,7 +67,7 @@ def bond_deal_summary_sse(date: str = "20210104") -> pd.DataFrame:
         "TRADE_DATE": f"{date[:4]}-{date[4:6]}-{date[6:]}",
     }
     r = requests.get(url, params=params, headers=headers)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df.columns = [
         "债券类型",
         "当日成交笔数",
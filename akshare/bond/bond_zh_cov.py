@@ -10,7 +10,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from .cons import (
@@ -19,10 +18,11 @@ from .cons import (
     zh_sina_bond_hs_cov_url,
     zh_sina_bond_hs_cov_hist_url,
 )
-from ..stock.cons import hk_js_decode
-from ..utils import demjson
-from ..utils.func import fetch_paginated_data
+from ..utils import relaxed_json
+from ..utils.func import concat_pages, fetch_paginated_data
 from ..utils.tqdm import get_tqdm
+from ..utils.sina_decode import hk_js_decode_frame
+from ..utils.kline import parse_klines
 
 
 def _get_zh_bond_hs_cov_page_count() -> int:
@@ -50,15 +50,16 @@ def bond_zh_hs_cov_spot() -> pd.DataFrame:
     :return: 所有沪深可转债在当前时刻的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_list = []
     page_count = _get_zh_bond_hs_cov_page_count()
     zh_sina_bond_hs_payload_copy = zh_sina_bond_hs_cov_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
         res = requests.get(zh_sina_bond_hs_cov_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(res.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = relaxed_json.decode(res.text)
+        big_list.append(pd.DataFrame(data_json))
+    big_df = concat_pages(big_list)
     return big_df
 
 
@@ -76,12 +77,7 @@ def bond_zh_hs_cov_daily(symbol: str = "sh010107") -> pd.DataFrame:
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = hk_js_decode_frame(r.text.split("=")[1].split(";")[0].replace('"', ""))
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
     return data_df
 
@@ -106,7 +102,7 @@ def _code_id_map() -> dict:
         "fs": "m:1 t:2,m:1 t:23",
         "fields": "f3,f12",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df["market_id"] = 1
     temp_df.rename(columns={"f12": "sh_code", "market_id": "sh_id"}, inplace=True)
     code_id_dict = dict(zip(temp_df["sh_code"], temp_df["sh_id"]))
@@ -122,7 +118,7 @@ def _code_id_map() -> dict:
         "fs": "m:0 t:6,m:0 t:80",
         "fields": "f3,f12",
     }
-    temp_df_sz = fetch_paginated_data(url, params)
+    temp_df_sz = fetch_paginated_data(url, params, output="pandas")
     temp_df_sz["sz_id"] = 0
     code_id_dict.update(dict(zip(temp_df_sz["f12"], temp_df_sz["sz_id"])))
     return code_id_dict
@@ -165,29 +161,23 @@ def bond_zh_hs_cov_min(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "最新价",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "最新价",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(
             str
         )  # show datatime here
@@ -213,35 +203,26 @@ def bond_zh_hs_cov_min(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         temp_df = temp_df[
             [
@@ -282,26 +263,22 @@ def bond_zh_hs_cov_pre_min(symbol: str = "sh113570") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
-    temp_df.columns = [
-        "时间",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "最新价",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["trends"],
+        columns=[
+            "时间",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "最新价",
+        ],
+        dtypes={"时间": "str"},
+    )
     temp_df.index = pd.to_datetime(temp_df["时间"])
     temp_df.reset_index(drop=True, inplace=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
     temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
     return temp_df
 
@@ -332,14 +309,15 @@ def bond_zh_cov() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.columns = [
         "债券代码",
@@ -483,7 +461,7 @@ def bond_cov_comparison() -> pd.DataFrame:
         "fields": "f1,f152,f2,f3,f12,f13,f14,f227,f228,f229,f230,f231,f232,f233,f234,"
         "f235,f236,f237,f238,f239,f240,f241,f242,f26,f243",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -11,17 +11,17 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
+from ..utils.func import concat_pages
 from .cons import (
     zh_sina_bond_hs_count_url,
     zh_sina_bond_hs_payload,
     zh_sina_bond_hs_url,
     zh_sina_bond_hs_hist_url,
 )
-from ..stock.cons import hk_js_decode
-from ..utils import demjson
+from ..utils import relaxed_json
 from ..utils.tqdm import get_tqdm
+from ..utils.sina_decode import hk_js_decode_frame
 
 
 def get_zh_bond_hs_page_count() -> int:
@@ -57,15 +57,16 @@ def bond_zh_hs_spot(start_page: str = "1", end_page: str = "10") -> pd.DataFrame
     page_count = int(page_count)
     zh_sina_bond_hs_payload_copy = zh_sina_bond_hs_payload.copy()
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    big_list = []
     start_page = int(start_page)
     end_page = int(end_page) + 1 if int(end_page) + 1 <= page_count else page_count
     for page in tqdm(range(start_page, end_page), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
         r = requests.get(zh_sina_bond_hs_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(r.text)
+        data_json = relaxed_json.decode(r.text)
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "代码",
         "-",
@@ -129,12 +130,7 @@ def bond_zh_hs_daily(symbol: str = "sh010107") -> pd.DataFrame:
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行 js 解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = hk_js_decode_frame(r.text.split("=")[1].split(";")[0].replace('"', ""))
     data_df["date"] = pd.to_datetime(data_df["date"], errors="coerce").dt.date
     data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
     data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
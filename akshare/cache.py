@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: Redis 缓存管理命令行
+python -m akshare.cache stats                  各函数命中率/耗时/流量（需开启 AKSHARE_CACHE_STATS_REDIS）
+python -m akshare.cache clear --func em:hy_to_ids
+python -m akshare.cache clear --pattern "ak:akshare.stock.*"
+python -m akshare.cache inspect "ak:a:*"
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from tabulate import tabulate
+
+from .utils.redis_cache import RedisLRUCache, _tagged_loads, summarize_stats
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def cache_stats(cache: RedisLRUCache) -> List[dict]:
+    """
+    读取各 worker 汇总到 Redis 的缓存统计
+    :param cache: 缓存实例
+    :type cache: RedisLRUCache
+    :return: 每个函数一行统计
+    :rtype: list
+    """
+    redis_client = cache._get_redis_client()
+    stats_prefix = f"{cache.prefix}:stats:"
+    rows = []
+    for key in cache.scan_keys(f"{stats_prefix}*"):
+        raw = redis_client.hgetall(key)
+        counts = {}
+        for field, value in raw.items():
+            value = _decode(value)
+            counts[_decode(field)] = float(value) if "." in value else int(value)
+        row = {"func": _decode(key)[len(stats_prefix):]}
+        row.update(summarize_stats(counts))
+        rows.append(row)
+    return sorted(rows, key=lambda item: item["func"])
+
+
+def cache_inspect(cache: RedisLRUCache, pattern: str, limit: int = 50) -> List[dict]:
+    """
+    查看匹配键的剩余时间、大小和内容概要
+    :param cache: 缓存实例
+    :type cache: RedisLRUCache
+    :param pattern: 键匹配模式
+    :type pattern: str
+    :param limit: 最多显示的键数量
+    :type limit: int
+    :return: 每个键一行信息
+    :rtype: list
+    """
+    redis_client = cache._get_redis_client()
+    rows = []
+    for key in cache.scan_keys(pattern):
+        if len(rows) >= limit:
+            break
+        row = {"key": _decode(key), "ttl": redis_client.ttl(key)}
+        key_type = _decode(redis_client.type(key))
+        if key_type != "string":
+            row.update({"bytes": None, "format": key_type, "value": ""})
+            rows.append(row)
+            continue
+        data = redis_client.get(key)
+        if data is None:
+            continue
+        row["bytes"] = len(data)
+        row["format"] = {b"A": "arrow", b"P": "pickle"}.get(data[:1], "pickle")
+        try:
+            value = _tagged_loads(data)
+            shape = getattr(value, "shape", None)
+            row["value"] = type(value).__name__ + (f"{shape}" if shape else "")
+        except Exception:
+            row["value"] = _decode(data[:40])
+        rows.append(row)
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m akshare.cache", description="AKShare Redis 缓存管理"
+    )
+    parser.add_argument("--url", help="Redis 连接串, 默认取环境变量 REDIS_URL")
+    parser.add_argument("--prefix", help="缓存键前缀, 默认取环境变量 AKSHARE_CACHE_PREFIX")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="显示各函数的缓存统计")
+
+    clear_parser = subparsers.add_parser("clear", help="使用 SCAN + UNLINK 分批清除缓存")
+    target = clear_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--func", help="函数标识, 即 func_key 或 模块名.函数名")
+    target.add_argument("--pattern", help="键匹配模式")
+    target.add_argument("--all", action="store_true", help="清除前缀下的所有键")
+
+    inspect_parser = subparsers.add_parser("inspect", help="查看匹配键的信息")
+    inspect_parser.add_argument("pattern", help="键匹配模式")
+    inspect_parser.add_argument("--limit", type=int, default=50, help="最多显示的键数量")
+
+    args = parser.parse_args(argv)
+    cache = RedisLRUCache(redis_url=args.url, prefix=args.prefix)
+
+    if args.command == "stats":
+        rows = cache_stats(cache)
+        if not rows:
+            print("暂无统计数据, 请在 worker 中设置 AKSHARE_CACHE_STATS_REDIS=1")
+            return 0
+        print(tabulate(rows, headers="keys", floatfmt=".3f"))
+    elif args.command == "clear":
+        if args.func:
+            base = f"{cache.prefix}:{args.func}"
+            deleted = cache.clear_prefix(base) + cache.clear_prefix(f"{base}:*")
+        else:
+            deleted = cache.clear_prefix(None if args.all else args.pattern)
+        print(f"已删除 {deleted} 个键")
+    elif args.command == "inspect":
+        rows = cache_inspect(cache, args.pattern, limit=args.limit)
+        print(tabulate(rows, headers="keys") if rows else "没有匹配的键")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
+
 
 def macro_cons_gold() -> pd.DataFrame:
     """
@@ -36,14 +38,14 @@ def macro_cons_gold() -> pd.DataFrame:
         "max_date": "",
         "_": str(int(round(t * 1000))),
     }
-    big_df = pd.DataFrame()
+    big_list = []
     while True:
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -54,6 +56,7 @@ def macro_cons_gold() -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "日期",
         "总库存",
@@ -101,14 +104,14 @@ def macro_cons_silver() -> pd.DataFrame:
         "max_date": "",
         "_": str(int(round(t * 1000))),
     }
-    big_df = pd.DataFrame()
+    big_list = []
     while True:
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -119,6 +122,7 @@ def macro_cons_silver() -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "日期",
         "总库存",
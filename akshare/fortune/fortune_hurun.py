@@ -12,6 +12,8 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.func import concat_pages
+
 
 def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.DataFrame:
     """
@@ -62,7 +64,7 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
         warnings.warn("正在下载中")
         offset = 0
         limit = 20
-        big_df = pd.DataFrame()
+        big_list = []
         while offset < 2200:
             try:
                 params.update(
@@ -76,10 +78,11 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
                 data_json = r.json()
                 temp_df = pd.DataFrame(data_json["rows"])
                 offset = offset + 20
-                big_df = pd.concat([big_df, temp_df], ignore_index=True)
+                big_list.append(temp_df)
             except requests.exceptions.JSONDecodeError:
                 offset = offset + 40
                 continue
+        big_df = concat_pages(big_list)
         big_df.rename(
             columns={
                 "hs_Rank_Rich_Ranking": "排名",
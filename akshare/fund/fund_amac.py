@@ -6,9 +6,12 @@ Desc: 中国证券投资基金业协会-信息公示数据
 中国证券投资基金业协会-新版: https://gs.amac.org.cn
 """
 
+from typing import Dict, Iterator
+
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages, iter_pages, paginated
 from ..utils.tqdm import get_tqdm
 
 headers = {
@@ -39,6 +42,35 @@ def get_data(url: str = "", payload: str = "") -> pd.DataFrame:
     return json_df
 
 
+def _iter_amac_pages(url: str, params: Dict) -> Iterator[pd.DataFrame]:
+    """
+    中国证券投资基金业协会-信息公示-逐页获取数据, 页码从 0 开始
+    :param url: 接口地址
+    :type url: str
+    :param params: 请求参数, 其中的 page 会被逐页替换
+    :type params: dict
+    :return: 每一页的原始数据
+    :rtype: Iterator[pandas.DataFrame]
+    """
+    params = params.copy()
+    params.update({"page": 0})
+    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    data_json = r.json()
+    total_page = int(data_json["totalPages"])
+    # NOTE(akshare): 第一页在获取总页数时已经取到, 不再重复请求
+    yield pd.DataFrame(data_json["content"])
+
+    def _fetch_page(page: int) -> pd.DataFrame:
+        page_params = params.copy()
+        page_params.update({"page": page})
+        r = requests.post(
+            url, params=page_params, json={}, verify=False, headers=headers
+        )
+        return pd.DataFrame(r.json()["content"])
+
+    yield from iter_pages(_fetch_page, range(1, total_page))
+
+
 # 中国证券投资基金业协会-信息公示-会员信息
 # 中国证券投资基金业协会-信息公示-会员信息-会员机构综合查询
 def amac_member_info() -> pd.DataFrame:
@@ -57,14 +89,15 @@ def amac_member_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     keys_list = [
         "managerName",
         "memberBehalf",
@@ -147,7 +180,7 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
     )
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
@@ -160,7 +193,8 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
         )
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     keys_list = [
         "orgName",
         "orgType",
@@ -237,7 +271,8 @@ def amac_person_bond_org_list() -> pd.DataFrame:
 
 # 中国证券投资基金业协会-信息公示-私募基金管理人公示
 # 中国证券投资基金业协会-信息公示-私募基金管理人公示-私募基金管理人综合查询
-def amac_manager_info() -> pd.DataFrame:
+@paginated
+def amac_manager_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-私募基金管理人公示-私募基金管理人综合查询
     https://gs.amac.org.cn/amac-infodisc/res/pof/manager/index.html
@@ -250,48 +285,39 @@ def amac_manager_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "managerName",
-        "artificialPersonName",
-        "primaryInvestType",
-        "registerProvince",
-        "registerNo",
-        "establishDate",
-        "registerDate",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "私募基金管理人名称",
-        "法定代表人/执行事务合伙人(委派代表)姓名",
-        "机构类型",
-        "注册地",
-        "登记编号",
-        "成立时间",
-        "登记时间",
-    ]
-    manager_data_out["成立时间"] = pd.to_datetime(
-        manager_data_out["成立时间"], unit="ms"
-    ).dt.date
-    manager_data_out["登记时间"] = pd.to_datetime(
-        manager_data_out["登记时间"], unit="ms"
-    ).dt.date
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "managerName",
+            "artificialPersonName",
+            "primaryInvestType",
+            "registerProvince",
+            "registerNo",
+            "establishDate",
+            "registerDate",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "私募基金管理人名称",
+            "法定代表人/执行事务合伙人(委派代表)姓名",
+            "机构类型",
+            "注册地",
+            "登记编号",
+            "成立时间",
+            "登记时间",
+        ]
+        manager_data_out["成立时间"] = pd.to_datetime(
+            manager_data_out["成立时间"], unit="ms"
+        ).dt.date
+        manager_data_out["登记时间"] = pd.to_datetime(
+            manager_data_out["登记时间"], unit="ms"
+        ).dt.date
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-私募基金管理人公示-私募基金管理人分类公示
-def amac_manager_classify_info() -> pd.DataFrame:
+@paginated
+def amac_manager_classify_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-私募基金管理人公示-私募基金管理人分类公示
     https://gs.amac.org.cn/amac-infodisc/res/pof/manager/managerList.html
@@ -304,65 +330,58 @@ def amac_manager_classify_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "managerName",
-        "artificialPersonName",
-        "primaryInvestType",
-        "registerNo",
-        "registerProvince",
-        "officeAdrAgg",
-        "establishDate",
-        "registerDate",
-        "fundCount",
-        "memberType",
-        "hasSpecialTips",
-        "hasCreditTips",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "私募基金管理人名称",
-        "法定代表人/执行事务合伙人(委派代表)姓名",
-        "机构类型",
-        "登记编号",
-        "注册地",
-        "办公地",
-        "成立时间",
-        "登记时间",
-        "在管基金数量",
-        "会员类型",
-        "是否有提示信息",
-        "是否有诚信信息",
-    ]
-    manager_data_out["成立时间"] = pd.to_datetime(
-        manager_data_out["成立时间"], unit="ms"
-    ).dt.date
-    manager_data_out["登记时间"] = pd.to_datetime(
-        manager_data_out["登记时间"], unit="ms"
-    ).dt.date
-    manager_data_out["在管基金数量"] = pd.to_numeric(manager_data_out["在管基金数量"])
-    manager_data_out["是否有提示信息"] = manager_data_out["是否有提示信息"].map(
-        {True: "是", False: "否"}
-    )
-    manager_data_out["是否有诚信信息"] = manager_data_out["是否有诚信信息"].map(
-        {True: "是", False: "否"}
-    )
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "managerName",
+            "artificialPersonName",
+            "primaryInvestType",
+            "registerNo",
+            "registerProvince",
+            "officeAdrAgg",
+            "establishDate",
+            "registerDate",
+            "fundCount",
+            "memberType",
+            "hasSpecialTips",
+            "hasCreditTips",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "私募基金管理人名称",
+            "法定代表人/执行事务合伙人(委派代表)姓名",
+            "机构类型",
+            "登记编号",
+            "注册地",
+            "办公地",
+            "成立时间",
+            "登记时间",
+            "在管基金数量",
+            "会员类型",
+            "是否有提示信息",
+            "是否有诚信信息",
+        ]
+        manager_data_out["成立时间"] = pd.to_datetime(
+            manager_data_out["成立时间"], unit="ms"
+        ).dt.date
+        manager_data_out["登记时间"] = pd.to_datetime(
+            manager_data_out["登记时间"], unit="ms"
+        ).dt.date
+        manager_data_out["在管基金数量"] = pd.to_numeric(
+            manager_data_out["在管基金数量"]
+        )
+        manager_data_out["是否有提示信息"] = manager_data_out["是否有提示信息"].map(
+            {True: "是", False: "否"}
+        )
+        manager_data_out["是否有诚信信息"] = manager_data_out["是否有诚信信息"].map(
+            {True: "是", False: "否"}
+        )
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-私募基金管理人公示-证券公司私募基金子公司管理人信息公示
-def amac_member_sub_info() -> pd.DataFrame:
+@paginated
+def amac_member_sub_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-私募基金管理人公示-证券公司私募基金子公司管理人信息公示
     https://gs.amac.org.cn/amac-infodisc/res/pof/member/index.html?primaryInvestType=private
@@ -375,39 +394,29 @@ def amac_member_sub_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "managerName",
-        "memberBehalf",
-        "memberType",
-        "memberCode",
-        "memberDate",
-        "primaryInvestType",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "机构（会员）名称",
-        "会员代表",
-        "会员类型",
-        "会员编号",
-        "入会时间",
-        "公司类型",
-    ]
-    manager_data_out["入会时间"] = pd.to_datetime(
-        manager_data_out["入会时间"], unit="ms"
-    ).dt.date
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "managerName",
+            "memberBehalf",
+            "memberType",
+            "memberCode",
+            "memberDate",
+            "primaryInvestType",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "机构（会员）名称",
+            "会员代表",
+            "会员类型",
+            "会员编号",
+            "入会时间",
+            "公司类型",
+        ]
+        manager_data_out["入会时间"] = pd.to_datetime(
+            manager_data_out["入会时间"], unit="ms"
+        ).dt.date
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-基金产品
@@ -436,14 +445,15 @@ def amac_fund_info(start_page: str = "1", end_page: str = "2000") -> pd.DataFram
         real_end_page = int(end_page)
     else:
         real_end_page = total_page
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(int(start_page) - 1, real_end_page), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     keys_list = [
         "fundName",
         "managerName",
@@ -473,7 +483,8 @@ def amac_fund_info(start_page: str = "1", end_page: str = "2000") -> pd.DataFram
 
 
 # 中国证券投资基金业协会-信息公示-基金产品-证券公司集合资管产品公示
-def amac_securities_info() -> pd.DataFrame:
+@paginated
+def amac_securities_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-基金产品公示-证券公司集合资管产品公示
     https://gs.amac.org.cn/amac-infodisc/res/pof/securities/index.html
@@ -486,48 +497,39 @@ def amac_securities_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "cpmc",
-        "cpbm",
-        "gljg",
-        "slrq",
-        "dqr",
-        "tzlx",
-        "sffj",
-        "tgjg",
-        "barq",
-        "yzzt",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "产品名称",
-        "产品编码",
-        "管理人名称",
-        "成立日期",
-        "到期时间",
-        "投资类型",
-        "是否分级",
-        "托管人名称",
-        "备案日期",
-        "运作状态",
-    ]
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "cpmc",
+            "cpbm",
+            "gljg",
+            "slrq",
+            "dqr",
+            "tzlx",
+            "sffj",
+            "tgjg",
+            "barq",
+            "yzzt",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "产品名称",
+            "产品编码",
+            "管理人名称",
+            "成立日期",
+            "到期时间",
+            "投资类型",
+            "是否分级",
+            "托管人名称",
+            "备案日期",
+            "运作状态",
+        ]
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-基金产品-证券公司直投基金
-def amac_aoin_info() -> pd.DataFrame:
+@paginated
+def amac_aoin_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-基金产品公示-证券公司直投基金
     https://gs.amac.org.cn/amac-infodisc/res/aoin/product/index.html
@@ -540,41 +542,32 @@ def amac_aoin_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "code",
-        "name",
-        "aoinName",
-        "managerName",
-        "createDate",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "产品编码",
-        "产品名称",
-        "直投子公司",
-        "管理机构",
-        "设立日期",
-    ]
-    manager_data_out["设立日期"] = pd.to_datetime(
-        manager_data_out["设立日期"], unit="ms"
-    ).dt.date
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "code",
+            "name",
+            "aoinName",
+            "managerName",
+            "createDate",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "产品编码",
+            "产品名称",
+            "直投子公司",
+            "管理机构",
+            "设立日期",
+        ]
+        manager_data_out["设立日期"] = pd.to_datetime(
+            manager_data_out["设立日期"], unit="ms"
+        ).dt.date
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-基金产品公示-证券公司私募投资基金
-def amac_fund_sub_info() -> pd.DataFrame:
+@paginated
+def amac_fund_sub_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-基金产品公示-证券公司私募投资基金
     https://gs.amac.org.cn/amac-infodisc/res/pof/subfund/index.html
@@ -587,46 +580,37 @@ def amac_fund_sub_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "productCode",
-        "productName",
-        "mgrName",
-        "trustee",
-        "foundDate",
-        "registeredDate",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "产品编码",
-        "产品名称",
-        "私募基金管理人名称",
-        "托管人名称",
-        "成立日期",
-        "备案日期",
-    ]
-    manager_data_out["备案日期"] = pd.to_datetime(
-        manager_data_out["备案日期"], unit="ms"
-    ).dt.date
-    manager_data_out["成立日期"] = pd.to_datetime(
-        manager_data_out["成立日期"], unit="ms"
-    ).dt.date
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "productCode",
+            "productName",
+            "mgrName",
+            "trustee",
+            "foundDate",
+            "registeredDate",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "产品编码",
+            "产品名称",
+            "私募基金管理人名称",
+            "托管人名称",
+            "成立日期",
+            "备案日期",
+        ]
+        manager_data_out["备案日期"] = pd.to_datetime(
+            manager_data_out["备案日期"], unit="ms"
+        ).dt.date
+        manager_data_out["成立日期"] = pd.to_datetime(
+            manager_data_out["成立日期"], unit="ms"
+        ).dt.date
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-基金产品公示-基金公司及子公司集合资管产品公示
-def amac_fund_account_info() -> pd.DataFrame:
+@paginated
+def amac_fund_account_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-基金产品公示-基金公司及子公司集合资管产品公示
     https://gs.amac.org.cn/amac-infodisc/res/fund/account/index.html
@@ -643,39 +627,30 @@ def amac_fund_account_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "registerDate",
-        "registerCode",
-        "name",
-        "manager",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "成立日期",
-        "产品编码",
-        "产品名称",
-        "管理人名称",
-    ]
-    manager_data_out["成立日期"] = pd.to_datetime(
-        manager_data_out["成立日期"], unit="ms"
-    ).dt.date
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "registerDate",
+            "registerCode",
+            "name",
+            "manager",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "成立日期",
+            "产品编码",
+            "产品名称",
+            "管理人名称",
+        ]
+        manager_data_out["成立日期"] = pd.to_datetime(
+            manager_data_out["成立日期"], unit="ms"
+        ).dt.date
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-基金产品公示-资产支持专项计划
-def amac_fund_abs() -> pd.DataFrame:
+@paginated
+def amac_fund_abs() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-基金产品公示-资产支持专项计划公示信息
     https://gs.amac.org.cn/amac-infodisc/res/fund/abs/index.html
@@ -688,53 +663,48 @@ def amac_fund_abs() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    big_df.reset_index(inplace=True)
-    big_df["index"] = range(1, len(big_df) + 1)
-    big_df.columns = [
-        "编号",
-        "_",
-        "_",
-        "专项计划全称",
-        "备案编号",
-        "管理人",
-        "托管人",
-        "备案通过时间",
-        "成立日期",
-        "预期到期时间",
-    ]
-    big_df["备案通过时间"] = pd.to_datetime(big_df["备案通过时间"], unit="ms").dt.date
-    big_df["成立日期"] = pd.to_datetime(big_df["成立日期"], unit="ms").dt.date
-    big_df["预期到期时间"] = pd.to_datetime(
-        big_df["预期到期时间"], unit="ms", errors="coerce"
-    ).dt.date
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in _iter_amac_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "编号",
-            "备案编号",
+            "_",
+            "_",
             "专项计划全称",
+            "备案编号",
             "管理人",
             "托管人",
+            "备案通过时间",
             "成立日期",
             "预期到期时间",
-            "备案通过时间",
         ]
-    ]
-    return big_df
+        temp_df["备案通过时间"] = pd.to_datetime(
+            temp_df["备案通过时间"], unit="ms"
+        ).dt.date
+        temp_df["成立日期"] = pd.to_datetime(temp_df["成立日期"], unit="ms").dt.date
+        temp_df["预期到期时间"] = pd.to_datetime(
+            temp_df["预期到期时间"], unit="ms", errors="coerce"
+        ).dt.date
+        temp_df = temp_df[
+            [
+                "编号",
+                "备案编号",
+                "专项计划全称",
+                "管理人",
+                "托管人",
+                "成立日期",
+                "预期到期时间",
+                "备案通过时间",
+            ]
+        ]
+        start += len(temp_df)
+        yield temp_df
 
 
 # 中国证券投资基金业协会-信息公示-基金产品公示-期货公司集合资管产品公示
-def amac_futures_info() -> pd.DataFrame:
+@paginated
+def amac_futures_info() -> Iterator[pd.DataFrame]:
     """
     中国证券投资基金业协会-信息公示-基金产品公示-期货公司集合资管产品公示
     https://gs.amac.org.cn/amac-infodisc/res/pof/futures/index.html
@@ -747,44 +717,34 @@ def amac_futures_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-    data_json = r.json()
-    total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(0, int(total_page)), leave=False):
-        params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    keys_list = [
-        "mpiName",
-        "mpiProductCode",
-        "aoiName",
-        "mpiTrustee",
-        "mpiCreateDate",
-        "tzlx",
-        "sfjgh",
-        "registeredDate",
-        "dueDate",
-        "fundStatus",
-    ]  # 定义要取的 value 的 keys
-    manager_data_out = pd.DataFrame(big_df)
-    manager_data_out = manager_data_out[keys_list]
-    manager_data_out.columns = [
-        "产品名称",
-        "产品编码",
-        "管理人名称",
-        "托管人名称",
-        "成立日期",
-        "投资类型",
-        "是否分级",
-        "备案日期",
-        "到期日",
-        "运作状态",
-    ]
-    return manager_data_out
+    for temp_df in _iter_amac_pages(url, params):
+        keys_list = [
+            "mpiName",
+            "mpiProductCode",
+            "aoiName",
+            "mpiTrustee",
+            "mpiCreateDate",
+            "tzlx",
+            "sfjgh",
+            "registeredDate",
+            "dueDate",
+            "fundStatus",
+        ]  # 定义要取的 value 的 keys
+        manager_data_out = pd.DataFrame(temp_df)
+        manager_data_out = manager_data_out[keys_list]
+        manager_data_out.columns = [
+            "产品名称",
+            "产品编码",
+            "管理人名称",
+            "托管人名称",
+            "成立日期",
+            "投资类型",
+            "是否分级",
+            "备案日期",
+            "到期日",
+            "运作状态",
+        ]
+        yield manager_data_out
 
 
 # 中国证券投资基金业协会-信息公示-诚信信息
@@ -808,14 +768,15 @@ def amac_manager_cancelled_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     keys_list = [
         "orgName",
         "orgCode",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2026/1/20 17:00
+Date: 2026/10/17 10:00
 Desc: 东方财富网站-天天基金网-基金数据-开放式基金净值
 https://fund.eastmoney.com/manager/default.html#dt14;mcreturnjson;ftall;pn20;pi1;scabbname;stasc
 1.基金经理基本数据, 建议包含:基金经理代码,基金经理姓名,从业起始日期,现任基金公司,管理资产总规模,上述数据可在"基金经理列表:
@@ -17,15 +17,18 @@ https://fundf10.eastmoney.com/jjjl_001810.html
 
 import json
 import math
+import re
 import time
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from ..utils import demjson
+from ..request import get as request_get
+from ..utils import relaxed_json
 from ..utils.cons import headers
+from ..utils.parse_pool import read_html
 from ..utils.tqdm import get_tqdm
 
 
@@ -45,7 +48,7 @@ def fund_purchase_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var reData="))
+    data_json = relaxed_json.decode(data_text.strip("var reData="))
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = temp_df.index + 1
@@ -106,7 +109,7 @@ def fund_name_em() -> pd.DataFrame:
     url = "https://fund.eastmoney.com/js/fundcode_search.js"
     r = requests.get(url, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data.strip("var r = ")[:-1])
+    data_json = relaxed_json.decode(text_data.strip("var r = ")[:-1])
     temp_df = pd.DataFrame(data_json)
     temp_df.columns = ["基金代码", "拼音缩写", "基金简称", "基金类型", "拼音全称"]
     return temp_df
@@ -286,7 +289,7 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = relaxed_json.decode(text_data.strip("var db="))
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -330,36 +333,85 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     return data_df
 
 
-def fund_open_fund_info_em(
-    symbol: str = "710001", indicator: str = "单位净值走势", period: str = "成立来"
-) -> pd.DataFrame:
+_PINGZHONGDATA_INDICATORS = {
+    "单位净值走势": "Data_netWorthTrend",
+    "累计净值走势": "Data_ACWorthTrend",
+    "每万份收益": "Data_millionCopiesIncome",
+    "7日年化收益率": "Data_sevenDaysYearIncome",
+    "同类排名走势": "Data_rateInSimilarType",
+    "同类排名百分比": "Data_rateInSimilarPersent",
+}
+
+_PINGZHONGDATA_VAR_RE = re.compile(r"\bvar\s+([\w$]+)\s*=\s*")
+# 赋值语句的值: 跳过引号内的分号, 直到语句结尾的分号
+_PINGZHONGDATA_VALUE_RE = re.compile(
+    r"""(?:"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*'|[^;"'])*"""
+)
+
+
+def _parse_pingzhongdata(data_text: str) -> dict:
     """
-    东方财富网-天天基金网-基金数据-开放式基金净值
-    https://fund.eastmoney.com/fund.html
-    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    解析天天基金 pingzhongdata 脚本中全部的 var X = ...; 赋值
+    脚本只包含字面量赋值, 直接按 JSON 逐个解析, 不需要 V8 执行
+    :param data_text: 脚本内容
+    :type data_text: str
+    :return: 变量名和对应的值
+    :rtype: dict
+    """
+    decoder = json.JSONDecoder()
+    data_dict = {}
+    pos = 0
+    while True:
+        match = _PINGZHONGDATA_VAR_RE.search(data_text, pos)
+        if match is None:
+            break
+        start = match.end()
+        try:
+            value, pos = decoder.raw_decode(data_text, start)
+        except json.JSONDecodeError:
+            # 单引号字符串等非标准 JSON 的字面量
+            pos = _PINGZHONGDATA_VALUE_RE.match(data_text, start).end()
+            try:
+                value = relaxed_json.decode(data_text[start:pos])
+            except Exception:
+                # NOTE(akshare): 非字面量的赋值不是数据, 直接跳过
+                continue
+        data_dict[match.group(1)] = value
+    return data_dict
+
+
+def _fund_pingzhongdata(symbol: str) -> dict:
+    """
+    天天基金网-基金数据-pingzhongdata 脚本中的全部数据
+    https://fund.eastmoney.com/pingzhongdata/710001.js
+    :param symbol: 基金代码
     :type symbol: str
-    :param indicator: 需要获取的指标
-    :type indicator: str
-    :param period: "成立来"; choice of {"1月", "3月", "6月", "1年", "3年", "5年", "今年来", "成立来"}
-    :type period: str
-    :return: 指定基金指定指标的数据
-    :rtype: pandas.DataFrame
+    :return: 变量名和对应的值
+    :rtype: dict
     """
-    from ..utils.cons import headers
-
     url = f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"  # 各类数据都在里面
-    r = requests.get(url, headers=headers)
-    data_text = r.text
+    # NOTE(akshare): 经过 akshare.request 复用连接, 同时按 host 限速并使用全局代理设置
+    r = request_get(url, headers=headers, timeout=15)
+    r.raise_for_status()
+    return _parse_pingzhongdata(r.text)
 
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(data_text)
 
+def _pingzhongdata_frame(indicator: str, data_dict: dict) -> pd.DataFrame:
+    """
+    将 pingzhongdata 中指定指标的数据整理为 pandas.DataFrame
+    :param indicator: 指标, choice of _PINGZHONGDATA_INDICATORS
+    :type indicator: str
+    :param data_dict: _parse_pingzhongdata 的解析结果
+    :type data_dict: dict
+    :return: 指定指标的数据
+    :rtype: pandas.DataFrame
+    """
+    data_json = data_dict.get(_PINGZHONGDATA_INDICATORS[indicator])
+    temp_df = pd.DataFrame(data_json)
+    if temp_df.empty:
+        return pd.DataFrame()
     # 单位净值走势
     if indicator == "单位净值走势":
-        data_json = js_code.execute("Data_netWorthTrend")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
         )
@@ -386,10 +438,6 @@ def fund_open_fund_info_em(
 
     # 累计净值走势
     if indicator == "累计净值走势":
-        data_json = js_code.execute("Data_ACWorthTrend")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
         temp_df.columns = ["x", "y"]
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
@@ -413,10 +461,6 @@ def fund_open_fund_info_em(
 
     # 每万份收益
     if indicator == "每万份收益":
-        data_json = js_code.execute("Data_millionCopiesIncome")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
         temp_df.columns = ["x", "y"]
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
@@ -440,10 +484,6 @@ def fund_open_fund_info_em(
 
     # 7日年化收益率
     if indicator == "7日年化收益率":
-        data_json = js_code.execute("Data_sevenDaysYearIncome")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
         temp_df.columns = ["x", "y"]
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
@@ -467,40 +507,8 @@ def fund_open_fund_info_em(
         )
         return temp_df
 
-    # 累计收益率走势
-    if indicator == "累计收益率走势":
-        url = "https://api.fund.eastmoney.com/pinzhong/LJSYLZS"
-        headers = {"Referer": "https://fund.eastmoney.com/"}
-        period_map = {
-            "1月": "m",
-            "3月": "q",
-            "6月": "hy",
-            "1年": "y",
-            "3年": "try",
-            "5年": "fiy",
-            "今年来": "sy",
-            "成立来": "se",
-        }
-        params = {
-            "fundCode": symbol,
-            "indexcode": "000300",
-            "type": period_map[period],
-        }
-        r = requests.get(url, params=params, headers=headers)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["Data"][0]["data"])
-        temp_df.columns = ["日期", "累计收益率"]
-        temp_df["日期"] = pd.to_datetime(
-            temp_df["日期"], unit="ms", utc=True
-        ).dt.tz_convert("Asia/Shanghai")
-        temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-        temp_df["累计收益率"] = pd.to_numeric(temp_df["累计收益率"], errors="coerce")
-        return temp_df
-
     # 同类排名走势
     if indicator == "同类排名走势":
-        data_json = js_code.execute("Data_rateInSimilarType")
-        temp_df = pd.DataFrame(data_json)
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
         )
@@ -530,8 +538,6 @@ def fund_open_fund_info_em(
 
     # 同类排名百分比
     if indicator == "同类排名百分比":
-        data_json = js_code.execute("Data_rateInSimilarPersent")
-        temp_df = pd.DataFrame(data_json)
         temp_df.columns = ["x", "y"]
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
@@ -554,16 +560,69 @@ def fund_open_fund_info_em(
             temp_df["同类型排名-每日近3月收益排名百分比"], errors="coerce"
         )
         return temp_df
+    return pd.DataFrame()
+
+
+def fund_open_fund_info_em(
+    symbol: str = "710001", indicator: str = "单位净值走势", period: str = "成立来"
+) -> pd.DataFrame:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    :type symbol: str
+    :param indicator: 需要获取的指标
+    :type indicator: str
+    :param period: "成立来"; choice of {"1月", "3月", "6月", "1年", "3年", "5年", "今年来", "成立来"}
+    :type period: str
+    :return: 指定基金指定指标的数据
+    :rtype: pandas.DataFrame
+    """
+    from ..utils.cons import headers
+
+    # 单位净值走势、累计净值走势、每万份收益、7日年化收益率、同类排名走势、同类排名百分比
+    if indicator in _PINGZHONGDATA_INDICATORS:
+        return _pingzhongdata_frame(indicator, _fund_pingzhongdata(symbol))
+
+    # 累计收益率走势
+    if indicator == "累计收益率走势":
+        url = "https://api.fund.eastmoney.com/pinzhong/LJSYLZS"
+        headers = {"Referer": "https://fund.eastmoney.com/"}
+        period_map = {
+            "1月": "m",
+            "3月": "q",
+            "6月": "hy",
+            "1年": "y",
+            "3年": "try",
+            "5年": "fiy",
+            "今年来": "sy",
+            "成立来": "se",
+        }
+        params = {
+            "fundCode": symbol,
+            "indexcode": "000300",
+            "type": period_map[period],
+        }
+        r = requests.get(url, params=params, headers=headers)
+        data_json = r.json()
+        temp_df = pd.DataFrame(data_json["Data"][0]["data"])
+        temp_df.columns = ["日期", "累计收益率"]
+        temp_df["日期"] = pd.to_datetime(
+            temp_df["日期"], unit="ms", utc=True
+        ).dt.tz_convert("Asia/Shanghai")
+        temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
+        temp_df["累计收益率"] = pd.to_numeric(temp_df["累计收益率"], errors="coerce")
+        return temp_df
 
     # 分红送配详情
     if indicator == "分红送配详情":
         url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
         r = requests.get(url, headers=headers)
-        table_num = len(pd.read_html(StringIO(r.text)))
+        table_num = len(read_html(r.text))
         if table_num == 3:
-            temp_df = pd.read_html(StringIO(r.text))[1]
+            temp_df = read_html(r.text)[1]
         else:
-            temp_df = pd.read_html(StringIO(r.text))[0]
+            temp_df = read_html(r.text)[0]
         if temp_df.iloc[0, 1] == "暂无分红信息!":
             return pd.DataFrame()
         else:
@@ -573,11 +632,11 @@ def fund_open_fund_info_em(
     if indicator == "拆分详情":
         url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
         r = requests.get(url, headers=headers)
-        table_num = len(pd.read_html(StringIO(r.text)))
+        table_num = len(read_html(r.text))
         if table_num == 3:
-            temp_df = pd.read_html(StringIO(r.text))[2]
+            temp_df = read_html(r.text)[2]
         else:
-            temp_df = pd.read_html(StringIO(r.text))[1]
+            temp_df = read_html(r.text)[1]
         if temp_df.iloc[0, 1] == "暂无拆分信息!":
             return pd.DataFrame()
         else:
@@ -585,6 +644,102 @@ def fund_open_fund_info_em(
     return pd.DataFrame()
 
 
+def fund_open_fund_info_em_bundle(symbol: str = "710001") -> Dict[str, pd.DataFrame]:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-全部指标
+    只下载并解析一次 pingzhongdata 脚本, 返回其中的全部指标
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    :type symbol: str
+    :return: 指标名称和对应的数据, 指标与 fund_open_fund_info_em 的 indicator 一致:
+    {"单位净值走势", "累计净值走势", "每万份收益", "7日年化收益率", "同类排名走势", "同类排名百分比"}
+    :rtype: dict
+    """
+    data_dict = _fund_pingzhongdata(symbol)
+    return {
+        indicator: _pingzhongdata_frame(indicator, data_dict)
+        for indicator in _PINGZHONGDATA_INDICATORS
+    }
+
+
+def fund_open_fund_info_em_batch(
+    symbol_list: List[str],
+    indicator_list: Optional[List[str]] = None,
+    max_workers: int = 8,
+) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-多只基金
+    每只基金只下载并解析一次 pingzhongdata 脚本, 多只基金并发获取; 单只基金获取失败不影响其余结果
+    https://fund.eastmoney.com/fund.html
+    :param symbol_list: 基金代码列表
+    :type symbol_list: list
+    :param indicator_list: 需要的指标, 默认为 fund_open_fund_info_em_bundle 中的全部指标
+    :type indicator_list: list
+    :param max_workers: 并发获取的线程数
+    :type max_workers: int
+    :return: (指标名称和对应的数据, 获取失败的 symbol、error), 每个指标的数据第一列为基金代码; 失败的可稍后重新获取
+    :rtype: tuple
+    """
+    symbol_list = list(dict.fromkeys(symbol_list))
+    if indicator_list is None:
+        indicator_list = list(_PINGZHONGDATA_INDICATORS)
+    for indicator in indicator_list:
+        if indicator not in _PINGZHONGDATA_INDICATORS:
+            raise ValueError(
+                f"indicator_list 只能包含 {list(_PINGZHONGDATA_INDICATORS)}"
+            )
+
+    def _fetch(symbol: str) -> Dict[str, pd.DataFrame]:
+        data_dict = _fund_pingzhongdata(symbol)
+        # NOTE(akshare): 解析结果在线程内即整理为所需指标, 不保留原始脚本
+        return {
+            indicator: _pingzhongdata_frame(indicator, data_dict)
+            for indicator in indicator_list
+        }
+
+    bundle_dict = {}
+    failed_dict = {}
+    tqdm = get_tqdm()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        future_symbol = {
+            executor.submit(_fetch, symbol): symbol for symbol in symbol_list
+        }
+        for future in tqdm(
+            as_completed(future_symbol), total=len(future_symbol), leave=False
+        ):
+            symbol = future_symbol[future]
+            try:
+                bundle_dict[symbol] = future.result()
+            except Exception as e:
+                failed_dict[symbol] = repr(e)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    result_dict = {}
+    for indicator in indicator_list:
+        temp_list = []
+        for symbol in symbol_list:
+            if symbol not in bundle_dict:
+                continue
+            temp_df = bundle_dict[symbol][indicator]
+            if not temp_df.empty:
+                temp_df.insert(0, "基金代码", symbol)
+                temp_list.append(temp_df)
+        if temp_list:
+            result_dict[indicator] = pd.concat(temp_list, ignore_index=True)
+        else:
+            result_dict[indicator] = pd.DataFrame(columns=["基金代码"])
+    failed_df = pd.DataFrame(
+        [
+            {"symbol": symbol, "error": failed_dict[symbol]}
+            for symbol in symbol_list
+            if symbol in failed_dict
+        ],
+        columns=["symbol", "error"],
+    )
+    return result_dict, failed_df
+
+
 def fund_money_fund_daily_em() -> pd.DataFrame:
     """
     东方财富网-天天基金网-基金数据-货币型基金收益
@@ -595,8 +750,8 @@ def fund_money_fund_daily_em() -> pd.DataFrame:
     url = "https://fund.eastmoney.com/HBJJ_pjsyl.html"
     r = requests.get(url, headers=headers)
     r.encoding = "gb2312"
-    show_day = pd.read_html(StringIO(r.text))[1].iloc[0, 5:11].tolist()
-    temp_df = pd.read_html(StringIO(r.text))[1].iloc[1:, 2:]
+    show_day = read_html(r.text)[1].iloc[0, 5:11].tolist()
+    temp_df = read_html(r.text)[1].iloc[1:, 2:]
     temp_df_columns = temp_df.iloc[0, :].tolist()[1:]
     temp_df = temp_df.iloc[1:, 1:]
     temp_df.columns = temp_df_columns
@@ -777,7 +932,7 @@ def fund_financial_fund_info_em(symbol: str = "000134") -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data[text_data.find("{") : -1])
+    data_json = relaxed_json.decode(text_data[text_data.find("{") : -1])
     temp_df = pd.DataFrame(data_json["Data"]["LSJZList"])
     temp_df.columns = [
         "净值日期",
@@ -839,7 +994,7 @@ def fund_graded_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = relaxed_json.decode(text_data.strip("var db="))
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -953,8 +1108,8 @@ def fund_etf_fund_daily_em() -> pd.DataFrame:
     url = "https://fund.eastmoney.com/cnjy_dwjz.html"
     r = requests.get(url, headers=headers)
     r.encoding = "gb2312"
-    show_day = pd.read_html(StringIO(r.text))[1].iloc[0, 6:10].tolist()
-    temp_df = pd.read_html(StringIO(r.text))[1].iloc[1:, 2:]
+    show_day = read_html(r.text)[1].iloc[0, 6:10].tolist()
+    temp_df = read_html(r.text)[1].iloc[1:, 2:]
     temp_df_columns = temp_df.iloc[0, :].tolist()[1:]
     temp_df = temp_df.iloc[1:, 1:]
     temp_df.columns = temp_df_columns
@@ -1283,6 +1438,15 @@ if __name__ == "__main__":
     )
     print(fund_open_fund_info_em_df)
 
+    fund_open_fund_info_em_bundle_dict = fund_open_fund_info_em_bundle(symbol="710001")
+    print(fund_open_fund_info_em_bundle_dict["单位净值走势"])
+
+    fund_open_fund_info_em_batch_dict, failed_df = fund_open_fund_info_em_batch(
+        symbol_list=["710001", "000001"], indicator_list=["单位净值走势"]
+    )
+    print(fund_open_fund_info_em_batch_dict["单位净值走势"])
+    print(failed_df)
+
     fund_money_fund_daily_em_df = fund_money_fund_daily_em()
     print(fund_money_fund_daily_em_df)
 
@@ -13,6 +13,7 @@ import pandas as pd
 import requests
 
 from ..utils.func import fetch_paginated_data
+from ..utils.kline import parse_klines
 
 
 @lru_cache(
@@ -39,7 +40,7 @@ def _fund_etf_code_id_map_em() -> dict:
         "fs": "b:MK0021,b:MK0022,b:MK0023,b:MK0024",
         "fields": "f3,f12,f13",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
     return temp_dict
 
@@ -72,7 +73,7 @@ def fund_etf_spot_em() -> pd.DataFrame:
             "f136,f152,f184,f297,f402,f441"
         ),
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.rename(
         columns={
             "f12": "代码",
@@ -291,32 +292,25 @@ def fund_etf_hist_em(
             data_json = r.json()
     if not (data_json["data"] and data_json["data"]["klines"]):
         return pd.DataFrame()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "str"},
+    )
     temp_df.index = pd.to_datetime(temp_df["日期"], errors="coerce")
     temp_df.reset_index(inplace=True, drop=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     return temp_df
 
 
@@ -372,29 +366,23 @@ def fund_etf_hist_min_em(
         }
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "均价",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "均价",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["均价"] = pd.to_numeric(temp_df["均价"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         return temp_df
     else:
@@ -411,35 +399,26 @@ def fund_etf_hist_min_em(
         }
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         temp_df = temp_df[
             [
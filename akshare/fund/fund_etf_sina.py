@@ -7,11 +7,10 @@ https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjhqetf
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from ..stock.cons import hk_js_decode
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.sina_decode import hk_js_decode_frame
 
 
 def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
@@ -42,7 +41,7 @@ def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("([") + 1 : -2])
+    data_json = relaxed_json.decode(data_text[data_text.find("([") + 1 : -2])
     temp_df = pd.DataFrame(data_json)
     if symbol == "封闭式基金":
         temp_df.columns = [
@@ -126,12 +125,7 @@ def fund_etf_hist_sina(symbol: str = "sh510050") -> pd.DataFrame:
         f"https://finance.sina.com.cn/realstock/company/{symbol}/hisdata_klc2/klc_kl.js"
     )
     r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    temp_df = pd.DataFrame(dict_list)
+    temp_df = hk_js_decode_frame(r.text.split("=")[1].split(";")[0].replace('"', ""))
     if temp_df.empty:  # 处理获取数据为空的问题
         return pd.DataFrame()
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.tz_localize(
@@ -11,6 +11,8 @@ import warnings
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def fund_etf_scale_szse() -> pd.DataFrame:
     """
@@ -34,7 +36,7 @@ def fund_etf_scale_szse() -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(r.content, engine="openpyxl", dtype={"基金代码": str})
+        temp_df = read_excel(r.content, engine="openpyxl", dtype={"基金代码": str})
     temp_df.rename(
         columns={
             "当前规模(份)": "基金份额",
@@ -9,6 +9,7 @@ https://fund.eastmoney.com/data/fundfenhong.html
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -207,7 +208,7 @@ def fund_fh_rank_em() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_text = r.text
     total_page = eval(data_text[data_text.find("=") + 1: data_text.find(";")])[0]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": str(page)})
@@ -217,7 +218,8 @@ def fund_fh_rank_em() -> pd.DataFrame:
             data_text[data_text.find("[["): data_text.find(";var fhph_jjgs")]
         )
         temp_df = pd.DataFrame(temp_list)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
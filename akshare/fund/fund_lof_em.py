@@ -13,6 +13,7 @@ import pandas as pd
 import requests
 
 from ..utils.func import fetch_paginated_data
+from ..utils.kline import parse_klines
 
 
 @lru_cache()
@@ -37,7 +38,7 @@ def _fund_lof_code_id_map_em() -> dict:
         "fs": "b:MK0404,b:MK0405,b:MK0406,b:MK0407",
         "fields": "f3,f12,f13",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
     return temp_dict
 
@@ -64,7 +65,7 @@ def fund_lof_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,"
         "f15,f16,f17,f18,f20,f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.rename(
         columns={
             "f12": "代码",
@@ -158,32 +159,25 @@ def fund_lof_hist_em(
     data_json = r.json()
     if not (data_json["data"] and data_json["data"]["klines"]):
         return pd.DataFrame()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "str"},
+    )
     temp_df.index = pd.to_datetime(temp_df["日期"])
     temp_df.reset_index(inplace=True, drop=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     return temp_df
 
 
@@ -228,29 +222,23 @@ def fund_lof_hist_min_em(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "均价",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "均价",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["均价"] = pd.to_numeric(temp_df["均价"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         return temp_df
     else:
@@ -267,35 +255,26 @@ def fund_lof_hist_min_em(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         temp_df = temp_df[
             [
@@ -9,7 +9,8 @@ https://fund.eastmoney.com/manager/default.html
 import pandas as pd
 import requests
 
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -20,7 +21,7 @@ def fund_manager_em() -> pd.DataFrame:
     :return: 基金经理大全
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_list = []
     url = "https://fund.eastmoney.com/Data/FundDataPortfolio_Interface.aspx"
     params = {
         "dt": "14",
@@ -33,7 +34,7 @@ def fund_manager_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var returnjson= "))
+    data_json = relaxed_json.decode(data_text.strip("var returnjson= "))
     total_page = data_json["pages"]
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
@@ -44,9 +45,10 @@ def fund_manager_em() -> pd.DataFrame:
         )
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text.strip("var returnjson= "))
+        data_json = relaxed_json.decode(data_text.strip("var returnjson= "))
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
     big_df.columns = [
@@ -13,7 +13,7 @@ from datetime import datetime, date
 import pandas as pd
 import requests
 
-from ..utils import demjson
+from ..utils import relaxed_json
 
 
 def __one_year_ago(date_str: str) -> date:
@@ -76,7 +76,7 @@ def fund_open_fund_rank_em(symbol: str = "全部") -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = relaxed_json.decode(data_text[data_text.find("{") : -1])
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
     temp_df.reset_index(inplace=True)
@@ -175,7 +175,7 @@ def fund_exchange_rank_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     text_data = r.text
-    json_data = demjson.decode(text_data[text_data.find("{") : -1])
+    json_data = relaxed_json.decode(text_data[text_data.find("{") : -1])
     temp_df = pd.DataFrame(json_data["datas"])
     temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
     temp_df.reset_index(inplace=True)
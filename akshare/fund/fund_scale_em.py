@@ -9,7 +9,8 @@ https://fund.eastmoney.com/data/cyrjglist.html
 import pandas as pd
 import requests
 
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.func import concat_pages
 
 
 def fund_scale_change_em() -> pd.DataFrame:
@@ -30,16 +31,17 @@ def fund_scale_change_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = relaxed_json.decode(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = relaxed_json.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.columns = [
@@ -86,16 +88,17 @@ def fund_hold_structure_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = relaxed_json.decode(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = relaxed_json.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.columns = [
@@ -6,7 +6,6 @@ Desc: 深圳证券交易所-基金规模日频数据
 https://www.szse.cn/market/fund/volume/etf/index.html
 """
 
-import io
 import random
 import warnings
 from datetime import date, datetime
@@ -14,6 +13,8 @@ from datetime import date, datetime
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def _parse_date(date_str: str) -> date:
     if len(date_str) != 8 or not date_str.isdigit():
@@ -82,7 +83,7 @@ def fund_scale_daily_szse(
     r.raise_for_status()
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(io.BytesIO(r.content), engine="openpyxl")
+        temp_df = read_excel(r.content, engine="openpyxl")
 
     temp_df = temp_df.dropna(how="all")
     if temp_df.empty:
@@ -20,18 +20,25 @@ import re
 import time
 import warnings
 import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from io import BytesIO
 from io import StringIO
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
 from . import cons
+from ..utils.local_store import get_store
+from ..utils.parse_pool import read_excel
+from ..utils.trade_calendar import get_trade_calendar
 from .requests_fun import requests_link
 from .symbol_var import symbol_varieties
 
-calendar = cons.get_calendar()
+calendar = get_trade_calendar()
 rank_columns = [
     "vol_party_name",
     "vol",
@@ -63,6 +70,7 @@ def get_rank_sum_daily(
     注1：由于上期所和中金所只公布每个品种内部的标的排名，没有公布品种的总排名;
         所以函数输出的品种排名是由品种中的每个标的加总获得，并不是真实的品种排名列表
     注2：大商所只公布了品种排名，未公布标的排名
+    注3：逐日采集, 遇到连接失败即停止; 采集较长时间段请使用 get_rank_sum_batch, 可并发采集并从中断处继续
     :param start_day: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
     :type start_day: str
     :param end_day: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
@@ -164,6 +172,16 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
         if data is False:
             return False
         big_dict.update(data)
+    return _rank_sum_records(date, big_dict, vars_list)
+
+
+def _rank_sum_records(
+    date: datetime.date, big_dict: dict, vars_list: list
+) -> pd.DataFrame:
+    """
+    由各合约的会员持仓排名表计算前 5、前 10、前 15、前 20 会员的合计, 字段同 get_rank_sum
+    """
+    czce_var = [i for i in vars_list if i in cons.market_exchange_symbols["czce"]]
     records = pd.DataFrame()
 
     for symbol, table in big_dict.items():
@@ -254,7 +272,7 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
                     [records, pd.DataFrame(big_dict, index=[0])], ignore_index=True
                 )
 
-    if len(big_dict.items()) > 0:
+    if len(big_dict.items()) > 0 and not records.empty:
         add_vars = [
             i
             for i in cons.market_exchange_symbols["dce"]
@@ -451,7 +469,7 @@ def get_rank_table_czce(date: str = "20251103") -> dict:
             f"{date.isoformat().replace('-', '')}/FutureDataHolding.xls"
         )
     r = requests.get(url, headers=headers)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
 
     temp_pinzhong_index = [
         item + 1
@@ -1328,6 +1346,224 @@ def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
     return big_dict
 
 
+RANK_SUM_MARKETS = ("DCE", "SHFE", "CZCE", "CFFEX", "GFEX")
+
+# NOTE(akshare): get_rank_sum_batch 中各交易所同时进行的请求数; 中金所按品种、广期所按合约分别请求, 单个请求较小
+RANK_SUM_CONCURRENCY = {
+    "DCE": 2,
+    "SHFE": 2,
+    "CZCE": 2,
+    "CFFEX": 3,
+    "GFEX": 3,
+}
+
+# NOTE(akshare): 有会员持仓排名数据的第一个交易日; 此后的交易日采集结果为空视为失败(各交易所函数在请求失败时也可能返回空结果),
+# 未列出的交易所在交易日历覆盖的范围内均有数据
+RANK_SUM_START_DATES = {
+    "CFFEX": datetime.date(2010, 4, 16),
+    "GFEX": datetime.date(2022, 12, 22),
+}
+
+
+def _rank_table_task(func, *args) -> dict:
+    # 各交易所函数以 False 或 None 表示连接失败
+    data = func(*args)
+    if data is False or data is None:
+        raise ConnectionError(f"{func.__name__} 获取失败")
+    return data
+
+
+def _gfex_contract_table(var: str, contract_id: str, date: str) -> dict:
+    return {
+        contract_id: __futures_gfex_contract_data(
+            symbol=var.lower(), contract_id=contract_id, date=date
+        )
+    }
+
+
+def _gfex_contract_tasks(var: str, date: str) -> list:
+    contract_list = __futures_gfex_contract_list(symbol=var.lower(), date=date)
+    return [partial(_gfex_contract_table, var, name, date) for name in contract_list]
+
+
+def _rank_sum_tasks(market: str, date: datetime.date, vars_list: list) -> list:
+    """
+    (交易所, 交易日) 的请求任务; 任务返回 {合约: 排名表}, 或返回需要继续执行的任务列表
+    """
+    if market == "DCE":
+        return [partial(_rank_table_task, futures_dce_position_rank, date, vars_list)]
+    if market == "SHFE":
+        return [partial(_rank_table_task, get_shfe_rank_table, date, vars_list)]
+    if market == "CZCE":
+        return [partial(_rank_table_task, get_rank_table_czce, date)]
+    if market == "CFFEX":
+        return [
+            partial(_rank_table_task, get_cffex_rank_table, date, [var])
+            for var in vars_list
+        ]
+    # 广州期货交易所先获取各品种的合约列表, 再按合约请求
+    return [
+        partial(_gfex_contract_tasks, var, date.strftime("%Y%m%d")) for var in vars_list
+    ]
+
+
+def get_rank_sum_batch(
+    start_day: str = "20210510",
+    end_day: str = "20210510",
+    vars_list: list = cons.contract_symbols,
+    max_workers: int = 8,
+    max_concurrency: Optional[Dict[str, int]] = None,
+    store=None,
+    refresh_empty: bool = True,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    五个期货交易所前 5、前 10、前 15、前 20 会员持仓排名数据, 按 (交易日, 交易所) 并发采集
+    中金所按品种、广期所按合约拆分请求, 各交易所同时进行的请求数分别限制; 设置 store 后每完成一个 (交易日, 交易所) 即保存,
+    中断后再次调用只采集未完成的部分; 单个请求失败只影响所在的 (交易日, 交易所), 其余结果照常返回
+    :param start_day: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type start_day: str
+    :param end_day: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为最近的有数据的交易日
+    :type end_day: str
+    :param vars_list: 合约品种如 ['RB'、'AL'] 等列表为空时为所有商品
+    :type vars_list: list
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :param max_concurrency: 各交易所同时进行的请求数 {交易所: 请求数}, 默认为 RANK_SUM_CONCURRENCY
+    :type max_concurrency: dict
+    :param store: 本地仓库目录或 LocalFrameStore
+    :type store: str or LocalFrameStore
+    :param refresh_empty: 是否重新采集本地保存为空表的 (交易日, 交易所); 各交易所函数在请求失败时也可能返回空结果, 默认重新采集
+    :type refresh_empty: bool
+    :return: (按日期及交易所排序的会员持仓排名数据, 采集失败的 market、date、error), 数据字段同 get_rank_sum;
+    RANK_SUM_START_DATES 之后的交易日采集结果为空时 error 为 "empty"
+    :rtype: tuple
+    """
+    start_day = (
+        cons.convert_date(start_day) if start_day is not None else datetime.date.today()
+    )
+    end_day = (
+        cons.convert_date(end_day)
+        if end_day is not None
+        else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
+    )
+    concurrency = {
+        **RANK_SUM_CONCURRENCY,
+        **{key.upper(): value for key, value in (max_concurrency or {}).items()},
+    }
+    day_list = calendar.range_dates(start_day, end_day)
+    store = get_store(store)
+    result = {}
+    units = {}
+    queues = {market: deque() for market in RANK_SUM_MARKETS}
+    for day in day_list:
+        for market in RANK_SUM_MARKETS:
+            market_vars = [
+                i
+                for i in vars_list
+                if i in cons.market_exchange_symbols[market.lower()]
+            ]
+            if not market_vars:
+                continue
+            key = (market, day)
+            if store is not None:
+                # NOTE(akshare): 保存时记录采集的品种, 已保存的品种覆盖本次的品种时才跳过
+                df = store.get(
+                    f"rank_sum/{market}",
+                    day.strftime("%Y%m%d"),
+                    skip_empty=refresh_empty,
+                )
+                if df is not None and set(market_vars) <= set(
+                    df.attrs.get("vars_list", [])
+                ):
+                    result[key] = df[df["variety"].isin(market_vars)] if len(df) else df
+                    continue
+            tasks = _rank_sum_tasks(market, day, market_vars)
+            units[key] = {
+                "vars_list": market_vars,
+                "pending": len(tasks),
+                "tables": {},
+                "error": None,
+            }
+            queues[market].extend((key, task) for task in tasks)
+
+    failed_list = []
+
+    def finish_task(key):
+        unit = units[key]
+        unit["pending"] -= 1
+        if unit["pending"] > 0:
+            return
+        del units[key]
+        market, day = key
+        error = unit["error"]
+        if error is None:
+            records = _rank_sum_records(day, unit["tables"], unit["vars_list"])
+            if records.empty and day >= RANK_SUM_START_DATES.get(market, day):
+                # 当天的数据可能尚未发布, 也可能是请求失败, 不保存
+                error = "empty"
+        if error is not None:
+            failed_list.append(
+                {"market": market, "date": day.strftime("%Y%m%d"), "error": error}
+            )
+            return
+        records.attrs["vars_list"] = unit["vars_list"]
+        result[key] = records
+        if store is not None:
+            store.put(f"rank_sum/{market}", day.strftime("%Y%m%d"), records)
+
+    running = {market: 0 for market in RANK_SUM_MARKETS}
+    future_dict = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while True:
+            for market, queue in queues.items():
+                while queue and running[market] < max(1, concurrency[market]):
+                    key, task = queue.popleft()
+                    if units[key]["error"] is not None:
+                        # 所在的 (交易日, 交易所) 已失败, 不再请求
+                        finish_task(key)
+                        continue
+                    future_dict[executor.submit(task)] = (key, market)
+                    running[market] += 1
+            if not future_dict:
+                break
+            done_set, _ = wait(future_dict, return_when=FIRST_COMPLETED)
+            for future in done_set:
+                key, market = future_dict.pop(future)
+                running[market] -= 1
+                unit = units[key]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    if unit["error"] is None:
+                        unit["error"] = repr(e)
+                else:
+                    if isinstance(data, list):
+                        # 合约列表: 后续请求排在该交易所队列的最前面, 尽快完成这一 (交易日, 交易所)
+                        unit["pending"] += len(data)
+                        queues[market].extendleft(
+                            (key, task) for task in reversed(data)
+                        )
+                    else:
+                        unit["tables"].update(data)
+                finish_task(key)
+
+    records_list = [
+        result[(market, day)]
+        for day in day_list
+        for market in RANK_SUM_MARKETS
+        if (market, day) in result and not result[(market, day)].empty
+    ]
+    records = (
+        pd.concat(records_list, ignore_index=True) if records_list else pd.DataFrame()
+    )
+    records.attrs = {}
+    failed_list.sort(
+        key=lambda item: (item["date"], RANK_SUM_MARKETS.index(item["market"]))
+    )
+    failed_df = pd.DataFrame(failed_list, columns=["market", "date", "error"])
+    return records, failed_df
+
+
 if __name__ == "__main__":
     # 郑州商品交易所
     get_rank_table_czce_df = get_rank_table_czce(date="20230109")
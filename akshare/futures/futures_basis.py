@@ -15,17 +15,17 @@ Desc: 生意社网站采集大宗商品现货价格及相应基差数据, 数据
 
 import datetime
 import re
-import time
 import warnings
 from typing import List
 
 import pandas as pd
 
 from . import cons
+from ..utils.trade_calendar import get_trade_calendar
 from .requests_fun import pandas_read_html_link
 from .symbol_var import chinese_to_english
 
-calendar = cons.get_calendar()
+calendar = get_trade_calendar()
 
 
 def futures_spot_price_daily(
@@ -127,8 +127,7 @@ def futures_spot_price(
                     temp_df = records.loc[var_list_in_market, :]
                     temp_df.reset_index(drop=True, inplace=True)
                     return temp_df
-                else:
-                    time.sleep(3)
+                # NOTE(akshare): 日期不匹配时直接重试, 由 100ppi.com 的令牌桶限速控制请求间隔
             except Exception as e:  # noqa: E722
                 print(
                     f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败[错误信息:{e}]，第{str(i)}次尝试，最多5次"
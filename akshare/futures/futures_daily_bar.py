@@ -8,17 +8,23 @@ Desc: 期货日线行情
 import datetime
 import json
 import re
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO, StringIO
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import requests
 
 from . import cons
+from ..utils.local_store import get_store
+from ..utils.rate_limit import get_rate_governor
+from ..utils.trade_calendar import get_trade_calendar
 from .requests_fun import requests_link
 
-calendar = cons.get_calendar()
+calendar = get_trade_calendar()
 
 
 def _futures_daily_czce(
@@ -634,6 +640,33 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
     return temp_df
 
 
+FUTURES_DAILY_FUNCS = {
+    "CFFEX": get_cffex_daily,
+    "CZCE": get_czce_daily,
+    "SHFE": get_shfe_daily,
+    "DCE": get_dce_daily,
+    "INE": get_ine_daily,
+    "GFEX": get_gfex_daily,
+}
+
+# NOTE(akshare): get_futures_daily_batch 中各交易所的限速规则 {交易所: (每秒请求数, 允许的突发请求数)}
+FUTURES_DAILY_RATE_LIMITS = {
+    "CFFEX": (2.0, 2.0),
+    "CZCE": (2.0, 2.0),
+    "SHFE": (2.0, 2.0),
+    "DCE": (2.0, 2.0),
+    "INE": (2.0, 2.0),
+    "GFEX": (2.0, 2.0),
+}
+
+# NOTE(akshare): 有日交易数据的第一个交易日; 此后的交易日返回空表视为获取失败(各交易所函数在请求失败时返回空表), 未列出的交易所在交易日历覆盖的范围内均有数据
+FUTURES_DAILY_START_DATES = {
+    "CFFEX": datetime.date(2010, 4, 16),
+    "INE": datetime.date(2018, 3, 26),
+    "GFEX": datetime.date(2022, 12, 22),
+}
+
+
 def get_futures_daily(
     start_date: str = "20220208",
     end_date: str = "20220208",
@@ -650,19 +683,8 @@ def get_futures_daily(
     :return: 交易所日交易数据
     :rtype: pandas.DataFrame
     """
-    if market.upper() == "CFFEX":
-        f = get_cffex_daily
-    elif market.upper() == "CZCE":
-        f = get_czce_daily
-    elif market.upper() == "SHFE":
-        f = get_shfe_daily
-    elif market.upper() == "DCE":
-        f = get_dce_daily
-    elif market.upper() == "INE":
-        f = get_ine_daily
-    elif market.upper() == "GFEX":
-        f = get_gfex_daily
-    else:
+    f = FUTURES_DAILY_FUNCS.get(market.upper())
+    if f is None:
         print("Invalid Market Symbol")
         return pd.DataFrame()
 
@@ -678,11 +700,11 @@ def get_futures_daily(
     )
 
     df_list = list()
-    while start_date <= end_date:
-        df = f(date=str(start_date).replace("-", ""))
+    # NOTE(akshare): 只遍历交易日, 非交易日各交易所函数本就返回空表
+    for day in calendar.range_dates(start_date, end_date):
+        df = f(date=day.strftime("%Y%m%d"))
         if not df.empty:
             df_list.append(df)
-        start_date += datetime.timedelta(days=1)
 
     if len(df_list) == 0:
         return pd.DataFrame()
@@ -694,6 +716,125 @@ def get_futures_daily(
         return pd.DataFrame()
 
 
+def _futures_daily_pair(
+    market: str, day: datetime.date, rate_limit: Optional[Tuple[float, float]]
+) -> pd.DataFrame:
+    if rate_limit is not None:
+        rate, burst = rate_limit
+        wait = get_rate_governor().backend.reserve(
+            f"futures_daily:{market}", rate, burst
+        )
+        if wait > 0:
+            time.sleep(wait)
+    return FUTURES_DAILY_FUNCS[market](date=day.strftime("%Y%m%d"))
+
+
+def get_futures_daily_batch(
+    start_date: str = "20220208",
+    end_date: str = "20220208",
+    market_list: Optional[List[str]] = None,
+    max_workers: int = 6,
+    rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+    store=None,
+    refresh_empty: bool = True,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    多个交易所的日交易数据, 只请求交易日, 按 (交易所, 交易日) 并发获取
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type start_date: str
+    :param end_date: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为最近的有数据的交易日
+    :type end_date: str
+    :param market_list: 交易所列表, 如 ["CFFEX", "SHFE"]; 默认为全部六个交易所
+    :type market_list: list
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :param rate_limits: 各交易所的限速规则 {交易所: (每秒请求数, 允许的突发请求数)}, 默认为 FUTURES_DAILY_RATE_LIMITS
+    :type rate_limits: dict
+    :param store: 本地仓库目录或 LocalFrameStore; 设置后按 (交易所, 交易日) 保存获取的数据, 已保存的不再请求
+    :type store: str or LocalFrameStore
+    :param refresh_empty: 是否重新获取本地保存为空表的 (交易所, 交易日); 各交易所函数在请求失败时也会返回空表, 默认重新获取,
+    确认本地的空表均为没有数据的交易日(如交易所成立前)时可设为 False, 减少请求
+    :type refresh_empty: bool
+    :return: (按 market_list 及日期排序的日交易数据, 获取失败的 market、date、error), 失败的可用 get_futures_daily 逐个重试;
+    FUTURES_DAILY_START_DATES 之后的交易日返回空表时 error 为 "empty"(交易所函数在请求失败时返回空表, 当天的数据也可能尚未发布)
+    :rtype: tuple
+    """
+    market_list = [
+        market.upper() for market in (market_list or list(FUTURES_DAILY_FUNCS))
+    ]
+    for market in market_list:
+        if market not in FUTURES_DAILY_FUNCS:
+            raise ValueError(f"market 只能为 {list(FUTURES_DAILY_FUNCS)} 之一")
+    rate_limits = {**FUTURES_DAILY_RATE_LIMITS, **(rate_limits or {})}
+    start_date = (
+        cons.convert_date(start_date)
+        if start_date is not None
+        else datetime.date.today()
+    )
+    end_date = (
+        cons.convert_date(end_date)
+        if end_date is not None
+        else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
+    )
+    day_list = calendar.range_dates(start_date, end_date)
+    store = get_store(store)
+    result = {}
+    if store is not None:
+        for market in market_list:
+            for day in day_list:
+                df = store.get(
+                    f"futures_daily/{market}",
+                    day.strftime("%Y%m%d"),
+                    skip_empty=refresh_empty,
+                )
+                if df is not None:
+                    result[(market, day)] = df
+    failed_list = []
+    # NOTE(akshare): 同一交易所的请求受该交易所的令牌桶约束; 按日期交替提交各交易所的请求, 避免所有线程都在等待同一个交易所的额度
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        future_dict = {
+            executor.submit(
+                _futures_daily_pair, market, day, rate_limits.get(market)
+            ): (market, day)
+            for day in day_list
+            for market in market_list
+            if (market, day) not in result
+        }
+        for future in as_completed(future_dict):
+            market, day = future_dict[future]
+            try:
+                df = future.result()
+            except Exception as e:
+                failed_list.append(
+                    {"market": market, "date": day.strftime("%Y%m%d"), "error": repr(e)}
+                )
+                continue
+            if df is None:
+                df = pd.DataFrame()
+            if df.empty and day >= FUTURES_DAILY_START_DATES.get(market, day):
+                failed_list.append(
+                    {"market": market, "date": day.strftime("%Y%m%d"), "error": "empty"}
+                )
+                continue
+            result[(market, day)] = df
+            if store is not None:
+                store.put(f"futures_daily/{market}", day.strftime("%Y%m%d"), df)
+    df_list = [
+        result[(market, day)]
+        for market in market_list
+        for day in day_list
+        if (market, day) in result and not result[(market, day)].empty
+    ]
+    failed_df = pd.DataFrame(failed_list, columns=["market", "date", "error"])
+    failed_df.sort_values(["market", "date"], inplace=True, ignore_index=True)
+    if not df_list:
+        return pd.DataFrame(), failed_df
+    temp_df = pd.concat(df_list, ignore_index=True)
+    temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df, failed_df
+
+
 def futures_hist_daily_cffex(date: str = "20260403") -> pd.DataFrame:
     """
     中国金融期货交易所-交易所日交易数据
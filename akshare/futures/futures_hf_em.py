@@ -12,6 +12,8 @@ from typing import Optional
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
+from ..utils.kline import parse_klines
 from ..utils.tqdm import get_tqdm
 
 
@@ -106,13 +108,14 @@ def futures_global_spot_em() -> pd.DataFrame:
     total_num = data_json["total"]
     total_page = math.ceil(total_num / 20) - 1
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    big_list = []
     for page in tqdm(range(total_page), leave=False):
         params.update({"pageIndex": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["list"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -193,27 +196,28 @@ def futures_global_hist_em(symbol: str = "HG00Y") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df["code"] = data_json["data"]["code"]
-    temp_df["name"] = data_json["data"]["name"]
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "最新价",
-        "最高",
-        "最低",
-        "总量",
-        "-",
-        "-",
-        "涨幅",
-        "-",
-        "-",
-        "-",
-        "持仓",
-        "日增",
-        "代码",
-        "名称",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "最新价",
+            "最高",
+            "最低",
+            "总量",
+            "-",
+            "-",
+            "涨幅",
+            "-",
+            "-",
+            "-",
+            "持仓",
+            "日增",
+        ],
+        dtypes={"日期": "str", "-": "str", "持仓": "str"},
+    )
+    temp_df["代码"] = data_json["data"]["code"]
+    temp_df["名称"] = data_json["data"]["name"]
     temp_df = temp_df[
         [
             "日期",
@@ -230,13 +234,6 @@ def futures_global_hist_em(symbol: str = "HG00Y") -> pd.DataFrame:
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["总量"] = pd.to_numeric(temp_df["总量"], errors="coerce")
-    temp_df["涨幅"] = pd.to_numeric(temp_df["涨幅"], errors="coerce")
-    temp_df["日增"] = pd.to_numeric(temp_df["日增"], errors="coerce")
     # 日增修复为有符号32位整数值
     unsigned_max, signed_max = (2**32) - 1, (2**31) - 1
     mask = temp_df["日增"] > signed_max
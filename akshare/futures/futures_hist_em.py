@@ -13,6 +13,8 @@ from typing import Tuple, Dict
 import pandas as pd
 import requests
 
+from ..utils.kline import parse_klines
+
 
 def __futures_hist_separate_char_and_numbers_em(symbol: str = "焦煤2506") -> tuple:
     """
@@ -135,25 +137,28 @@ def futures_hist_em(
     }
     r = requests.get(url, timeout=15, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "时间",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "-",
+            "涨跌幅",
+            "涨跌",
+            "_",
+            "_",
+            "持仓量",
+            "_",
+        ],
+        dtypes={"时间": "str", "-": "str", "_": "str"},
+    )
     if temp_df.empty:
         return temp_df
-    temp_df.columns = [
-        "时间",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "-",
-        "涨跌幅",
-        "涨跌",
-        "_",
-        "_",
-        "持仓量",
-        "_",
-    ]
     temp_df = temp_df[
         [
             "时间",
@@ -171,15 +176,6 @@ def futures_hist_em(
     temp_df.index = pd.to_datetime(temp_df["时间"])
     temp_df = temp_df[start_date:end_date]
     temp_df.reset_index(drop=True, inplace=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["涨跌"] = pd.to_numeric(temp_df["涨跌"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["持仓量"] = pd.to_numeric(temp_df["持仓量"], errors="coerce")
     temp_df["时间"] = pd.to_datetime(temp_df["时间"], errors="coerce").dt.date
     return temp_df
 
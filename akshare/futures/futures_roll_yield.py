@@ -11,13 +11,17 @@ import re
 import warnings
 
 import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 import pandas as pd
 
 from . import cons
-from .futures_daily_bar import get_futures_daily
+from ..utils.trade_calendar import get_trade_calendar
+from .futures_daily_bar import get_futures_daily, get_futures_daily_batch
 from .symbol_var import symbol_market, symbol_varieties
 
-calendar = cons.get_calendar()
+calendar = get_trade_calendar()
 
 
 def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
@@ -71,6 +75,157 @@ def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
         return math.log(close2 / close1) / c * 12, symbol1, symbol2
 
 
+ROLL_YIELD_COLUMNS = [
+    "date",
+    "variety",
+    "main",
+    "sub_main",
+    "near_by",
+    "deferred",
+    "near_by_months",
+    "months",
+    "roll_yield",
+]
+
+
+def _delivery_month_code(symbol: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    # 与 get_roll_yield 一致: 合约代码中的数字, 末两位为月份, 其余为年份(郑商所为 1 位, 其他交易所为 2 位)
+    code = symbol.str.replace(r"\D", "", regex=True)
+    year = pd.to_numeric(code.str[:-2], errors="coerce")
+    month = pd.to_numeric(code.str[-2:], errors="coerce")
+    return year, month
+
+
+def roll_yield_from_panel(
+    panel: pd.DataFrame, exclude: Sequence[str] = ("IO", "MO", "HO")
+) -> pd.DataFrame:
+    """
+    由多个交易日、多个品种的日线数据一次计算每个 (交易日, 品种) 的展期收益率
+    规则与 get_roll_yield 一致: 持仓量最大的两个合约为主力和次主力, 交割月较早的为近月合约,
+    展期收益率 = ln(次主力收盘价 / 主力收盘价) / 两合约相差的月数(主力减次主力) * 12
+    :param panel: get_futures_daily 或 get_futures_daily_batch 返回的日线数据
+    :type panel: pandas.DataFrame
+    :param exclude: 不参与计算的品种, 默认排除股指期权 IO、MO、HO
+    :type exclude: list
+    :return: 展期收益率
+    :rtype: pandas.DataFrame
+    date              交易日                          str
+    variety           品种                            str
+    main              主力合约(持仓量最大)             str
+    sub_main          次主力合约(持仓量第二)           str
+    near_by           近月合约                        str
+    deferred          远月合约                        str
+    near_by_months    近月合约距交割月的月数           int
+    months            两个合约相差的月数               int
+    roll_yield        年化展期收益率                  float
+    """
+    if panel.empty:
+        return pd.DataFrame(columns=ROLL_YIELD_COLUMNS)
+    df = panel.loc[
+        ~panel["symbol"].str.contains("efp") & ~panel["variety"].isin(exclude),
+        ["date", "variety", "symbol", "close", "open_interest"],
+    ].copy()
+    df["close"] = pd.to_numeric(df["close"], errors="coerce")
+    df["open_interest"] = pd.to_numeric(df["open_interest"], errors="coerce")
+    # NOTE(akshare): 一次排序后按组内名次取主力和次主力, 代替逐个品种筛选排序
+    df.sort_values(
+        by=["date", "variety", "open_interest"],
+        ascending=[True, True, False],
+        kind="mergesort",
+        inplace=True,
+    )
+    rank = df.groupby(["date", "variety"], sort=False).cumcount().to_numpy()
+    main_df = df[rank == 0].set_index(["date", "variety"])
+    sub_df = df[rank == 1].set_index(["date", "variety"])
+    temp_df = main_df.join(sub_df, how="inner", lsuffix="_1", rsuffix="_2")
+    temp_df.reset_index(inplace=True)
+    if temp_df.empty:
+        return pd.DataFrame(columns=ROLL_YIELD_COLUMNS)
+
+    year_1, month_1 = _delivery_month_code(temp_df["symbol_1"])
+    year_2, month_2 = _delivery_month_code(temp_df["symbol_2"])
+    months = ((year_1 - year_2) * 12 + (month_1 - month_2)).to_numpy(dtype=float)
+    close_1 = temp_df["close_1"].to_numpy(dtype=float)
+    close_2 = temp_df["close_2"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roll_yield = np.log(close_2 / close_1) / months * 12
+    valid = (close_1 != 0) & (close_2 != 0) & (months != 0) & np.isfinite(roll_yield)
+    temp_df["roll_yield"] = roll_yield
+    later = months > 0
+    temp_df["near_by"] = np.where(later, temp_df["symbol_2"], temp_df["symbol_1"])
+    temp_df["deferred"] = np.where(later, temp_df["symbol_1"], temp_df["symbol_2"])
+    temp_df["months"] = np.abs(months)
+
+    # 近月合约的交割年份: 两位年份为 20xx; 郑商所一位年份取交易日所在的十年, 早于交易日年份时为下一个十年
+    trade_date = pd.to_datetime(
+        temp_df["date"].astype(str), format="%Y%m%d", errors="coerce"
+    )
+    near_year, near_month = _delivery_month_code(temp_df["near_by"])
+    near_digits = temp_df["near_by"].str.replace(r"\D", "", regex=True).str.len()
+    decade = trade_date.dt.year // 10 * 10
+    near_year = np.where(
+        near_digits == 3,
+        np.where(
+            decade + near_year < trade_date.dt.year,
+            decade + near_year + 10,
+            decade + near_year,
+        ),
+        2000 + near_year,
+    )
+    temp_df["near_by_months"] = (
+        near_year * 12 + near_month - (trade_date.dt.year * 12 + trade_date.dt.month)
+    )
+
+    temp_df = temp_df[valid].rename(
+        columns={"symbol_1": "main", "symbol_2": "sub_main"}
+    )
+    temp_df = temp_df[ROLL_YIELD_COLUMNS].reset_index(drop=True)
+    temp_df["months"] = temp_df["months"].astype(int)
+    temp_df["near_by_months"] = temp_df["near_by_months"].astype("Int64")
+    return temp_df
+
+
+def get_roll_yield_panel(
+    start_date: str = "20240102",
+    end_date: str = "20240131",
+    market_list: Optional[List[str]] = None,
+    store=None,
+    max_workers: int = 6,
+    refresh_empty: bool = True,
+) -> pd.DataFrame:
+    """
+    指定时间段所有品种每个交易日的展期收益率
+    日线数据由 get_futures_daily_batch 并发获取, 设置 store 后保存在本地, 再次计算时只请求本地没有的交易日
+    :param start_date: 开始日期 format：YYYYMMDD
+    :type start_date: str
+    :param end_date: 结束日期 format：YYYYMMDD
+    :type end_date: str
+    :param market_list: 交易所列表, 如 ["DCE", "SHFE"]; 默认为全部六个交易所
+    :type market_list: list
+    :param store: 本地仓库目录或 LocalFrameStore
+    :type store: str or LocalFrameStore
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :param refresh_empty: 是否重新获取本地保存为空表的 (交易所, 交易日), 同 get_futures_daily_batch
+    :type refresh_empty: bool
+    :return: 展期收益率, 字段同 roll_yield_from_panel
+    :rtype: pandas.DataFrame
+    """
+    panel_df, failed_df = get_futures_daily_batch(
+        start_date=start_date,
+        end_date=end_date,
+        market_list=market_list,
+        max_workers=max_workers,
+        store=store,
+        refresh_empty=refresh_empty,
+    )
+    if not failed_df.empty:
+        warnings.warn(
+            f"{len(failed_df)} 个交易所交易日的日线数据获取失败: {failed_df[['market', 'date']].values.tolist()}"
+        )
+    return roll_yield_from_panel(panel_df)
+
+
 def get_roll_yield_bar(
     type_method: str = "var",
     var: str = "RB",
@@ -108,55 +263,33 @@ def get_roll_yield_bar(
         return df
 
     if type_method == "var":
-        df = pd.DataFrame()
-        for market in ["dce", "cffex", "shfe", "czce", "gfex"]:
-            df = pd.concat(
-                [
-                    df,
-                    get_futures_daily(start_date=date, end_date=date, market=market),
-                ]
-            )
-        var_list = list(set(df["variety"]))
-        for i_remove in ["IO", "MO", "HO"]:
-            if i_remove in var_list:
-                var_list.remove(i_remove)
-        df_l = pd.DataFrame()
-        for var in var_list:
-            ry = get_roll_yield(date, var, df=df)
-            if ry:
-                df_l = pd.concat(
-                    [
-                        df_l,
-                        pd.DataFrame(
-                            [ry],
-                            index=[var],
-                            columns=["roll_yield", "near_by", "deferred"],
-                        ),
-                    ]
-                )
+        df, failed_df = get_futures_daily_batch(
+            start_date=date,
+            end_date=date,
+            market_list=["DCE", "CFFEX", "SHFE", "CZCE", "GFEX"],
+        )
+        if not failed_df.empty:
+            warnings.warn(f"{failed_df['market'].tolist()} 的日线数据获取失败")
+        temp_df = roll_yield_from_panel(df)
+        df_l = temp_df.set_index("variety")[["roll_yield", "near_by", "deferred"]]
+        df_l.index.name = None
         df_l["date"] = date
         df_l = df_l.sort_values("roll_yield")
         return df_l
 
     if type_method == "date":
-        df_l = pd.DataFrame()
-        while start_day <= end_day:
-            try:
-                ry = get_roll_yield(start_day, var)
-                if ry:
-                    df_l = pd.concat(
-                        [
-                            df_l,
-                            pd.DataFrame(
-                                [ry],
-                                index=[start_day],
-                                columns=["roll_yield", "near_by", "deferred"],
-                            ),
-                        ]
-                    )
-            except:  # noqa: E722
-                pass
-            start_day += datetime.timedelta(days=1)
+        # NOTE(akshare): 一次获取整个时间段的日线数据, 再一次计算每个交易日的展期收益率
+        df, failed_df = get_futures_daily_batch(
+            start_date=start_day, end_date=end_day, market_list=[symbol_market(var)]
+        )
+        if df.empty:
+            return pd.DataFrame()
+        temp_df = roll_yield_from_panel(df[df["variety"] == var])
+        df_l = temp_df[["roll_yield", "near_by", "deferred"]]
+        df_l.index = pd.to_datetime(
+            temp_df["date"].astype(str), format="%Y%m%d"
+        ).dt.date
+        df_l.index.name = None
         return df_l
 
 
@@ -5,11 +5,14 @@ Date: 2024/1/22 20:30
 Desc: 期货-期转现-交割
 """
 
-from io import StringIO, BytesIO
+from io import StringIO
 
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
+from ..utils.parse_pool import read_excel
+
 
 def futures_to_spot_shfe(date: str = "202312") -> pd.DataFrame:
     """
@@ -176,7 +179,7 @@ def futures_to_spot_czce(date: str = "20231228") -> pd.DataFrame:
     }
     r = requests.get(url, headers=headers)
     r.encoding = "utf-8"
-    temp_df = pd.read_excel(BytesIO(r.content), skiprows=1)
+    temp_df = read_excel(r.content, skiprows=1)
 
     temp_df.columns = [
         "合约代码",
@@ -207,9 +210,9 @@ def futures_delivery_match_czce(date: str = "20210106") -> pd.DataFrame:
     url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataDelsettle.xls"
     r = requests.get(url)
     r.encoding = "utf-8"
-    temp_df = pd.read_excel(BytesIO(r.content), skiprows=0)
+    temp_df = read_excel(r.content, skiprows=0)
     index_flag = temp_df[temp_df.iloc[:, 0].str.contains("配对日期")].index.values
-    big_df = pd.DataFrame()
+    big_list = []
     for i, item in enumerate(index_flag):
         try:
             temp_inner_df = temp_df[index_flag[i] + 1 : index_flag[i + 1]]
@@ -225,7 +228,8 @@ def futures_delivery_match_czce(date: str = "20210106") -> pd.DataFrame:
         symbol = date_contract_str.split("：")[-1]
         temp_inner_df["配对日期"] = inner_date
         temp_inner_df["合约代码"] = symbol
-        big_df = pd.concat([big_df, temp_inner_df], ignore_index=True)
+        big_list.append(temp_inner_df)
+    big_df = concat_pages(big_list)
 
     big_df.columns = [
         "卖方会员",
@@ -253,7 +257,7 @@ def futures_delivery_czce(date: str = "20210112") -> pd.DataFrame:
     url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataSettlematched.xls"
     r = requests.get(url)
     r.encoding = "utf-8"
-    temp_df = pd.read_excel(BytesIO(r.content), skiprows=1)
+    temp_df = read_excel(r.content, skiprows=1)
     temp_df.columns = [
         "品种",
         "交割数量",
@@ -14,11 +14,13 @@ http://www.gfex.com.cn/gfex/cdrb/hqsj_tjsj.shtml
 """
 
 import re
-from io import BytesIO, StringIO
+from io import StringIO
 
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def futures_warehouse_receipt_czce(date: str = "20251103") -> dict:
     """
@@ -41,7 +43,7 @@ def futures_warehouse_receipt_czce(date: str = "20251103") -> dict:
         "Chrome/83.0.4103.116 Safari/537.36"
     }
     r = requests.get(url, verify=False, headers=headers)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     index_list = temp_df[temp_df.iloc[:, 0].str.find("品种") == 0.0].index.to_list()
     index_list.append(len(temp_df))
     big_dict = {}
@@ -21,7 +21,7 @@ from .cons import (
     zh_match_main_contract_payload,
 )
 from .futures_contract_detail import futures_contract_detail
-from ..utils import demjson
+from ..utils import relaxed_json
 
 
 @lru_cache()
@@ -39,7 +39,7 @@ def futures_symbol_mark() -> pd.DataFrame:
     r.encoding = "gb2312"
     data_text = r.text
     raw_json = data_text[data_text.find("{") : data_text.find("}") + 1]
-    data_json = demjson.decode(raw_json)
+    data_json = relaxed_json.decode(raw_json)
     czce_mark_list = [item[1] for item in data_json["czce"][1:]]
     dce_mark_list = [item[1] for item in data_json["dce"][1:]]
     shfe_mark_list = [item[1] for item in data_json["shfe"][1:]]
@@ -148,7 +148,7 @@ def zh_subscribe_exchange_symbol(symbol: str = "cffex") -> pd.DataFrame:
     r = requests.get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gbk"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = relaxed_json.decode(
         data_text[data_text.find("{") : data_text.find("};") + 1]
     )
     if symbol == "czce":
@@ -185,7 +185,7 @@ def match_main_contract(symbol: str = "cffex") -> str:
         res = requests.get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = relaxed_json.decode(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[data_df.iloc[:, 3:].duplicated()]
@@ -9,17 +9,20 @@ Desc: 每日注册仓单数据
 import datetime
 import re
 import warnings
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import pandas as pd
 import requests
 
 from . import cons
+from ..utils.local_store import get_store
+from ..utils.parse_pool import read_excel
+from ..utils.trade_calendar import get_trade_calendar
 from .requests_fun import requests_link, pandas_read_html_link
 from .symbol_var import chinese_to_english
 
-calendar = cons.get_calendar()
+calendar = get_trade_calendar()
 shfe_20100126 = pd.DataFrame(
     {
         "var": ["CU", "AL", "ZN", "RU", "FU", "AU", "RB", "WR"],
@@ -413,7 +416,7 @@ def get_czce_receipt_3(
     else:
         url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataWhsheet.xls"
     r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df = temp_df[
         [
             bool(1 - item)
@@ -568,21 +571,97 @@ def get_gfex_receipt(
     return result_df
 
 
+def _receipt_func(market: str, date: datetime.date):
+    """
+    指定交易所及交易日对应的仓单解析函数, 交易所尚未公布仓单数据时为 None
+    """
+    if market == "dce":
+        if date >= datetime.date(2009, 4, 7):
+            return get_dce_receipt
+        print("20090407 起，大连商品交易所每个交易日更新仓单数据")
+    elif market == "shfe":
+        if datetime.date(2008, 10, 6) <= date <= datetime.date(2014, 5, 16):
+            return get_shfe_receipt_1
+        elif datetime.date(2014, 5, 16) <= date <= datetime.date(2025, 11, 17):
+            return get_shfe_receipt_2
+        elif date > datetime.date(2025, 11, 17):
+            return get_shfe_receipt_3
+        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
+    elif market == "gfex":
+        if date > datetime.date(2022, 12, 22):
+            return get_gfex_receipt
+        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
+    elif market == "czce":
+        if datetime.date(2008, 3, 3) <= date <= datetime.date(2010, 8, 24):
+            return get_czce_receipt_1
+        elif datetime.date(2010, 8, 24) < date <= datetime.date(2015, 11, 11):
+            return get_czce_receipt_2
+        elif date > datetime.date(2015, 11, 11):
+            return get_czce_receipt_3
+        print("20080303 起，郑州商品交易所每个交易日更新仓单数据")
+    return None
+
+
+def _receipt_unit(
+    f,
+    market: str,
+    date: datetime.date,
+    vars_list: list,
+    store=None,
+    refresh_empty: bool = True,
+) -> pd.DataFrame:
+    """
+    (交易日, 交易所) 的注册仓单数据; 设置 store 时优先读取本地, 获取后保存
+    获取的结果为空时返回 None 且不保存, 解析函数在请求失败时也会返回空表或 None
+    """
+    key = date.strftime("%Y%m%d")
+    if store is not None:
+        # NOTE(akshare): 保存时记录获取的品种, 已保存的品种覆盖本次的品种时才使用本地数据;
+        # 解析函数在请求失败时也会返回空表, refresh_empty 时本地的空表重新获取
+        df = store.get(f"receipt/{market}", key, skip_empty=refresh_empty)
+        if df is not None and set(vars_list) <= set(df.attrs.get("vars_list", [])):
+            return df[df["var"].isin(vars_list)] if len(df) else df
+    # 解析函数可能修改传入的品种列表, 传入副本
+    df = f(date, list(vars_list))
+    if df is None or df.empty:
+        return None
+    # NOTE(akshare): 历史仓单数据不会再变化
+    if store is not None:
+        df.attrs["vars_list"] = list(vars_list)
+        store.put(f"receipt/{market}", key, df)
+    return df
+
+
 def get_receipt(
     start_date: str = None,
     end_date: str = None,
     vars_list: List = cons.contract_symbols,
+    max_workers: int = 4,
+    store=None,
+    refresh_empty: bool = True,
+    return_failed: bool = False,
 ):
     """
     大宗商品-注册仓单数据
+    按 (交易日, 交易所) 并发获取, 设置 store 后每个 (交易日, 交易所) 的数据保存在本地, 再次获取时只请求本地没有的部分;
+    获取出错时与以前一样抛出异常; 设置 return_failed 时单个 (交易日, 交易所) 出错不影响其余结果, 出错的部分单独返回
     :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象 为空时为当天
     :type start_date: str
     :param end_date: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象 为空时为当天
     :type end_date: str
     :param vars_list: 合约品种如 RB、AL 等列表为空时为所有商品
     :type vars_list: str
-    :return: 注册仓单数据
-    :rtype: pandas.DataFrame
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :param store: 本地仓库目录或 LocalFrameStore
+    :type store: str or LocalFrameStore
+    :param refresh_empty: 是否重新获取本地保存为空表的 (交易日, 交易所); 解析函数在请求失败时也会返回空表, 默认重新获取
+    :type refresh_empty: bool
+    :param return_failed: 是否同时返回获取失败的 market、date、error; 获取的结果为空(解析函数在请求失败时返回空表, 也可能当天所选品种没有仓单)时 error 为 "empty",
+    未设置时结果为空的部分以警告列出
+    :type return_failed: bool
+    :return: 注册仓单数据; return_failed 时为 (注册仓单数据, 获取失败的 market、date、error)
+    :rtype: pandas.DataFrame or tuple
     """
     if not isinstance(vars_list, list):
         return warnings.warn("vars_list: 必须是列表")
@@ -596,70 +675,56 @@ def get_receipt(
         if end_date is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    records = pd.DataFrame()
-    while start_date <= end_date:
-        if start_date.strftime("%Y%m%d") not in calendar:
-            warnings.warn(f"{start_date.strftime('%Y%m%d')} 非交易日")
-        else:
-            print(start_date)
-            for market, market_vars in cons.market_exchange_symbols.items():
-                f = None
-                if market == "dce":
-                    if start_date >= datetime.date(2009, 4, 7):
-                        f = get_dce_receipt
-                    else:
-                        print("20090407 起，大连商品交易所每个交易日更新仓单数据")
-                        f = None
-                elif market == "shfe":
-                    if (
-                        datetime.date(2008, 10, 6)
-                        <= start_date
-                        <= datetime.date(2014, 5, 16)
-                    ):
-                        f = get_shfe_receipt_1
-                    elif (
-                        datetime.date(2014, 5, 16)
-                        <= start_date
-                        <= datetime.date(2025, 11, 17)
-                    ):
-                        f = get_shfe_receipt_2
-                    elif start_date > datetime.date(2025, 11, 17):
-                        f = get_shfe_receipt_3
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "gfex":
-                    if start_date > datetime.date(2022, 12, 22):
-                        f = get_gfex_receipt
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "czce":
-                    if (
-                        datetime.date(2008, 3, 3)
-                        <= start_date
-                        <= datetime.date(2010, 8, 24)
-                    ):
-                        f = get_czce_receipt_1
-                    elif (
-                        datetime.date(2010, 8, 24)
-                        < start_date
-                        <= datetime.date(2015, 11, 11)
-                    ):
-                        f = get_czce_receipt_2
-                    elif start_date > datetime.date(2015, 11, 11):
-                        f = get_czce_receipt_3
-                    else:
-                        f = None
-                        print("20080303 起，郑州商品交易所每个交易日更新仓单数据")
-                get_vars = [var for var in vars_list if var in market_vars]
-                if market != "cffex" and get_vars != []:
-                    if f is not None:
-                        records = pd.concat([records, f(start_date, get_vars)])
-        start_date += datetime.timedelta(days=1)
-    records.reset_index(drop=True, inplace=True)
-    if records.empty:
-        return records
+    store = get_store(store)
+    task_list = []
+    # NOTE(akshare): 只遍历交易日, 按日期及交易所的顺序生成任务, 结果按同样的顺序一次合并
+    for day in calendar.range_dates(start_date, end_date):
+        for market, market_vars in cons.market_exchange_symbols.items():
+            get_vars = [var for var in vars_list if var in market_vars]
+            if market == "cffex" or get_vars == []:
+                continue
+            f = _receipt_func(market, day)
+            if f is not None:
+                task_list.append((f, market, day, get_vars))
+    df_list = []
+    failed_list = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        future_list = [
+            executor.submit(_receipt_unit, *task, store, refresh_empty)
+            for task in task_list
+        ]
+        for (_, market, day, _), future in zip(task_list, future_list):
+            try:
+                df = future.result()
+            except Exception as e:
+                if not return_failed:
+                    # 与逐个获取时一致, 出错后不再请求其余的 (交易日, 交易所)
+                    for pending in future_list:
+                        pending.cancel()
+                    raise
+                error = repr(e)
+            else:
+                if df is not None:
+                    df_list.append(df)
+                    continue
+                error = "empty"
+            failed_list.append(
+                {"market": market, "date": day.strftime("%Y%m%d"), "error": error}
+            )
+    failed_df = pd.DataFrame(failed_list, columns=["market", "date", "error"])
+    if not return_failed and failed_list:
+        warnings.warn(
+            f"{len(failed_list)} 个 (交易日, 交易所) 的仓单数据为空, 可能是请求失败, 可稍后重新获取: "
+            f"{failed_df[['date', 'market']].values.tolist()}"
+        )
+    df_list = [df for df in df_list if not df.empty]
+    if not df_list:
+        records = pd.DataFrame()
+    else:
+        records = pd.concat(df_list, ignore_index=True)
+        records.attrs = {}
+    if return_failed:
+        return records, failed_df
     return records
 
 
@@ -12,6 +12,8 @@ from typing import Dict
 import pandas as pd
 import requests
 
+from ..utils.rate_limit import acquire
+
 
 def requests_link(
     url: str,
@@ -32,6 +34,7 @@ def requests_link(
     i = 0
     while True:
         try:
+            acquire(url)
             if method == "get":
                 r = requests.get(url, timeout=20, headers=headers)
                 r.encoding = encoding
@@ -69,6 +72,7 @@ def pandas_read_html_link(
     i = 0
     while True:
         try:
+            acquire(url)
             if method == "get":
                 r = requests.get(url, timeout=20, headers=headers)
                 r.encoding = encoding
@@ -16,7 +16,7 @@ from ..futures.cons import (
     zh_match_main_contract_url,
     zh_match_main_contract_payload,
 )
-from ..utils import demjson
+from ..utils import relaxed_json
 
 
 def zh_subscribe_exchange_symbol(symbol: str = "dce") -> pd.DataFrame:
@@ -31,7 +31,7 @@ def zh_subscribe_exchange_symbol(symbol: str = "dce") -> pd.DataFrame:
     r = requests.get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gb2312"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = relaxed_json.decode(
         data_text[data_text.find("{") : data_text.find("};") + 1]
     )
     if symbol == "czce":
@@ -67,7 +67,7 @@ def match_main_contract(symbol: str = "shfe") -> pd.DataFrame:
         res = requests.get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = relaxed_json.decode(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[
@@ -7,11 +7,12 @@ https://www.cnindex.com.cn/index.html
 """
 
 import zipfile
-from io import BytesIO
 
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def index_all_cni() -> pd.DataFrame:
     """
@@ -159,7 +160,7 @@ def index_detail_cni(symbol: str = "399001") -> pd.DataFrame:
     url = "https://www.cnindex.com.cn/sample-detail/download-history"
     params = {"indexcode": symbol}
     r = requests.get(url, params=params)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df["样本代码"] = temp_df["样本代码"].astype(str).str.zfill(6)
     temp_df.columns = [
         "日期",
@@ -186,7 +187,7 @@ def index_detail_hist_cni(symbol: str = "399001") -> pd.DataFrame:
     url = "https://www.cnindex.com.cn/sample-detail/download-history"
     params = {"indexcode": symbol}
     r = requests.get(url, params=params)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df["样本代码"] = temp_df["样本代码"].astype(str).str.zfill(6)
     temp_df.columns = [
         "日期",
@@ -218,7 +219,7 @@ def index_detail_hist_adjust_cni(symbol: str = "399005") -> pd.DataFrame:
 
         with warnings.catch_warnings():
             warnings.simplefilter(action="ignore", category=UserWarning)
-            temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl")
+            temp_df = read_excel(r.content, engine="openpyxl")
     except zipfile.BadZipFile:
         return pd.DataFrame()
     temp_df["样本代码"] = temp_df["样本代码"].astype(str).str.zfill(6)
@@ -8,13 +8,14 @@ Desc: 股票指数成份股数据, 新浪有两个接口, 这里使用老接口:
 """
 
 import math
-from io import BytesIO, StringIO
+from io import StringIO
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.parse_pool import read_excel
 
 
 def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
@@ -49,7 +50,8 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
             }
             r = requests.get(url, params=params)
             temp_df = pd.concat(
-                objs=[temp_df, pd.DataFrame(demjson.decode(r.text))], ignore_index=True
+                objs=[temp_df, pd.DataFrame(relaxed_json.decode(r.text))],
+                ignore_index=True,
             )
         return temp_df
 
@@ -63,7 +65,7 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
         "_s_r_a": "setlen",
     }
     r = requests.get(url, params=params)
-    temp = pd.DataFrame(demjson.decode(r.text))
+    temp = pd.DataFrame(relaxed_json.decode(r.text))
     return temp
 
 
@@ -137,7 +139,7 @@ def index_stock_cons_csindex(symbol: str = "000300") -> pd.DataFrame:
         f"html/csindex/public/uploads/file/autofile/cons/{symbol}cons.xls"
     )
     r = requests.get(url)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df.columns = [
         "日期",
         "指数代码",
@@ -171,7 +173,7 @@ def index_stock_cons_weight_csindex(symbol: str = "000300") -> pd.DataFrame:
         f"public/uploads/file/autofile/closeweight/{symbol}closeweight.xls"
     )
     r = requests.get(url)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df.columns = [
         "日期",
         "指数代码",
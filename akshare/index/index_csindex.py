@@ -7,11 +7,12 @@ Desc: 中证指数网站-指数列表
 """
 
 import warnings
-from io import BytesIO
 
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def index_csindex_all() -> pd.DataFrame:
     """
@@ -47,7 +48,7 @@ def index_csindex_all() -> pd.DataFrame:
     }
     r = requests.post(url, json=playloads, headers=headers)
 
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df["基日"] = pd.to_datetime(
         temp_df["基日"], format="%Y-%m-%d", errors="coerce"
     ).dt.date
@@ -11,6 +11,7 @@ import math
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -240,14 +241,15 @@ def index_realtime_sw(symbol: str = "二级行业") -> pd.DataFrame:
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "指数代码",
         "指数名称",
@@ -317,14 +319,15 @@ def index_analysis_daily_sw(
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.rename(
         columns={
             "swindexcode": "指数代码",
@@ -417,14 +420,15 @@ def index_analysis_weekly_sw(
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.rename(
         columns={
             "swindexcode": "指数代码",
@@ -492,14 +496,15 @@ def index_analysis_monthly_sw(
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.rename(
         columns={
             "swindexcode": "指数代码",
@@ -12,12 +12,12 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from functools import lru_cache
 
-from ..stock.cons import hk_js_decode
+from ..utils.sina_decode import hk_js_decode_frame
 from ..utils.func import fetch_paginated_data
+from ..utils.kline import parse_klines
 
 
 def _replace_comma(x) -> str:
@@ -130,12 +130,7 @@ def stock_hk_index_daily_sina(symbol: str = "CES100") -> pd.DataFrame:
     url = f"https://finance.sina.com.cn/stock/hkstock/{symbol}/klc2_kl.js"
     params = {"d": "2023_5_01"}
     res = requests.get(url, params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    temp_df = pd.DataFrame(dict_list)
+    temp_df = hk_js_decode_frame(res.text.split("=")[1].split(";")[0].replace('"', ""))
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
     temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
@@ -167,7 +162,7 @@ def stock_hk_index_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,f23,f24,f25,"
         "f26,f22,f33,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.rename(
         columns={
             "index": "序号",
@@ -263,28 +258,27 @@ def stock_hk_index_daily_em(symbol: str = "HSTECF2L") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "date",
-        "open",
-        "latest",
-        "high",
-        "low",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "date",
+            "open",
+            "latest",
+            "high",
+            "low",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+        ],
+        dtypes={"date": "str", "-": "str"},
+    )
     temp_df = temp_df[["date", "open", "high", "low", "latest"]]
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["latest"] = pd.to_numeric(temp_df["latest"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
     return temp_df
 
 
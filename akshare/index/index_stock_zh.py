@@ -11,7 +11,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from .cons import (
@@ -20,10 +19,11 @@ from .cons import (
     zh_sina_index_stock_count_url,
     zh_sina_index_stock_hist_url,
 )
-from ..stock.cons import hk_js_decode
-from ..utils import demjson
-from ..utils.func import fetch_paginated_data
+from ..utils.sina_decode import hk_js_decode_frame
+from ..utils import relaxed_json
+from ..utils.func import concat_pages, fetch_paginated_data
 from ..utils.tqdm import get_tqdm
+from ..utils.kline import parse_klines
 
 
 def _replace_comma(x):
@@ -63,15 +63,16 @@ def stock_zh_index_spot_sina() -> pd.DataFrame:
     :return: 所有指数的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_list = []
     page_count = get_zh_index_page_count()
     zh_sina_stock_payload_copy = zh_sina_index_stock_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_stock_payload_copy.update({"page": page})
         res = requests.get(zh_sina_index_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(res.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = relaxed_json.decode(res.text)
+        big_list.append(pd.DataFrame(data_json))
+    big_df = concat_pages(big_list)
     big_df = big_df.map(_replace_comma)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
     big_df["pricechange"] = pd.to_numeric(big_df["pricechange"], errors="coerce")
@@ -238,7 +239,7 @@ def stock_zh_index_spot_em(symbol: str = "上证系列指数") -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,f23,f24,f25,"
         "f26,f22,f33,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.rename(
         columns={
             "index": "序号",
@@ -301,12 +302,7 @@ def stock_zh_index_daily(symbol: str = "sh000922") -> pd.DataFrame:
     """
     params = {"d": "2020_2_4"}
     res = requests.get(zh_sina_index_stock_hist_url.format(symbol), params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    temp_df = pd.DataFrame(dict_list)
+    temp_df = hk_js_decode_frame(res.text.split("=")[1].split(";")[0].replace('"', ""))
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
     temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
@@ -334,7 +330,7 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    if not demjson.decode(data_text[data_text.find("={") + 1 :])["data"]:
+    if not relaxed_json.decode(data_text[data_text.find("={") + 1 :])["data"]:
         url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
         params = {
             "_var": "kline_dayqfq",
@@ -343,11 +339,13 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
         }
         r = requests.get(url, params=params)
         data_text = r.text
-        start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
+        start_date = relaxed_json.decode(data_text[data_text.find("={") + 1 :])["data"][
             symbol
         ]["day"][0][0]
         return start_date
-    start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][0][0]
+    start_date = relaxed_json.decode(data_text[data_text.find("={") + 1 :])["data"][0][
+        0
+    ]
     return start_date
 
 
@@ -366,7 +364,7 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
     url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
     range_start = int(start_date.split("-")[0])
     range_end = datetime.date.today().year + 1
-    temp_df = pd.DataFrame()
+    temp_list = []
     tqdm = get_tqdm()
     for year in tqdm(range(range_start, range_end), leave=False):
         params = {
@@ -378,13 +376,16 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
         text = res.text
         try:
             inner_temp_df = pd.DataFrame(
-                demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["day"]
+                relaxed_json.decode(text[text.find("={") + 1 :])["data"][symbol]["day"]
             )
         except:  # noqa: E722
             inner_temp_df = pd.DataFrame(
-                demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["qfqday"]
+                relaxed_json.decode(text[text.find("={") + 1 :])["data"][symbol][
+                    "qfqday"
+                ]
             )
-        temp_df = pd.concat(objs=[temp_df, inner_temp_df], ignore_index=True)
+        temp_list.append(inner_temp_df)
+    temp_df = concat_pages(temp_list)
     if temp_df.shape[1] == 6:
         temp_df.columns = ["date", "open", "close", "high", "low", "amount"]
     else:
@@ -440,17 +441,14 @@ def stock_zh_index_daily_em(
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=["date", "open", "close", "high", "low", "volume", "amount", "_"],
+        dtypes={"date": "str", "_": "str"},
+    )
     if temp_df.empty:
         return pd.DataFrame()
-    temp_df.columns = ["date", "open", "close", "high", "low", "volume", "amount", "_"]
     temp_df = temp_df[["date", "open", "close", "high", "low", "volume", "amount"]]
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["volume"] = pd.to_numeric(temp_df["volume"], errors="coerce")
-    temp_df["amount"] = pd.to_numeric(temp_df["amount"], errors="coerce")
     return temp_df
 
 
@@ -11,6 +11,9 @@ import pandas as pd
 import requests
 
 from ..utils.func import fetch_paginated_data
+from ..utils.kline import parse_klines
+from ..utils.output import filter_between, resolve_output, to_output
+from ..utils.schema import typed_output
 
 
 @lru_cache()
@@ -34,11 +37,12 @@ def index_code_id_map_em() -> dict:
         "fs": "b:MK0010,m:1+t:1,m:0 t:5,m:1+s:3,m:0+t:5,m:2",
         "fields": "f3,f12,f13",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     code_id_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
     return code_id_dict
 
 
+@typed_output
 def index_zh_a_hist(
     symbol: str = "000859",
     period: str = "daily",
@@ -126,9 +130,7 @@ def index_zh_a_hist(
     r = requests.get(url, params=params)
     data_json = r.json()
     try:
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
-        )
+        klines = data_json["data"]["klines"]
     except:  # noqa: E722
         # 兼容 000859(中证国企一路一带) 和 000861(中证央企创新)
         params = {
@@ -143,38 +145,52 @@ def index_zh_a_hist(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        klines = data_json["data"]["klines"]
+    output = resolve_output()
+    if output != "pandas":
+        table = parse_klines(
+            klines,
+            columns=[
+                "日期",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"日期": "date"},
+            output=output,
         )
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+        return to_output(filter_between(table, "日期", start_date, end_date), output)
+    temp_df = parse_klines(
+        klines,
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "str"},
+    )
     temp_df.index = pd.to_datetime(temp_df["日期"], errors="coerce")
     temp_df = temp_df[start_date:end_date]
     temp_df.reset_index(inplace=True, drop=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     return temp_df
 
 
+@typed_output
 def index_zh_a_hist_min_em(
     symbol: str = "399006",
     period: str = "1",
@@ -236,29 +252,23 @@ def index_zh_a_hist_min_em(
                     }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "均价",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "均价",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"], errors="coerce")
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["均价"] = pd.to_numeric(temp_df["均价"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         return temp_df
     else:
@@ -313,35 +323,26 @@ def index_zh_a_hist_min_em(
                     }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"时间": "str"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"], errors="coerce")
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"], errors="coerce").astype(str)
         temp_df = temp_df[
             [
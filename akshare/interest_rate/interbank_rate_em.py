@@ -8,6 +8,7 @@ https://data.eastmoney.com/shibor/shibor.aspx
 
 import pandas as pd
 import requests
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -89,7 +90,7 @@ def rate_interbank(
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -103,7 +104,8 @@ def rate_interbank(
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "报告日",
         "-",
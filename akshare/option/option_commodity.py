@@ -21,8 +21,8 @@ from io import StringIO
 import pandas as pd
 import requests
 
+from ..utils.trade_calendar import get_trade_calendar
 from .cons import (
-    get_calendar,
     convert_date,
     CZCE_DAILY_OPTION_URL_3,
     SHFE_HEADERS,
@@ -63,7 +63,7 @@ def option_hist_dce(
         "生猪期权": "lh",
         "原木期权": "lg",
     }
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -199,7 +199,7 @@ def option_hist_czce(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("{}非交易日".format(day.strftime("%Y%m%d")))
@@ -376,7 +376,7 @@ def option_hist_shfe(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -456,7 +456,7 @@ def option_vol_shfe(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -514,7 +514,7 @@ def option_hist_gfex(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -606,7 +606,7 @@ def option_vol_gfex(symbol: str = "碳酸锂", trade_date: str = "20230724"):
         "碳酸锂": "lc",
         "多晶硅": "ps",
     }
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
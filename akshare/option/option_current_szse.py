@@ -5,11 +5,11 @@ Date: 2025/9/13 16:00
 Desc: 深圳证券交易所-期权子网-行情数据-当日合约
 """
 
-from io import BytesIO
-
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def option_current_day_szse() -> pd.DataFrame:
     """
@@ -30,7 +30,7 @@ def option_current_day_szse() -> pd.DataFrame:
         "TABKEY": "tab1",
     }
     r = requests.get(url, params=params)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel(r.content)
     temp_df["序号"] = pd.to_numeric(temp_df["序号"], errors="coerce")
     temp_df["行权价"] = pd.to_numeric(temp_df["行权价"], errors="coerce")
     temp_df["合约单位"] = pd.to_numeric(temp_df["合约单位"], errors="coerce")
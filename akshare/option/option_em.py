@@ -32,7 +32,7 @@ def option_current_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,"
         "f23,f24,f25,f22,f28,f11,f62,f128,f136,f115,f152,f133,f108,f163,f161,f162",
     }
-    temp_df = fetch_paginated_data(url=url, base_params=params)
+    temp_df = fetch_paginated_data(url=url, base_params=params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
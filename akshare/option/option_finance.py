@@ -14,6 +14,7 @@ from io import BytesIO
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from .cons import (
     SH_OPTION_PAYLOAD,
     SH_OPTION_PAYLOAD_OTHER,
@@ -216,7 +217,7 @@ def option_finance_board(
         r = requests.get(url, params=params)
         data_json = r.json()
         page_num = data_json[0]["metadata"]["pagecount"]
-        big_df = pd.DataFrame()
+        big_list = []
         for page in range(1, page_num + 1):
             params = {
                 "SHOWTYPE": "JSON",
@@ -228,7 +229,8 @@ def option_finance_board(
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json[0]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_list.append(temp_df)
+        big_df = concat_pages(big_list)
 
         big_df.columns = [
             "合约编码",
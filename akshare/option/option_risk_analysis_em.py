@@ -31,7 +31,7 @@ def option_risk_analysis_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f12,f13,f14,f302,f303,f325,f326,f327,f329,f328,f301,f152,f154",
         "fs": "m:10",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "-",
         "-",
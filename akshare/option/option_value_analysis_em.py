@@ -31,7 +31,7 @@ def option_value_analysis_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f12,f13,f14,f298,f299,f249,f300,f330,f331,f332,f333,f334,f335,f336,f301,f152",
         "fs": "m:10",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "-",
         "-",
@@ -1,10 +1,50 @@
 import time
 
-import requests
 from requests.exceptions import RequestException
 
 from .exceptions import NetworkError, APIError, RateLimitError, DataParsingError
 from .utils.context import config
+from .utils.rate_limit import acquire
+from .utils.request import get_pooled_session
+
+
+def request(method, url, **kwargs):
+    """
+    使用进程级 keep-alive Session 发送 HTTP 请求，参数与 requests.request 一致
+    同一 host 的请求复用连接，避免重复 TCP + TLS 握手，并按 host 限速；未指定 proxies 时使用全局代理设置
+
+    :param method: 请求方法, 如 "GET", "POST"
+    :param url: 请求的 URL
+    :param kwargs: 透传给 requests.Session.request 的参数
+    :return: Response 对象
+    """
+    if kwargs.get("proxies") is None and config.proxies is not None:
+        kwargs["proxies"] = config.proxies
+    acquire(url)
+    return get_pooled_session(url).request(method, url, **kwargs)
+
+
+def get(url, params=None, **kwargs):
+    """
+    requests.get 的复用连接版本
+
+    :param url: 请求的 URL
+    :param params: URL 参数 (可选)
+    :return: Response 对象
+    """
+    return request("GET", url, params=params, **kwargs)
+
+
+def post(url, data=None, json=None, **kwargs):
+    """
+    requests.post 的复用连接版本
+
+    :param url: 请求的 URL
+    :param data: 表单数据 (可选)
+    :param json: JSON 数据 (可选)
+    :return: Response 对象
+    """
+    return request("POST", url, data=data, json=json, **kwargs)
 
 
 def make_request_with_retry_json(
@@ -25,9 +65,7 @@ def make_request_with_retry_json(
         proxies = config.proxies
     for attempt in range(max_retries):
         try:
-            response = requests.get(
-                url, params=params, headers=headers, proxies=proxies
-            )
+            response = get(url, params=params, headers=headers, proxies=proxies)
             if response.status_code == 200:
                 try:
                     data = response.json()
@@ -80,9 +118,7 @@ def make_request_with_retry_text(
         proxies = config.proxies
     for attempt in range(max_retries):
         try:
-            response = requests.get(
-                url, params=params, headers=headers, proxies=proxies
-            )
+            response = get(url, params=params, headers=headers, proxies=proxies)
             if response.status_code == 200:
                 try:
                     data = response.text
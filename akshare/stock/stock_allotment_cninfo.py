@@ -7,24 +7,9 @@ https://webapi.cninfo.com.cn/#/dataBrowse
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from ..datasets import get_ths_js
-
-
-def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+from ..utils.js_pool import js_call
 
 
 def stock_allotment_cninfo(
@@ -52,10 +37,7 @@ def stock_allotment_cninfo(
         if not end_date
         else f"{end_date[0:4]}-{end_date[4:6]}-{end_date[6:8]}",
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
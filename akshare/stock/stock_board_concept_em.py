@@ -15,6 +15,7 @@ import pandas as pd
 
 from ..utils.func import fetch_paginated_data
 from ..utils.request import get_session, get_tls_session, request_with_retry_tls
+from ..utils.kline import parse_klines
 
 
 def _em_headers(referer: str) -> dict:
@@ -67,6 +68,7 @@ def __stock_board_concept_name_em() -> pd.DataFrame:
         ),
         session=_em_session(),
         use_tls_impersonation=True,
+        output="pandas",
     )
     temp_df.columns = [
         "排名",
@@ -155,6 +157,7 @@ def stock_board_concept_name_em() -> pd.DataFrame:
         ),
         session=_em_session(),
         use_tls_impersonation=True,
+        output="pandas",
     )
     temp_df.columns = [
         "排名",
@@ -323,20 +326,23 @@ def stock_board_concept_hist_em(
         headers=_em_headers(f"https://quote.eastmoney.com/bk/90.{stock_board_code}.html"),
     )
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "str"},
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -352,16 +358,6 @@ def stock_board_concept_hist_em(
             "换手率",
         ]
     ]
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     return temp_df
 
 
@@ -401,26 +397,20 @@ def stock_board_concept_hist_min_em(
             ),
         )
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "日期时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "最新价",
+            ],
+            dtypes={"日期时间": "str"},
         )
-        temp_df.columns = [
-            "日期时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "最新价",
-        ]
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
         return temp_df
     else:
         url = "https://91.push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -443,22 +433,23 @@ def stock_board_concept_hist_min_em(
             ),
         )
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "日期时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"日期时间": "str"},
         )
-        temp_df.columns = [
-            "日期时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df = temp_df[
             [
                 "日期时间",
@@ -474,16 +465,6 @@ def stock_board_concept_hist_min_em(
                 "换手率",
             ]
         ]
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         return temp_df
 
 
@@ -526,6 +507,7 @@ def stock_board_concept_cons_em(symbol: str = "融资融券") -> pd.DataFrame:
         ),
         session=_em_session(),
         use_tls_impersonation=True,
+        output="pandas",
     )
     temp_df.columns = [
         "序号",
@@ -8,23 +8,8 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 
 import pandas as pd
 import requests
-import py_mini_racer
 
-from ..datasets import get_ths_js
-
-
-def _get_file_content_ths(file: str = "cninfo.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+from ..utils.js_pool import js_call
 
 
 def stock_cg_guarantee_cninfo(
@@ -50,10 +35,7 @@ def stock_cg_guarantee_cninfo(
         "科创板": "012029",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1054"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Encoding": "gzip, deflate",
@@ -9,6 +9,8 @@ https://data.eastmoney.com/dzjy/
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
+
 
 def stock_dzjy_sctj() -> pd.DataFrame:
     """
@@ -32,13 +34,14 @@ def stock_dzjy_sctj() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = int(data_json["result"]["pages"])
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, total_page + 1):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.columns = [
@@ -324,13 +327,14 @@ def stock_dzjy_hygtj(symbol: str = "近三月") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, int(total_page) + 1):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -431,13 +435,14 @@ def stock_dzjy_hyyybtj(symbol: str = "近3日") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, int(total_page) + 1):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -514,13 +519,14 @@ def stock_dzjy_yybph(symbol: str = "近三月") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, int(total_page) + 1):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
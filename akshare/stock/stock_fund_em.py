@@ -16,6 +16,7 @@ import requests
 
 from ..utils.func import fetch_paginated_data
 from ..utils.tqdm import get_tqdm
+from ..utils.kline import parse_klines
 
 
 def stock_individual_fund_flow(
@@ -49,24 +50,27 @@ def stock_individual_fund_flow(
     r = requests.get(url, params=params, headers=headers)
     data_json = r.json()
     content_list = data_json["data"]["klines"]
-    temp_df = pd.DataFrame([item.split(",") for item in content_list])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "收盘价",
-        "涨跌幅",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        content_list,
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+            "收盘价",
+            "涨跌幅",
+            "-",
+            "-",
+        ],
+        dtypes={"日期": "str", "-": "str"},
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -85,38 +89,6 @@ def stock_individual_fund_flow(
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["收盘价"] = pd.to_numeric(temp_df["收盘价"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
     return temp_df
 
 
@@ -387,24 +359,27 @@ def stock_market_fund_flow() -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     data_json = r.json()
     content_list = data_json["data"]["klines"]
-    temp_df = pd.DataFrame([item.split(",") for item in content_list])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "上证-收盘价",
-        "上证-涨跌幅",
-        "深证-收盘价",
-        "深证-涨跌幅",
-    ]
+    temp_df = parse_klines(
+        content_list,
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+            "上证-收盘价",
+            "上证-涨跌幅",
+            "深证-收盘价",
+            "深证-涨跌幅",
+        ],
+        dtypes={"日期": "str"},
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -425,40 +400,6 @@ def stock_market_fund_flow() -> pd.DataFrame:
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["上证-收盘价"] = pd.to_numeric(temp_df["上证-收盘价"], errors="coerce")
-    temp_df["上证-涨跌幅"] = pd.to_numeric(temp_df["上证-涨跌幅"], errors="coerce")
-    temp_df["深证-收盘价"] = pd.to_numeric(temp_df["深证-收盘价"], errors="coerce")
-    temp_df["深证-涨跌幅"] = pd.to_numeric(temp_df["深证-涨跌幅"], errors="coerce")
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
     return temp_df
 
 
@@ -684,6 +625,7 @@ def stock_sector_fund_flow_rank(
 
 @lru_cache(
     func_key='em:hy_to_ids',
+    stale_ttl=24 * 60 * 60,  # 过期后一天内先返回旧值并后台刷新
 )
 def _get_stock_sector_fund_flow_summary_code() -> dict:
     """
@@ -705,7 +647,7 @@ def _get_stock_sector_fund_flow_summary_code() -> dict:
         "fs": "m:90 t:2",
         "fields": "f12,f14,f2,f3,f62,f184,f66,f69,f72,f75,f78,f81,f84,f87,f204,f205,f124,f1,f13",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     name_code_map = dict(zip(temp_df["f14"], temp_df["f12"]))
     return name_code_map
 
@@ -1016,24 +958,27 @@ def stock_sector_fund_flow_hist(symbol: str = "汽车服务") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+            "-",
+            "-",
+            "-",
+            "-",
+        ],
+        dtypes={"日期": "str", "-": "str"},
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -1049,42 +994,13 @@ def stock_sector_fund_flow_hist(symbol: str = "汽车服务") -> pd.DataFrame:
             "小单净流入-净占比",
         ]
     ]
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
     return temp_df
 
 
 @lru_cache(
     func_key='em:gn_to_ids',
+    stale_ttl=24 * 60 * 60,  # 过期后一天内先返回旧值并后台刷新
 )
 def _get_stock_concept_fund_flow_summary_code() -> dict:
     """
@@ -1105,7 +1021,7 @@ def _get_stock_concept_fund_flow_summary_code() -> dict:
         "ut": "b2884a393a59ad64002292a3e90d46a5",
         "_": int(time.time() * 1000),
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     name_code_map = dict(zip(temp_df["f14"], temp_df["f12"]))
     return name_code_map
 
@@ -1130,24 +1046,27 @@ def stock_concept_fund_flow_hist(symbol: str = "数据要素") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+            "-",
+            "-",
+            "-",
+            "-",
+        ],
+        dtypes={"日期": "str", "-": "str"},
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -1163,36 +1082,6 @@ def stock_concept_fund_flow_hist(symbol: str = "数据要素") -> pd.DataFrame:
             "小单净流入-净占比",
         ]
     ]
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
     temp_df["日期"] = pd.to_datetime(temp_df["日期"]).dt.date
     return temp_df
 
@@ -1229,7 +1118,7 @@ def stock_main_fund_flow(symbol: str = "全部股票") -> pd.DataFrame:
         "ut": "b2884a393a59ad64002292a3e90d46a5",
         "fs": symbol_map[symbol],
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.rename(
         columns={
             "index": "序号",
@@ -12,24 +12,9 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 import datetime
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from ..datasets import get_ths_js
-
-
-def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+from ..utils.js_pool import js_call
 
 
 def stock_hold_control_cninfo(symbol: str = "全部") -> pd.DataFrame:
@@ -49,10 +34,7 @@ def stock_hold_control_cninfo(symbol: str = "全部") -> pd.DataFrame:
         "全部": "",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1033"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Enckey": mcode,
@@ -118,10 +100,7 @@ def stock_hold_management_detail_cninfo(symbol: str = "增持") -> pd.DataFrame:
     }
     current_date = datetime.datetime.now().date().isoformat()
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1030"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Encoding": "gzip, deflate",
@@ -213,10 +192,7 @@ def stock_hold_change_cninfo(symbol: str = "全部") -> pd.DataFrame:
         "全部": "",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1029"
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "/",
         "Accept-Enckey": mcode,
@@ -10,6 +10,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
+
 
 def stock_hold_management_detail_em() -> pd.DataFrame:
     """
@@ -37,7 +39,7 @@ def stock_hold_management_detail_em() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -50,7 +52,8 @@ def stock_hold_management_detail_em() -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.rename(
         columns={
@@ -10,23 +10,8 @@ https://webapi.cninfo.com.cn/api/stock/p_stock2110
 import numpy as np
 import pandas as pd
 import requests
-import py_mini_racer
 
-from ..datasets import get_ths_js
-
-
-def _get_file_content_ths(file: str = "cninfo.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+from ..utils.js_pool import js_call
 
 
 def stock_industry_category_cninfo(symbol: str = "巨潮行业分类标准") -> pd.DataFrame:
@@ -52,10 +37,7 @@ def stock_industry_category_cninfo(symbol: str = "巨潮行业分类标准") ->
     }
     url = "https://webapi.cninfo.com.cn/api/stock/p_public0002"
     params = {"indcode": "", "indtype": symbol_map[symbol], "format": "json"}
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Encoding": "gzip, deflate",
@@ -126,10 +108,7 @@ def stock_industry_change_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
-    mcode = js_code.call("getResCode1")
+    mcode = js_call("cninfo.js", "getResCode1")
     headers = {
         "Accept": "*/*",
         "Accept-Encoding": "gzip, deflate",
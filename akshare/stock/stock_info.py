@@ -9,16 +9,18 @@ import json
 import warnings
 # from functools import lru_cache
 from ..utils.redis_cache import lru_cache
-from io import BytesIO
 from io import StringIO
 
 import pandas as pd
 import requests
+from ..utils.func import concat_pages
+from ..utils.parse_pool import read_excel
 from ..utils.tqdm import get_tqdm
 
 
 @lru_cache(
     func_key='a:sz:name_codes',
+    stale_ttl=24 * 60 * 60,  # 过期后一天内先返回旧值并后台刷新
 )
 def stock_info_sz_name_code(symbol: str = "A股列表") -> pd.DataFrame:
     """
@@ -45,7 +47,7 @@ def stock_info_sz_name_code(symbol: str = "A股列表") -> pd.DataFrame:
     r = requests.get(url, params=params, timeout=15)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content))
+        temp_df = read_excel(r.content)
     if len(temp_df) > 10:
         if symbol == "A股列表":
             temp_df["A股代码"] = (
@@ -123,6 +125,7 @@ def stock_info_sz_name_code(symbol: str = "A股列表") -> pd.DataFrame:
 
 @lru_cache(
     func_key='a:sh:name_codes',
+    stale_ttl=24 * 60 * 60,  # 过期后一天内先返回旧值并后台刷新
 )
 def stock_info_sh_name_code(symbol: str = "主板A股") -> pd.DataFrame:
     """
@@ -188,6 +191,7 @@ def stock_info_sh_name_code(symbol: str = "主板A股") -> pd.DataFrame:
 
 @lru_cache(
     func_key='a:bj:name_codes',
+    stale_ttl=24 * 60 * 60,  # 过期后一天内先返回旧值并后台刷新
 )
 def stock_info_bj_name_code() -> pd.DataFrame:
     """
@@ -213,7 +217,7 @@ def stock_info_bj_name_code() -> pd.DataFrame:
     data_text = r.text
     data_json = json.loads(data_text[data_text.find("[") : -1])
     total_page = data_json[0]["totalPages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(total_page), leave=False):
         payload.update({"page": page})
@@ -222,7 +226,8 @@ def stock_info_bj_name_code() -> pd.DataFrame:
         data_json = json.loads(data_text[data_text.find("[") : -1])
         temp_df = data_json[0]["content"]
         temp_df = pd.DataFrame(temp_df)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "上市日期",
         "-",
@@ -379,7 +384,7 @@ def stock_info_sz_delist(symbol: str = "终止上市公司") -> pd.DataFrame:
     r = requests.get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content))
+        temp_df = read_excel(r.content)
         if temp_df.empty:
             return pd.DataFrame()
         temp_df["证券代码"] = temp_df["证券代码"].astype("str").str.zfill(6)
@@ -408,7 +413,7 @@ def stock_info_sz_change_name(symbol: str = "全称变更") -> pd.DataFrame:
     r = requests.get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content))
+        temp_df = read_excel(r.content)
         temp_df["证券代码"] = temp_df["证券代码"].astype("str").str.zfill(6)
         temp_df["变更日期"] = pd.to_datetime(temp_df["变更日期"]).dt.date
         temp_df.sort_values(["变更日期"], inplace=True, ignore_index=True)
@@ -445,6 +450,7 @@ def stock_info_change_name(symbol: str = "000503") -> pd.DataFrame:
 
 @lru_cache(
     func_key='a:name_codes',
+    stale_ttl=24 * 60 * 60,  # 过期后一天内先返回旧值并后台刷新
 )
 def stock_info_a_code_name() -> pd.DataFrame:
     """
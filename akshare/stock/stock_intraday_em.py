@@ -11,6 +11,8 @@ import json
 import pandas as pd
 import requests
 
+from ..utils.schema import typed_output
+
 
 def __event_stream(url, params):
     # 使用 stream=True 参数来启用流式请求
@@ -26,6 +28,7 @@ def __event_stream(url, params):
             event_data = ""
 
 
+@typed_output
 def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
     """
     东方财富-分时数据
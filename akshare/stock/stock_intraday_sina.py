@@ -11,9 +11,12 @@ import math
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
+from ..utils.schema import typed_output
 from ..utils.tqdm import get_tqdm
 
 
+@typed_output
 def stock_intraday_sina(
     symbol: str = "sz000001", date: str = "20240321"
 ) -> pd.DataFrame:
@@ -48,14 +51,15 @@ def stock_intraday_sina(
     data_json = r.json()
     total_page = math.ceil(int(data_json) / 60)
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/CN_Bill.GetBillList"
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url=url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.sort_values(by=["ticktime"], inplace=True, ignore_index=True)
     big_df["price"] = pd.to_numeric(big_df["price"], errors="coerce")
     big_df["volume"] = pd.to_numeric(big_df["volume"], errors="coerce")
@@ -9,12 +9,14 @@ https://www.sse.com.cn/market/stockdata/statistic/
 """
 
 import warnings
-from io import BytesIO, StringIO
+from io import StringIO
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.parse_pool import read_excel
+
 
 def stock_szse_summary(date: str = "20240830") -> pd.DataFrame:
     """
@@ -36,7 +38,7 @@ def stock_szse_summary(date: str = "20240830") -> pd.DataFrame:
     r = requests.get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl")
+        temp_df = read_excel(r.content, engine="openpyxl")
     temp_df["证券类别"] = temp_df["证券类别"].str.strip()
     temp_df.iloc[:, 2:] = temp_df.iloc[:, 2:].map(lambda x: x.replace(",", ""))
     temp_df.columns = ["证券类别", "数量", "成交金额", "总市值", "流通市值"]
@@ -67,7 +69,7 @@ def stock_szse_area_summary(date: str = "202203") -> pd.DataFrame:
     r = requests.get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl")
+        temp_df = read_excel(r.content, engine="openpyxl")
     column_map = {
         "序号": "序号",
         "地区": "地区",
@@ -9,6 +9,7 @@ https://quote.eastmoney.com/center/gridlist.html#us_pinksheet
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -40,13 +41,14 @@ def stock_us_pink_spot_em() -> pd.DataFrame:
 
     total_page = math.ceil(data_json["data"]["total"] / 100)
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    big_list = []
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pn": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["diff"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "_",
         "最新价",
@@ -16,11 +16,11 @@ from tqdm import tqdm
 
 from .cons import (
     js_hash_text,
-    zh_js_decode,
     us_sina_stock_list_url,
     us_sina_stock_dict_payload,
     us_sina_stock_hist_qfq_url,
 )
+from ..utils.sina_decode import hk_js_decode_frame
 
 
 @lru_cache()
@@ -130,10 +130,7 @@ def stock_us_daily(symbol: str = "FB", adjust: str = "") -> pd.DataFrame:
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     res = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
-    dict_list = js_code.call("d", res.text.split("=")[1].split(";")[0].replace('"', ""))
-    data_df = pd.DataFrame(dict_list)
+    data_df = hk_js_decode_frame(res.text.split("=")[1].split(";")[0].replace('"', ""))
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
     data_df.index = pd.to_datetime(data_df["date"])
     del data_df["amount"]
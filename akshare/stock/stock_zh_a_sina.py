@@ -7,10 +7,11 @@ https://finance.sina.com.cn/realstock/company/sh689009/nc.shtml
 """
 
 import json
+import math
 import re
+from typing import Iterator
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from .cons import (
@@ -18,13 +19,15 @@ from .cons import (
     zh_sina_a_stock_url,
     zh_sina_a_stock_count_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.func import paginated
+from ..utils.schema import typed_output
 from ..utils.tqdm import get_tqdm
+from ..utils.sina_decode import hk_js_decode_frame
 
 
 def _get_zh_a_page_count() -> int:
@@ -35,21 +38,19 @@ def _get_zh_a_page_count() -> int:
     :rtype: int
     """
     res = requests.get(zh_sina_a_stock_count_url)
-    page_count = int(re.findall(re.compile(r"\d+"), res.text)[0]) / 80
-    if isinstance(page_count, int):
-        return page_count
-    else:
-        return int(page_count) + 1
+    total = int(re.findall(re.compile(r"\d+"), res.text)[0])
+    return math.ceil(total / 80)
 
 
-def stock_zh_a_spot() -> pd.DataFrame:
+@typed_output
+@paginated
+def stock_zh_a_spot() -> Iterator[pd.DataFrame]:
     """
     新浪财经-所有 A 股的实时行情数据; 重复运行本函数会被新浪暂时封 IP
     https://vip.stock.finance.sina.com.cn/mkt/#hs_a
     :return: 所有股票的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
     page_count = _get_zh_a_page_count()
     zh_sina_stock_payload_copy = zh_sina_a_stock_payload.copy()
     tqdm = get_tqdm()
@@ -58,54 +59,34 @@ def stock_zh_a_spot() -> pd.DataFrame:
     ):
         zh_sina_stock_payload_copy.update({"page": page})
         r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
-
-    big_df = big_df.astype(
-        {
-            "trade": "float",
-            "pricechange": "float",
-            "changepercent": "float",
-            "buy": "float",
-            "sell": "float",
-            "settlement": "float",
-            "open": "float",
-            "high": "float",
-            "low": "float",
-            "volume": "float",
-            "amount": "float",
-            "per": "float",
-            "pb": "float",
-            "mktcap": "float",
-            "nmc": "float",
-            "turnoverratio": "float",
-        }
-    )
-    big_df.columns = [
-        "代码",
-        "_",
-        "名称",
-        "最新价",
-        "涨跌额",
-        "涨跌幅",
-        "买入",
-        "卖出",
-        "昨收",
-        "今开",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "时间戳",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-    ]
-    big_df = big_df[
-        [
+        data_json = relaxed_json.decode(r.text)
+        temp_df = pd.DataFrame(data_json)
+        # NOTE(akshare): 新浪可能返回 null 或空列表, 空页没有任何字段, 跳过
+        if temp_df.empty:
+            continue
+        temp_df = temp_df.astype(
+            {
+                "trade": "float",
+                "pricechange": "float",
+                "changepercent": "float",
+                "buy": "float",
+                "sell": "float",
+                "settlement": "float",
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "volume": "float",
+                "amount": "float",
+                "per": "float",
+                "pb": "float",
+                "mktcap": "float",
+                "nmc": "float",
+                "turnoverratio": "float",
+            }
+        )
+        temp_df.columns = [
             "代码",
+            "_",
             "名称",
             "最新价",
             "涨跌额",
@@ -119,11 +100,34 @@ def stock_zh_a_spot() -> pd.DataFrame:
             "成交量",
             "成交额",
             "时间戳",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
         ]
-    ]
-    return big_df
+        temp_df = temp_df[
+            [
+                "代码",
+                "名称",
+                "最新价",
+                "涨跌额",
+                "涨跌幅",
+                "买入",
+                "卖出",
+                "昨收",
+                "今开",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "时间戳",
+            ]
+        ]
+        yield temp_df
 
 
+@typed_output
 def stock_zh_a_daily(
     symbol: str = "sh603843",
     start_date: str = "19900101",
@@ -175,12 +179,9 @@ def stock_zh_a_daily(
         return _fq_factor(adjust.split("-")[0])
 
     r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = hk_js_decode_frame(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
+    )
     data_df.index = pd.to_datetime(data_df["date"], errors="coerce").dt.date
     del data_df["date"]
     try:
@@ -194,7 +195,9 @@ def stock_zh_a_daily(
         pass
     data_df = data_df.astype("float")
     r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = relaxed_json.decode(
+        r.text[r.text.find("[") : r.text.rfind("]") + 1]
+    )
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.columns = ["date", "outstanding_share"]
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
@@ -322,12 +325,9 @@ def stock_zh_a_cdr_daily(
     :rtype: pandas.DataFrame
     """
     res = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = hk_js_decode_frame(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
+    )
     data_df.index = pd.to_datetime(data_df["date"])
     del data_df["date"]
     data_df = data_df.astype("float")
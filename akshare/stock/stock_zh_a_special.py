@@ -14,7 +14,7 @@ import math
 import pandas as pd
 import requests
 
-from ..utils.func import fetch_paginated_data
+from ..utils.func import concat_pages, fetch_paginated_data
 
 
 def stock_zh_a_st_em() -> pd.DataFrame:
@@ -38,7 +38,7 @@ def stock_zh_a_st_em() -> pd.DataFrame:
         "fields": "f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "最新价",
@@ -128,7 +128,7 @@ def stock_zh_a_new_em() -> pd.DataFrame:
         "fields": "f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,"
         "f20,f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "最新价",
@@ -218,7 +218,7 @@ def stock_zh_a_stop_em() -> pd.DataFrame:
         "fields": "f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,"
         "f18,f20,f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "最新价",
@@ -299,7 +299,7 @@ def stock_zh_a_new() -> pd.DataFrame:
     r = requests.get(url, params=params)
     total_page = math.ceil(int(r.json()) / 80)
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, total_page + 1):
         params = {
             "page": str(page),
@@ -314,7 +314,8 @@ def stock_zh_a_new() -> pd.DataFrame:
         r.encoding = "gb2312"
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df = big_df[
         [
             "symbol",
@@ -12,7 +12,11 @@ import warnings
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
+from ..utils.schema import typed_output
 
+
+@typed_output
 def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
     """
     腾讯财经-历史分笔数据
@@ -22,7 +26,7 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
     :return: 历史分笔数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_list = []
     page = 0
     warnings.warn("正在下载数据，请稍等")
     while True:
@@ -42,9 +46,10 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
                 .str.split("/", expand=True)
             )
             page += 1
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_list.append(temp_df)
         except:  # noqa: E722
             break
+    big_df = concat_pages(big_list)
     if not big_df.empty:
         big_df = big_df.iloc[:, 1:].copy()
         big_df.columns = [
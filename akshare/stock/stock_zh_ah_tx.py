@@ -11,6 +11,7 @@ import random
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from .cons import (
     hk_url,
     hk_headers,
@@ -18,7 +19,7 @@ from .cons import (
     hk_stock_headers,
     hk_stock_payload,
 )
-from ..utils import demjson
+from ..utils import relaxed_json
 from ..utils.tqdm import get_tqdm
 
 
@@ -32,7 +33,7 @@ def _get_zh_stock_ah_page_count() -> int:
     hk_payload_copy = hk_payload.copy()
     hk_payload_copy.update({"reqPage": 1})
     r = requests.get(hk_url, params=hk_payload_copy, headers=hk_headers)
-    data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+    data_json = relaxed_json.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
     page_count = data_json["data"]["page_count"]
     return page_count
 
@@ -50,7 +51,9 @@ def stock_zh_ah_spot() -> pd.DataFrame:
     for i in tqdm(range(0, page_count), leave=False):
         hk_payload.update({"reqPage": i})
         r = requests.get(hk_url, params=hk_payload, headers=hk_headers)
-        data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+        data_json = relaxed_json.decode(
+            r.text[r.text.find("{") : r.text.rfind("}") + 1]
+        )
         big_df = pd.concat(
             objs=[
                 big_df,
@@ -120,7 +123,9 @@ def stock_zh_ah_name() -> pd.DataFrame:
     for i in tqdm(range(0, page_count), leave=False):
         hk_payload.update({"reqPage": i})
         r = requests.get(hk_url, params=hk_payload, headers=hk_headers)
-        data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+        data_json = relaxed_json.decode(
+            r.text[r.text.find("{") : r.text.rfind("}") + 1]
+        )
         big_df = pd.concat(
             objs=[
                 big_df,
@@ -174,7 +179,7 @@ def stock_zh_ah_daily(
     :return: 指定股票在指定年份的日频率历史行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for year in tqdm(range(int(start_year), int(end_year)), leave=False):
         # year = "2003"
@@ -214,7 +219,9 @@ def stock_zh_ah_daily(
                 params=hk_stock_payload_copy,
                 headers=hk_stock_headers,
             )
-        data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+        data_json = relaxed_json.decode(
+            r.text[r.text.find("{") : r.text.rfind("}") + 1]
+        )
         try:
             if adjust == "":
                 temp_df = pd.DataFrame(data_json["data"][f"hk{symbol}"]["day"])
@@ -249,7 +256,8 @@ def stock_zh_ah_daily(
             except:  # noqa
                 temp_df.columns = ["日期", "开盘", "收盘", "最高", "最低", "成交量"]
             temp_df = temp_df[["日期", "开盘", "收盘", "最高", "最低", "成交量"]]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
     big_df["开盘"] = pd.to_numeric(big_df["开盘"], errors="coerce")
     big_df["收盘"] = pd.to_numeric(big_df["收盘"], errors="coerce")
@@ -12,17 +12,17 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
 
+from ..utils.func import concat_pages
 from .cons import (
     zh_sina_a_stock_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.sina_decode import hk_js_decode_frame
 
 
 @lru_cache()
@@ -62,12 +62,13 @@ def stock_zh_b_spot() -> pd.DataFrame:
         "symbol": "",
         "_s_r_a": "page",
     }
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, page_count + 1):
         zh_sina_stock_payload_copy.update({"page": page})
         r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = relaxed_json.decode(r.text)
+        big_list.append(pd.DataFrame(data_json))
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "代码",
         "_",
@@ -172,12 +173,7 @@ def stock_zh_b_daily(
         return _fq_factor(adjust.split("-")[0])
 
     r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = hk_js_decode_frame(r.text.split("=")[1].split(";")[0].replace('"', ""))
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
     del data_df["date"]
     del data_df["amount"]
@@ -185,7 +181,9 @@ def stock_zh_b_daily(
 
     data_df = data_df.astype("float")
     r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = relaxed_json.decode(
+        r.text[r.text.find("[") : r.text.rfind("]") + 1]
+    )
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
     del amount_data_df["date"]
@@ -10,6 +10,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
+
 
 def _stock_zh_kcb_report_em_page() -> int:
     """
@@ -49,7 +51,7 @@ def stock_zh_kcb_report_em(from_page: int = 1, to_page: int = 100) -> pd.DataFra
     """
     url = "https://np-anotice-stock.eastmoney.com/api/security/ann"
     total_page = _stock_zh_kcb_report_em_page()
-    big_df = pd.DataFrame()
+    big_list = []
     if to_page >= total_page:
         to_page = total_page
     for i in tqdm(range(from_page, to_page + 1), leave=False):
@@ -77,7 +79,8 @@ def stock_zh_kcb_report_em(from_page: int = 1, to_page: int = 100) -> pd.DataFra
                 [item["art_code"] for item in data_json["data"]["list"]],
             ]
         ).T
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.columns = [
         "代码",
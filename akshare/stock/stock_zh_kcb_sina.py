@@ -8,11 +8,12 @@ Desc: 新浪财经-科创板-实时行情数据和历史行情数据(包含前
 import datetime
 import re
 
-from ..utils import demjson
+from ..utils import relaxed_json
 import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
 from .cons import (
     zh_sina_kcb_stock_payload,
     zh_sina_kcb_stock_url,
@@ -46,15 +47,16 @@ def stock_zh_kcb_spot() -> pd.DataFrame:
     :return: 科创板实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_list = []
     page_count = get_zh_kcb_page_count()
     zh_sina_stock_payload_copy = zh_sina_kcb_stock_payload.copy()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_stock_payload_copy.update({"page": page})
         zh_sina_stock_payload_copy.update({"_s_r_a": "page"})
         res = requests.get(zh_sina_kcb_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(res.text)
-        big_df = pd.concat([big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = relaxed_json.decode(res.text)
+        big_list.append(pd.DataFrame(data_json))
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "代码",
         "-",
@@ -136,14 +138,18 @@ def stock_zh_kcb_daily(symbol: str = "sh688399", adjust: str = "") -> pd.DataFra
             symbol, datetime.datetime.now().strftime("%Y_%m_%d"), symbol
         )
     )
-    data_json = demjson.decode(res.text[res.text.find("[") : res.text.rfind("]") + 1])
+    data_json = relaxed_json.decode(
+        res.text[res.text.find("[") : res.text.rfind("]") + 1]
+    )
     data_df = pd.DataFrame(data_json)
     data_df.index = pd.to_datetime(data_df["d"])
     data_df.index.name = "date"
     del data_df["d"]
 
     r = requests.get(zh_sina_kcb_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = relaxed_json.decode(
+        r.text[r.text.find("[") : r.text.rfind("]") + 1]
+    )
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
     del amount_data_df["date"]
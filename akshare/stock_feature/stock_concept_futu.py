@@ -12,6 +12,8 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.func import concat_pages
+
 
 def _stock_concept_cons_futu(symbol: str = "巴菲特持仓") -> pd.DataFrame:
     """
@@ -125,7 +127,7 @@ def stock_concept_cons_futu(symbol: str = "特朗普概念股") -> pd.DataFrame:
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["data"]["pagination"]["pageCount"]
-        big_df = pd.DataFrame()
+        big_list = []
         for page in range(0, total_page):
             params.update(
                 {
@@ -137,7 +139,8 @@ def stock_concept_cons_futu(symbol: str = "特朗普概念股") -> pd.DataFrame:
             r = requests.get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["data"]["list"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_list.append(temp_df)
+        big_df = concat_pages(big_list)
 
         big_df.rename(
             columns={
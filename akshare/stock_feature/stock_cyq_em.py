@@ -6,218 +6,310 @@ Desc: 东方财富网-概念板-行情中心-日K-筹码分布
 https://quote.eastmoney.com/concept/sz000001.html
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-import py_mini_racer
 import requests
 
+from ..utils.kline import parse_klines
+from ..utils.tqdm import get_tqdm
 
-def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
+
+_FACTOR = 150
+_OUTPUT_DAYS = 90
+_KLINE_LIMIT = 210
+# NOTE(akshare): 每批同时计算的 (股票, 日期) 行数, 控制 (行数, 150) 筹码矩阵的内存占用
+_CHUNK_ROWS = 8192
+_RESULT_COLUMNS = [
+    "日期",
+    "获利比例",
+    "平均成本",
+    "90成本-低",
+    "90成本-高",
+    "90集中度",
+    "70成本-低",
+    "70成本-高",
+    "70集中度",
+]
+
+
+def _two_product(a: np.ndarray, b: float):
+    """Dekker 无误差乘法: a * b == product + error (精确)"""
+    product = a * b
+    a_big = a * 134217729.0
+    a_hi = a_big - (a_big - a)
+    a_lo = a - a_hi
+    b_big = b * 134217729.0
+    b_hi = b_big - (b_big - b)
+    b_lo = b - b_hi
+    error = ((a_hi * b_hi - product) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+    return product, error
+
+
+def _to_precision12(values: np.ndarray) -> np.ndarray:
     """
-    东方财富网-概念板-行情中心-日K-筹码分布
-    https://quote.eastmoney.com/concept/sz000001.html
-    :param symbol: 股票代码
-    :type symbol: str
-    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
-    :type adjust: str
-    :return: 筹码分布
-    :rtype: pandas.DataFrame
+    向量化的 Number(x.toPrecision(12)), 按二进制精确值保留 12 位有效数字
     """
-    html_str = """
-    // @ts-nocheck
-
-    /**
-     * 计算分布及相关指标
-     * @param {number} index 当前选中的K线的索引
-     * @return {{x: Array.<number>, y: Array.<number>}}
-     */
-    /**
-    this.range = 120;
-    */
-    function CYQCalculator(index, klinedata) {
-        var maxprice = 0;
-        var minprice = 0;
-        var factor = 150;
-        var start = this.range ? Math.max(0, index - this.range + 1) : 0;
-        /**
-         * K图数据[time,open,close,high,low,volume,amount,amplitude,turnoverRate]
-         */
-        var kdata = klinedata.slice(start, Math.max(1, index + 1));
-        if (kdata.length === 0) throw 'invaild index';
-        for (var i = 0; i < kdata.length; i++) {
-            var elements = kdata[i];
-            maxprice = !maxprice ? elements.high : Math.max(maxprice, elements.high);
-            minprice = !minprice ? elements.low : Math.min(minprice, elements.low);
-        }
+    result = values.copy()
+    magnitude = np.abs(values)
+    todo = np.flatnonzero((magnitude != 0) & np.isfinite(magnitude))
+    flat_values = values.ravel()
+    flat_result = result.ravel()
+    with np.errstate(divide="ignore"):
+        shift = 11 - np.floor(np.log10(magnitude.ravel()[todo])).astype(np.int64)
+    x = flat_values[todo]
+    # NOTE(akshare): 10 ** shift 仅在 0..22 内可精确表示, 其余极少出现的情况逐个格式化
+    exact = (shift >= 0) & (shift <= 22)
+    for _ in range(2):
+        scale = 10.0 ** np.where(exact, shift, 0)
+        product, error = _two_product(np.abs(x), scale)
+        digits = np.floor(product)
+        # 修正 log10 在 10 的整数次幂附近的误差, 保证整数部分恰好 12 位
+        wrong = exact & ((digits >= 1e12) | (digits < 1e11))
+        if not wrong.any():
+            break
+        shift = np.where(wrong & (digits >= 1e12), shift - 1, shift)
+        shift = np.where(wrong & (digits < 1e11), shift + 1, shift)
+        exact &= (shift >= 0) & (shift <= 22)
+    # 舍入: 小数部分大于等于 0.5 时进位(与 JS 一致, 正好一半时取较大值)
+    digits += ((product - digits) - 0.5) + error >= 0
+    flat_result[todo] = np.where(exact, np.copysign(digits / scale, x), 0)
+    for i in todo[~exact]:
+        flat_result[i] = float(f"{flat_values[i]:.11e}")
+    return result
 
-        // 精度不小于0.01 产品逻辑
-        var accuracy = Math.max(0.01, (maxprice - minprice) / (factor - 1));
-        /**
-         * 值域
-         * @type {Array.<number>}
-         */
-        var yrange = [];
-        for (var i = 0; i < factor; i++) {
-            yrange.push((minprice + accuracy * i).toFixed(2) / 1);
-        }
-        /**
-         * 横轴数据
-         */
-        var xdata = createNumberArray(factor);
-
-        for (var i = 0; i < kdata.length; i++) {
-            var eles = kdata[i];
-
-            var open = eles.open,
-                close = eles.close,
-                high = eles.high,
-                low = eles.low,
-                avg = (open + close + high + low) / 4,
-                turnoverRate = Math.min(1, eles.hsl / 100 || 0);
-
-            var H = Math.floor((high - minprice) / accuracy),
-                L = Math.ceil((low - minprice) / accuracy),
-                // G点坐标, 一字板时, X为进度因子
-                GPoint = [high == low ? factor - 1 : 2 / (high - low), Math.floor((avg - minprice) / accuracy)];
-            // 衰减
-            for (var n = 0; n < xdata.length; n++) {
-                xdata[n] *= (1 - turnoverRate);
-            }
 
-            if (high == low) {
-                // 一字板时，画矩形面积是三角形的2倍
-                xdata[GPoint[1]] += GPoint[0] * turnoverRate / 2;
-            } else {
-                for (var j = L; j <= H; j++) {
-                    var curprice = minprice + accuracy * j;
-                    if (curprice <= avg) {
-                        // 上半三角叠加分布分布
-                        if (Math.abs(avg - low) < 1e-8) {
-                            xdata[j] += GPoint[0] * turnoverRate;
-                        } else {
-                            xdata[j] += (curprice - low) / (avg - low) * GPoint[0] * turnoverRate;
-                        }
-                    } else {
-                        // 下半三角叠加分布分布
-                        if (Math.abs(high - avg) < 1e-8) {
-                            xdata[j] += GPoint[0] * turnoverRate;
-                        } else {
-                            xdata[j] += (high - curprice) / (high - avg) * GPoint[0] * turnoverRate;
-                        }
-                    }
-                }
-            }
+def _to_fixed2(values: np.ndarray) -> np.ndarray:
+    """
+    Number(x.toFixed(2)): 按二进制精确值四舍五入到 2 位小数
+    """
+    quantum = Decimal("0.01")
+    return np.array(
+        [float(Decimal(value).quantize(quantum, ROUND_HALF_UP)) for value in values]
+    )
 
-        }
 
+def _cyq_rows(
+    kline: Dict[str, np.ndarray],
+    symbol_index: np.ndarray,
+    day_index: np.ndarray,
+    lookback: Optional[int],
+) -> Dict[str, np.ndarray]:
+    """
+    计算一批 (股票, 日期) 的筹码分布指标
+    与东方财富 CYQCalculator 逐日迭代的浮点运算顺序一致, 但所有行在同一次遍历中向量化完成
+    :param kline: open/close/high/low/hsl 二维数组, 形状为 (股票数, 最大 K 线数), 不足部分为 NaN
+    :type kline: dict
+    :param symbol_index: 每行对应的股票下标
+    :type symbol_index: numpy.ndarray
+    :param day_index: 每行对应的 K 线下标
+    :type day_index: numpy.ndarray
+    :param lookback: 参与计算的 K 线数, None 为全部历史
+    :type lookback: int
+    :return: 各指标列
+    :rtype: dict
+    """
+    rows = len(day_index)
+    start = (
+        np.zeros(rows, dtype=np.int64)
+        if lookback is None
+        else np.maximum(0, day_index - lookback + 1)
+    )
+    last_day = int(day_index.max()) + 1
+    first_day = int(start.min())
+    high_all = kline["high"][symbol_index]
+    low_all = kline["low"][symbol_index]
 
-        var currentprice = klinedata[index].close;
-        var totalChips = 0;
-        for (var i = 0; i < factor; i++) {
-            var x = xdata[i].toPrecision(12) / 1;
-            //if (x < 0) xdata[i] = 0;
-            totalChips += x;
-        }
-        var result = new CYQData();
-        result.x = xdata;
-        result.y = yrange;
-        result.benefitPart = result.getBenefitPart(currentprice);
-        result.avgCost = getCostByChip(totalChips * 0.5).toFixed(2);
-        result.percentChips = {
-            '90': result.computePercentChips(0.9),
-            '70': result.computePercentChips(0.7)
-        };
-        return result;
-
-        /**
-         * 获取指定筹码处的成本
-         * @param {number} chip 堆叠筹码
-         */
-        function getCostByChip(chip) {
-            var result = 0,
-                sum = 0;
-            for (var i = 0; i < factor; i++) {
-                var x = xdata[i].toPrecision(12) / 1;
-                if (sum + x > chip) {
-                    result = minprice + i * accuracy;
-                    break;
-                }
-                sum += x;
-            }
-            return result;
-        }
+    # 价格区间: 与原脚本一致, 当前值为 0 或 NaN 时直接取新值
+    max_price = np.zeros(rows)
+    min_price = np.zeros(rows)
+    with np.errstate(invalid="ignore"):
+        for k in range(first_day, last_day):
+            active = (start <= k) & (k <= day_index)
+            high, low = high_all[:, k], low_all[:, k]
+            max_price = np.where(
+                active,
+                np.where(max_price == 0, high, np.maximum(max_price, high)),
+                max_price,
+            )
+            min_price = np.where(
+                active,
+                np.where(min_price == 0, low, np.minimum(min_price, low)),
+                min_price,
+            )
+            max_price = np.where(np.isnan(max_price), 0, max_price)
+            min_price = np.where(np.isnan(min_price), 0, min_price)
+    accuracy = np.maximum(0.01, (max_price - min_price) / (_FACTOR - 1))
 
-        /**
-         * 筹码分布数据
-         */
-        function CYQData() {
-            /**
-             * 筹码堆叠
-             * @type {Array.<number>}
-             */
-            this.x = arguments[0];
-            /**
-             * 价格分布
-             * @type {Array.<number>}
-             */
-            this.y = arguments[1];
-            /**
-             * 获利比例
-             * @type {number}
-             */
-            this.benefitPart = arguments[2];
-            /**
-             * 平均成本
-             * @type {number}
-             */
-            this.avgCost = arguments[3];
-            /**
-             * 百分比筹码
-             * @type {{Object.<string, {{priceRange: number[], concentration: number}}>}}
-             */
-            this.percentChips = arguments[4];
-            /**
-             * 计算指定百分比的筹码
-             * @param {number} percent 百分比大于0，小于1
-             */
-            this.computePercentChips = function (percent) {
-                if (percent > 1 || percent < 0) throw 'argument "percent" out of range';
-                var ps = [(1 - percent) / 2, (1 + percent) / 2];
-                var pr = [getCostByChip(totalChips * ps[0]), getCostByChip(totalChips * ps[1])];
-                return {
-                    priceRange: [pr[0].toFixed(2), pr[1].toFixed(2)],
-                    concentration: pr[0] + pr[1] === 0 ? 0 : (pr[1] - pr[0]) / (pr[0] + pr[1])
-                };
-            };
-            /**
-             * 获取指定价格的获利比例
-             * @param {number} price 价格
-             */
-            this.getBenefitPart = function (price) {
-                var below = 0;
-                for (var i = 0; i < factor; i++) {
-                    var x = xdata[i].toPrecision(12) / 1;
-                    if (price >= minprice + i * accuracy) {
-                        below += x;
-                    }
-                }
-                return totalChips == 0 ? 0 : below / totalChips;
-            };
-        }
-    }
+    grid = np.arange(_FACTOR)
+    chips = np.zeros((rows, _FACTOR))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k in range(first_day, last_day):
+            active = (start <= k) & (k <= day_index)
+            turnover = kline["hsl"][symbol_index, k] / 100
+            turnover = np.minimum(1, np.where(np.isnan(turnover), 0, turnover))
+            turnover = np.where(active, turnover, 0)
+            # 衰减: 未参与计算的行乘以 1, 结果不变
+            chips *= (1 - turnover)[:, None]
 
+            idx = np.flatnonzero(turnover != 0)
+            if len(idx) == 0:
+                continue
+            t = turnover[idx]
+            sym = symbol_index[idx]
+            open_, close = kline["open"][sym, k], kline["close"][sym, k]
+            high, low = high_all[idx, k], low_all[idx, k]
+            lo, acc = min_price[idx], accuracy[idx]
+            avg = (open_ + close + high + low) / 4
+            flat = high == low
+            g0 = np.where(flat, _FACTOR - 1, 2 / (high - low))
+            g1 = np.floor((avg - lo) / acc)
 
-    function createNumberArray(count) {
-        var array = [];
-        for (var i = 0; i < count; i++) {
-            array.push(0);
+            # 一字板: 矩形面积是三角形的 2 倍
+            flat_idx = np.flatnonzero(flat & (g1 >= 0) & (g1 < _FACTOR))
+            if len(flat_idx):
+                chips[idx[flat_idx], g1[flat_idx].astype(np.int64)] += (
+                    g0[flat_idx] * t[flat_idx] / 2
+                )
+
+            tri_idx = np.flatnonzero(~flat)
+            if len(tri_idx) == 0:
+                continue
+            lo, acc = lo[tri_idx], acc[tri_idx]
+            high, low, avg = high[tri_idx], low[tri_idx], avg[tri_idx]
+            upper = np.minimum(np.floor((high - lo) / acc), _FACTOR - 1)
+            lower = np.maximum(np.ceil((low - lo) / acc), 0)
+            # 只计算当天价格区间 [L, H] 覆盖的格子, 所有行的格子展开为一维
+            count = np.maximum(upper - lower + 1, 0).astype(np.int64)
+            cell = np.repeat(tri_idx, count)
+            if len(cell) == 0:
+                continue
+            row_cell = np.repeat(np.arange(len(tri_idx)), count)
+            column = lower[row_cell] + (
+                np.arange(len(cell)) - (np.cumsum(count) - count)[row_cell]
+            )
+            t, g0 = t[cell], g0[cell]
+            high, low, avg = high[row_cell], low[row_cell], avg[row_cell]
+            price = lo[row_cell] + acc[row_cell] * column
+            rising = np.where(
+                np.abs(avg - low) < 1e-8, g0 * t, (price - low) / (avg - low) * g0 * t
+            )
+            falling = np.where(
+                np.abs(high - avg) < 1e-8,
+                g0 * t,
+                (high - price) / (high - avg) * g0 * t,
+            )
+            chips[idx[cell], column.astype(np.int64)] += np.where(
+                price <= avg, rising, falling
+            )
+
+    chips = _to_precision12(chips)
+    cum_chips = np.cumsum(chips, axis=1)
+    total = cum_chips[:, -1]
+
+    def cost_by_chip(chip: np.ndarray) -> np.ndarray:
+        above = cum_chips > chip[:, None]
+        found = above.any(axis=1)
+        return np.where(found, min_price + above.argmax(axis=1) * accuracy, 0)
+
+    price = kline["close"][symbol_index, day_index]
+    below = np.where(
+        price[:, None] >= min_price[:, None] + grid * accuracy[:, None], chips, 0
+    )
+    below = np.cumsum(below, axis=1)[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = {
+            "获利比例": np.where(total == 0, 0, below / total),
+            "平均成本": _to_fixed2(cost_by_chip(total * 0.5)),
         }
-        return array;
-    }
+        for percent in (0.9, 0.7):
+            low = cost_by_chip(total * ((1 - percent) / 2))
+            high = cost_by_chip(total * ((1 + percent) / 2))
+            name = str(int(percent * 100))
+            result[f"{name}成本-低"] = _to_fixed2(low)
+            result[f"{name}成本-高"] = _to_fixed2(high)
+            result[f"{name}集中度"] = np.where(
+                low + high == 0, 0, (high - low) / (low + high)
+            )
+    return result
+
+
+def _cyq_compute(
+    kline_list: List[pd.DataFrame], lookback: Optional[int] = None
+) -> List[pd.DataFrame]:
+    """
+    批量计算多只股票最近 90 个交易日的筹码分布
+    :param kline_list: 日 K 线, 需包含 date/open/close/high/low/hsl 列
+    :type kline_list: list
+    :param lookback: 参与计算的 K 线数, None 为全部历史
+    :type lookback: int
+    :return: 与 kline_list 一一对应的筹码分布
+    :rtype: list
+    """
+    lengths = np.array([len(df) for df in kline_list], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    kline = {}
+    for item in ("open", "close", "high", "low", "hsl"):
+        kline[item] = np.full((len(kline_list), width), np.nan)
+        for i, df in enumerate(kline_list):
+            kline[item][i, : len(df)] = df[item].to_numpy(dtype="float64")
+    symbol_index = np.repeat(
+        np.arange(len(kline_list)), np.minimum(lengths, _OUTPUT_DAYS)
+    )
+    day_index = np.concatenate(
+        [np.arange(max(0, n - _OUTPUT_DAYS), n) for n in lengths] + [[]]
+    ).astype(np.int64)
+
+    columns = {name: [] for name in _RESULT_COLUMNS[1:]}
+    for begin in range(0, len(day_index), _CHUNK_ROWS):
+        chunk = slice(begin, begin + _CHUNK_ROWS)
+        for name, values in _cyq_rows(
+            kline, symbol_index[chunk], day_index[chunk], lookback
+        ).items():
+            columns[name].append(values)
+
+    result_list = []
+    offset = 0
+    for df in kline_list:
+        rows = min(len(df), _OUTPUT_DAYS)
+        temp_df = pd.DataFrame(
+            {
+                name: np.concatenate(values)[offset : offset + rows]
+                if values
+                else np.array([], dtype="float64")
+                for name, values in columns.items()
+            }
+        )
+        temp_df.insert(
+            0,
+            "日期",
+            pd.to_datetime(
+                df["date"].iloc[len(df) - rows :].to_numpy(), errors="coerce"
+            ).date,
+        )
+        result_list.append(temp_df)
+        offset += rows
+    return result_list
+
+
+def _stock_cyq_em_kline(
+    symbol: str = "000001", adjust: str = "", limit: int = _KLINE_LIMIT
+) -> pd.DataFrame:
+    """
+    东方财富网-日K 线, 用于计算筹码分布
+    :param symbol: 股票代码
+    :type symbol: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param limit: K 线数量
+    :type limit: int
+    :return: 日 K 线
+    :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(html_str)
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     market_code = 1 if symbol.startswith("6") else 0
     url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -228,12 +320,11 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         "klt": "101",
         "fqt": adjust_dict[adjust],
         "end": datetime.now().date().strftime("%Y%m%d"),
-        "lmt": "210",
+        "lmt": str(limit),
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
+    columns = [
         "date",
         "open",
         "close",
@@ -246,68 +337,91 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         "zde",
         "hsl",
     ]
-    for item in temp_df.columns[1:]:
-        temp_df[item] = pd.to_numeric(temp_df[item])
-    temp_df["index"] = range(0, len(temp_df))
-    records = temp_df.to_dict(orient="records")
-    date_list = []
-    benefit_part = []
-    avg_cost = []
-    pct_70_low = []
-    pct_70_high = []
-    pct_90_low = []
-    pct_90_high = []
-    pct_70_con = []
-    pct_90_con = []
-    for i in range(0, len(records)):
-        mcode = js_code.call("CYQCalculator", i, records)
-        date_list.append(records[i]["date"])
-        benefit_part.append(mcode["benefitPart"])
-        avg_cost.append(mcode["avgCost"])
-        pct_70_low.append(mcode["percentChips"]["70"]["priceRange"][0])
-        pct_70_high.append(mcode["percentChips"]["70"]["priceRange"][1])
-        pct_90_low.append(mcode["percentChips"]["90"]["priceRange"][0])
-        pct_90_high.append(mcode["percentChips"]["90"]["priceRange"][1])
-        pct_70_con.append(mcode["percentChips"]["70"]["concentration"])
-        pct_90_con.append(mcode["percentChips"]["90"]["concentration"])
-    temp_df = pd.DataFrame(
-        [
-            date_list,
-            benefit_part,
-            avg_cost,
-            pct_90_low,
-            pct_90_high,
-            pct_90_con,
-            pct_70_low,
-            pct_70_high,
-            pct_70_con,
-        ]
-    ).T
-    temp_df.columns = [
-        "日期",
-        "获利比例",
-        "平均成本",
-        "90成本-低",
-        "90成本-高",
-        "90集中度",
-        "70成本-低",
-        "70成本-高",
-        "70集中度",
-    ]
-    temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["获利比例"] = pd.to_numeric(temp_df["获利比例"], errors="coerce")
-    temp_df["平均成本"] = pd.to_numeric(temp_df["平均成本"], errors="coerce")
-    temp_df["90成本-低"] = pd.to_numeric(temp_df["90成本-低"], errors="coerce")
-    temp_df["90成本-高"] = pd.to_numeric(temp_df["90成本-高"], errors="coerce")
-    temp_df["90集中度"] = pd.to_numeric(temp_df["90集中度"], errors="coerce")
-    temp_df["70成本-低"] = pd.to_numeric(temp_df["70成本-低"], errors="coerce")
-    temp_df["70成本-高"] = pd.to_numeric(temp_df["70成本-高"], errors="coerce")
-    temp_df["70集中度"] = pd.to_numeric(temp_df["70集中度"], errors="coerce")
-    temp_df = temp_df.iloc[-90:, :].copy()
-    temp_df.reset_index(inplace=True, drop=True)
-    return temp_df
+    if not (data_json.get("data") or {}).get("klines"):
+        return pd.DataFrame(columns=columns)
+    return parse_klines(
+        data_json["data"]["klines"], columns=columns, dtypes={"date": "str"}
+    )
+
+
+def _kline_limit(lookback: Optional[int]) -> int:
+    # NOTE(akshare): 指定 lookback 时多取数据, 保证返回的第一天也有完整的 lookback 窗口
+    if lookback is None:
+        return _KLINE_LIMIT
+    return max(_KLINE_LIMIT, lookback + _OUTPUT_DAYS - 1)
+
+
+def stock_cyq_em(
+    symbol: str = "000001", adjust: str = "", lookback: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布
+    https://quote.eastmoney.com/concept/sz000001.html
+    :param symbol: 股票代码
+    :type symbol: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param lookback: 计算每天筹码分布时使用的 K 线数量, 默认使用获取到的全部 K 线(与网页一致)
+    :type lookback: int
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
+    """
+    temp_df = _stock_cyq_em_kline(
+        symbol=symbol, adjust=adjust, limit=_kline_limit(lookback)
+    )
+    return _cyq_compute([temp_df], lookback=lookback)[0]
+
+
+def stock_cyq_em_batch(
+    symbol_list: List[str],
+    adjust: str = "",
+    lookback: Optional[int] = None,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布-多只股票
+    K 线并发获取, 筹码分布对所有股票统一向量化计算
+    https://quote.eastmoney.com/concept/sz000001.html
+    :param symbol_list: 股票代码列表
+    :type symbol_list: list
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param lookback: 计算每天筹码分布时使用的 K 线数量, 默认使用获取到的全部 K 线
+    :type lookback: int
+    :param max_workers: 并发获取 K 线的线程数
+    :type max_workers: int
+    :return: 筹码分布, 第一列为股票代码
+    :rtype: pandas.DataFrame
+    """
+    symbol_list = list(dict.fromkeys(symbol_list))
+    limit = _kline_limit(lookback)
+    kline_dict = {}
+    tqdm = get_tqdm()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        future_symbol = {
+            executor.submit(_stock_cyq_em_kline, symbol, adjust, limit): symbol
+            for symbol in symbol_list
+        }
+        for future in tqdm(
+            as_completed(future_symbol), total=len(future_symbol), leave=False
+        ):
+            kline_dict[future_symbol[future]] = future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    result_list = _cyq_compute(
+        [kline_dict[symbol] for symbol in symbol_list], lookback=lookback
+    )
+    for symbol, temp_df in zip(symbol_list, result_list):
+        temp_df.insert(0, "代码", symbol)
+    if not result_list:
+        return pd.DataFrame(columns=["代码"] + _RESULT_COLUMNS)
+    return pd.concat(result_list, ignore_index=True)
 
 
 if __name__ == "__main__":
     stock_cyq_em_df = stock_cyq_em(symbol="000001", adjust="")
     print(stock_cyq_em_df)
+
+    stock_cyq_em_batch_df = stock_cyq_em_batch(symbol_list=["000001", "600000"])
+    print(stock_cyq_em_batch_df)
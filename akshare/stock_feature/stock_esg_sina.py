@@ -7,6 +7,7 @@ https://finance.sina.com.cn/esg/
 """
 
 import math
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 import pandas as pd
@@ -24,7 +25,7 @@ def stock_esg_msci_sina() -> pd.DataFrame:
     r = requests.get(url)
     data_json = r.json()
     page_num = math.ceil(int(data_json["result"]["data"]["total"]) / 100)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         headers = {
@@ -36,7 +37,8 @@ def stock_esg_msci_sina() -> pd.DataFrame:
         r = requests.get(url, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.rename(
         columns={
@@ -276,14 +278,15 @@ def stock_esg_hz_sina() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = math.ceil(int(data_json["result"]["data"]["total"]) / 100)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params = {"p": str(page), "num": "100"}
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.rename(
         columns={
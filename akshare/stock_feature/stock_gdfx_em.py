@@ -6,15 +6,18 @@ Desc: 东方财富网-数据中心-股东分析
 https://data.eastmoney.com/gdfx/
 """
 
+from typing import Iterator
+
 import pandas as pd
 import requests
 
-from ..utils.tqdm import get_tqdm
+from ..utils.func import iter_datacenter_pages, paginated
 
 
+@paginated
 def stock_gdfx_free_holding_statistics_em(
     date: str = "20210630",
-) -> pd.DataFrame:
+) -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股统计-十大流通股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -35,43 +38,17 @@ def stock_gdfx_free_holding_statistics_em(
         "client": "WEB",
         "filter": f"""(HOLDNUM_CHANGE_TYPE="001")(END_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.columns = [
-        "序号",
-        "-",
-        "-",
-        "股东名称",
-        "股东类型",
-        "-",
-        "统计次数",
-        "公告日后涨幅统计-10个交易日-平均涨幅",
-        "公告日后涨幅统计-10个交易日-最大涨幅",
-        "公告日后涨幅统计-10个交易日-最小涨幅",
-        "公告日后涨幅统计-30个交易日-平均涨幅",
-        "公告日后涨幅统计-30个交易日-最大涨幅",
-        "公告日后涨幅统计-30个交易日-最小涨幅",
-        "公告日后涨幅统计-60个交易日-平均涨幅",
-        "公告日后涨幅统计-60个交易日-最大涨幅",
-        "公告日后涨幅统计-60个交易日-最小涨幅",
-        "持有个股",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "序号",
+            "-",
+            "-",
             "股东名称",
             "股东类型",
+            "-",
             "统计次数",
             "公告日后涨幅统计-10个交易日-平均涨幅",
             "公告日后涨幅统计-10个交易日-最大涨幅",
@@ -84,39 +61,58 @@ def stock_gdfx_free_holding_statistics_em(
             "公告日后涨幅统计-60个交易日-最小涨幅",
             "持有个股",
         ]
-    ]
-    big_df["统计次数"] = pd.to_numeric(big_df["统计次数"])
-    big_df["公告日后涨幅统计-10个交易日-平均涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-10个交易日-平均涨幅"]
-    )
-    big_df["公告日后涨幅统计-10个交易日-最大涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-10个交易日-最大涨幅"]
-    )
-    big_df["公告日后涨幅统计-10个交易日-最小涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-10个交易日-最小涨幅"]
-    )
-    big_df["公告日后涨幅统计-30个交易日-平均涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-30个交易日-平均涨幅"]
-    )
-    big_df["公告日后涨幅统计-30个交易日-最大涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-30个交易日-最大涨幅"]
-    )
-    big_df["公告日后涨幅统计-30个交易日-最小涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-30个交易日-最小涨幅"]
-    )
-    big_df["公告日后涨幅统计-60个交易日-平均涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-60个交易日-平均涨幅"]
-    )
-    big_df["公告日后涨幅统计-60个交易日-最大涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-60个交易日-最大涨幅"]
-    )
-    big_df["公告日后涨幅统计-60个交易日-最小涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-60个交易日-最小涨幅"]
-    )
-    return big_df
-
-
-def stock_gdfx_holding_statistics_em(date: str = "20210930") -> pd.DataFrame:
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "统计次数",
+                "公告日后涨幅统计-10个交易日-平均涨幅",
+                "公告日后涨幅统计-10个交易日-最大涨幅",
+                "公告日后涨幅统计-10个交易日-最小涨幅",
+                "公告日后涨幅统计-30个交易日-平均涨幅",
+                "公告日后涨幅统计-30个交易日-最大涨幅",
+                "公告日后涨幅统计-30个交易日-最小涨幅",
+                "公告日后涨幅统计-60个交易日-平均涨幅",
+                "公告日后涨幅统计-60个交易日-最大涨幅",
+                "公告日后涨幅统计-60个交易日-最小涨幅",
+                "持有个股",
+            ]
+        ]
+        temp_df["统计次数"] = pd.to_numeric(temp_df["统计次数"])
+        temp_df["公告日后涨幅统计-10个交易日-平均涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-10个交易日-平均涨幅"]
+        )
+        temp_df["公告日后涨幅统计-10个交易日-最大涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-10个交易日-最大涨幅"]
+        )
+        temp_df["公告日后涨幅统计-10个交易日-最小涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-10个交易日-最小涨幅"]
+        )
+        temp_df["公告日后涨幅统计-30个交易日-平均涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-30个交易日-平均涨幅"]
+        )
+        temp_df["公告日后涨幅统计-30个交易日-最大涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-30个交易日-最大涨幅"]
+        )
+        temp_df["公告日后涨幅统计-30个交易日-最小涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-30个交易日-最小涨幅"]
+        )
+        temp_df["公告日后涨幅统计-60个交易日-平均涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-60个交易日-平均涨幅"]
+        )
+        temp_df["公告日后涨幅统计-60个交易日-最大涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-60个交易日-最大涨幅"]
+        )
+        temp_df["公告日后涨幅统计-60个交易日-最小涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-60个交易日-最小涨幅"]
+        )
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
+def stock_gdfx_holding_statistics_em(date: str = "20210930") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股统计-十大股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -137,44 +133,17 @@ def stock_gdfx_holding_statistics_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"""(HOLDNUM_CHANGE_TYPE="001")(END_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.columns = [
-        "序号",
-        "-",
-        "-",
-        "股东名称",
-        "股东类型",
-        "-",
-        "统计次数",
-        "公告日后涨幅统计-10个交易日-平均涨幅",
-        "公告日后涨幅统计-10个交易日-最大涨幅",
-        "公告日后涨幅统计-10个交易日-最小涨幅",
-        "公告日后涨幅统计-30个交易日-平均涨幅",
-        "公告日后涨幅统计-30个交易日-最大涨幅",
-        "公告日后涨幅统计-30个交易日-最小涨幅",
-        "公告日后涨幅统计-60个交易日-平均涨幅",
-        "公告日后涨幅统计-60个交易日-最大涨幅",
-        "公告日后涨幅统计-60个交易日-最小涨幅",
-        "持有个股",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "序号",
+            "-",
+            "-",
             "股东名称",
             "股东类型",
+            "-",
             "统计次数",
             "公告日后涨幅统计-10个交易日-平均涨幅",
             "公告日后涨幅统计-10个交易日-最大涨幅",
@@ -187,39 +156,58 @@ def stock_gdfx_holding_statistics_em(date: str = "20210930") -> pd.DataFrame:
             "公告日后涨幅统计-60个交易日-最小涨幅",
             "持有个股",
         ]
-    ]
-    big_df["统计次数"] = pd.to_numeric(big_df["统计次数"])
-    big_df["公告日后涨幅统计-10个交易日-平均涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-10个交易日-平均涨幅"]
-    )
-    big_df["公告日后涨幅统计-10个交易日-最大涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-10个交易日-最大涨幅"]
-    )
-    big_df["公告日后涨幅统计-10个交易日-最小涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-10个交易日-最小涨幅"]
-    )
-    big_df["公告日后涨幅统计-30个交易日-平均涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-30个交易日-平均涨幅"]
-    )
-    big_df["公告日后涨幅统计-30个交易日-最大涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-30个交易日-最大涨幅"]
-    )
-    big_df["公告日后涨幅统计-30个交易日-最小涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-30个交易日-最小涨幅"]
-    )
-    big_df["公告日后涨幅统计-60个交易日-平均涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-60个交易日-平均涨幅"]
-    )
-    big_df["公告日后涨幅统计-60个交易日-最大涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-60个交易日-最大涨幅"]
-    )
-    big_df["公告日后涨幅统计-60个交易日-最小涨幅"] = pd.to_numeric(
-        big_df["公告日后涨幅统计-60个交易日-最小涨幅"]
-    )
-    return big_df
-
-
-def stock_gdfx_free_holding_change_em(date: str = "20210930") -> pd.DataFrame:
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "统计次数",
+                "公告日后涨幅统计-10个交易日-平均涨幅",
+                "公告日后涨幅统计-10个交易日-最大涨幅",
+                "公告日后涨幅统计-10个交易日-最小涨幅",
+                "公告日后涨幅统计-30个交易日-平均涨幅",
+                "公告日后涨幅统计-30个交易日-最大涨幅",
+                "公告日后涨幅统计-30个交易日-最小涨幅",
+                "公告日后涨幅统计-60个交易日-平均涨幅",
+                "公告日后涨幅统计-60个交易日-最大涨幅",
+                "公告日后涨幅统计-60个交易日-最小涨幅",
+                "持有个股",
+            ]
+        ]
+        temp_df["统计次数"] = pd.to_numeric(temp_df["统计次数"])
+        temp_df["公告日后涨幅统计-10个交易日-平均涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-10个交易日-平均涨幅"]
+        )
+        temp_df["公告日后涨幅统计-10个交易日-最大涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-10个交易日-最大涨幅"]
+        )
+        temp_df["公告日后涨幅统计-10个交易日-最小涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-10个交易日-最小涨幅"]
+        )
+        temp_df["公告日后涨幅统计-30个交易日-平均涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-30个交易日-平均涨幅"]
+        )
+        temp_df["公告日后涨幅统计-30个交易日-最大涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-30个交易日-最大涨幅"]
+        )
+        temp_df["公告日后涨幅统计-30个交易日-最小涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-30个交易日-最小涨幅"]
+        )
+        temp_df["公告日后涨幅统计-60个交易日-平均涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-60个交易日-平均涨幅"]
+        )
+        temp_df["公告日后涨幅统计-60个交易日-最大涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-60个交易日-最大涨幅"]
+        )
+        temp_df["公告日后涨幅统计-60个交易日-最小涨幅"] = pd.to_numeric(
+            temp_df["公告日后涨幅统计-60个交易日-最小涨幅"]
+        )
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
+def stock_gdfx_free_holding_change_em(date: str = "20210930") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股变动统计-十大流通股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -240,77 +228,71 @@ def stock_gdfx_free_holding_change_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.columns = [
-        "序号",
-        "-",
-        "-",
-        "股东名称",
-        "-",
-        "股东类型",
-        "-",
-        "-",
-        "-",
-        "期末持股只数统计-总持有",
-        "期末持股只数统计-新进",
-        "期末持股只数统计-增加",
-        "期末持股只数统计-减少",
-        "期末持股只数统计-不变",
-        "-",
-        "流通市值统计",
-        "持有个股",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "序号",
+            "-",
+            "-",
             "股东名称",
+            "-",
             "股东类型",
+            "-",
+            "-",
+            "-",
             "期末持股只数统计-总持有",
             "期末持股只数统计-新进",
             "期末持股只数统计-增加",
-            "期末持股只数统计-不变",
             "期末持股只数统计-减少",
+            "期末持股只数统计-不变",
+            "-",
             "流通市值统计",
             "持有个股",
+            "-",
+            "-",
+            "-",
+            "-",
         ]
-    ]
-    big_df["期末持股只数统计-总持有"] = pd.to_numeric(
-        big_df["期末持股只数统计-总持有"], errors="coerce"
-    )
-    big_df["期末持股只数统计-新进"] = pd.to_numeric(
-        big_df["期末持股只数统计-新进"], errors="coerce"
-    )
-    big_df["期末持股只数统计-增加"] = pd.to_numeric(
-        big_df["期末持股只数统计-增加"], errors="coerce"
-    )
-    big_df["期末持股只数统计-不变"] = pd.to_numeric(
-        big_df["期末持股只数统计-不变"], errors="coerce"
-    )
-    big_df["期末持股只数统计-减少"] = pd.to_numeric(
-        big_df["期末持股只数统计-减少"], errors="coerce"
-    )
-    big_df["流通市值统计"] = pd.to_numeric(big_df["流通市值统计"], errors="coerce")
-    return big_df
-
-
-def stock_gdfx_holding_change_em(date: str = "20210930") -> pd.DataFrame:
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "期末持股只数统计-总持有",
+                "期末持股只数统计-新进",
+                "期末持股只数统计-增加",
+                "期末持股只数统计-不变",
+                "期末持股只数统计-减少",
+                "流通市值统计",
+                "持有个股",
+            ]
+        ]
+        temp_df["期末持股只数统计-总持有"] = pd.to_numeric(
+            temp_df["期末持股只数统计-总持有"], errors="coerce"
+        )
+        temp_df["期末持股只数统计-新进"] = pd.to_numeric(
+            temp_df["期末持股只数统计-新进"], errors="coerce"
+        )
+        temp_df["期末持股只数统计-增加"] = pd.to_numeric(
+            temp_df["期末持股只数统计-增加"], errors="coerce"
+        )
+        temp_df["期末持股只数统计-不变"] = pd.to_numeric(
+            temp_df["期末持股只数统计-不变"], errors="coerce"
+        )
+        temp_df["期末持股只数统计-减少"] = pd.to_numeric(
+            temp_df["期末持股只数统计-减少"], errors="coerce"
+        )
+        temp_df["流通市值统计"] = pd.to_numeric(
+            temp_df["流通市值统计"], errors="coerce"
+        )
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
+def stock_gdfx_holding_change_em(date: str = "20210930") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股变动统计-十大股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -331,63 +313,64 @@ def stock_gdfx_holding_change_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.columns = [
-        "序号",
-        "-",
-        "-",
-        "股东名称",
-        "-",
-        "股东类型",
-        "-",
-        "-",
-        "-",
-        "期末持股只数统计-总持有",
-        "期末持股只数统计-新进",
-        "期末持股只数统计-增加",
-        "期末持股只数统计-减少",
-        "期末持股只数统计-不变",
-        "-",
-        "-",
-        "持有个股",
-        "流通市值统计",
-        "-",
-        "-",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "序号",
+            "-",
+            "-",
             "股东名称",
+            "-",
             "股东类型",
+            "-",
+            "-",
+            "-",
             "期末持股只数统计-总持有",
             "期末持股只数统计-新进",
             "期末持股只数统计-增加",
-            "期末持股只数统计-不变",
             "期末持股只数统计-减少",
-            "流通市值统计",
+            "期末持股只数统计-不变",
+            "-",
+            "-",
             "持有个股",
+            "流通市值统计",
+            "-",
+            "-",
         ]
-    ]
-    big_df["期末持股只数统计-总持有"] = pd.to_numeric(big_df["期末持股只数统计-总持有"])
-    big_df["期末持股只数统计-新进"] = pd.to_numeric(big_df["期末持股只数统计-新进"])
-    big_df["期末持股只数统计-增加"] = pd.to_numeric(big_df["期末持股只数统计-增加"])
-    big_df["期末持股只数统计-不变"] = pd.to_numeric(big_df["期末持股只数统计-不变"])
-    big_df["期末持股只数统计-减少"] = pd.to_numeric(big_df["期末持股只数统计-减少"])
-    big_df["流通市值统计"] = pd.to_numeric(big_df["流通市值统计"])
-    return big_df
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "期末持股只数统计-总持有",
+                "期末持股只数统计-新进",
+                "期末持股只数统计-增加",
+                "期末持股只数统计-不变",
+                "期末持股只数统计-减少",
+                "流通市值统计",
+                "持有个股",
+            ]
+        ]
+        temp_df["期末持股只数统计-总持有"] = pd.to_numeric(
+            temp_df["期末持股只数统计-总持有"]
+        )
+        temp_df["期末持股只数统计-新进"] = pd.to_numeric(
+            temp_df["期末持股只数统计-新进"]
+        )
+        temp_df["期末持股只数统计-增加"] = pd.to_numeric(
+            temp_df["期末持股只数统计-增加"]
+        )
+        temp_df["期末持股只数统计-不变"] = pd.to_numeric(
+            temp_df["期末持股只数统计-不变"]
+        )
+        temp_df["期末持股只数统计-减少"] = pd.to_numeric(
+            temp_df["期末持股只数统计-减少"]
+        )
+        temp_df["流通市值统计"] = pd.to_numeric(temp_df["流通市值统计"])
+        start += len(temp_df)
+        yield temp_df
 
 
 def stock_gdfx_free_top_10_em(
@@ -502,7 +485,8 @@ def stock_gdfx_top_10_em(
     return temp_df
 
 
-def stock_gdfx_free_holding_detail_em(date: str = "20210930") -> pd.DataFrame:
+@paginated
+def stock_gdfx_free_holding_detail_em(date: str = "20210930") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股明细-十大流通股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -523,76 +507,70 @@ def stock_gdfx_free_holding_detail_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.rename(
-        columns={
-            "index": "序号",
-            "HOLDER_NAME": "股东名称",
-            "HOLDER_TYPE": "股东类型",
-            "SHARES_TYPE": "股份类型",
-            "HOLDER_RANK": "股东排名",
-            "SECURITY_CODE": "股票代码",
-            "SECURITY_NAME_ABBR": "股票简称",
-            "HOLD_NUM": "期末持股-数量",
-            "FREE_HOLDNUM_RATIO": "期末持股-持股占流通股比",
-            "XZCHANGE": "期末持股-数量变化",
-            "CHANGE_RATIO": "期末持股-数量变化比例",
-            "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
-            "HOLDER_MARKET_CAP": "期末持股-流通市值",
-            "END_DATE": "报告期",
-            "UPDATE_DATE": "公告日",
-            "REPORT_DATE_NAME": "报告名称",
-        },
-        inplace=True,
-    )
-
-    big_df = big_df[
-        [
-            "序号",
-            "股东名称",
-            "股东类型",
-            "股票代码",
-            "股票简称",
-            "报告期",
-            "期末持股-数量",
-            "期末持股-数量变化",
-            "期末持股-数量变化比例",
-            "期末持股-持股变动",
-            "期末持股-流通市值",
-            "公告日",
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.rename(
+            columns={
+                "index": "序号",
+                "HOLDER_NAME": "股东名称",
+                "HOLDER_TYPE": "股东类型",
+                "SHARES_TYPE": "股份类型",
+                "HOLDER_RANK": "股东排名",
+                "SECURITY_CODE": "股票代码",
+                "SECURITY_NAME_ABBR": "股票简称",
+                "HOLD_NUM": "期末持股-数量",
+                "FREE_HOLDNUM_RATIO": "期末持股-持股占流通股比",
+                "XZCHANGE": "期末持股-数量变化",
+                "CHANGE_RATIO": "期末持股-数量变化比例",
+                "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
+                "HOLDER_MARKET_CAP": "期末持股-流通市值",
+                "END_DATE": "报告期",
+                "UPDATE_DATE": "公告日",
+                "REPORT_DATE_NAME": "报告名称",
+            },
+            inplace=True,
+        )
+
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "股票代码",
+                "股票简称",
+                "报告期",
+                "期末持股-数量",
+                "期末持股-数量变化",
+                "期末持股-数量变化比例",
+                "期末持股-持股变动",
+                "期末持股-流通市值",
+                "公告日",
+            ]
         ]
-    ]
-    big_df["报告期"] = pd.to_datetime(big_df["报告期"], errors="coerce").dt.date
-    big_df["公告日"] = pd.to_datetime(big_df["公告日"], errors="coerce").dt.date
-    big_df["期末持股-数量"] = pd.to_numeric(big_df["期末持股-数量"], errors="coerce")
-    big_df["期末持股-数量变化"] = pd.to_numeric(
-        big_df["期末持股-数量变化"], errors="coerce"
-    )
-    big_df["期末持股-数量变化比例"] = pd.to_numeric(
-        big_df["期末持股-数量变化比例"], errors="coerce"
-    )
-    big_df["期末持股-流通市值"] = pd.to_numeric(
-        big_df["期末持股-流通市值"], errors="coerce"
-    )
-    return big_df
-
-
+        temp_df["报告期"] = pd.to_datetime(temp_df["报告期"], errors="coerce").dt.date
+        temp_df["公告日"] = pd.to_datetime(temp_df["公告日"], errors="coerce").dt.date
+        temp_df["期末持股-数量"] = pd.to_numeric(
+            temp_df["期末持股-数量"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化"] = pd.to_numeric(
+            temp_df["期末持股-数量变化"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化比例"] = pd.to_numeric(
+            temp_df["期末持股-数量变化比例"], errors="coerce"
+        )
+        temp_df["期末持股-流通市值"] = pd.to_numeric(
+            temp_df["期末持股-流通市值"], errors="coerce"
+        )
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
 def stock_gdfx_holding_detail_em(
     date: str = "20230331", indicator: str = "个人", symbol: str = "新进"
-) -> pd.DataFrame:
+) -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股明细-十大股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -620,73 +598,69 @@ def stock_gdfx_holding_detail_em(
         "client": "WEB",
         "filter": f"""(HOLDER_NEWTYPE="{indicator}")(HOLDNUM_CHANGE_NAME="{symbol}")(END_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.rename(
-        columns={
-            "index": "序号",
-            "HOLDER_NAME": "股东名称",
-            "HOLDER_NEWTYPE": "股东类型",
-            "RANK": "股东排名",
-            "SECURITY_CODE": "股票代码",
-            "SECURITY_NAME_ABBR": "股票简称",
-            "END_DATE": "报告期",
-            "HOLD_NUM": "期末持股-数量",
-            "HOLD_NUM_CHANGE": "期末持股-数量变化",
-            "HOLD_RATIO_CHANGE": "期末持股-数量变化比例",
-            "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
-            "HOLDER_MARKET_CAP": "期末持股-流通市值",
-            "NOTICE_DATE": "公告日",
-        },
-        inplace=True,
-    )
-
-    big_df = big_df[
-        [
-            "序号",
-            "股东名称",
-            "股东类型",
-            "股票代码",
-            "股票简称",
-            "报告期",
-            "期末持股-数量",
-            "期末持股-数量变化",
-            "期末持股-数量变化比例",
-            "期末持股-持股变动",
-            "期末持股-流通市值",
-            "公告日",
-            "股东排名",
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.rename(
+            columns={
+                "index": "序号",
+                "HOLDER_NAME": "股东名称",
+                "HOLDER_NEWTYPE": "股东类型",
+                "RANK": "股东排名",
+                "SECURITY_CODE": "股票代码",
+                "SECURITY_NAME_ABBR": "股票简称",
+                "END_DATE": "报告期",
+                "HOLD_NUM": "期末持股-数量",
+                "HOLD_NUM_CHANGE": "期末持股-数量变化",
+                "HOLD_RATIO_CHANGE": "期末持股-数量变化比例",
+                "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
+                "HOLDER_MARKET_CAP": "期末持股-流通市值",
+                "NOTICE_DATE": "公告日",
+            },
+            inplace=True,
+        )
+
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "股票代码",
+                "股票简称",
+                "报告期",
+                "期末持股-数量",
+                "期末持股-数量变化",
+                "期末持股-数量变化比例",
+                "期末持股-持股变动",
+                "期末持股-流通市值",
+                "公告日",
+                "股东排名",
+            ]
         ]
-    ]
-    big_df["报告期"] = pd.to_datetime(big_df["报告期"], errors="coerce").dt.date
-    big_df["公告日"] = pd.to_datetime(big_df["公告日"], errors="coerce").dt.date
-    big_df["期末持股-数量"] = pd.to_numeric(big_df["期末持股-数量"], errors="coerce")
-    big_df["期末持股-数量变化"] = pd.to_numeric(
-        big_df["期末持股-数量变化"], errors="coerce"
-    )
-    big_df["期末持股-数量变化比例"] = pd.to_numeric(
-        big_df["期末持股-数量变化比例"], errors="coerce"
-    )
-    big_df["期末持股-流通市值"] = pd.to_numeric(
-        big_df["期末持股-流通市值"], errors="coerce"
-    )
-    big_df["股东排名"] = pd.to_numeric(big_df["股东排名"], errors="coerce")
-    return big_df
-
-
-def stock_gdfx_free_holding_analyse_em(date: str = "20230930") -> pd.DataFrame:
+        temp_df["报告期"] = pd.to_datetime(temp_df["报告期"], errors="coerce").dt.date
+        temp_df["公告日"] = pd.to_datetime(temp_df["公告日"], errors="coerce").dt.date
+        temp_df["期末持股-数量"] = pd.to_numeric(
+            temp_df["期末持股-数量"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化"] = pd.to_numeric(
+            temp_df["期末持股-数量变化"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化比例"] = pd.to_numeric(
+            temp_df["期末持股-数量变化比例"], errors="coerce"
+        )
+        temp_df["期末持股-流通市值"] = pd.to_numeric(
+            temp_df["期末持股-流通市值"], errors="coerce"
+        )
+        temp_df["股东排名"] = pd.to_numeric(temp_df["股东排名"], errors="coerce")
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
+def stock_gdfx_free_holding_analyse_em(
+    date: str = "20230930",
+) -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股分析-十大流通股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -707,84 +681,78 @@ def stock_gdfx_free_holding_analyse_em(date: str = "20230930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.rename(
-        columns={
-            "index": "序号",
-            "HOLDER_NAME": "股东名称",
-            "HOLDER_TYPE": "股东类型",
-            "SECURITY_CODE": "股票代码",
-            "SECURITY_NAME_ABBR": "股票简称",
-            "END_DATE": "报告期",
-            "HOLD_NUM": "期末持股-数量",
-            "XZCHANGE": "期末持股-数量变化",
-            "HOLD_RATIO_CHANGE": "期末持股-数量变化比例",
-            "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
-            "HOLDER_MARKET_CAP": "期末持股-流通市值",
-            "UPDATE_DATE": "公告日",
-            "D10_ADJCHRATE": "公告日后涨跌幅-10个交易日",
-            "D30_ADJCHRATE": "公告日后涨跌幅-30个交易日",
-            "D60_ADJCHRATE": "公告日后涨跌幅-60个交易日",
-        },
-        inplace=True,
-    )
-    big_df = big_df[
-        [
-            "序号",
-            "股东名称",
-            "股东类型",
-            "股票代码",
-            "股票简称",
-            "报告期",
-            "期末持股-数量",
-            "期末持股-数量变化",
-            "期末持股-数量变化比例",
-            "期末持股-持股变动",
-            "期末持股-流通市值",
-            "公告日",
-            "公告日后涨跌幅-10个交易日",
-            "公告日后涨跌幅-30个交易日",
-            "公告日后涨跌幅-60个交易日",
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.rename(
+            columns={
+                "index": "序号",
+                "HOLDER_NAME": "股东名称",
+                "HOLDER_TYPE": "股东类型",
+                "SECURITY_CODE": "股票代码",
+                "SECURITY_NAME_ABBR": "股票简称",
+                "END_DATE": "报告期",
+                "HOLD_NUM": "期末持股-数量",
+                "XZCHANGE": "期末持股-数量变化",
+                "HOLD_RATIO_CHANGE": "期末持股-数量变化比例",
+                "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
+                "HOLDER_MARKET_CAP": "期末持股-流通市值",
+                "UPDATE_DATE": "公告日",
+                "D10_ADJCHRATE": "公告日后涨跌幅-10个交易日",
+                "D30_ADJCHRATE": "公告日后涨跌幅-30个交易日",
+                "D60_ADJCHRATE": "公告日后涨跌幅-60个交易日",
+            },
+            inplace=True,
+        )
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "股票代码",
+                "股票简称",
+                "报告期",
+                "期末持股-数量",
+                "期末持股-数量变化",
+                "期末持股-数量变化比例",
+                "期末持股-持股变动",
+                "期末持股-流通市值",
+                "公告日",
+                "公告日后涨跌幅-10个交易日",
+                "公告日后涨跌幅-30个交易日",
+                "公告日后涨跌幅-60个交易日",
+            ]
         ]
-    ]
-    big_df["报告期"] = pd.to_datetime(big_df["报告期"], errors="coerce").dt.date
-    big_df["公告日"] = pd.to_datetime(big_df["公告日"], errors="coerce").dt.date
-    big_df["期末持股-数量"] = pd.to_numeric(big_df["期末持股-数量"], errors="coerce")
-    big_df["期末持股-数量变化"] = pd.to_numeric(
-        big_df["期末持股-数量变化"], errors="coerce"
-    )
-    big_df["期末持股-数量变化比例"] = pd.to_numeric(
-        big_df["期末持股-数量变化比例"], errors="coerce"
-    )
-    big_df["期末持股-流通市值"] = pd.to_numeric(
-        big_df["期末持股-流通市值"], errors="coerce"
-    )
-    big_df["公告日后涨跌幅-10个交易日"] = pd.to_numeric(
-        big_df["公告日后涨跌幅-10个交易日"], errors="coerce"
-    )
-    big_df["公告日后涨跌幅-30个交易日"] = pd.to_numeric(
-        big_df["公告日后涨跌幅-30个交易日"], errors="coerce"
-    )
-    big_df["公告日后涨跌幅-60个交易日"] = pd.to_numeric(
-        big_df["公告日后涨跌幅-60个交易日"], errors="coerce"
-    )
-    return big_df
-
-
-def stock_gdfx_holding_analyse_em(date: str = "20230331") -> pd.DataFrame:
+        temp_df["报告期"] = pd.to_datetime(temp_df["报告期"], errors="coerce").dt.date
+        temp_df["公告日"] = pd.to_datetime(temp_df["公告日"], errors="coerce").dt.date
+        temp_df["期末持股-数量"] = pd.to_numeric(
+            temp_df["期末持股-数量"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化"] = pd.to_numeric(
+            temp_df["期末持股-数量变化"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化比例"] = pd.to_numeric(
+            temp_df["期末持股-数量变化比例"], errors="coerce"
+        )
+        temp_df["期末持股-流通市值"] = pd.to_numeric(
+            temp_df["期末持股-流通市值"], errors="coerce"
+        )
+        temp_df["公告日后涨跌幅-10个交易日"] = pd.to_numeric(
+            temp_df["公告日后涨跌幅-10个交易日"], errors="coerce"
+        )
+        temp_df["公告日后涨跌幅-30个交易日"] = pd.to_numeric(
+            temp_df["公告日后涨跌幅-30个交易日"], errors="coerce"
+        )
+        temp_df["公告日后涨跌幅-60个交易日"] = pd.to_numeric(
+            temp_df["公告日后涨跌幅-60个交易日"], errors="coerce"
+        )
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
+def stock_gdfx_holding_analyse_em(date: str = "20230331") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东持股分析-十大股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -805,89 +773,83 @@ def stock_gdfx_holding_analyse_em(date: str = "20230331") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df["index"] + 1
-    big_df.rename(
-        columns={
-            "index": "序号",
-            "SECUCODE": "-",
-            "SECURITY_CODE": "股票代码",
-            "ORG_CODE": "-",
-            "SECURITY_TYPE_CODE": "-",
-            "END_DATE": "报告期",
-            "HOLDER_CODE": "-",
-            "HOLDER_NAME": "股东名称",
-            "HOLD_NUM": "期末持股-数量",
-            "HOLD_RATIO": "-",
-            "HOLD_NUM_CHANGE": "期末持股-数量变化",
-            "HOLD_RATIO_CHANGE": "期末持股-数量变化比例",
-            "NOTICE_DATE": "公告日",
-            "SECURITY_NAME_ABBR": "股票简称",
-            "HOLDER_MARKET_CAP": "期末持股-流通市值",
-            "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
-            "HOLDER_TYPE_ORG": "股东类型",
-            "D10_ADJCHRATE": "公告日后涨跌幅-10个交易日",
-            "D30_ADJCHRATE": "公告日后涨跌幅-30个交易日",
-            "D60_ADJCHRATE": "公告日后涨跌幅-60个交易日",
-        },
-        inplace=True,
-    )
-    big_df = big_df[
-        [
-            "序号",
-            "股东名称",
-            "股东类型",
-            "股票代码",
-            "股票简称",
-            "报告期",
-            "期末持股-数量",
-            "期末持股-数量变化",
-            "期末持股-数量变化比例",
-            "期末持股-持股变动",
-            "期末持股-流通市值",
-            "公告日",
-            "公告日后涨跌幅-10个交易日",
-            "公告日后涨跌幅-30个交易日",
-            "公告日后涨跌幅-60个交易日",
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df["index"] + start + 1
+        temp_df.rename(
+            columns={
+                "index": "序号",
+                "SECUCODE": "-",
+                "SECURITY_CODE": "股票代码",
+                "ORG_CODE": "-",
+                "SECURITY_TYPE_CODE": "-",
+                "END_DATE": "报告期",
+                "HOLDER_CODE": "-",
+                "HOLDER_NAME": "股东名称",
+                "HOLD_NUM": "期末持股-数量",
+                "HOLD_RATIO": "-",
+                "HOLD_NUM_CHANGE": "期末持股-数量变化",
+                "HOLD_RATIO_CHANGE": "期末持股-数量变化比例",
+                "NOTICE_DATE": "公告日",
+                "SECURITY_NAME_ABBR": "股票简称",
+                "HOLDER_MARKET_CAP": "期末持股-流通市值",
+                "HOLDNUM_CHANGE_NAME": "期末持股-持股变动",
+                "HOLDER_TYPE_ORG": "股东类型",
+                "D10_ADJCHRATE": "公告日后涨跌幅-10个交易日",
+                "D30_ADJCHRATE": "公告日后涨跌幅-30个交易日",
+                "D60_ADJCHRATE": "公告日后涨跌幅-60个交易日",
+            },
+            inplace=True,
+        )
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "股票代码",
+                "股票简称",
+                "报告期",
+                "期末持股-数量",
+                "期末持股-数量变化",
+                "期末持股-数量变化比例",
+                "期末持股-持股变动",
+                "期末持股-流通市值",
+                "公告日",
+                "公告日后涨跌幅-10个交易日",
+                "公告日后涨跌幅-30个交易日",
+                "公告日后涨跌幅-60个交易日",
+            ]
         ]
-    ]
-    big_df["公告日"] = pd.to_datetime(big_df["公告日"]).dt.date
-    big_df["报告期"] = pd.to_datetime(big_df["报告期"]).dt.date
-    big_df["期末持股-数量"] = pd.to_numeric(big_df["期末持股-数量"], errors="coerce")
-    big_df["期末持股-数量变化"] = pd.to_numeric(
-        big_df["期末持股-数量变化"], errors="coerce"
-    )
-    big_df["期末持股-数量变化比例"] = pd.to_numeric(
-        big_df["期末持股-数量变化比例"], errors="coerce"
-    )
-    big_df["期末持股-流通市值"] = pd.to_numeric(
-        big_df["期末持股-流通市值"], errors="coerce"
-    )
-    big_df["公告日后涨跌幅-10个交易日"] = pd.to_numeric(
-        big_df["公告日后涨跌幅-10个交易日"], errors="coerce"
-    )
-    big_df["公告日后涨跌幅-30个交易日"] = pd.to_numeric(
-        big_df["公告日后涨跌幅-30个交易日"], errors="coerce"
-    )
-    big_df["公告日后涨跌幅-60个交易日"] = pd.to_numeric(
-        big_df["公告日后涨跌幅-60个交易日"], errors="coerce"
-    )
-    return big_df
-
-
-def stock_gdfx_free_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
+        temp_df["公告日"] = pd.to_datetime(temp_df["公告日"]).dt.date
+        temp_df["报告期"] = pd.to_datetime(temp_df["报告期"]).dt.date
+        temp_df["期末持股-数量"] = pd.to_numeric(
+            temp_df["期末持股-数量"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化"] = pd.to_numeric(
+            temp_df["期末持股-数量变化"], errors="coerce"
+        )
+        temp_df["期末持股-数量变化比例"] = pd.to_numeric(
+            temp_df["期末持股-数量变化比例"], errors="coerce"
+        )
+        temp_df["期末持股-流通市值"] = pd.to_numeric(
+            temp_df["期末持股-流通市值"], errors="coerce"
+        )
+        temp_df["公告日后涨跌幅-10个交易日"] = pd.to_numeric(
+            temp_df["公告日后涨跌幅-10个交易日"], errors="coerce"
+        )
+        temp_df["公告日后涨跌幅-30个交易日"] = pd.to_numeric(
+            temp_df["公告日后涨跌幅-30个交易日"], errors="coerce"
+        )
+        temp_df["公告日后涨跌幅-60个交易日"] = pd.to_numeric(
+            temp_df["公告日后涨跌幅-60个交易日"], errors="coerce"
+        )
+        start += len(temp_df)
+        yield temp_df
+
+
+@paginated
+def stock_gdfx_free_holding_teamwork_em(symbol: str = "社保") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东协同-十大流通股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -909,48 +871,40 @@ def stock_gdfx_free_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
         "client": "WEB",
     }
     params.update(symbol_dict)
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.columns = [
-        "序号",
-        "-",
-        "股东名称",
-        "股东类型",
-        "-",
-        "协同股东名称",
-        "协同股东类型",
-        "协同次数",
-        "-",
-        "个股详情",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "序号",
+            "-",
             "股东名称",
             "股东类型",
+            "-",
             "协同股东名称",
             "协同股东类型",
             "协同次数",
+            "-",
             "个股详情",
         ]
-    ]
-    big_df["协同次数"] = pd.to_numeric(big_df["协同次数"], errors="coerce")
-    return big_df
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "协同股东名称",
+                "协同股东类型",
+                "协同次数",
+                "个股详情",
+            ]
+        ]
+        temp_df["协同次数"] = pd.to_numeric(temp_df["协同次数"], errors="coerce")
+        start += len(temp_df)
+        yield temp_df
 
 
-def stock_gdfx_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
+@paginated
+def stock_gdfx_holding_teamwork_em(symbol: str = "社保") -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-股东分析-股东协同-十大股东
     https://data.eastmoney.com/gdfx/HoldingAnalyse.html
@@ -972,45 +926,36 @@ def stock_gdfx_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
         "client": "WEB",
     }
     params.update(symbol_dict)
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.columns = [
-        "序号",
-        "-",
-        "股东名称",
-        "股东类型",
-        "-",
-        "协同股东名称",
-        "协同股东类型",
-        "协同次数",
-        "-",
-        "个股详情",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = temp_df.index + start + 1
+        temp_df.columns = [
             "序号",
+            "-",
             "股东名称",
             "股东类型",
+            "-",
             "协同股东名称",
             "协同股东类型",
             "协同次数",
+            "-",
             "个股详情",
         ]
-    ]
-    big_df["协同次数"] = pd.to_numeric(big_df["协同次数"], errors="coerce")
-    return big_df
+        temp_df = temp_df[
+            [
+                "序号",
+                "股东名称",
+                "股东类型",
+                "协同股东名称",
+                "协同股东类型",
+                "协同次数",
+                "个股详情",
+            ]
+        ]
+        temp_df["协同次数"] = pd.to_numeric(temp_df["协同次数"], errors="coerce")
+        start += len(temp_df)
+        yield temp_df
 
 
 if __name__ == "__main__":
@@ -10,8 +10,12 @@ import pandas as pd
 import requests
 
 from ..utils.func import fetch_paginated_data
+from ..utils.kline import parse_klines
+from ..utils.output import empty_output, filter_between, pa, resolve_output, to_output
+from ..utils.schema import typed_output
 
 
+@typed_output
 def stock_zh_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-沪深京 A 股-实时行情
@@ -33,7 +37,7 @@ def stock_zh_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,"
         "f20,f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "index",
         "_",
@@ -121,6 +125,7 @@ def stock_zh_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_sh_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-沪 A 股-实时行情
@@ -142,7 +147,7 @@ def stock_sh_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,f23,"
         "f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -229,6 +234,7 @@ def stock_sh_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_sz_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-深 A 股-实时行情
@@ -250,7 +256,7 @@ def stock_sz_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,f23,f24,"
         "f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -337,6 +343,7 @@ def stock_sz_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_bj_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-京 A 股-实时行情
@@ -358,7 +365,7 @@ def stock_bj_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,f23,f24"
         ",f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -445,6 +452,7 @@ def stock_bj_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_new_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-新股-实时行情
@@ -467,7 +475,7 @@ def stock_new_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,f23,f24,"
         "f25,f26,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -558,6 +566,7 @@ def stock_new_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_cy_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-创业板-实时行情
@@ -580,7 +589,7 @@ def stock_cy_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,"
         "f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -667,6 +676,7 @@ def stock_cy_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_kc_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-科创板-实时行情
@@ -689,7 +699,7 @@ def stock_kc_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -815,7 +825,7 @@ def stock_zh_ab_comparison_em() -> pd.DataFrame:
         "f202": "-",
         "f203": "B股名称",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df = temp_df.rename(columns=columns_map)
     list_name = [value for key, value in columns_map.items() if value != "_"]
     temp_df = temp_df[list_name]
@@ -841,6 +851,7 @@ def stock_zh_ab_comparison_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_zh_b_spot_em() -> pd.DataFrame:
     """
     东方财富网- B 股-实时行情
@@ -862,7 +873,7 @@ def stock_zh_b_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20"
         ",f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -949,6 +960,7 @@ def stock_zh_b_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_zh_a_hist(
     symbol: str = "000001",
     period: str = "daily",
@@ -989,37 +1001,52 @@ def stock_zh_a_hist(
         "beg": start_date,
         "end": end_date,
     }
+    output = resolve_output()
     r = requests.get(url, params=params, timeout=timeout)
     data_json = r.json()
     if not (data_json["data"] and data_json["data"]["klines"]):
-        return pd.DataFrame()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+        return empty_output(output)
+    if output != "pandas":
+        table = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "日期",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"日期": "date"},
+            output=output,
+        )
+        table = table.add_column(
+            1, "股票代码", pa.repeat(pa.scalar(symbol), table.num_rows)
+        )
+        return to_output(table, output)
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "date"},
+    )
     temp_df["股票代码"] = symbol
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-        "股票代码",
-    ]
-    temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     temp_df = temp_df[
         [
             "日期",
@@ -1039,6 +1066,7 @@ def stock_zh_a_hist(
     return temp_df
 
 
+@typed_output
 def stock_zh_a_hist_min_em(
     symbol: str = "000001",
     start_date: str = "1979-09-01 09:32:00",
@@ -1080,29 +1108,23 @@ def stock_zh_a_hist_min_em(
         }
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "均价",
+            ],
+            dtypes={"时间": "datetime"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "均价",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["均价"] = pd.to_numeric(temp_df["均价"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         return temp_df
     else:
@@ -1117,37 +1139,65 @@ def stock_zh_a_hist_min_em(
             "beg": "0",
             "end": "20500000",
         }
+        output = resolve_output()
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        if output != "pandas":
+            table = parse_klines(
+                data_json["data"]["klines"],
+                columns=[
+                    "时间",
+                    "开盘",
+                    "收盘",
+                    "最高",
+                    "最低",
+                    "成交量",
+                    "成交额",
+                    "振幅",
+                    "涨跌幅",
+                    "涨跌额",
+                    "换手率",
+                ],
+                dtypes={"时间": "datetime"},
+                output=output,
+            )
+            table = filter_between(table, "时间", start_date, end_date)
+            table = table.select(
+                [
+                    "时间",
+                    "开盘",
+                    "收盘",
+                    "最高",
+                    "最低",
+                    "涨跌幅",
+                    "涨跌额",
+                    "成交量",
+                    "成交额",
+                    "振幅",
+                    "换手率",
+                ]
+            )
+            return to_output(table, output)
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"时间": "datetime"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         temp_df = temp_df[
             [
@@ -1167,6 +1217,7 @@ def stock_zh_a_hist_min_em(
         return temp_df
 
 
+@typed_output
 def stock_zh_a_hist_pre_min_em(
     symbol: str = "000001",
     start_time: str = "09:00:00",
@@ -1196,32 +1247,29 @@ def stock_zh_a_hist_pre_min_em(
     }
     r = requests.get(url, timeout=15, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
-    temp_df.columns = [
-        "时间",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "最新价",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["trends"],
+        columns=[
+            "时间",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "最新价",
+        ],
+        dtypes={"时间": "datetime"},
+    )
     temp_df.index = pd.to_datetime(temp_df["时间"])
     date_format = temp_df.index[0].date().isoformat()
     temp_df = temp_df[date_format + " " + start_time : date_format + " " + end_time]
     temp_df.reset_index(drop=True, inplace=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
     temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
     return temp_df
 
 
+@typed_output
 def stock_hk_spot_em() -> pd.DataFrame:
     """
     东方财富网-港股-实时行情
@@ -1243,7 +1291,7 @@ def stock_hk_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -1307,6 +1355,7 @@ def stock_hk_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_hk_main_board_spot_em() -> pd.DataFrame:
     """
     东方财富网-港股-主板-实时行情
@@ -1328,7 +1377,7 @@ def stock_hk_main_board_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -1392,6 +1441,7 @@ def stock_hk_main_board_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_hk_hist(
     symbol: str = "00593",
     period: str = "daily",
@@ -1427,43 +1477,61 @@ def stock_hk_hist(
         "end": "20500000",
         "lmt": "1000000",
     }
+    output = resolve_output()
     r = requests.get(url, timeout=15, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+    if output != "pandas":
+        table = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "日期",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"日期": "date"},
+            output=output,
+        )
+        table = filter_between(table, "日期", start_date, end_date)
+        if table.num_rows == 0:
+            return empty_output(output)
+        return to_output(table, output)
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "str"},
+    )
     if temp_df.empty:
         return pd.DataFrame()
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
     temp_df.index = pd.to_datetime(temp_df["日期"], errors="coerce")
     temp_df = temp_df[start_date:end_date]
     if temp_df.empty:
         return pd.DataFrame()
     temp_df.reset_index(inplace=True, drop=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
     return temp_df
 
 
+@typed_output
 def stock_hk_hist_min_em(
     symbol: str = "01611",
     period: str = "1",
@@ -1503,29 +1571,23 @@ def stock_hk_hist_min_em(
         }
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "最新价",
+            ],
+            dtypes={"时间": "datetime"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "最新价",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         return temp_df
     else:
@@ -1542,35 +1604,26 @@ def stock_hk_hist_min_em(
         }
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"时间": "datetime"},
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df.index = pd.to_datetime(temp_df["时间"])
         temp_df = temp_df[start_date:end_date]
         temp_df.reset_index(drop=True, inplace=True)
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         temp_df = temp_df[
             [
@@ -1590,6 +1643,7 @@ def stock_hk_hist_min_em(
     return temp_df
 
 
+@typed_output
 def stock_us_spot_em() -> pd.DataFrame:
     """
     东方财富网-美股-实时行情
@@ -1611,7 +1665,7 @@ def stock_us_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f26,f22,f33,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    temp_df = fetch_paginated_data(url, params, output="pandas")
     temp_df.columns = [
         "序号",
         "_",
@@ -1685,6 +1739,7 @@ def stock_us_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
 def stock_us_hist(
     symbol: str = "105.MSFT",
     period: str = "daily",
@@ -1720,41 +1775,57 @@ def stock_us_hist(
         "end": "20500000",
         "lmt": "1000000",
     }
+    output = resolve_output()
     r = requests.get(url, timeout=15, params=params)
     data_json = r.json()
     if not data_json["data"]["klines"]:
-        return pd.DataFrame()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+        return empty_output(output)
+    if output != "pandas":
+        table = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "日期",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            dtypes={"日期": "date"},
+            output=output,
+        )
+        table = filter_between(table, "日期", start_date, end_date)
+        return to_output(table.sort_by("日期"), output)
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+        dtypes={"日期": "str"},
+    )
     temp_df.index = pd.to_datetime(temp_df["日期"], errors="coerce")
     temp_df = temp_df[start_date:end_date]
     temp_df.reset_index(inplace=True, drop=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     temp_df.sort_values(["日期"], inplace=True, ignore_index=True)
     return temp_df
 
 
+@typed_output
 def stock_us_hist_min_em(
     symbol: str = "105.ATER",
     start_date: str = "1979-09-01 09:32:00",
@@ -1784,27 +1855,23 @@ def stock_us_hist_min_em(
     data_json = r.json()
     if not data_json["data"]["trends"]:
         return pd.DataFrame()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
-    temp_df.columns = [
-        "时间",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "最新价",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["trends"],
+        columns=[
+            "时间",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "最新价",
+        ],
+        dtypes={"时间": "datetime"},
+    )
     temp_df.index = pd.to_datetime(temp_df["时间"], errors="coerce")
     temp_df = temp_df[start_date:end_date]
     temp_df.reset_index(drop=True, inplace=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
     temp_df["时间"] = pd.to_datetime(temp_df["时间"], errors="coerce").astype(str)
     return temp_df
 
@@ -7,11 +7,19 @@ https://data.eastmoney.com/hsgtcg/
 沪深港通详情: https://finance.eastmoney.com/news/1622,20161118685370149.html
 """
 
+from typing import Iterator
+
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from ..utils.func import fetch_paginated_data
+from ..utils.func import (
+    concat_pages,
+    fetch_paginated_data,
+    iter_datacenter_pages,
+    paginated,
+)
+from ..utils.schema import typed_output
 from ..utils.tqdm import get_tqdm
 
 
@@ -111,7 +119,7 @@ def stock_hk_ggt_components_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f19,f20,f21,f23,f24,"
         "f25,f26,f22,f33,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url=url, base_params=params)
+    temp_df = fetch_paginated_data(url=url, base_params=params, output="pandas")
     temp_df.columns = [
         "序号",
         "-",
@@ -168,9 +176,11 @@ def stock_hk_ggt_components_em() -> pd.DataFrame:
     return temp_df
 
 
+@typed_output
+@paginated
 def stock_hsgt_hold_stock_em(
     market: str = "沪股通", indicator: str = "5日排行"
-) -> pd.DataFrame:
+) -> Iterator[pd.DataFrame]:
     """
     东方财富-数据中心-沪深港通持股-个股排行
     https://data.eastmoney.com/hsgtcg/list.html
@@ -224,120 +234,116 @@ def stock_hsgt_hold_stock_em(
         "client": "WEB",
         "filter": filter_str,
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, page_num + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = range(1, len(big_df) + 1)
-    big_df.columns = [
-        "序号",
-        "_",
-        "_",
-        "日期",
-        "_",
-        "名称",
-        "_",
-        "_",
-        "代码",
-        "_",
-        "_",
-        "_",
-        "_",
-        "今日持股-股数",
-        "今日持股-市值",
-        "今日持股-占流通股比",
-        "今日持股-占总股本比",
-        "今日收盘价",
-        "今日涨跌幅",
-        "_",
-        "所属板块",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        f"{indicator.split('排')[0]}增持估计-市值",
-        f"{indicator.split('排')[0]}增持估计-股数",
-        f"{indicator.split('排')[0]}增持估计-市值增幅",
-        f"{indicator.split('排')[0]}增持估计-占流通股比",
-        f"{indicator.split('排')[0]}增持估计-占总股本比",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-    ]
-    big_df = big_df[
-        [
+    start = 0
+    for temp_df in iter_datacenter_pages(url, params):
+        temp_df.reset_index(inplace=True)
+        temp_df["index"] = range(start + 1, start + len(temp_df) + 1)
+        temp_df.columns = [
             "序号",
-            "代码",
+            "_",
+            "_",
+            "日期",
+            "_",
             "名称",
-            "今日收盘价",
-            "今日涨跌幅",
+            "_",
+            "_",
+            "代码",
+            "_",
+            "_",
+            "_",
+            "_",
             "今日持股-股数",
             "今日持股-市值",
             "今日持股-占流通股比",
             "今日持股-占总股本比",
-            f"{indicator.split('排')[0]}增持估计-股数",
+            "今日收盘价",
+            "今日涨跌幅",
+            "_",
+            "所属板块",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
             f"{indicator.split('排')[0]}增持估计-市值",
+            f"{indicator.split('排')[0]}增持估计-股数",
             f"{indicator.split('排')[0]}增持估计-市值增幅",
             f"{indicator.split('排')[0]}增持估计-占流通股比",
             f"{indicator.split('排')[0]}增持估计-占总股本比",
-            "所属板块",
-            "日期",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
         ]
-    ]
-    big_df["今日收盘价"] = pd.to_numeric(big_df["今日收盘价"], errors="coerce")
-    big_df["今日涨跌幅"] = pd.to_numeric(big_df["今日涨跌幅"], errors="coerce")
-    big_df["今日持股-股数"] = pd.to_numeric(big_df["今日持股-股数"], errors="coerce")
-    big_df["今日持股-市值"] = pd.to_numeric(big_df["今日持股-市值"], errors="coerce")
-    big_df["今日持股-占流通股比"] = pd.to_numeric(
-        big_df["今日持股-占流通股比"], errors="coerce"
-    )
-    big_df["今日持股-占总股本比"] = pd.to_numeric(
-        big_df["今日持股-占总股本比"], errors="coerce"
-    )
-    big_df[f"{indicator.split('排')[0]}增持估计-股数"] = pd.to_numeric(
-        big_df[f"{indicator.split('排')[0]}增持估计-股数"], errors="coerce"
-    )
-    big_df[f"{indicator.split('排')[0]}增持估计-市值"] = pd.to_numeric(
-        big_df[f"{indicator.split('排')[0]}增持估计-市值"], errors="coerce"
-    )
-    big_df[f"{indicator.split('排')[0]}增持估计-市值增幅"] = pd.to_numeric(
-        big_df[f"{indicator.split('排')[0]}增持估计-市值增幅"], errors="coerce"
-    )
-    big_df[f"{indicator.split('排')[0]}增持估计-占流通股比"] = pd.to_numeric(
-        big_df[f"{indicator.split('排')[0]}增持估计-占流通股比"], errors="coerce"
-    )
-    big_df[f"{indicator.split('排')[0]}增持估计-占总股本比"] = pd.to_numeric(
-        big_df[f"{indicator.split('排')[0]}增持估计-占总股本比"], errors="coerce"
-    )
-    big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
-    return big_df
+        temp_df = temp_df[
+            [
+                "序号",
+                "代码",
+                "名称",
+                "今日收盘价",
+                "今日涨跌幅",
+                "今日持股-股数",
+                "今日持股-市值",
+                "今日持股-占流通股比",
+                "今日持股-占总股本比",
+                f"{indicator.split('排')[0]}增持估计-股数",
+                f"{indicator.split('排')[0]}增持估计-市值",
+                f"{indicator.split('排')[0]}增持估计-市值增幅",
+                f"{indicator.split('排')[0]}增持估计-占流通股比",
+                f"{indicator.split('排')[0]}增持估计-占总股本比",
+                "所属板块",
+                "日期",
+            ]
+        ]
+        temp_df["今日收盘价"] = pd.to_numeric(temp_df["今日收盘价"], errors="coerce")
+        temp_df["今日涨跌幅"] = pd.to_numeric(temp_df["今日涨跌幅"], errors="coerce")
+        temp_df["今日持股-股数"] = pd.to_numeric(
+            temp_df["今日持股-股数"], errors="coerce"
+        )
+        temp_df["今日持股-市值"] = pd.to_numeric(
+            temp_df["今日持股-市值"], errors="coerce"
+        )
+        temp_df["今日持股-占流通股比"] = pd.to_numeric(
+            temp_df["今日持股-占流通股比"], errors="coerce"
+        )
+        temp_df["今日持股-占总股本比"] = pd.to_numeric(
+            temp_df["今日持股-占总股本比"], errors="coerce"
+        )
+        temp_df[f"{indicator.split('排')[0]}增持估计-股数"] = pd.to_numeric(
+            temp_df[f"{indicator.split('排')[0]}增持估计-股数"], errors="coerce"
+        )
+        temp_df[f"{indicator.split('排')[0]}增持估计-市值"] = pd.to_numeric(
+            temp_df[f"{indicator.split('排')[0]}增持估计-市值"], errors="coerce"
+        )
+        temp_df[f"{indicator.split('排')[0]}增持估计-市值增幅"] = pd.to_numeric(
+            temp_df[f"{indicator.split('排')[0]}增持估计-市值增幅"], errors="coerce"
+        )
+        temp_df[f"{indicator.split('排')[0]}增持估计-占流通股比"] = pd.to_numeric(
+            temp_df[f"{indicator.split('排')[0]}增持估计-占流通股比"], errors="coerce"
+        )
+        temp_df[f"{indicator.split('排')[0]}增持估计-占总股本比"] = pd.to_numeric(
+            temp_df[f"{indicator.split('排')[0]}增持估计-占总股本比"], errors="coerce"
+        )
+        temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
+        start += len(temp_df)
+        yield temp_df
 
 
+@paginated
 def stock_hsgt_stock_statistics_em(
     symbol: str = "北向持股",
     start_date: str = "20240110",
     end_date: str = "20240110",
-):
+) -> Iterator[pd.DataFrame]:
     """
     东方财富网-数据中心-沪深港通-沪深港通持股-每日个股统计
     https://data.eastmoney.com/hsgtcg/StockStatistics.aspx
@@ -354,7 +360,6 @@ def stock_hsgt_stock_statistics_em(
     """
     start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
-    big_df = pd.DataFrame()
     if symbol == "南向持股":
         params = {
             "sortColumns": "TRADE_DATE",
@@ -373,81 +378,77 @@ def stock_hsgt_stock_statistics_em(
                 {"filter": f"""(INTERVAL_TYPE="1")(RN=1)(TRADE_DATE='{start_date}')"""}
             )
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
-        tqdm = get_tqdm()
-        for page in tqdm(range(1, int(total_page) + 1), leave=False):
-            params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
-            data_json = r.json()
-            temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-        big_df.columns = [
-            "-",
-            "持股日期",
-            "-",
-            "-",
-            "股票简称",
-            "股票代码",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股市值",
-            "持股数量",
-            "-",
-            "-",
-            "-",
-            "-",
-            "当日收盘价",
-            "当日涨跌幅",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股数量占发行股百分比",
-            "-",
-            "持股市值变化-1日",
-            "持股市值变化-5日",
-            "持股市值变化-10日",
-            "-",
-        ]
-        big_df = big_df[
-            [
+        for temp_df in iter_datacenter_pages(url, params):
+            temp_df.columns = [
+                "-",
                 "持股日期",
-                "股票代码",
+                "-",
+                "-",
                 "股票简称",
+                "股票代码",
+                "-",
+                "-",
+                "-",
+                "-",
+                "持股市值",
+                "持股数量",
+                "-",
+                "-",
+                "-",
+                "-",
                 "当日收盘价",
                 "当日涨跌幅",
-                "持股数量",
-                "持股市值",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股数量占发行股百分比",
+                "-",
                 "持股市值变化-1日",
                 "持股市值变化-5日",
                 "持股市值变化-10日",
+                "-",
             ]
-        ]
-        big_df["持股日期"] = pd.to_datetime(big_df["持股日期"], errors="coerce").dt.date
-        big_df["当日收盘价"] = pd.to_numeric(big_df["当日收盘价"], errors="coerce")
-        big_df["当日涨跌幅"] = pd.to_numeric(big_df["当日涨跌幅"], errors="coerce")
-        big_df["持股数量"] = pd.to_numeric(big_df["持股数量"], errors="coerce")
-        big_df["持股市值"] = pd.to_numeric(big_df["持股市值"], errors="coerce")
-        big_df["持股数量占发行股百分比"] = pd.to_numeric(
-            big_df["持股数量占发行股百分比"], errors="coerce"
-        )
-        big_df["持股市值变化-1日"] = pd.to_numeric(
-            big_df["持股市值变化-1日"], errors="coerce"
-        )
-        big_df["持股市值变化-5日"] = pd.to_numeric(
-            big_df["持股市值变化-5日"], errors="coerce"
-        )
-        big_df["持股市值变化-10日"] = pd.to_numeric(
-            big_df["持股市值变化-10日"], errors="coerce"
-        )
+            temp_df = temp_df[
+                [
+                    "持股日期",
+                    "股票代码",
+                    "股票简称",
+                    "当日收盘价",
+                    "当日涨跌幅",
+                    "持股数量",
+                    "持股市值",
+                    "持股数量占发行股百分比",
+                    "持股市值变化-1日",
+                    "持股市值变化-5日",
+                    "持股市值变化-10日",
+                ]
+            ]
+            temp_df["持股日期"] = pd.to_datetime(
+                temp_df["持股日期"], errors="coerce"
+            ).dt.date
+            temp_df["当日收盘价"] = pd.to_numeric(
+                temp_df["当日收盘价"], errors="coerce"
+            )
+            temp_df["当日涨跌幅"] = pd.to_numeric(
+                temp_df["当日涨跌幅"], errors="coerce"
+            )
+            temp_df["持股数量"] = pd.to_numeric(temp_df["持股数量"], errors="coerce")
+            temp_df["持股市值"] = pd.to_numeric(temp_df["持股市值"], errors="coerce")
+            temp_df["持股数量占发行股百分比"] = pd.to_numeric(
+                temp_df["持股数量占发行股百分比"], errors="coerce"
+            )
+            temp_df["持股市值变化-1日"] = pd.to_numeric(
+                temp_df["持股市值变化-1日"], errors="coerce"
+            )
+            temp_df["持股市值变化-5日"] = pd.to_numeric(
+                temp_df["持股市值变化-5日"], errors="coerce"
+            )
+            temp_df["持股市值变化-10日"] = pd.to_numeric(
+                temp_df["持股市值变化-10日"], errors="coerce"
+            )
+            yield temp_df
     elif symbol == "北向持股":
         params = {
             "sortColumns": "TRADE_DATE",
@@ -468,95 +469,91 @@ def stock_hsgt_stock_statistics_em(
                 }
             )
         url = "http://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
-        tqdm = get_tqdm()
-        for page in tqdm(range(1, int(total_page) + 1), leave=False):
-            params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
-            data_json = r.json()
-            temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-        big_df.columns = [
-            "-",
-            "-",
-            "持股日期",
-            "-",
-            "股票简称",
-            "-",
-            "-",
-            "股票代码",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股数量",
-            "持股市值",
-            "-",
-            "持股数量占发行股百分比",
-            "当日收盘价",
-            "当日涨跌幅",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股市值变化-1日",
-            "持股市值变化-5日",
-            "持股市值变化-10日",
-            "-",
-            "-",
-            "-",
-        ]
-        big_df = big_df[
-            [
+        for temp_df in iter_datacenter_pages(url, params):
+            temp_df.columns = [
+                "-",
+                "-",
                 "持股日期",
-                "股票代码",
+                "-",
                 "股票简称",
-                "当日收盘价",
-                "当日涨跌幅",
+                "-",
+                "-",
+                "股票代码",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股数量",
                 "持股市值",
+                "-",
                 "持股数量占发行股百分比",
+                "当日收盘价",
+                "当日涨跌幅",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股市值变化-1日",
                 "持股市值变化-5日",
                 "持股市值变化-10日",
+                "-",
+                "-",
+                "-",
             ]
-        ]
-        big_df["持股日期"] = pd.to_datetime(big_df["持股日期"], errors="coerce").dt.date
-        big_df["当日收盘价"] = pd.to_numeric(big_df["当日收盘价"], errors="coerce")
-        big_df["当日涨跌幅"] = pd.to_numeric(big_df["当日涨跌幅"], errors="coerce")
-        big_df["持股数量"] = pd.to_numeric(big_df["持股数量"], errors="coerce")
-        big_df["持股市值"] = pd.to_numeric(big_df["持股市值"], errors="coerce")
-        big_df["持股数量占发行股百分比"] = pd.to_numeric(
-            big_df["持股数量占发行股百分比"], errors="coerce"
-        )
-        big_df["持股市值变化-1日"] = pd.to_numeric(
-            big_df["持股市值变化-1日"], errors="coerce"
-        )
-        big_df["持股市值变化-5日"] = pd.to_numeric(
-            big_df["持股市值变化-5日"], errors="coerce"
-        )
-        big_df["持股市值变化-10日"] = pd.to_numeric(
-            big_df["持股市值变化-10日"], errors="coerce"
-        )
+            temp_df = temp_df[
+                [
+                    "持股日期",
+                    "股票代码",
+                    "股票简称",
+                    "当日收盘价",
+                    "当日涨跌幅",
+                    "持股数量",
+                    "持股市值",
+                    "持股数量占发行股百分比",
+                    "持股市值变化-1日",
+                    "持股市值变化-5日",
+                    "持股市值变化-10日",
+                ]
+            ]
+            temp_df["持股日期"] = pd.to_datetime(
+                temp_df["持股日期"], errors="coerce"
+            ).dt.date
+            temp_df["当日收盘价"] = pd.to_numeric(
+                temp_df["当日收盘价"], errors="coerce"
+            )
+            temp_df["当日涨跌幅"] = pd.to_numeric(
+                temp_df["当日涨跌幅"], errors="coerce"
+            )
+            temp_df["持股数量"] = pd.to_numeric(temp_df["持股数量"], errors="coerce")
+            temp_df["持股市值"] = pd.to_numeric(temp_df["持股市值"], errors="coerce")
+            temp_df["持股数量占发行股百分比"] = pd.to_numeric(
+                temp_df["持股数量占发行股百分比"], errors="coerce"
+            )
+            temp_df["持股市值变化-1日"] = pd.to_numeric(
+                temp_df["持股市值变化-1日"], errors="coerce"
+            )
+            temp_df["持股市值变化-5日"] = pd.to_numeric(
+                temp_df["持股市值变化-5日"], errors="coerce"
+            )
+            temp_df["持股市值变化-10日"] = pd.to_numeric(
+                temp_df["持股市值变化-10日"], errors="coerce"
+            )
+            yield temp_df
     elif symbol == "沪股通持股":
         params = {
             "sortColumns": "TRADE_DATE",
@@ -576,94 +573,91 @@ def stock_hsgt_stock_statistics_em(
                 }
             )
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
-        tqdm = get_tqdm()
-        for page in tqdm(range(1, int(total_page) + 1), leave=False):
-            params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
-            data_json = r.json()
-            temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        big_df.columns = [
-            "-",
-            "-",
-            "持股日期",
-            "-",
-            "股票简称",
-            "-",
-            "-",
-            "股票代码",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股数量",
-            "持股市值",
-            "-",
-            "持股数量占发行股百分比",
-            "当日收盘价",
-            "当日涨跌幅",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股市值变化-1日",
-            "持股市值变化-5日",
-            "持股市值变化-10日",
-            "-",
-            "-",
-            "-",
-        ]
-        big_df = big_df[
-            [
+        for temp_df in iter_datacenter_pages(url, params):
+            temp_df.columns = [
+                "-",
+                "-",
                 "持股日期",
-                "股票代码",
+                "-",
                 "股票简称",
-                "当日收盘价",
-                "当日涨跌幅",
+                "-",
+                "-",
+                "股票代码",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股数量",
                 "持股市值",
+                "-",
                 "持股数量占发行股百分比",
+                "当日收盘价",
+                "当日涨跌幅",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股市值变化-1日",
                 "持股市值变化-5日",
                 "持股市值变化-10日",
+                "-",
+                "-",
+                "-",
             ]
-        ]
-        big_df["持股日期"] = pd.to_datetime(big_df["持股日期"], errors="coerce").dt.date
-        big_df["当日收盘价"] = pd.to_numeric(big_df["当日收盘价"], errors="coerce")
-        big_df["当日涨跌幅"] = pd.to_numeric(big_df["当日涨跌幅"], errors="coerce")
-        big_df["持股数量"] = pd.to_numeric(big_df["持股数量"], errors="coerce")
-        big_df["持股市值"] = pd.to_numeric(big_df["持股市值"], errors="coerce")
-        big_df["持股数量占发行股百分比"] = pd.to_numeric(
-            big_df["持股数量占发行股百分比"], errors="coerce"
-        )
-        big_df["持股市值变化-1日"] = pd.to_numeric(
-            big_df["持股市值变化-1日"], errors="coerce"
-        )
-        big_df["持股市值变化-5日"] = pd.to_numeric(
-            big_df["持股市值变化-5日"], errors="coerce"
-        )
-        big_df["持股市值变化-10日"] = pd.to_numeric(
-            big_df["持股市值变化-10日"], errors="coerce"
-        )
+            temp_df = temp_df[
+                [
+                    "持股日期",
+                    "股票代码",
+                    "股票简称",
+                    "当日收盘价",
+                    "当日涨跌幅",
+                    "持股数量",
+                    "持股市值",
+                    "持股数量占发行股百分比",
+                    "持股市值变化-1日",
+                    "持股市值变化-5日",
+                    "持股市值变化-10日",
+                ]
+            ]
+            temp_df["持股日期"] = pd.to_datetime(
+                temp_df["持股日期"], errors="coerce"
+            ).dt.date
+            temp_df["当日收盘价"] = pd.to_numeric(
+                temp_df["当日收盘价"], errors="coerce"
+            )
+            temp_df["当日涨跌幅"] = pd.to_numeric(
+                temp_df["当日涨跌幅"], errors="coerce"
+            )
+            temp_df["持股数量"] = pd.to_numeric(temp_df["持股数量"], errors="coerce")
+            temp_df["持股市值"] = pd.to_numeric(temp_df["持股市值"], errors="coerce")
+            temp_df["持股数量占发行股百分比"] = pd.to_numeric(
+                temp_df["持股数量占发行股百分比"], errors="coerce"
+            )
+            temp_df["持股市值变化-1日"] = pd.to_numeric(
+                temp_df["持股市值变化-1日"], errors="coerce"
+            )
+            temp_df["持股市值变化-5日"] = pd.to_numeric(
+                temp_df["持股市值变化-5日"], errors="coerce"
+            )
+            temp_df["持股市值变化-10日"] = pd.to_numeric(
+                temp_df["持股市值变化-10日"], errors="coerce"
+            )
+            yield temp_df
     elif symbol == "深股通持股":
         params = {
             "sortColumns": "TRADE_DATE",
@@ -684,95 +678,91 @@ def stock_hsgt_stock_statistics_em(
                 }
             )
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
-        tqdm = get_tqdm()
-        for page in tqdm(range(1, int(total_page) + 1), leave=False):
-            params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
-            data_json = r.json()
-            temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        big_df.columns = [
-            "-",
-            "-",
-            "持股日期",
-            "-",
-            "股票简称",
-            "-",
-            "-",
-            "股票代码",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股数量",
-            "持股市值",
-            "-",
-            "持股数量占发行股百分比",
-            "当日收盘价",
-            "当日涨跌幅",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "-",
-            "持股市值变化-1日",
-            "持股市值变化-5日",
-            "持股市值变化-10日",
-            "-",
-            "-",
-            "-",
-        ]
-        big_df = big_df[
-            [
+        for temp_df in iter_datacenter_pages(url, params):
+            temp_df.columns = [
+                "-",
+                "-",
                 "持股日期",
-                "股票代码",
+                "-",
                 "股票简称",
-                "当日收盘价",
-                "当日涨跌幅",
+                "-",
+                "-",
+                "股票代码",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股数量",
                 "持股市值",
+                "-",
                 "持股数量占发行股百分比",
+                "当日收盘价",
+                "当日涨跌幅",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
                 "持股市值变化-1日",
                 "持股市值变化-5日",
                 "持股市值变化-10日",
+                "-",
+                "-",
+                "-",
             ]
-        ]
-        big_df["持股日期"] = pd.to_datetime(big_df["持股日期"], errors="coerce").dt.date
-        big_df["当日收盘价"] = pd.to_numeric(big_df["当日收盘价"], errors="coerce")
-        big_df["当日涨跌幅"] = pd.to_numeric(big_df["当日涨跌幅"], errors="coerce")
-        big_df["持股数量"] = pd.to_numeric(big_df["持股数量"], errors="coerce")
-        big_df["持股市值"] = pd.to_numeric(big_df["持股市值"], errors="coerce")
-        big_df["持股数量占发行股百分比"] = pd.to_numeric(
-            big_df["持股数量占发行股百分比"], errors="coerce"
-        )
-        big_df["持股市值变化-1日"] = pd.to_numeric(
-            big_df["持股市值变化-1日"], errors="coerce"
-        )
-        big_df["持股市值变化-5日"] = pd.to_numeric(
-            big_df["持股市值变化-5日"], errors="coerce"
-        )
-        big_df["持股市值变化-10日"] = pd.to_numeric(
-            big_df["持股市值变化-10日"], errors="coerce"
-        )
-    return big_df
+            temp_df = temp_df[
+                [
+                    "持股日期",
+                    "股票代码",
+                    "股票简称",
+                    "当日收盘价",
+                    "当日涨跌幅",
+                    "持股数量",
+                    "持股市值",
+                    "持股数量占发行股百分比",
+                    "持股市值变化-1日",
+                    "持股市值变化-5日",
+                    "持股市值变化-10日",
+                ]
+            ]
+            temp_df["持股日期"] = pd.to_datetime(
+                temp_df["持股日期"], errors="coerce"
+            ).dt.date
+            temp_df["当日收盘价"] = pd.to_numeric(
+                temp_df["当日收盘价"], errors="coerce"
+            )
+            temp_df["当日涨跌幅"] = pd.to_numeric(
+                temp_df["当日涨跌幅"], errors="coerce"
+            )
+            temp_df["持股数量"] = pd.to_numeric(temp_df["持股数量"], errors="coerce")
+            temp_df["持股市值"] = pd.to_numeric(temp_df["持股市值"], errors="coerce")
+            temp_df["持股数量占发行股百分比"] = pd.to_numeric(
+                temp_df["持股数量占发行股百分比"], errors="coerce"
+            )
+            temp_df["持股市值变化-1日"] = pd.to_numeric(
+                temp_df["持股市值变化-1日"], errors="coerce"
+            )
+            temp_df["持股市值变化-5日"] = pd.to_numeric(
+                temp_df["持股市值变化-5日"], errors="coerce"
+            )
+            temp_df["持股市值变化-10日"] = pd.to_numeric(
+                temp_df["持股市值变化-10日"], errors="coerce"
+            )
+            yield temp_df
 
 
 def stock_hsgt_institution_statistics_em(
@@ -877,14 +867,15 @@ def stock_hsgt_institution_statistics_em(
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_list = []
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_list.append(temp_df)
+        big_df = concat_pages(big_list)
         big_df.columns = [
             "持股日期",
             "_",
@@ -945,14 +936,15 @@ def stock_hsgt_institution_statistics_em(
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        page_list = []
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            page_list.append(temp_df)
+        big_df = concat_pages(page_list)
         big_df.columns = [
             "持股日期",
             "_",
@@ -1570,14 +1562,15 @@ def stock_hsgt_individual_detail_em(
         r = requests.get(url, params=params)
         data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.rename(
         columns={
             "SECUCODE": "-",
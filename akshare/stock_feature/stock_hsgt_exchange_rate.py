@@ -14,6 +14,8 @@ from datetime import datetime
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def stock_sgt_settlement_exchange_rate_szse() -> pd.DataFrame:
     """
@@ -32,7 +34,7 @@ def stock_sgt_settlement_exchange_rate_szse() -> pd.DataFrame:
     r = requests.get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(r.content, engine="openpyxl")
+        temp_df = read_excel(r.content, engine="openpyxl")
     temp_df.sort_values(by="适用日期", inplace=True, ignore_index=True)
     temp_df["适用日期"] = pd.to_datetime(temp_df["适用日期"], errors="coerce").dt.date
     temp_df["买入结算汇兑比率"] = pd.to_numeric(
@@ -61,7 +63,7 @@ def stock_sgt_reference_exchange_rate_szse() -> pd.DataFrame:
     r = requests.get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(r.content, engine="openpyxl")
+        temp_df = read_excel(r.content, engine="openpyxl")
     temp_df.sort_values(by="适用日期", inplace=True, ignore_index=True)
     temp_df["适用日期"] = pd.to_datetime(temp_df["适用日期"], errors="coerce").dt.date
     temp_df["参考汇率买入价"] = pd.to_numeric(
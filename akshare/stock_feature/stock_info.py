@@ -13,6 +13,7 @@ import requests
 
 from ..request import make_request_with_retry_json
 from ..utils.cons import headers
+from ..utils.func import concat_pages
 
 
 def stock_info_cjzc_em() -> pd.DataFrame:
@@ -34,13 +35,14 @@ def stock_info_cjzc_em() -> pd.DataFrame:
         "req_trace": "1710314682980",
         "fields": "code,showTime,title,mediaName,summary,image,url,uniqueUrl,Np_dst",
     }
-    big_df = pd.DataFrame()
+    big_list = []
     for page in range(1, 3):
         params.update({"page_index": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["list"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df = big_df[["title", "summary", "showTime", "uniqueUrl"]]
     big_df.rename(
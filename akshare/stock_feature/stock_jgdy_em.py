@@ -12,6 +12,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
+
 
 def stock_jgdy_tj_em(date: str = "20220101") -> pd.DataFrame:
     """
@@ -38,13 +40,14 @@ def stock_jgdy_tj_em(date: str = "20220101") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df])
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list, ignore_index=False)
     big_df.reset_index(inplace=True)
     big_df["index"] = list(range(1, len(big_df) + 1))
     big_df.columns = [
@@ -132,13 +135,14 @@ def stock_jgdy_detail_em(date: str = "20241211") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df])
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list, ignore_index=False)
     big_df.reset_index(inplace=True)
     big_df["index"] = list(range(1, len(big_df) + 1))
     big_df.columns = [
@@ -12,6 +12,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -32,12 +33,13 @@ def stock_lhb_detail_daily_sina(date: str = "20240222") -> pd.DataFrame:
     selected_html = soup.find(name="div", attrs={"class": "list"}).find_all(
         name="table", attrs={"class": "list_table"}
     )
-    big_df = pd.DataFrame()
+    big_list = []
     for table in selected_html:
         temp_df = pd.read_html(StringIO(table.prettify()), header=0, skiprows=1)[0]
         temp_symbol = pd.read_html(StringIO(table.prettify()))[0].iat[0, 0]
         temp_df["指标"] = temp_symbol
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     del big_df["查看详情"]
     big_df.columns = [
@@ -101,7 +103,7 @@ def stock_lhb_ggtj_sina(symbol: str = "5") -> pd.DataFrame:
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/ggtj/index.phtml"
     )
     last_page_num = _find_last_page(url, symbol)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
@@ -110,7 +112,8 @@ def stock_lhb_ggtj_sina(symbol: str = "5") -> pd.DataFrame:
         }
         r = requests.get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     big_df.columns = [
         "股票代码",
@@ -138,7 +141,7 @@ def stock_lhb_yytj_sina(symbol: str = "5") -> pd.DataFrame:
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/yytj/index.phtml"
     )
     last_page_num = _find_last_page(url, symbol)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
@@ -147,7 +150,8 @@ def stock_lhb_yytj_sina(symbol: str = "5") -> pd.DataFrame:
         }
         r = requests.get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "营业部名称",
         "上榜次数",
@@ -176,7 +180,7 @@ def stock_lhb_jgzz_sina(symbol: str = "5") -> pd.DataFrame:
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/jgzz/index.phtml"
     )
     last_page_num = _find_last_page(url, symbol)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
@@ -187,7 +191,8 @@ def stock_lhb_jgzz_sina(symbol: str = "5") -> pd.DataFrame:
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
         if temp_df.empty:
             continue
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     del big_df["当前价"]
     del big_df["涨跌幅"]
@@ -224,7 +229,7 @@ def stock_lhb_jgmx_sina() -> pd.DataFrame:
         last_page_num = int(soup.find_all(attrs={"class": "page"})[-2].text)
     except:  # noqa: E722
         last_page_num = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
@@ -232,7 +237,8 @@ def stock_lhb_jgmx_sina() -> pd.DataFrame:
         }
         r = requests.get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
     big_df.rename(
@@ -7,10 +7,11 @@ https://www.szse.cn/disclosure/margin/object/index.html
 """
 
 import warnings
-from io import BytesIO
 import pandas as pd
 import requests
 
+from ..utils.parse_pool import read_excel
+
 
 def stock_margin_underlying_info_szse(date: str = "20221129") -> pd.DataFrame:
     """
@@ -38,7 +39,7 @@ def stock_margin_underlying_info_szse(date: str = "20221129") -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl", dtype={"证券代码": str})
+        temp_df = read_excel(r.content, engine="openpyxl", dtype={"证券代码": str})
     return temp_df
 
 
@@ -116,7 +117,7 @@ def stock_margin_detail_szse(date: str = "20230925") -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
-        temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl", dtype={"证券代码": str})
+        temp_df = read_excel(r.content, engine="openpyxl", dtype={"证券代码": str})
     temp_df.columns = [
         "证券代码",
         "证券简称",
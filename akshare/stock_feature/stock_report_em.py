@@ -14,6 +14,7 @@ https://data.eastmoney.com/bbsj/202003/xjll.html
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -325,7 +326,7 @@ def stock_lrb_em(date: str = "20240331") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -336,7 +337,8 @@ def stock_lrb_em(date: str = "20240331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -461,7 +463,7 @@ def stock_xjll_em(date: str = "20240331") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -472,7 +474,8 @@ def stock_xjll_em(date: str = "20240331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -13,6 +13,7 @@ Desc: 东方财富网-数据中心-特色数据-商誉
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -103,7 +104,7 @@ def stock_sy_yq_em(date: str = "20240630") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_list = []
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
@@ -111,7 +112,8 @@ def stock_sy_yq_em(date: str = "20240630") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -212,7 +214,7 @@ def stock_sy_jz_em(date: str = "20240630") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_list = []
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
@@ -220,7 +222,8 @@ def stock_sy_jz_em(date: str = "20240630") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -313,7 +316,7 @@ def stock_sy_em(date: str = "20231231") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_list = []
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
@@ -321,7 +324,8 @@ def stock_sy_em(date: str = "20231231") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -405,7 +409,7 @@ def stock_sy_hy_em(date: str = "20240930") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_list = []
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
@@ -413,7 +417,8 @@ def stock_sy_hy_em(date: str = "20240930") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.reset_index(inplace=True, drop=True)
     big_df.rename(
         columns={
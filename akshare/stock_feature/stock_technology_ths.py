@@ -9,28 +9,14 @@ https://data.10jqka.com.cn/rank/cxg/
 from io import StringIO
 
 import pandas as pd
-import py_mini_racer
 import requests
 from bs4 import BeautifulSoup
 
-from ..datasets import get_ths_js
+from ..utils.func import concat_pages
+from ..utils.js_pool import js_call
 from ..utils.tqdm import get_tqdm
 
 
-def _get_file_content_ths(file: str = "ths.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
-
-
 def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
     """
     同花顺-数据中心-技术选股-创新高
@@ -46,10 +32,7 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         "一年新高": "2",
         "历史新高": "1",
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -67,10 +50,10 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -82,7 +65,8 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         )
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[:, :-1]  # 20260214 新增
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -121,10 +105,7 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         "一年新低": "2",
         "历史新低": "1",
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -142,10 +123,10 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -157,7 +138,8 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         )
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[:, :-1]  # 20260214 新增
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -188,10 +170,7 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
     :return: 连续上涨
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -206,10 +185,10 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -218,7 +197,8 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
         url = f"http://data.10jqka.com.cn/rank/lxsz/field/lxts/order/desc/page/{page}/ajax/1/free/1/"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -249,10 +229,7 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
     :return: 连续下跌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -267,10 +244,10 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -279,7 +256,8 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
         url = f"http://data.10jqka.com.cn/rank/lxxd/field/lxts/order/desc/page/{page}/ajax/1/free/1/"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -310,10 +288,7 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
     :return: 持续放量
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -328,10 +303,10 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -366,7 +341,8 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -396,10 +372,7 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
     :return: 持续缩量
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -414,10 +387,10 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -452,7 +425,8 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -494,10 +468,7 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "250日均线": 250,
         "500日均线": 500,
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -512,10 +483,10 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -552,7 +523,8 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -591,10 +563,7 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "250日均线": 250,
         "500日均线": 500,
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -609,10 +578,10 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -648,7 +617,8 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -675,10 +645,7 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
     :return: 量价齐升
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -693,10 +660,10 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -729,7 +696,8 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -757,10 +725,7 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
     :return: 量价齐跌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -775,10 +740,10 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
+        v_code = js_call("ths.js", "v")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -811,7 +776,8 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -839,11 +805,8 @@ def stock_rank_xzjp_ths() -> pd.DataFrame:
     :return: 险资举牌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
     big_df = pd.DataFrame()
-    v_code = js_code.call("v")
+    v_code = js_call("ths.js", "v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
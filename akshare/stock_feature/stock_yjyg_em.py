@@ -13,6 +13,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from ..utils.func import concat_pages
+
 
 def stock_yjkb_em(date: str = "20211231") -> pd.DataFrame:
     """
@@ -36,7 +38,7 @@ def stock_yjkb_em(date: str = "20211231") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_list = []
     total_page = data_json["result"]["pages"]
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -47,7 +49,8 @@ def stock_yjkb_em(date: str = "20211231") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -153,7 +156,7 @@ def stock_yjyg_em(date: str = "20200331") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_list = []
     total_page = data_json["result"]["pages"]
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -164,7 +167,8 @@ def stock_yjyg_em(date: str = "20200331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -289,7 +293,7 @@ def stock_yysj_em(symbol: str = "沪深A股", date: str = "20200331") -> pd.Data
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -299,7 +303,8 @@ def stock_yysj_em(symbol: str = "沪深A股", date: str = "20200331") -> pd.Data
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -12,12 +12,13 @@ https://money.finance.sina.com.cn/corp/go.php/vISSUE_ShareBonus/stockid/600004.p
 """
 
 from datetime import datetime
-from io import StringIO
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.func import concat_pages
+from ..utils.parse_pool import read_html
 from ..utils.tqdm import get_tqdm
 
 
@@ -250,7 +251,7 @@ def stock_financial_analysis_indicator(
         year_list = year_list[: year_list.index(start_year) + 1]
     else:
         return pd.DataFrame()
-    out_df = pd.DataFrame()
+    out_list = []
     tqdm = get_tqdm()
     for year_item in tqdm(year_list, leave=False):
         url = (
@@ -258,7 +259,7 @@ def stock_financial_analysis_indicator(
             f"stockid/{symbol}/ctrl/{year_item}/displaytype/4.phtml"
         )
         r = requests.get(url)
-        temp_df = pd.read_html(StringIO(r.text))[12].iloc[:, :-1]
+        temp_df = read_html(r.text)[12].iloc[:, :-1]
         temp_df.columns = temp_df.iloc[0, :]
         temp_df = temp_df.iloc[1:, :]
         big_df = pd.DataFrame()
@@ -292,7 +293,8 @@ def stock_financial_analysis_indicator(
         big_df.columns = big_df.iloc[0, :].tolist()
         big_df = big_df.iloc[1:, :]
         big_df.index = temp_df.columns.tolist()[1:]
-        out_df = pd.concat(objs=[out_df, big_df])
+        out_list.append(big_df)
+    out_df = concat_pages(out_list, ignore_index=False)
 
     out_df.dropna(inplace=True)
     out_df.reset_index(inplace=True)
@@ -314,7 +316,7 @@ def stock_history_dividend() -> pd.DataFrame:
     url = "https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/lsfh/index.phtml"
     params = {"p": "1", "num": "50000"}
     r = requests.get(url, params=params)
-    temp_df = pd.read_html(StringIO(r.text))[0]
+    temp_df = read_html(r.text)[0]
     temp_df["代码"] = temp_df["代码"].astype(str).str.zfill(6)
     temp_df.columns = [
         "代码",
@@ -355,7 +357,7 @@ def stock_history_dividend_detail(
     if indicator == "分红":
         url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_ShareBonus/stockid/{symbol}.phtml"
         r = requests.get(url)
-        temp_df = pd.read_html(StringIO(r.text))[12]
+        temp_df = read_html(r.text)[12]
         temp_df.columns = [item[2] for item in temp_df.columns.tolist()]
         temp_df.columns = [
             "公告日期",
@@ -394,7 +396,7 @@ def stock_history_dividend_detail(
                 "end_date": date,
             }
             r = requests.get(url, params=params)
-            temp_df = pd.read_html(StringIO(r.text))[12]
+            temp_df = read_html(r.text)[12]
             temp_df.columns = ["item", "value"]
             return temp_df
         else:
@@ -402,7 +404,7 @@ def stock_history_dividend_detail(
     else:
         url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_ShareBonus/stockid/{symbol}.phtml"
         r = requests.get(url)
-        temp_df = pd.read_html(StringIO(r.text))[13]
+        temp_df = read_html(r.text)[13]
         temp_df.columns = [item[1] for item in temp_df.columns.tolist()]
         temp_df.columns = [
             "公告日期",
@@ -453,7 +455,7 @@ def stock_history_dividend_detail(
                 "end_date": date,
             }
             r = requests.get(url, params=params)
-            temp_df = pd.read_html(StringIO(r.text))[12]
+            temp_df = read_html(r.text)[12]
             temp_df.columns = ["item", "value"]
             return temp_df
         else:
@@ -471,7 +473,7 @@ def stock_ipo_info(stock: str = "600004") -> pd.DataFrame:
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_NewStock/stockid/{stock}.phtml"
     r = requests.get(url)
-    temp_df = pd.read_html(StringIO(r.text))[12]
+    temp_df = read_html(r.text)[12]
     temp_df.columns = ["item", "value"]
     return temp_df
 
@@ -487,12 +489,12 @@ def stock_add_stock(symbol: str = "688166") -> pd.DataFrame:
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_AddStock/stockid/{symbol}.phtml"
     r = requests.get(url)
-    temp_df = pd.read_html(StringIO(r.text))[12]
+    temp_df = read_html(r.text)[12]
     if temp_df.at[0, 0] == "对不起，暂时没有相关增发记录":
         raise f"股票 {symbol} 无增发记录"
     big_df = pd.DataFrame()
     for i in range(int(len(temp_df.at[0, 1]) / 10)):
-        temp_df = pd.read_html(StringIO(r.text))[13 + i].iloc[:, 1]
+        temp_df = read_html(r.text)[13 + i].iloc[:, 1]
         big_df[temp_df.name.split(" ")[1].split("：")[1][:10]] = temp_df
     big_df = big_df.T
     big_df.reset_index(inplace=True)
@@ -519,7 +521,7 @@ def stock_restricted_release_queue_sina(symbol: str = "600000") -> pd.DataFrame:
     """
     url = f"https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/xsjj/index.phtml?symbol={symbol}"
     r = requests.get(url)
-    temp_df = pd.read_html(StringIO(r.text))[0]
+    temp_df = read_html(r.text)[0]
     temp_df.columns = [
         "代码",
         "名称",
@@ -553,7 +555,7 @@ def stock_circulate_stock_holder(symbol: str = "600000") -> pd.DataFrame:
     pd.set_option("future.no_silent_downcasting", True)
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_CirculateStockHolder/stockid/{symbol}.phtml"
     r = requests.get(url)
-    temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :5]
+    temp_df = read_html(r.text)[13].iloc[:, :5]
     temp_df.columns = [*range(5)]
     big_df = pd.DataFrame()
     need_range = temp_df[
@@ -626,7 +628,7 @@ def stock_fund_stock_holder(symbol: str = "600004") -> pd.DataFrame:
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_FundStockHolder/stockid/{symbol}.phtml"
     r = requests.get(url)
-    temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :6]
+    temp_df = read_html(r.text)[13].iloc[:, :6]
     temp_df.columns = [*range(6)]
     big_df = pd.DataFrame()
     need_range = temp_df[
@@ -685,7 +687,7 @@ def stock_main_stock_holder(stock: str = "600004") -> pd.DataFrame:
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_StockHolder/stockid/{stock}.phtml"
     r = requests.get(url)
-    temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :5]
+    temp_df = read_html(r.text)[13].iloc[:, :5]
     temp_df.columns = [*range(5)]
     big_df = pd.DataFrame()
     need_range = temp_df[
@@ -11,7 +11,8 @@ from io import StringIO
 import pandas as pd
 import requests
 
-from ..utils import demjson
+from ..utils import relaxed_json
+from ..utils.func import concat_pages
 
 
 def stock_institute_hold(symbol: str = "20051") -> pd.DataFrame:
@@ -75,12 +76,13 @@ def stock_institute_hold_detail(
     }
     r = requests.get(url, params=params)
     text_data = r.text
-    json_data = demjson.decode(text_data[text_data.find("{") : -2])
-    big_df = pd.DataFrame()
+    json_data = relaxed_json.decode(text_data[text_data.find("{") : -2])
+    big_list = []
     for item in json_data["data"].keys():
         inner_temp_df = pd.DataFrame(json_data["data"][item]).T.iloc[:-1, :]
         inner_temp_df.reset_index(inplace=True)
-        big_df = pd.concat(objs=[big_df, inner_temp_df], ignore_index=True)
+        big_list.append(inner_temp_df)
+    big_df = concat_pages(big_list)
     if not big_df.empty:
         big_df["index"] = big_df["index"].str.split("_", expand=True)[0]
         big_df.rename(columns={"index": "institute"}, inplace=True)
@@ -12,6 +12,7 @@ import pandas as pd
 import requests
 
 from ..utils.cons import headers
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -52,7 +53,7 @@ def stock_ipo_review_em() -> pd.DataFrame:
         raise ValueError("响应格式异常，未找到 result.pages")
 
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_list = []
 
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
@@ -62,10 +63,11 @@ def stock_ipo_review_em() -> pd.DataFrame:
         try:
             data_json = parse_jsonp(r.text)
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_list.append(temp_df)
         except Exception as e:
             print(f"第 {page} 页解析失败: {e}")
             continue
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(drop=True, inplace=True)
     big_df.insert(0, "序号", big_df.index + 1)
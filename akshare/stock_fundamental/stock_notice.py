@@ -11,6 +11,7 @@ import math
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -63,7 +64,7 @@ def _stock_notice_report(
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = math.ceil(data_json["data"]["total_hits"] / 100)
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update(
@@ -95,7 +96,8 @@ def _stock_notice_report(
         del temp_df["codes"]
         del temp_df["columns"]
         temp_df = pd.concat(objs=[temp_df, temp_columns_df, temp_codes_df], axis=1)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.rename(
         columns={
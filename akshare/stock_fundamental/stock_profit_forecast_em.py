@@ -9,6 +9,7 @@ https://data.eastmoney.com/report/profitforecast.jshtml
 import pandas as pd
 import requests
 
+from ..utils.func import concat_pages
 from ..utils.tqdm import get_tqdm
 
 
@@ -39,7 +40,7 @@ def stock_profit_forecast_em(symbol: str = "") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = int(data_json["result"]["pages"])
-    big_df = pd.DataFrame()
+    big_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -53,7 +54,8 @@ def stock_profit_forecast_em(symbol: str = "") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_list.append(temp_df)
+    big_df = concat_pages(big_list)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 基于交易日历的缓存过期策略, 可直接作为 utils.redis_cache.lru_cache 的 max_age 参数
+until_next_close: 日终数据, 有效至下一个交易日收盘(数据发布)时刻
+intraday: 盘中快照, 交易时段内使用短 TTL, 非交易时段有效至下一个交易时段开始
+"""
+
+import abc
+import datetime
+from typing import Optional, Sequence, Tuple, Union
+
+from .trade_calendar import get_trade_calendar
+
+# NOTE(akshare): 中国不实行夏令时, 固定 UTC+8 即可, 无需依赖 tzdata
+CHINA_TZ = datetime.timezone(datetime.timedelta(hours=8))
+
+
+def is_trading_day(day: datetime.date) -> bool:
+    """
+    是否为交易日; 超出 calendar.json 覆盖范围时按工作日判断
+    :param day: 日期
+    :type day: datetime.date
+    :return: 是否为交易日
+    :rtype: bool
+    """
+    calendar = get_trade_calendar()
+    if day > calendar.last:
+        return day.weekday() < 5
+    return day in calendar
+
+
+def _parse_time(value: Union[str, datetime.time]) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+    return datetime.datetime.strptime(value, "%H:%M").time()
+
+
+def _now(now: Optional[datetime.datetime]) -> datetime.datetime:
+    if now is None:
+        return datetime.datetime.now(CHINA_TZ)
+    if now.tzinfo is None:
+        return now.replace(tzinfo=CHINA_TZ)
+    return now.astimezone(CHINA_TZ)
+
+
+def _seconds_until(now: datetime.datetime, target: datetime.datetime) -> int:
+    return max(1, int((target - now).total_seconds()))
+
+
+class ExpiryPolicy(abc.ABC):
+    """
+    缓存过期策略基类, ttl 返回写入缓存时应设置的过期秒数
+    """
+
+    @abc.abstractmethod
+    def ttl(self, now: Optional[datetime.datetime] = None) -> int:
+        """
+        本次写入缓存的过期秒数
+        :param now: 当前时间, 默认为当前北京时间
+        :type now: datetime.datetime
+        :return: 过期秒数
+        :rtype: int
+        """
+
+
+class UntilNextClose(ExpiryPolicy):
+    """
+    有效至下一个交易日的 close_time(北京时间)
+    例如 close_time="17:00" 时, 周五 18:00 写入的期货持仓排名缓存在下周一 17:00 过期
+    """
+
+    def __init__(self, close_time: Union[str, datetime.time] = "15:00"):
+        self.close_time = _parse_time(close_time)
+
+    def next_close(self, now: Optional[datetime.datetime] = None) -> datetime.datetime:
+        """
+        下一个收盘(数据发布)时刻
+        :param now: 当前时间, 默认为当前北京时间
+        :type now: datetime.datetime
+        :return: 下一个收盘时刻
+        :rtype: datetime.datetime
+        """
+        now = _now(now)
+        day = now.date()
+        while True:
+            if is_trading_day(day):
+                close = datetime.datetime.combine(day, self.close_time, tzinfo=CHINA_TZ)
+                if close > now:
+                    return close
+            day += datetime.timedelta(days=1)
+
+    def ttl(self, now: Optional[datetime.datetime] = None) -> int:
+        now = _now(now)
+        return _seconds_until(now, self.next_close(now))
+
+    def __repr__(self):
+        return f"until_next_close({self.close_time.strftime('%H:%M')!r})"
+
+
+class Intraday(ExpiryPolicy):
+    """
+    交易时段内有效 ttl 秒(且不跨越时段结束); 非交易时段有效至下一个交易时段开始
+    """
+
+    def __init__(
+        self,
+        ttl: int = 60,
+        sessions: Sequence[Tuple[str, str]] = (("09:15", "11:30"), ("13:00", "15:00")),
+    ):
+        self.session_ttl = ttl
+        self.sessions = [(_parse_time(start), _parse_time(end)) for start, end in sessions]
+
+    def ttl(self, now: Optional[datetime.datetime] = None) -> int:
+        now = _now(now)
+        day = now.date()
+        while True:
+            if is_trading_day(day):
+                for start, end in self.sessions:
+                    start_dt = datetime.datetime.combine(day, start, tzinfo=CHINA_TZ)
+                    end_dt = datetime.datetime.combine(day, end, tzinfo=CHINA_TZ)
+                    if start_dt <= now < end_dt:
+                        # 盘中: 短 TTL 且不跨越时段结束, 时段结束后重新获取的快照有效至下一时段
+                        return min(self.session_ttl, _seconds_until(now, end_dt))
+                    if now < start_dt:
+                        return _seconds_until(now, start_dt)
+            day += datetime.timedelta(days=1)
+
+    def __repr__(self):
+        sessions = [(s.strftime("%H:%M"), e.strftime("%H:%M")) for s, e in self.sessions]
+        return f"intraday({self.session_ttl}, sessions={sessions})"
+
+
+def until_next_close(close_time: Union[str, datetime.time] = "15:00") -> UntilNextClose:
+    """
+    日终数据过期策略
+    :param close_time: 数据更新时刻(北京时间), 如股票日线 "15:00", 期货持仓排名 "17:00"
+    :type close_time: str
+    :return: 过期策略
+    :rtype: UntilNextClose
+    """
+    return UntilNextClose(close_time)
+
+
+def intraday(
+    ttl: int = 60,
+    sessions: Sequence[Tuple[str, str]] = (("09:15", "11:30"), ("13:00", "15:00")),
+) -> Intraday:
+    """
+    盘中快照过期策略
+    :param ttl: 交易时段内的缓存秒数
+    :type ttl: int
+    :param sessions: 交易时段列表(北京时间), 默认为 A 股集合竞价至收盘
+    :type sessions: list
+    :return: 过期策略
+    :rtype: Intraday
+    """
+    return Intraday(ttl, sessions)
+
+
+def resolve_ttl(max_age: Union[int, ExpiryPolicy]) -> int:
+    """
+    将固定秒数或过期策略转换为本次写入的过期秒数
+    :param max_age: 秒数或过期策略
+    :type max_age: int or ExpiryPolicy
+    :return: 过期秒数
+    :rtype: int
+    """
+    if isinstance(max_age, ExpiryPolicy):
+        return max_age.ttl()
+    return max_age
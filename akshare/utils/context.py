@@ -5,6 +5,11 @@ class AkshareConfig:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.proxies = None
+            # 见 utils.schema.set_compact_dtypes
+            cls._instance.compact_dtypes = False
+            cls._instance.label_dtype = "string"
+            # 见 utils.output.set_output_format
+            cls._instance.output_format = "pandas"
         return cls._instance
 
     @classmethod
@@ -1,21 +1,155 @@
 # !/usr/bin/env python
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/17 10:00
 Desc: 通用帮助函数
 """
 
+import functools
 import math
-import random
-import time
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 
 import pandas as pd
 
-from ..utils.request import get_session, get_tls_session, request_with_retry, request_with_retry_tls
+from ..utils.request import (
+    get_pooled_session,
+    get_pooled_tls_session,
+    request_with_retry,
+    request_with_retry_tls,
+)
+from ..utils.output import arrow_array, pa, resolve_output, rows_to_arrow, to_output
 from ..utils.tqdm import get_tqdm
 
 
-def fetch_paginated_data(
+def iter_pages(
+    fetch_page: Callable[[int], pd.DataFrame],
+    pages: Iterable[int],
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    按页码顺序逐页获取数据, 调用方可以边获取边处理(如逐页写入文件), 不必等全部页面都在内存中
+    :param fetch_page: 获取某一页数据的函数, 参数为页码
+    :type fetch_page: callable
+    :param pages: 需要获取的页码
+    :type pages: iterable
+    :param max_workers: 并发请求的线程数, 1 为逐页顺序请求; 大于 1 时最多提前请求 max_workers 页, 仍按页码顺序返回
+    :type max_workers: int
+    :return: 每一页的数据
+    :rtype: Iterator[pandas.DataFrame]
+    """
+    pages = list(pages)
+    tqdm = get_tqdm()
+    if max_workers <= 1 or len(pages) <= 1:
+        for page in tqdm(pages, leave=False):
+            yield fetch_page(page)
+        return
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(pages)))
+
+    def _ordered() -> Iterator[pd.DataFrame]:
+        page_iter = iter(pages)
+        pending = deque()
+        for page in page_iter:
+            pending.append(executor.submit(fetch_page, page))
+            if len(pending) >= max_workers:
+                break
+        while pending:
+            result = pending.popleft().result()
+            next_page = next(page_iter, None)
+            if next_page is not None:
+                pending.append(executor.submit(fetch_page, next_page))
+            yield result
+
+    try:
+        yield from tqdm(_ordered(), total=len(pages), leave=False)
+    finally:
+        # NOTE(akshare): 任一页失败或调用方提前停止迭代时, 取消尚未开始的页面请求
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def concat_pages(
+    pages: Iterable[pd.DataFrame], ignore_index: bool = True
+) -> pd.DataFrame:
+    """
+    一次性合并所有页面的数据, 避免在循环中反复 pd.concat 导致已获取的数据被重复复制
+    :param pages: 每一页的数据
+    :type pages: iterable
+    :param ignore_index: 是否重建索引
+    :type ignore_index: bool
+    :return: 合并后的数据, 没有任何页面时返回空表
+    :rtype: pandas.DataFrame
+    """
+    page_list = list(pages)
+    if not page_list:
+        return pd.DataFrame()
+    return pd.concat(objs=page_list, ignore_index=ignore_index)
+
+
+def paginated(page_func: Callable[..., Iterator[pd.DataFrame]]) -> Callable:
+    """
+    将逐页返回数据的生成器函数包装为一次性返回全部数据的接口
+    func(...) 合并所有页面后返回; func.iter_pages(...) 逐页返回, 每页的列名和类型与合并后的结果一致
+    :param page_func: 逐页返回数据的生成器函数
+    :type page_func: callable
+    :return: 合并所有页面数据的函数
+    :rtype: callable
+    """
+
+    @functools.wraps(page_func)
+    def wrapper(*args, **kwargs) -> pd.DataFrame:
+        return concat_pages(page_func(*args, **kwargs))
+
+    wrapper.iter_pages = page_func
+    return wrapper
+
+
+def iter_datacenter_pages(
+    url: str,
+    params: Dict,
+    page_key: str = "pageNumber",
+    timeout: int = 15,
+    headers: Dict = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    东方财富-数据中心(datacenter-web)-逐页获取数据
+    https://data.eastmoney.com/stock/tradedetail.html
+    :param url: 接口地址
+    :type url: str
+    :param params: 请求参数, 其中的页码参数会被逐页替换
+    :type params: dict
+    :param page_key: 页码参数名
+    :type page_key: str
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 每一页的原始数据
+    :rtype: Iterator[pandas.DataFrame]
+    """
+    params = params.copy()
+    params.update({page_key: 1})
+    # NOTE(akshare): 与其他东方财富分页接口一致, 使用进程级复用 Session, 请求带重试及按 host 限速
+    session = get_pooled_session(url)
+    r = request_with_retry(
+        url, params=params, timeout=timeout, session=session, headers=headers
+    )
+    data_json = r.json()
+    if not data_json.get("result"):
+        return
+    total_page = int(data_json["result"]["pages"])
+    # NOTE(akshare): 第一页在获取总页数时已经取到, 不再重复请求
+    yield pd.DataFrame(data_json["result"]["data"])
+
+    def _fetch_page(page: int) -> pd.DataFrame:
+        page_params = params.copy()
+        page_params.update({page_key: page})
+        r = request_with_retry(
+            url, params=page_params, timeout=timeout, session=session, headers=headers
+        )
+        return pd.DataFrame(r.json()["result"]["data"])
+
+    yield from iter_pages(_fetch_page, range(2, total_page + 1))
+
+
+def _iter_paginated_rows(
     url: str,
     base_params: Dict,
     timeout: int = 15,
@@ -23,78 +157,144 @@ def fetch_paginated_data(
     session=None,
     use_tls_impersonation: bool = False,
     impersonate: str = "chrome120",
-):
+    max_workers: int = 4,
+) -> Iterator[List[dict]]:
     """
-    东方财富-分页获取数据并合并结果
-    https://quote.eastmoney.com/f1.html?newcode=0.000001
-    :param url: 股票代码
-    :type url: str
-    :param base_params: 基础请求参数
-    :type base_params: dict
-    :param timeout: 请求超时时间
-    :type timeout: str
-    :return: 合并后的数据
-    :rtype: pandas.DataFrame
+    东方财富-分页获取数据-逐页返回原始记录, 参数同 iter_paginated_data
     """
     # 复制参数以避免修改原始参数
     params = base_params.copy()
-    # NOTE(akshare): 支持复用 Session + TLS 指纹（东财反爬适配）
-    own_session = session is None
-    if own_session:
+    # NOTE(akshare): 支持复用 Session + TLS 指纹（东财反爬适配），默认使用进程级复用 Session
+    if session is None:
         if use_tls_impersonation:
-            session = get_tls_session(headers=headers, impersonate=impersonate)
+            session = get_pooled_tls_session(url, impersonate=impersonate)
         if session is None:
-            session = get_session()
+            session = get_pooled_session(url)
 
-    try:
-        # 获取第一页数据，用于确定分页信息
-        # NOTE(akshare): 按需选择 TLS/常规请求函数
-        request_func = (
-            request_with_retry_tls if use_tls_impersonation else request_with_retry
-        )
+    # NOTE(akshare): 按需选择 TLS/常规请求函数
+    request_func = (
+        request_with_retry_tls if use_tls_impersonation else request_with_retry
+    )
+
+    def _request(page_params: Dict):
         request_kwargs = {
             "url": url,
-            "params": params,
+            "params": page_params,
             "timeout": timeout,
             "session": session,
             "headers": headers,
         }
         if use_tls_impersonation:
             request_kwargs["impersonate"] = impersonate
-        r = request_func(**request_kwargs)
-        data_json = r.json()
-        # 计算分页信息
-        per_page_num = len(data_json["data"]["diff"])
-        total_page = math.ceil(data_json["data"]["total"] / per_page_num)
-        # 存储所有页面数据
-        temp_list = []
-        # 添加第一页数据
-        temp_list.append(pd.DataFrame(data_json["data"]["diff"]))
-        # 获取进度条
-        tqdm = get_tqdm()
-        # 获取剩余页面数据
-        for page in tqdm(range(2, total_page + 1), leave=False):
-            params.update({"pn": page})
-            # 添加随机延迟，避免请求过于频繁
-            time.sleep(random.uniform(0.5, 1.5))
-            request_kwargs = {
-                "url": url,
-                "params": params,
-                "timeout": timeout,
-                "session": session,
-                "headers": headers,
-            }
-            if use_tls_impersonation:
-                request_kwargs["impersonate"] = impersonate
-            r = request_func(**request_kwargs)
-            data_json = r.json()
-            inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
-            temp_list.append(inner_temp_df)
-    finally:
-        if own_session and session is not None:
-            session.close()
-    # 合并所有数据
-    temp_df = pd.concat(temp_list, ignore_index=True)
+        return request_func(**request_kwargs).json()
+
+    def _fetch_page(page: int) -> List[dict]:
+        page_params = params.copy()
+        page_params.update({"pn": page})
+        return _request(page_params)["data"]["diff"]
+
+    # 获取第一页数据，用于确定分页信息
+    data_json = _request(params)
+    # 计算分页信息
+    per_page_num = len(data_json["data"]["diff"])
+    total_page = math.ceil(data_json["data"]["total"] / per_page_num)
+    yield data_json["data"]["diff"]
+    yield from iter_pages(
+        _fetch_page, range(2, total_page + 1), max_workers=max_workers
+    )
+
+
+def iter_paginated_data(
+    url: str,
+    base_params: Dict,
+    timeout: int = 15,
+    headers: Dict = None,
+    session=None,
+    use_tls_impersonation: bool = False,
+    impersonate: str = "chrome120",
+    max_workers: int = 4,
+) -> Iterator[pd.DataFrame]:
+    """
+    东方财富-分页获取数据-逐页返回
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param url: 接口地址
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :param timeout: 请求超时时间
+    :type timeout: str
+    :param max_workers: 获取第一页后并发请求剩余页面的线程数, 1 为逐页顺序请求
+    :type max_workers: int
+    :return: 按页码顺序返回的每一页数据
+    :rtype: Iterator[pandas.DataFrame]
+    """
+    for rows in _iter_paginated_rows(
+        url,
+        base_params,
+        timeout=timeout,
+        headers=headers,
+        session=session,
+        use_tls_impersonation=use_tls_impersonation,
+        impersonate=impersonate,
+        max_workers=max_workers,
+    ):
+        yield pd.DataFrame(rows)
+
+
+def fetch_paginated_data(
+    url: str,
+    base_params: Dict,
+    timeout: int = 15,
+    headers: Dict = None,
+    session=None,
+    use_tls_impersonation: bool = False,
+    impersonate: str = "chrome120",
+    max_workers: int = 4,
+    output: Optional[str] = None,
+):
+    """
+    东方财富-分页获取数据并合并结果
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param url: 股票代码
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :param timeout: 请求超时时间
+    :type timeout: str
+    :param max_workers: 获取第一页后并发请求剩余页面的线程数, 1 为逐页顺序请求
+    :type max_workers: int
+    :param output: choice of {"pandas", "arrow", "polars"}; arrow/polars 时直接由返回的记录构建, 不经过 pandas;
+    默认为 set_output_format 中的设置, 对结果做 pandas 处理的接口需要传入 output="pandas"
+    :type output: str
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame or pyarrow.Table or polars.DataFrame
+    """
+    output = resolve_output(output)
+    kwargs = dict(
+        timeout=timeout,
+        headers=headers,
+        session=session,
+        use_tls_impersonation=use_tls_impersonation,
+        impersonate=impersonate,
+        max_workers=max_workers,
+    )
+    if output != "pandas":
+        table = pa.concat_tables(
+            [
+                rows_to_arrow(rows)
+                for rows in _iter_paginated_rows(url, base_params, **kwargs)
+            ],
+            promote_options="permissive",
+        )
+        table = table.set_column(
+            table.schema.get_field_index("f3"),
+            "f3",
+            arrow_array(table.column("f3").to_pylist()).cast("float64"),
+        )
+        table = table.sort_by([("f3", "descending")])
+        table = table.add_column(0, "index", pa.array(range(1, table.num_rows + 1)))
+        return to_output(table, output)
+    temp_df = concat_pages(iter_paginated_data(url, base_params, **kwargs))
     temp_df["f3"] = pd.to_numeric(temp_df["f3"], errors="coerce")
     temp_df.sort_values(by=["f3"], ascending=False, inplace=True, ignore_index=True)
     temp_df.reset_index(inplace=True)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 预编译 JS 上下文池
+akshare/data 下的 ths.js、cninfo.js 等脚本每个上下文只 eval 一次, 之后借出复用, 避免每次请求都启动 V8 并重新编译脚本
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from ..datasets import get_ths_js
+
+# NOTE(akshare): 每个脚本最多同时存在的上下文数, 超出时借用方阻塞等待归还
+DEFAULT_POOL_SIZE = int(os.getenv("AKSHARE_JS_POOL_SIZE", "4"))
+
+
+class JsPoolTimeout(TimeoutError):
+    """等待可用 JS 上下文超时"""
+
+
+def _create_context(source: str):
+    import py_mini_racer
+
+    ctx = py_mini_racer.MiniRacer()
+    ctx.eval(source)
+    return ctx
+
+
+class JsContextPool:
+    """
+    同一脚本的 JS 上下文池（线程安全）
+    上下文按需创建, 用完归还后供下一个调用方复用; 同一时刻一个上下文只会借给一个线程
+    fork 出的子进程不会复用父进程的上下文, 而是重新创建
+    """
+
+    def __init__(
+        self,
+        source: str,
+        max_size: int = DEFAULT_POOL_SIZE,
+        factory: Optional[Callable] = None,
+    ):
+        """
+        :param source: JS 脚本内容
+        :type source: str
+        :param max_size: 最多同时存在的上下文数
+        :type max_size: int
+        :param factory: 创建上下文的函数, 接收脚本内容, 默认为 MiniRacer 并 eval 脚本
+        :type factory: callable
+        """
+        self.source = source
+        self.max_size = max(1, max_size)
+        self._factory = factory or _create_context
+        self._cond = threading.Condition()
+        self._idle: List = []
+        self._created = 0
+        self._pid = os.getpid()
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            # NOTE(akshare): V8 上下文不能跨 fork 使用, 子进程直接丢弃继承来的上下文
+            self._idle = []
+            self._created = 0
+            self._pid = os.getpid()
+
+    @property
+    def size(self) -> int:
+        """已创建的上下文数"""
+        with self._cond:
+            self._check_fork()
+            return self._created
+
+    @property
+    def idle(self) -> int:
+        """空闲的上下文数"""
+        with self._cond:
+            self._check_fork()
+            return len(self._idle)
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        借出一个上下文, 用完必须调用 release 归还
+        :param timeout: 等待可用上下文的最长时间（秒）, None 表示一直等待
+        :type timeout: float
+        :return: 已 eval 脚本的 MiniRacer 上下文
+        :rtype: py_mini_racer.MiniRacer
+        """
+        with self._cond:
+            self._check_fork()
+            while not self._idle and self._created >= self.max_size:
+                if not self._cond.wait(timeout):
+                    raise JsPoolTimeout(f"no idle js context after {timeout}s")
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            return self._factory(self.source)
+        except BaseException:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, ctx, discard: bool = False) -> None:
+        """
+        归还上下文
+        :param ctx: acquire 借出的上下文
+        :type ctx: py_mini_racer.MiniRacer
+        :param discard: 是否丢弃该上下文(如脚本执行出错、状态可能已被破坏)
+        :type discard: bool
+        """
+        with self._cond:
+            if self._pid != os.getpid():
+                return
+            if discard:
+                self._created -= 1
+            else:
+                self._idle.append(ctx)
+            self._cond.notify()
+
+    @contextmanager
+    def borrow(self, timeout: Optional[float] = None):
+        """
+        with pool.borrow() as ctx: 借出上下文, 离开时自动归还; 出现异常时丢弃该上下文
+        :param timeout: 等待可用上下文的最长时间（秒）
+        :type timeout: float
+        """
+        ctx = self.acquire(timeout)
+        try:
+            yield ctx
+        except BaseException:
+            self.release(ctx, discard=True)
+            raise
+        self.release(ctx)
+
+    def call(self, name: str, *args):
+        """
+        借用一个上下文调用脚本中的函数
+        :param name: 函数名
+        :type name: str
+        :return: 函数返回值
+        :rtype: Any
+        """
+        with self.borrow() as ctx:
+            return ctx.call(name, *args)
+
+    def clear(self) -> None:
+        """丢弃所有空闲上下文, 借出中的上下文归还后仍可继续使用"""
+        with self._cond:
+            self._created -= len(self._idle)
+            self._idle = []
+            self._cond.notify_all()
+
+
+_pools: Dict[str, JsContextPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _read_script(file: str) -> str:
+    with open(get_ths_js(file), encoding="utf-8") as f:
+        return f.read()
+
+
+def get_js_pool(file: str = "ths.js") -> JsContextPool:
+    """
+    获取 akshare/data 下某个脚本的进程级上下文池, 脚本只从磁盘读取一次
+    :param file: 脚本文件名, 如 ths.js、cninfo.js
+    :type file: str
+    :return: 上下文池
+    :rtype: JsContextPool
+    """
+    pool = _pools.get(file)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(file)
+            if pool is None:
+                pool = _pools[file] = JsContextPool(_read_script(file))
+    return pool
+
+
+def js_call(file: str, name: str, *args):
+    """
+    调用 akshare/data 下某个脚本中的函数, 如 js_call("ths.js", "v")
+    :param file: 脚本文件名
+    :type file: str
+    :param name: 函数名
+    :type name: str
+    :return: 函数返回值
+    :rtype: Any
+    """
+    return get_js_pool(file).call(name, *args)
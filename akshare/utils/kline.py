@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 东方财富 klines/trends 等逗号分隔行数据的快速解析
+将所有行拼接后一次性交给 pandas 的 C CSV 引擎, 直接按列类型解析, 避免逐行 split 和逐列 pd.to_numeric
+"""
+
+import io
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from .output import pa
+
+if pa is not None:
+    import pyarrow.csv as pa_csv
+
+# NOTE(akshare): 东方财富用 "-" 表示缺失值
+_NA_VALUES = ["-", ""]
+
+_TEXT_KINDS = ("str", "date", "datetime")
+
+_ARROW_TYPES = {
+    "str": "string",
+    "date": "date32",
+    "datetime": "timestamp[s]",
+}
+
+
+def _parse_klines_arrow(lines: List[str], kinds: List[str]) -> "pa.Table":
+    """
+    直接由 Arrow CSV 引擎解析为 pyarrow.Table, 不经过 pandas
+    """
+    names = [f"f{i}" for i in range(len(kinds))]
+    column_types = {
+        name: _ARROW_TYPES[kind]
+        for name, kind in zip(names, kinds)
+        if kind in _ARROW_TYPES
+    }
+    if not lines:
+        return pa.table(
+            {
+                name: pa.array([], type=column_types.get(name, "float64"))
+                for name in names
+            }
+        )
+    table = pa_csv.read_csv(
+        io.BytesIO("\n".join(lines).encode("utf-8")),
+        read_options=pa_csv.ReadOptions(column_names=names),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            # NOTE(akshare): 文本列不转换为缺失值, 与 pandas 路径一致
+            null_values=_NA_VALUES,
+            strings_can_be_null=False,
+            timestamp_parsers=[pa_csv.ISO8601, "%Y-%m-%d %H:%M"],
+        ),
+    )
+    for i, kind in enumerate(kinds):
+        if kind != "number":
+            continue
+        column_type = table.schema.types[i]
+        if pa.types.is_null(column_type):
+            table = table.set_column(i, names[i], table.column(i).cast("float64"))
+        elif not (
+            pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+        ):
+            raise pa.ArrowInvalid(f"column {i} is not numeric")
+    return table
+
+
+def parse_klines(
+    lines: List[str],
+    columns: Sequence[str],
+    dtypes: Optional[Dict[str, str]] = None,
+    output: str = "pandas",
+):
+    """
+    解析东方财富接口返回的 klines/trends 列表, 如 ["2024-01-02,9.39,9.21,...", ...]
+    :param lines: 逗号分隔的行
+    :type lines: list
+    :param columns: 列名, 数量需与每行的字段数一致
+    :type columns: list
+    :param dtypes: 列类型 {列名: "str" | "date" | "datetime" | "number"}; 未列出的列为 "number",
+    与 pd.to_numeric(errors="coerce") 的结果一致; "date" 转为 datetime.date, "datetime" 转为 datetime64
+    :type dtypes: dict
+    :param output: choice of {"pandas", "arrow"}; "arrow" 时直接返回 pyarrow.Table, "date" 列为 date32
+    :type output: str
+    :return: 解析结果
+    :rtype: pandas.DataFrame or pyarrow.Table
+    """
+    columns = list(columns)
+    dtypes = dtypes or {}
+    kinds = [dtypes.get(name, "number") for name in columns]
+    if output != "pandas":
+        try:
+            table = _parse_klines_arrow(lines, kinds)
+        except pa.ArrowInvalid:
+            # 出现 "-" 以外的非数字内容等少见情况时, 经 pandas 路径解析后转换
+            table = pa.Table.from_pandas(
+                parse_klines(lines, columns, dtypes), preserve_index=False
+            )
+        return table.rename_columns(columns)
+    if not lines:
+        temp_df = pd.DataFrame(columns=columns)
+    else:
+        temp_df = pd.read_csv(
+            io.StringIO("\n".join(lines)),
+            header=None,
+            dtype={i: str for i, kind in enumerate(kinds) if kind in _TEXT_KINDS},
+            # NOTE(akshare): 文本列保留原始内容, 与逐行 split 的结果一致
+            na_values={
+                i: _NA_VALUES for i, kind in enumerate(kinds) if kind == "number"
+            },
+            keep_default_na=False,
+            skip_blank_lines=False,
+            low_memory=False,
+            engine="c",
+        )
+        temp_df.columns = columns
+    # NOTE(akshare): 按位置处理, 兼容 "-" 等重复的占位列名
+    for i, kind in enumerate(kinds):
+        column = temp_df.iloc[:, i]
+        if kind == "date":
+            temp_df.isetitem(i, pd.to_datetime(column, errors="coerce").dt.date)
+        elif kind == "datetime":
+            temp_df.isetitem(i, pd.to_datetime(column, errors="coerce"))
+        elif kind == "number" and not is_numeric_dtype(column):
+            # 出现 "-" 以外的非数字内容时, 与原先逐列 pd.to_numeric 的处理一致
+            temp_df.isetitem(i, pd.to_numeric(column, errors="coerce"))
+    return temp_df
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 本地数据仓库
+按 (数据集, 键) 将 DataFrame 保存为本地文件, 如期货日线按 (交易所, 交易日) 保存, 回补历史数据时只请求本地没有的部分
+文件为 pandas pickle 格式, 写入时先写临时文件再原子替换, 中断不会留下不完整的文件
+"""
+
+import os
+import re
+import tempfile
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+# NOTE(akshare): 默认目录可通过环境变量 AKSHARE_DATA_DIR 修改
+DEFAULT_STORE_DIR = os.getenv(
+    "AKSHARE_DATA_DIR", os.path.join(os.path.expanduser("~"), ".akshare", "store")
+)
+
+_SAFE_NAME = re.compile(r"[^0-9A-Za-z_.\-]")
+
+
+class LocalFrameStore:
+    """
+    本地 DataFrame 仓库, 目录结构为 root/数据集/键.pkl
+    多线程写入不同的键是安全的; 同一个键以最后一次写入为准
+    """
+
+    suffix = ".pkl"
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        :param root: 仓库目录, 默认为 DEFAULT_STORE_DIR
+        :type root: str
+        """
+        self.root = os.path.abspath(os.path.expanduser(root or DEFAULT_STORE_DIR))
+
+    def __repr__(self):
+        return f"LocalFrameStore({self.root!r})"
+
+    def path(self, dataset: str, key: str) -> str:
+        """
+        数据文件路径
+        :param dataset: 数据集, 如 "futures_daily/DCE"
+        :type dataset: str
+        :param key: 键, 如 "20240102"
+        :type key: str
+        :return: 文件路径
+        :rtype: str
+        """
+        parts = [_SAFE_NAME.sub("_", part) for part in dataset.split("/") if part]
+        return os.path.join(self.root, *parts, _SAFE_NAME.sub("_", key) + self.suffix)
+
+    def has(self, dataset: str, key: str) -> bool:
+        """是否已保存"""
+        return os.path.exists(self.path(dataset, key))
+
+    def get(
+        self, dataset: str, key: str, skip_empty: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        读取数据
+        :param dataset: 数据集
+        :type dataset: str
+        :param key: 键
+        :type key: str
+        :param skip_empty: 已保存的为空表时视为不存在, 用于重新获取可能因请求失败而为空的数据
+        :type skip_empty: bool
+        :return: 已保存的数据, 不存在时为 None
+        :rtype: pandas.DataFrame
+        """
+        try:
+            df = pd.read_pickle(self.path(dataset, key))
+        except FileNotFoundError:
+            return None
+        if skip_empty and df.empty:
+            return None
+        return df
+
+    def put(self, dataset: str, key: str, df: pd.DataFrame) -> None:
+        """
+        保存数据; 空表同样保存, 表示该键已获取过且没有数据. 各交易所函数在请求失败时也可能返回空表,
+        读取时可通过 get(..., skip_empty=True) 重新获取
+        :param dataset: 数据集
+        :type dataset: str
+        :param key: 键
+        :type key: str
+        :param df: 数据
+        :type df: pandas.DataFrame
+        """
+        path = self.path(dataset, key)
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                df.to_pickle(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def keys(self, dataset: str) -> List[str]:
+        """
+        数据集中已保存的键, 按名称排序
+        :rtype: list
+        """
+        folder = os.path.dirname(self.path(dataset, "_"))
+        if not os.path.isdir(folder):
+            return []
+        return sorted(
+            name[: -len(self.suffix)]
+            for name in os.listdir(folder)
+            if name.endswith(self.suffix)
+        )
+
+    def load(self, dataset: str, keys: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        读取多个键并按键的顺序合并
+        :param dataset: 数据集
+        :type dataset: str
+        :param keys: 键, 默认为全部已保存的键; 未保存的键会被跳过
+        :type keys: list
+        :return: 合并后的数据
+        :rtype: pandas.DataFrame
+        """
+        keys = self.keys(dataset) if keys is None else keys
+        df_list = [self.get(dataset, key) for key in keys]
+        df_list = [df for df in df_list if df is not None and not df.empty]
+        if not df_list:
+            return pd.DataFrame()
+        return pd.concat(df_list, ignore_index=True)
+
+
+def get_store(store: Optional[object] = None) -> Optional[LocalFrameStore]:
+    """
+    统一接口中的 store 参数: None 表示不使用本地仓库, 字符串为仓库目录, 也可以直接传入 LocalFrameStore
+    :param store: None, 目录或 LocalFrameStore
+    :type store: str or LocalFrameStore
+    :return: 本地仓库
+    :rtype: LocalFrameStore
+    """
+    if store is None or isinstance(store, LocalFrameStore):
+        return store
+    return LocalFrameStore(str(store))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 输出格式设置, 支持 pandas(默认)、pyarrow.Table 及 polars.DataFrame
+选择 arrow/polars 时, 东方财富 K 线接口及 fetch_paginated_data 直接由解析结果构建 Arrow 数据, 不经过 pandas;
+polars.DataFrame 由 Arrow 数据零拷贝转换得到
+"""
+
+from typing import Any, Iterable, List, Optional
+
+import pandas as pd
+
+from .context import config
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+OUTPUT_FORMATS = ("pandas", "arrow", "polars")
+
+
+def set_output_format(output: str = "pandas") -> None:
+    """
+    设置支持的接口的输出格式
+    :param output: choice of {"pandas", "arrow", "polars"}
+    :type output: str
+    """
+    config.output_format = resolve_output(output)
+
+
+def resolve_output(output: Optional[str] = None) -> str:
+    """
+    确定本次调用的输出格式并检查依赖
+    :param output: choice of {"pandas", "arrow", "polars"}; 默认为 set_output_format 中的设置
+    :type output: str
+    :return: 输出格式
+    :rtype: str
+    """
+    if output is None:
+        output = config.output_format
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"output 只能为 {OUTPUT_FORMATS} 之一")
+    if output != "pandas" and pa is None:
+        raise ImportError("output='arrow' 或 'polars' 需要安装 pyarrow")
+    if output == "polars" and pl is None:
+        raise ImportError("output='polars' 需要安装 polars")
+    return output
+
+
+def to_output(table: "pa.Table", output: str) -> Any:
+    """
+    将 Arrow 数据转换为指定的输出格式
+    :param table: Arrow 数据
+    :type table: pyarrow.Table
+    :param output: choice of {"pandas", "arrow", "polars"}
+    :type output: str
+    :return: 指定格式的数据
+    :rtype: pandas.DataFrame or pyarrow.Table or polars.DataFrame
+    """
+    if output == "polars":
+        return pl.from_arrow(table)
+    if output == "pandas":
+        return table.to_pandas()
+    return table
+
+
+def empty_output(output: str) -> Any:
+    """
+    指定输出格式的空表, 对应 pandas 路径中的 pd.DataFrame()
+    :param output: choice of {"pandas", "arrow", "polars"}
+    :type output: str
+    :return: 空表
+    :rtype: pandas.DataFrame or pyarrow.Table or polars.DataFrame
+    """
+    if output == "pandas":
+        return pd.DataFrame()
+    return to_output(pa.table({}), output)
+
+
+def arrow_array(values: List[Any]) -> "pa.Array":
+    """
+    将接口返回的一列 JSON 值转换为 Arrow 数组
+    :param values: 一列的值
+    :type values: list
+    :return: Arrow 数组
+    :rtype: pyarrow.Array
+    """
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    # NOTE(akshare): 东方财富用 "-" 表示缺失值, 与数字混在同一列, 与 pd.to_numeric(errors="coerce") 一致
+    numbers = []
+    for value in values:
+        if isinstance(value, bool):
+            value = None
+        elif isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                value = None
+        numbers.append(value)
+    return pa.array(numbers, type=pa.float64())
+
+
+def rows_to_arrow(rows: Iterable[dict]) -> "pa.Table":
+    """
+    将接口返回的记录列表转换为 Arrow 数据, 字段顺序与 pd.DataFrame(rows) 一致
+    :param rows: 记录列表
+    :type rows: list
+    :return: Arrow 数据
+    :rtype: pyarrow.Table
+    """
+    rows = list(rows)
+    names = list(dict.fromkeys(key for row in rows for key in row))
+    return pa.table(
+        {name: arrow_array([row.get(name) for row in rows]) for name in names}
+    )
+
+
+def filter_between(
+    table: "pa.Table", column: str, start_date: str, end_date: str
+) -> "pa.Table":
+    """
+    按时间范围筛选, 与 pandas 中 df[start_date:end_date] 的部分字符串切片一致(包含两端)
+    :param table: Arrow 数据
+    :type table: pyarrow.Table
+    :param column: 日期或时间字段, 类型为 date32、timestamp 或日期字符串
+    :type column: str
+    :param start_date: 开始时间, 如 "20240102" 或 "2024-01-02 09:30:00"
+    :type start_date: str
+    :param end_date: 结束时间; "20240105" 包含当天全部数据
+    :type end_date: str
+    :return: 筛选后的数据
+    :rtype: pyarrow.Table
+    """
+    values = table.column(column)
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        values = pa.array(pd.to_datetime(values.to_pandas(), errors="coerce"))
+    if pa.types.is_date(values.type):
+        values = values.cast(pa.timestamp("s"))
+    start = pd.Period(start_date).start_time.floor("s").to_pydatetime()
+    end = pd.Period(end_date).end_time.floor("s").to_pydatetime()
+    start_scalar = pa.scalar(start, type=values.type)
+    end_scalar = pa.scalar(end, type=values.type)
+    mask = pc.and_(
+        pc.greater_equal(values, start_scalar), pc.less_equal(values, end_scalar)
+    )
+    return table.filter(pc.fill_null(mask, False))
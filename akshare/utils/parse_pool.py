@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 解析进程池
+pd.read_html、pd.read_excel 等解析占用 CPU 且持有 GIL, 多线程并发请求时解析仍然只能逐个进行;
+较大的网页或 Excel 交给进程池解析, 传入原始文本或字节, 返回解析得到的 DataFrame; 较小的数据或进程池不可用时在当前线程解析
+"""
+
+import multiprocessing
+import os
+import threading
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO, StringIO
+from typing import Any, Callable, List, Optional, Union
+
+import pandas as pd
+
+# NOTE(akshare): 进程池需要显式开启(set_parse_workers 或环境变量 AKSHARE_PARSE_WORKERS);
+# 子进程会重新导入调用方的 __main__ 脚本, 默认开启会让没有 if __name__ == "__main__" 保护的脚本被重复执行,
+# 逐个调用接口时也只会增加序列化开销
+_CPU_COUNT = os.cpu_count() or 1
+DEFAULT_PARSE_WORKERS = int(os.getenv("AKSHARE_PARSE_WORKERS", 0))
+# 小于该长度(字节或字符)的数据直接在当前线程解析, 避免进程间传输的开销大于解析本身
+INLINE_PARSE_SIZE = int(os.getenv("AKSHARE_PARSE_INLINE_SIZE", 256 * 1024))
+
+_max_workers = DEFAULT_PARSE_WORKERS
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def _mp_context():
+    # NOTE(akshare): 进程池通常在并发请求的工作线程中首次创建, 多线程进程中 fork 出的子进程可能因其他线程持有的锁而死锁
+    # (Python 3.12 起会给出 DeprecationWarning), 默认使用 forkserver, 不支持时使用 spawn, 可通过 AKSHARE_PARSE_START_METHOD 指定;
+    # forkserver/spawn 会在子进程中重新导入调用方的 __main__ 脚本, 脚本需要有 if __name__ == "__main__" 保护
+    methods = multiprocessing.get_all_start_methods()
+    method = os.getenv(
+        "AKSHARE_PARSE_START_METHOD",
+        "forkserver" if "forkserver" in methods else "spawn",
+    )
+    context = multiprocessing.get_context(method)
+    if method == "forkserver":
+        # 预先在 forkserver 进程中导入 pandas 及解析函数, 新的子进程无需重复导入
+        context.set_forkserver_preload(["akshare.utils.parse_pool"])
+    return context
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor, _executor_pid
+    if _max_workers < 1:
+        return None
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            # fork 出的子进程不使用父进程的进程池
+            _executor = ProcessPoolExecutor(
+                max_workers=_max_workers, mp_context=_mp_context()
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def set_parse_workers(max_workers: Optional[int] = None) -> None:
+    """
+    设置解析进程数, 已有的进程池会被关闭, 下次解析时按新的进程数重新创建
+    :param max_workers: 解析进程数, 0 为全部在当前线程解析(默认); None 为 CPU 核数(最多 4 个)
+    :type max_workers: int
+    """
+    global _max_workers
+    if max_workers is None:
+        max_workers = min(4, _CPU_COUNT)
+    _max_workers = max(0, int(max_workers))
+    shutdown_parse_executor()
+
+
+def shutdown_parse_executor() -> None:
+    """关闭解析进程池"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _payload_size(data: Any) -> int:
+    try:
+        return len(data)
+    except TypeError:
+        return 0
+
+
+def submit_parse(func: Callable, data: Union[str, bytes], **kwargs) -> Future:
+    """
+    提交解析任务; 数据较小或进程池不可用时在当前线程解析, 返回已完成的 Future
+    :param func: 解析函数, 第一个参数为 data; 需要是模块级函数, 才能传给子进程
+    :type func: callable
+    :param data: 网页文本或文件字节
+    :type data: str or bytes
+    :return: 解析结果
+    :rtype: concurrent.futures.Future
+    """
+    if _payload_size(data) >= INLINE_PARSE_SIZE:
+        try:
+            executor = _get_executor()
+        except (OSError, NotImplementedError) as e:
+            # NOTE(akshare): 受限环境(如没有 /dev/shm)无法创建进程池, 关闭进程池后在当前线程解析
+            warnings.warn(f"解析进程池不可用, 改为在当前线程解析: {e}")
+            set_parse_workers(0)
+            executor = None
+        if executor is not None:
+            try:
+                return executor.submit(func, data, **kwargs)
+            except (BrokenProcessPool, RuntimeError):
+                _discard_executor(executor)
+    future = Future()
+    try:
+        future.set_result(func(data, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def parse(func: Callable, data: Union[str, bytes], **kwargs) -> Any:
+    """
+    解析数据并等待结果, 参数同 submit_parse; 子进程意外退出时在当前线程重新解析
+    :param func: 解析函数, 第一个参数为 data
+    :type func: callable
+    :param data: 网页文本或文件字节
+    :type data: str or bytes
+    :return: 解析结果
+    :rtype: Any
+    """
+    future = submit_parse(func, data, **kwargs)
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        executor = _executor
+        if executor is not None:
+            _discard_executor(executor)
+        return func(data, **kwargs)
+
+
+def _read_html(data: Union[str, bytes], **kwargs) -> List[pd.DataFrame]:
+    source = StringIO(data) if isinstance(data, str) else BytesIO(data)
+    return pd.read_html(source, **kwargs)
+
+
+def _read_excel(data: bytes, **kwargs) -> Any:
+    return pd.read_excel(BytesIO(data), **kwargs)
+
+
+def read_html(data: Union[str, bytes], **kwargs) -> List[pd.DataFrame]:
+    """
+    同 pd.read_html, 较大的网页交给解析进程池
+    :param data: 网页文本, 如 r.text
+    :type data: str or bytes
+    :return: 网页中的表格
+    :rtype: list
+    """
+    return parse(_read_html, data, **kwargs)
+
+
+def read_excel(data: bytes, **kwargs) -> Any:
+    """
+    同 pd.read_excel, 较大的文件交给解析进程池
+    :param data: 文件字节, 如 r.content
+    :type data: bytes
+    :return: 表格数据
+    :rtype: pandas.DataFrame or dict
+    """
+    return parse(_read_excel, data, **kwargs)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 按 host 的令牌桶限速器
+支持进程内（多线程共享）与 Redis（多进程/多机器共享）两种后端, utils.request 在每次请求前调用
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# NOTE(akshare): 默认限速规则 {域名: (每秒令牌数, 桶容量)}, 匹配该域名及其所有子域名; 未列出的 host 不限速
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "eastmoney.com": (4.0, 4.0),
+    "100ppi.com": (0.5, 2.0),
+}
+
+
+class LocalTokenBucketBackend:
+    """
+    进程内令牌桶（线程安全）
+    采用预约方式: 令牌可以透支, 透支部分折算为调用方需要等待的时间, 保证多线程按到达顺序排队
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: float, tokens: float = 1) -> float:
+        """
+        预约令牌
+        :param key: 令牌桶名称, 一般为 host
+        :type key: str
+        :param rate: 每秒补充的令牌数
+        :type rate: float
+        :param burst: 桶容量
+        :type burst: float
+        :param tokens: 本次消耗的令牌数
+        :type tokens: float
+        :return: 需要等待的时间（秒）
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            remain, last = self._buckets.get(key, (burst, now))
+            remain = min(burst, remain + (now - last) * rate) - tokens
+            self._buckets[key] = (remain, now)
+        return -remain / rate if remain < 0 else 0.0
+
+
+class RedisTokenBucketBackend:
+    """
+    基于 Redis 的共享令牌桶, 所有连接同一 Redis 的进程共用一份额度
+    令牌计算在 Lua 脚本中原子完成, 时间取 Redis 服务器时间以避免各机器时钟偏差
+    """
+
+    _SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local remain = tonumber(state[1]) or burst
+local last = tonumber(state[2]) or now
+remain = math.min(burst, remain + math.max(0, now - last) * rate) - tokens
+redis.call('HSET', KEYS[1], 'tokens', tostring(remain), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - remain) / rate) + 60)
+if remain < 0 then
+    return tostring(-remain / rate)
+end
+return '0'
+"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        redis_client=None,
+        prefix: Optional[str] = None,
+    ):
+        """
+        :param redis_url: Redis 连接串, 默认取环境变量 REDIS_URL
+        :type redis_url: str
+        :param redis_client: 已配置好的 Redis 客户端
+        :type redis_client: redis.Redis
+        :param prefix: 键前缀, 默认取环境变量 AKSHARE_CACHE_PREFIX 或 'ak'
+        :type prefix: str
+        """
+        if redis_client is None:
+            # NOTE(akshare): 复用缓存模块的客户端创建逻辑（兼容集群地址）, redis 为可选依赖, 按需导入
+            from .redis_cache import RedisLRUCache
+
+            redis_client = RedisLRUCache(redis_url=redis_url)._get_redis_client()
+        self.redis_client = redis_client
+        self.prefix = prefix or os.getenv("AKSHARE_CACHE_PREFIX", "ak")
+        self._script = redis_client.register_script(self._SCRIPT)
+        self._fallback = LocalTokenBucketBackend()
+
+    def reserve(self, key: str, rate: float, burst: float, tokens: float = 1) -> float:
+        """
+        预约令牌, Redis 不可用时退化为进程内令牌桶
+        :param key: 令牌桶名称, 一般为 host
+        :type key: str
+        :param rate: 每秒补充的令牌数
+        :type rate: float
+        :param burst: 桶容量
+        :type burst: float
+        :param tokens: 本次消耗的令牌数
+        :type tokens: float
+        :return: 需要等待的时间（秒）
+        :rtype: float
+        """
+        try:
+            wait = self._script(
+                keys=[f"{self.prefix}:rl:{key}"], args=[rate, burst, tokens]
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning(f"Redis rate limit unavailable, using local bucket: {e}")
+            return self._fallback.reserve(key, rate, burst, tokens)
+
+
+class RateGovernor:
+    """
+    按 host 的限速器
+    规则按域名后缀匹配: 为 eastmoney.com 设置的规则同样作用于 push2.eastmoney.com
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        self.backend = backend or LocalTokenBucketBackend()
+        self._limits: Dict[str, Tuple[float, float]] = dict(limits or {})
+        self._lock = threading.Lock()
+
+    def configure(
+        self, host: str, rate: Optional[float], burst: Optional[float] = None
+    ) -> None:
+        """
+        设置 host 的限速规则
+        :param host: 域名, 如 eastmoney.com 或 push2.eastmoney.com
+        :type host: str
+        :param rate: 每秒请求数, None 表示不限速
+        :type rate: float
+        :param burst: 允许的突发请求数, 默认与 rate 相同且至少为 1
+        :type burst: float
+        """
+        with self._lock:
+            if rate is None:
+                self._limits.pop(host, None)
+            else:
+                self._limits[host] = (rate, burst or max(1.0, rate))
+
+    def get_limit(self, host: str) -> Optional[Tuple[str, float, float]]:
+        """
+        查找 host 适用的限速规则
+        :param host: 域名
+        :type host: str
+        :return: (规则域名, 每秒令牌数, 桶容量), 无规则时返回 None
+        :rtype: tuple
+        """
+        host = host.split(":")[0].lower()
+        parts = host.split(".")
+        with self._lock:
+            for i in range(len(parts)):
+                domain = ".".join(parts[i:])
+                if domain in self._limits:
+                    rate, burst = self._limits[domain]
+                    return domain, rate, burst
+        return None
+
+    def acquire(self, url: str, tokens: float = 1) -> float:
+        """
+        在请求 url 前调用, 阻塞到额度可用
+        :param url: 请求地址
+        :type url: str
+        :param tokens: 本次消耗的令牌数
+        :type tokens: float
+        :return: 实际等待时间（秒）
+        :rtype: float
+        """
+        limit = self.get_limit(urlsplit(url).netloc or url)
+        if limit is None:
+            return 0.0
+        domain, rate, burst = limit
+        wait = self.backend.reserve(domain, rate, burst, tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def _create_default_governor() -> RateGovernor:
+    backend = None
+    if os.getenv("AKSHARE_RATE_LIMIT_BACKEND", "local").lower() == "redis":
+        try:
+            backend = RedisTokenBucketBackend()
+        except Exception as e:
+            logger.warning(f"Failed to create Redis rate limit backend: {e}")
+    return RateGovernor(backend=backend, limits=DEFAULT_RATE_LIMITS)
+
+
+_governor: Optional[RateGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_rate_governor() -> RateGovernor:
+    """
+    获取进程级限速器; 环境变量 AKSHARE_RATE_LIMIT_BACKEND=redis 时使用 Redis 共享额度
+    :return: 限速器
+    :rtype: RateGovernor
+    """
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = _create_default_governor()
+    return _governor
+
+
+def set_rate_governor(governor: RateGovernor) -> None:
+    """
+    替换进程级限速器
+    :param governor: 限速器
+    :type governor: RateGovernor
+    """
+    global _governor
+    _governor = governor
+
+
+def configure_rate_limit(
+    host: str, rate: Optional[float], burst: Optional[float] = None
+) -> None:
+    """
+    设置进程级限速器中 host 的限速规则
+    :param host: 域名, 如 eastmoney.com
+    :type host: str
+    :param rate: 每秒请求数, None 表示不限速
+    :type rate: float
+    :param burst: 允许的突发请求数
+    :type burst: float
+    """
+    get_rate_governor().configure(host, rate, burst)
+
+
+def use_redis_rate_limit(
+    redis_url: Optional[str] = None, redis_client=None, prefix: Optional[str] = None
+) -> None:
+    """
+    将进程级限速器切换到 Redis 后端, 保留已设置的限速规则
+    :param redis_url: Redis 连接串
+    :type redis_url: str
+    :param redis_client: 已配置好的 Redis 客户端
+    :type redis_client: redis.Redis
+    :param prefix: 键前缀
+    :type prefix: str
+    """
+    get_rate_governor().backend = RedisTokenBucketBackend(
+        redis_url=redis_url, redis_client=redis_client, prefix=prefix
+    )
+
+
+def acquire(url: str, tokens: float = 1) -> float:
+    """
+    使用进程级限速器等待 url 所在 host 的额度
+    :param url: 请求地址
+    :type url: str
+    :param tokens: 本次消耗的令牌数
+    :type tokens: float
+    :return: 实际等待时间（秒）
+    :rtype: float
+    """
+    return get_rate_governor().acquire(url, tokens)
@@ -6,16 +6,186 @@ Provides LRU-like caching functionality using Redis cluster
 """
 
 import os
+import atexit
+import copy
+import fnmatch
 import pickle
 import hashlib
 import functools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Union, Callable
 import redis
 from redis.cluster import RedisCluster
 import logging
 
+from .cache_policy import ExpiryPolicy, resolve_ttl
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 logger = logging.getLogger(__name__)
 
+# Delete the lock only if it still holds our token (compare-and-delete)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# Header byte of "arrow" payloads. Raw pickle payloads written by the "pickle"
+# serializer start with the protocol opcode 0x80 and are still readable.
+_PICKLE_TAG = b"P"
+_ARROW_TAG = b"A"
+_ARROW_COMPRESSION = "zstd"
+
+# Seconds to wait for the server to confirm the invalidation subscription, and
+# before trying again after a failed attempt; L1 is bypassed in the meantime
+_SUBSCRIBE_TIMEOUT = 1.0
+_SUBSCRIBE_RETRY_SECONDS = 30.0
+
+
+def _arrow_dumps(value: Any) -> bytes:
+    """Store DataFrames as compressed Arrow IPC, anything else as pickle"""
+    if pa is not None and _is_dataframe(value):
+        try:
+            table = pa.Table.from_pandas(value, preserve_index=True)
+            sink = pa.BufferOutputStream()
+            options = pa.ipc.IpcWriteOptions(compression=_ARROW_COMPRESSION)
+            with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+            return _ARROW_TAG + sink.getvalue().to_pybytes()
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            # Mixed-type object columns cannot be typed by Arrow
+            logger.debug(f"Arrow serialization failed, using pickle: {e}")
+    return _PICKLE_TAG + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _tagged_loads(data: bytes) -> Any:
+    """Read payloads written by either the "arrow" or the "pickle" serializer"""
+    tag = data[:1]
+    if tag == _ARROW_TAG:
+        if pa is None:
+            raise RuntimeError("pyarrow is required to read Arrow cache entries")
+        with pa.ipc.open_stream(pa.py_buffer(memoryview(data)[1:])) as reader:
+            return reader.read_all().to_pandas()
+    if tag == _PICKLE_TAG:
+        return pickle.loads(memoryview(data)[1:])
+    return pickle.loads(data)
+
+
+def _is_lock_key(key) -> bool:
+    """Recompute lock keys written by acquire_lock"""
+    if isinstance(key, bytes):
+        return key.endswith(b":lock")
+    return key.endswith(":lock")
+
+
+def _is_dataframe(value: Any) -> bool:
+    """DataFrames whose column labels survive an Arrow round trip"""
+    if type(value).__name__ != "DataFrame" or not hasattr(value, "to_numpy"):
+        return False
+    return value.columns.nlevels == 1 and all(
+        isinstance(column, str) for column in value.columns
+    )
+
+
+class LocalLRU:
+    """
+    Byte-size-bounded in-process LRU with per-entry expiry
+
+    Sizes are measured on the serialized Redis payload, so the bound tracks
+    what the entries cost in Redis rather than an estimate of Python objects.
+    ``generation`` is bumped by every delete, invalidate and clear, so a value
+    read from Redis before an invalidation can be kept out of the cache.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Return a private copy of the value, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, nbytes = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.current_bytes -= nbytes
+                return None
+            self._entries.move_to_end(key)
+        return _detach(value)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        nbytes: int,
+        ttl: float,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store value for ttl seconds, evicting least recently used entries
+
+        With generation the value is dropped if anything was invalidated since
+        that generation was read.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[2]
+            if ttl <= 0 or nbytes > self.max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + ttl, _detach(value), nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.generation += 1
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[2]
+
+    def invalidate(self, pattern: str) -> None:
+        """Drop every entry whose key matches a Redis glob-style pattern"""
+        with self._lock:
+            self.generation += 1
+            for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+                self.current_bytes -= self._entries.pop(key)[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+def _detach(value: Any) -> Any:
+    """Copy a cached value so callers cannot mutate the L1 entry in place"""
+    if hasattr(value, "copy") and hasattr(value, "to_numpy"):
+        # pandas objects: copies the column buffers, far cheaper than unpickling
+        return value.copy()
+    if isinstance(value, (str, bytes, int, float, bool, tuple, frozenset)):
+        return value
+    return copy.deepcopy(value)
+
 
 class RedisLRUCache:
     """Redis-based LRU cache implementation"""
@@ -24,11 +194,14 @@ class RedisLRUCache:
         self,
         redis_url: Optional[str] = None,
         prefix: Optional[str] = None,
-        max_age: int = 86400, # 24 hours default, = 24 * 60 * 60
+        max_age: Union[int, ExpiryPolicy] = 86400, # 24 hours default, = 24 * 60 * 60
         redis_client: Optional[Union[redis.Redis, RedisCluster]] = None,
         serialize_method: str = "pickle",
         func_key: Optional[str] = None,
         # key_version: str = "v1"
+        l1_max_bytes: Optional[int] = None,
+        l1_max_age: Optional[int] = None,
+        stats_to_redis: Optional[bool] = None,
     ):
         """
         Initialize Redis LRU Cache
@@ -36,11 +209,20 @@ class RedisLRUCache:
         Args:
             redis_url: Redis connection string, defaults to env REDIS_URL
             prefix: Cache key prefix, defaults to env AKSHARE_CACHE_PREFIX or 'akshare'
-            max_age: Cache expiration time in seconds
+            max_age: Cache expiration time in seconds, or an ExpiryPolicy from
+                utils.cache_policy such as until_next_close() or intraday(60)
             redis_client: Pre-configured Redis client
-            serialize_method: Serialization method ('pickle',)
+            serialize_method: Serialization method ('pickle', 'arrow'); 'arrow'
+                stores DataFrames as zstd-compressed Arrow IPC and other values
+                as pickle, and reads plain pickle entries as well
             func_key: Optional key for function-specific cache
             # key_version: Key version for cache invalidation
+            l1_max_bytes: Size of the in-process L1 tier in serialized bytes,
+                defaults to env AKSHARE_CACHE_L1_MAX_BYTES; 0 disables it
+            l1_max_age: Upper bound of the L1 TTL in seconds; an L1 entry never
+                outlives its Redis copy either way
+            stats_to_redis: Mirror per-function counters to Redis, defaults to
+                env AKSHARE_CACHE_STATS_REDIS
         """
         self.redis_url = redis_url or os.getenv('REDIS_URL', 'redis://tasks.redis-cluster_node')
         self.prefix = prefix or os.getenv('AKSHARE_CACHE_PREFIX', 'ak')
@@ -48,6 +230,16 @@ class RedisLRUCache:
         # self.key_version = key_version
         self.func_key = func_key
         self.serialize_method = serialize_method
+        if l1_max_bytes is None:
+            l1_max_bytes = int(os.getenv('AKSHARE_CACHE_L1_MAX_BYTES', '0'))
+        self.l1 = LocalLRU(l1_max_bytes) if l1_max_bytes > 0 else None
+        self.l1_max_age = l1_max_age
+        if stats_to_redis is None:
+            stats_to_redis = os.getenv('AKSHARE_CACHE_STATS_REDIS', '0').lower() in ('1', 'true', 'yes')
+        self.stats_to_redis = stats_to_redis
+        self._invalidation_pid = None
+        self._invalidation_retry = (None, 0.0)
+        self._invalidation_lock = threading.Lock()
         
         # Store Redis client configuration for lazy initialization
         if redis_client:
@@ -101,6 +293,11 @@ class RedisLRUCache:
         if self.serialize_method == "pickle":
             self.serialize = pickle.dumps
             self.deserialize = pickle.loads
+        elif self.serialize_method == "arrow":
+            if pa is None:
+                logger.warning("pyarrow not available, falling back to pickle")
+            self.serialize = _arrow_dumps
+            self.deserialize = _tagged_loads
         # elif self.serialize_method == "dill":
         #     try:
         #         import dill
@@ -113,7 +310,24 @@ class RedisLRUCache:
         else:
             raise ValueError(f"Unsupported serialize_method: {self.serialize_method}")
     
-    def _generate_cache_key(self, func: Callable, args: tuple, kwargs: dict) -> str:
+    def _func_id(self, func: Callable, func_key: Optional[str] = None) -> str:
+        """Identifier of a cached function, used in cache keys and stats"""
+        func_key = func_key if func_key is not None else self.func_key
+        if isinstance(func_key, str):
+            # Use provided func_key directly
+            return func_key
+        # Fallback to module and function name
+        func_module = getattr(func, '__module__', 'unknown')
+        func_name = getattr(func, '__name__', 'unknown')
+        return f"{func_module}.{func_name}"
+
+    def _generate_cache_key(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        func_key: Optional[str] = None,
+    ) -> str:
         """
         Generate unique cache key for function call
         
@@ -121,19 +335,13 @@ class RedisLRUCache:
             func: Function object
             args: Function positional arguments
             kwargs: Function keyword arguments
+            func_key: Function identifier overriding the cache-level func_key
             
         Returns:
             Unique cache key string
         """
         # Get function identifier
-        if isinstance(self.func_key, str):
-            # Use provided func_key directly
-            func_id = self.func_key
-        else:
-            # Fallback to module and function name
-            func_module = getattr(func, '__module__', 'unknown')
-            func_name = getattr(func, '__name__', 'unknown')
-            func_id = f"{func_module}.{func_name}"
+        func_id = self._func_id(func, func_key)
         
         # Create args signature
         if len(args) == 0 and len(kwargs) == 0:
@@ -192,52 +400,564 @@ class RedisLRUCache:
                 # Ultimate fallback - use string representation
                 return str((args, kwargs))
     
-    def get(self, key: str) -> Any:
-        """Get value from cache"""
+    @property
+    def invalidation_channel(self) -> str:
+        """Pub/sub channel used to drop L1 copies in every process"""
+        return f"{self.prefix}:invalidate"
+
+    def _l1_active(self) -> bool:
+        """Whether L1 may be used, i.e. this process receives invalidations"""
+        if self.l1 is None:
+            return False
+        self._ensure_invalidation_listener()
+        return self._invalidation_pid == os.getpid()
+
+    def _subscribe_due(self, pid: int) -> bool:
+        retry_pid, retry_at = self._invalidation_retry
+        return retry_pid != pid or time.monotonic() >= retry_at
+
+    def _ensure_invalidation_listener(self) -> None:
+        """
+        Start (or restart after fork) the thread that applies invalidations
+
+        The listener only counts as running once the server has confirmed the
+        subscription; a failed attempt is retried after _SUBSCRIBE_RETRY_SECONDS
+        instead of on every lookup.
+        """
+        pid = os.getpid()
+        if self.l1 is None or self._invalidation_pid == pid or not self._subscribe_due(pid):
+            return
+        with self._invalidation_lock:
+            if self._invalidation_pid == pid or not self._subscribe_due(pid):
+                return
+            # Entries inherited from the parent missed its invalidations
+            self.l1.clear()
+            pubsub = None
+            try:
+                pubsub = self._get_redis_client().pubsub()
+                pubsub.subscribe(self.invalidation_channel)
+                message = pubsub.get_message(timeout=_SUBSCRIBE_TIMEOUT)
+                if message is None or message.get("type") != "subscribe":
+                    raise RuntimeError("subscription was not confirmed")
+            except Exception as e:
+                logger.warning(f"Failed to subscribe to cache invalidations: {e}")
+                self._invalidation_retry = (pid, time.monotonic() + _SUBSCRIBE_RETRY_SECONDS)
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+                return
+            thread = threading.Thread(
+                target=self._listen_invalidations,
+                args=(pubsub,),
+                name="akshare-cache-invalidation",
+                daemon=True,
+            )
+            thread.start()
+            self._invalidation_pid = os.getpid()
+
+    def _listen_invalidations(self, pubsub) -> None:
+        try:
+            for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                pattern = message["data"]
+                if isinstance(pattern, bytes):
+                    pattern = pattern.decode("utf-8")
+                self.l1.invalidate(pattern)
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener stopped: {e}")
+            # Without invalidations L1 could go stale, so stop serving from it
+            self._invalidation_pid = None
+            self.l1.clear()
+
+    def _publish_invalidation(self, pattern: str) -> None:
+        if self.l1 is None:
+            return
+        self.l1.invalidate(pattern)
+        try:
+            self._get_redis_client().publish(self.invalidation_channel, pattern)
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def get(self, key: str, stats: Optional["CacheStats"] = None) -> Any:
+        """Get value from cache, serving from the L1 tier when enabled"""
+        return self.get_entry(key, stats=stats)[0]
+
+    def get_entry(
+        self,
+        key: str,
+        stats: Optional["CacheStats"] = None,
+        stale_ttl: int = 0,
+    ) -> tuple:
+        """
+        Get value from cache together with its freshness
+
+        Args:
+            key: Cache key
+            stats: Counters to record the lookup in
+            stale_ttl: Seconds the entry was written to outlive its fresh TTL;
+                an entry with less than this left is past its soft expiry
+
+        Returns:
+            (value, is_stale); value is None on a miss
+        """
+        start = time.perf_counter()
+        l1_active = self._l1_active()
+        if l1_active:
+            # Read before Redis so an invalidation racing the read is noticed
+            generation = self.l1.generation
+            value = self.l1.get(key)
+            if value is not None:
+                if stats is not None:
+                    stats.incr(
+                        hits=1, l1_hits=1, get_seconds=time.perf_counter() - start
+                    )
+                return value, False
         try:
             redis_client = self._get_redis_client()
-            cached_data = redis_client.get(key)
+            pttl = -1
+            if not l1_active and not stale_ttl:
+                cached_data = redis_client.get(key)
+            else:
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.pttl(key)
+                cached_data, pttl = pipe.execute()
             if cached_data is None:
-                return None
-            return self.deserialize(cached_data)
+                if stats is not None:
+                    stats.incr(misses=1, get_seconds=time.perf_counter() - start)
+                return None, False
+            value = self.deserialize(cached_data)
+            # Seconds left before the soft expiry; only fresh values go to L1
+            fresh_ttl = pttl / 1000 - stale_ttl if pttl > 0 else resolve_ttl(self.max_age)
+            stale = bool(stale_ttl) and fresh_ttl <= 0
+            if l1_active:
+                # L1 TTL is capped by what is left of the Redis TTL
+                ttl = fresh_ttl
+                if self.l1_max_age is not None:
+                    ttl = min(ttl, self.l1_max_age)
+                self.l1.set(key, value, len(cached_data), ttl, generation=generation)
+            if stats is not None:
+                stats.incr(
+                    hits=1,
+                    stale_hits=int(stale),
+                    bytes_read=len(cached_data),
+                    get_seconds=time.perf_counter() - start,
+                )
+            return value, stale
         except Exception as e:
             logger.warning(f"Failed to get from cache: {e}")
-            return None
+            if stats is not None:
+                stats.incr(errors=1, get_seconds=time.perf_counter() - start)
+            return None, False
     
-    def set(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
-        """Set value in cache"""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[int] = None,
+        stats: Optional["CacheStats"] = None,
+        stale_ttl: int = 0,
+    ) -> bool:
+        """
+        Set value in cache, replacing stale L1 copies in every process
+
+        With stale_ttl the Redis entry lives stale_ttl seconds past its fresh
+        TTL, so callers can keep serving it while it is refreshed.
+        """
         try:
             redis_client = self._get_redis_client()
             serialized_data = self.serialize(value)
-            expire_time = expire or self.max_age
-            redis_client.setex(key, expire_time, serialized_data)
+            expire_time = expire or resolve_ttl(self.max_age)
+            redis_client.setex(key, expire_time + stale_ttl, serialized_data)
+            self._publish_invalidation(key)
+            if self._l1_active():
+                ttl = expire_time
+                if self.l1_max_age is not None:
+                    ttl = min(ttl, self.l1_max_age)
+                self.l1.set(key, value, len(serialized_data), ttl)
+            if stats is not None:
+                stats.incr(bytes_written=len(serialized_data))
             return True
         except Exception as e:
             logger.warning(f"Failed to set cache: {e}")
+            if stats is not None:
+                stats.incr(errors=1)
             return False
     
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
             redis_client = self._get_redis_client()
-            return bool(redis_client.delete(key))
+            deleted = bool(redis_client.delete(key))
+            self._publish_invalidation(key)
+            return deleted
         except Exception as e:
             logger.warning(f"Failed to delete from cache: {e}")
             return False
     
-    def clear_prefix(self, pattern: Optional[str] = None) -> int:
-        """Clear all keys with prefix"""
+    def acquire_lock(self, key: str, lease: int) -> Optional[str]:
+        """
+        Try to acquire the recompute lock for a cache key
+
+        Args:
+            key: Cache key being recomputed
+            lease: Lock lease in seconds, the lock expires by itself after it
+
+        Returns:
+            Lock token if acquired, None if another caller holds the lock.
+            An empty string is returned when Redis is unavailable so that the
+            caller recomputes instead of waiting forever.
+        """
+        token = uuid.uuid4().hex
+        try:
+            redis_client = self._get_redis_client()
+            if redis_client.set(f"{key}:lock", token, nx=True, ex=lease):
+                return token
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to acquire cache lock: {e}")
+            return ""
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the recompute lock if it is still owned by token"""
+        if not token:
+            return
+        try:
+            redis_client = self._get_redis_client()
+            redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
+        except Exception as e:
+            logger.warning(f"Failed to release cache lock: {e}")
+
+    def is_locked(self, key: str) -> bool:
+        """Check whether some caller is recomputing key"""
+        try:
+            redis_client = self._get_redis_client()
+            return bool(redis_client.exists(f"{key}:lock"))
+        except Exception as e:
+            logger.warning(f"Failed to check cache lock: {e}")
+            return False
+
+    def scan_keys(self, pattern: Optional[str] = None, count: int = 1000):
+        """
+        Iterate keys matching pattern with SCAN (every primary on a cluster)
+
+        Unlike KEYS this never blocks the server for the whole keyspace.
+        """
+        redis_client = self._get_redis_client()
+        pattern = pattern or f"{self.prefix}:*"
+        return redis_client.scan_iter(match=pattern, count=count)
+
+    def clear_prefix(self, pattern: Optional[str] = None, batch_size: int = 500) -> int:
+        """
+        Clear all keys with prefix
+
+        Keys are found with SCAN and removed with UNLINK in batches; on a
+        cluster the client splits each batch by hash slot. Recompute lock
+        keys are kept, they expire with their lease, so a recompute running
+        during the clear is not taken over by its waiters.
+        """
         try:
             redis_client = self._get_redis_client()
             pattern = pattern or f"{self.prefix}:*"
-            keys = redis_client.keys(pattern)
-            if keys:
-                return redis_client.delete(*keys)
-            return 0
+            deleted = 0
+            batch = []
+            for key in self.scan_keys(pattern):
+                if _is_lock_key(key):
+                    continue
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += self._unlink(redis_client, batch)
+                    batch = []
+            if batch:
+                deleted += self._unlink(redis_client, batch)
+            # Publish after deleting so no process can refill L1 from the old value
+            self._publish_invalidation(pattern)
+            return deleted
         except Exception as e:
             logger.warning(f"Failed to clear cache: {e}")
             return 0
 
+    @staticmethod
+    def _unlink(redis_client, keys: list) -> int:
+        try:
+            return redis_client.unlink(*keys)
+        except redis.exceptions.ResponseError:
+            # UNLINK needs Redis >= 4.0
+            return redis_client.delete(*keys)
+
+
+class CacheStats:
+    """
+    Per-function cache counters kept in-process
+
+    When mirroring is enabled the deltas are added to the Redis hash
+    '<prefix>:stats:<func_id>' at most every flush_interval seconds, so the
+    numbers of all workers can be read back with `python -m akshare.cache stats`.
+    """
+
+    FIELDS = (
+        "hits",
+        "l1_hits",
+        "misses",
+        "errors",
+        "loads",
+        "stale_hits",
+        "refreshes",
+        "bytes_read",
+        "bytes_written",
+        "get_seconds",
+        "load_seconds",
+    )
+
+    def __init__(self, name: str, flush_interval: float = 10.0):
+        self.name = name
+        self.flush_interval = flush_interval
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+        self._pending = dict.fromkeys(self.FIELDS, 0)
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def incr(self, **deltas) -> None:
+        with self._lock:
+            for field, delta in deltas.items():
+                self._counts[field] += delta
+                self._pending[field] += delta
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        return summarize_stats(counts)
+
+    def maybe_flush(self, cache: "RedisLRUCache", force: bool = False) -> None:
+        """Mirror pending deltas to Redis if mirroring is on and it is time to"""
+        if not cache.stats_to_redis:
+            return
+        with self._lock:
+            if not force and time.monotonic() - self._last_flush < self.flush_interval:
+                return
+            pending = {k: v for k, v in self._pending.items() if v}
+            self._pending = dict.fromkeys(self.FIELDS, 0)
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            pipe = cache._get_redis_client().pipeline(transaction=False)
+            stats_key = f"{cache.prefix}:stats:{self.name}"
+            for field, delta in pending.items():
+                if isinstance(delta, float):
+                    pipe.hincrbyfloat(stats_key, field, delta)
+                else:
+                    pipe.hincrby(stats_key, field, delta)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to mirror cache stats: {e}")
+
+
+def summarize_stats(counts: dict) -> dict:
+    """Add hit rate and mean latencies to raw counters"""
+    lookups = counts.get("hits", 0) + counts.get("misses", 0) + counts.get("errors", 0)
+    loads = counts.get("loads", 0)
+    summary = dict(counts)
+    summary["hit_rate"] = counts.get("hits", 0) / lookups if lookups else 0.0
+    summary["avg_get_ms"] = counts.get("get_seconds", 0) * 1000 / lookups if lookups else 0.0
+    summary["avg_load_ms"] = counts.get("load_seconds", 0) * 1000 / loads if loads else 0.0
+    return summary
+
+
+# Stats of every decorated function in this process, keyed by func id
+_function_stats = {}
+_function_stats_caches = {}
+
+
+def get_cache_stats() -> dict:
+    """Snapshot of the in-process counters of every cached function"""
+    return {name: stats.snapshot() for name, stats in _function_stats.items()}
+
+
+def flush_cache_stats() -> None:
+    """Mirror all pending counters to Redis now"""
+    for name, stats in list(_function_stats.items()):
+        cache = _function_stats_caches.get(name)
+        if cache is not None:
+            stats.maybe_flush(cache, force=True)
+
+
+atexit.register(flush_cache_stats)
+
+
+class _InflightCall:
+    """A call in progress that other threads of this process can wait on"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one execution
+
+    Threads of the same process share the result of the first caller, each
+    waiter receiving its own copy (see _detach) so that mutating it in place
+    does not affect the others; exceptions are propagated to every waiter.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InflightCall()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return _detach(call.result)
+        result = None
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            if waiters and call.error is None:
+                # Snapshot for the waiters before the leader can modify the result
+                call.result = _detach(result)
+            call.event.set()
+        return result
+
+
+def _load_single_flight(
+    cache: RedisLRUCache,
+    cache_key: str,
+    loader: Callable[[], Any],
+    lease: int,
+    wait_timeout: float,
+    stats: Optional[CacheStats] = None,
+    stale_ttl: int = 0,
+) -> Any:
+    """
+    Recompute an expired key in exactly one caller across all processes
+
+    The caller holding the Redis lock runs loader and stores the value, the
+    others poll the key until it appears. A waiter that outlives wait_timeout,
+    or sees the lock vanish without a value, takes over the recompute.
+    """
+    deadline = time.monotonic() + wait_timeout
+    interval = 0.05
+    while True:
+        token = cache.acquire_lock(cache_key, lease)
+        if token is not None:
+            try:
+                # Another caller may have finished between our miss and the lock
+                result = (
+                    cache.get_entry(cache_key, stale_ttl=stale_ttl)[0] if token else None
+                )
+                if result is None:
+                    result = loader()
+                    cache.set(cache_key, result, stats=stats, stale_ttl=stale_ttl)
+                return result
+            finally:
+                cache.release_lock(cache_key, token)
+        while True:
+            time.sleep(interval)
+            interval = min(interval * 2, 0.5)
+            result = cache.get_entry(cache_key, stale_ttl=stale_ttl)[0]
+            if result is not None:
+                return result
+            if time.monotonic() > deadline:
+                logger.warning(f"Timed out waiting for {cache_key}, recomputing")
+                return loader()
+            if not cache.is_locked(cache_key):
+                break
+
+
+class BackgroundRefresher:
+    """
+    Refresh stale entries on a bounded thread pool
+
+    A key is refreshed at most once at a time in this process, and across
+    processes the Redis recompute lock lets only one of them do the work.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def schedule(
+        self,
+        cache: "RedisLRUCache",
+        cache_key: str,
+        loader: Callable[[], Any],
+        lease: int,
+        stats: Optional[CacheStats] = None,
+        stale_ttl: int = 0,
+    ) -> bool:
+        """Queue a refresh of cache_key unless one is already pending"""
+        with self._lock:
+            if cache_key in self._pending:
+                return False
+            self._pending.add(cache_key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="akshare-cache-refresh",
+                )
+            executor = self._executor
+        executor.submit(
+            self._refresh, cache, cache_key, loader, lease, stats, stale_ttl
+        )
+        return True
+
+    def _refresh(self, cache, cache_key, loader, lease, stats, stale_ttl) -> None:
+        try:
+            token = cache.acquire_lock(cache_key, lease)
+            if token is None:
+                # Another process is already refreshing this key
+                return
+            try:
+                result = loader()
+                cache.set(cache_key, result, stats=stats, stale_ttl=stale_ttl)
+                if stats is not None:
+                    stats.incr(refreshes=1)
+            finally:
+                cache.release_lock(cache_key, token)
+        except Exception as e:
+            logger.warning(f"Background refresh of {cache_key} failed: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(cache_key)
+
+    def _reset_after_fork(self) -> None:
+        # Worker threads do not survive fork
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+
+_refresher = BackgroundRefresher(
+    max_workers=int(os.getenv('AKSHARE_CACHE_REFRESH_WORKERS', '4'))
+)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresher._reset_after_fork)
+
 
 # Global cache instance
 _default_cache = None
@@ -254,12 +974,17 @@ def get_default_cache() -> RedisLRUCache:
 def lru_cache(
     redis_url: Optional[str] = None,
     prefix: Optional[str] = None,
-    max_age: int = 86400, # 24小时， = 24 * 60 * 60,
+    max_age: Union[int, ExpiryPolicy] = 86400, # 24小时， = 24 * 60 * 60,
     redis_client: Optional[Union[redis.Redis, RedisCluster]] = None,
     serialize_method: str = "pickle",
     func_key: Optional[str] = None,
     # key_version: str = "v1",
-    cache_instance: Optional[RedisLRUCache] = None
+    cache_instance: Optional[RedisLRUCache] = None,
+    single_flight: bool = True,
+    lock_timeout: int = 60,
+    l1_max_bytes: Optional[int] = None,
+    l1_max_age: Optional[int] = None,
+    stale_ttl: int = 0,
 ):
     """
     Redis-based LRU cache decorator
@@ -279,6 +1004,12 @@ def lru_cache(
         def my_function():
             return expensive_operation()
         
+        # Expire with the trading calendar instead of a fixed TTL
+        from akshare.utils.cache_policy import until_next_close, intraday
+        @lru_cache(max_age=until_next_close("15:00"))
+        def end_of_day_data():
+            return expensive_operation()
+        
         # With pre-configured cache
         cache = RedisLRUCache(redis_url='redis://localhost:6379')
         @lru_cache(cache_instance=cache)
@@ -288,19 +1019,29 @@ def lru_cache(
     Args:
         redis_url: Redis connection string
         prefix: Cache key prefix
-        max_age: Cache expiration time in seconds
+        max_age: Cache expiration time in seconds, or a trading-calendar-aware
+            ExpiryPolicy such as until_next_close("17:00") or intraday(60)
         redis_client: Pre-configured Redis client
         serialize_method: Serialization method
         func_key: Optional key for function-specific cache
         # key_version: Key version for cache invalidation
         cache_instance: Pre-configured cache instance
+        single_flight: On a miss, let only one caller (per process and across
+            processes sharing Redis) run func while the others wait for its value
+        lock_timeout: Lease of the recompute lock in seconds; waiters give up
+            and recompute themselves after this long
+        l1_max_bytes: Size of the in-process L1 tier in serialized bytes
+        l1_max_age: Upper bound of the L1 TTL in seconds
+        stale_ttl: Stale-while-revalidate window in seconds. max_age becomes the
+            soft TTL and max_age + stale_ttl the hard TTL; in between the stale
+            value is returned at once and a single background refresh is queued
     """
     def decorator(func: Callable) -> Callable:
         # Create cache instance for this decorator
         if cache_instance:
             cache = cache_instance
         else:
-            if all(param is None for param in [redis_url, prefix, redis_client]) and max_age == 86400: # 24小时默认值
+            if all(param is None for param in [redis_url, prefix, redis_client, l1_max_bytes, l1_max_age]) and max_age == 86400 and serialize_method == "pickle": # 24小时默认值
                 # Use default cache for minimal configuration
                 cache = get_default_cache()
             else:
@@ -313,32 +1054,91 @@ def lru_cache(
                     serialize_method=serialize_method,
                     func_key=func_key,
                     # key_version=key_version
+                    l1_max_bytes=l1_max_bytes,
+                    l1_max_age=l1_max_age,
                 )
         
+        flight = SingleFlight()
+        func_id = cache._func_id(func, func_key)
+        stats = _function_stats.setdefault(func_id, CacheStats(func_id))
+        _function_stats_caches[func_id] = cache
+
+        def load(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.incr(loads=1, load_seconds=time.perf_counter() - start)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
-            cache_key = cache._generate_cache_key(func, args, kwargs)
+            cache_key = cache._generate_cache_key(func, args, kwargs, func_key)
             
             # Try to get from cache
-            cached_result = cache.get(cache_key)
+            cached_result, stale = cache.get_entry(
+                cache_key, stats=stats, stale_ttl=stale_ttl
+            )
             if cached_result is not None:
                 logger.debug(f"Cache hit for {func.__name__}")
+                if stale:
+                    logger.debug(f"Serving stale {func.__name__}, refreshing")
+                    _refresher.schedule(
+                        cache,
+                        cache_key,
+                        lambda: load(*args, **kwargs),
+                        lease=lock_timeout,
+                        stats=stats,
+                        stale_ttl=stale_ttl,
+                    )
+                stats.maybe_flush(cache)
                 return cached_result
             
             # Cache miss - execute function
             logger.debug(f"Cache miss for {func.__name__}")
-            result = func(*args, **kwargs)
-            
-            # Store in cache
-            cache.set(cache_key, result)
-            
-            return result
+            try:
+                if single_flight:
+                    return flight.do(
+                        cache_key,
+                        lambda: _load_single_flight(
+                            cache,
+                            cache_key,
+                            lambda: load(*args, **kwargs),
+                            lease=lock_timeout,
+                            wait_timeout=lock_timeout,
+                            stats=stats,
+                            stale_ttl=stale_ttl,
+                        ),
+                    )
+                result = load(*args, **kwargs)
+                
+                # Store in cache
+                cache.set(cache_key, result, stats=stats, stale_ttl=stale_ttl)
+                
+                return result
+            finally:
+                stats.maybe_flush(cache)
+
+        def cache_clear() -> int:
+            # Only this function's entries, not the whole shared prefix
+            base = f"{cache.prefix}:{func_id}"
+            deleted = cache.clear_prefix(base)
+            return deleted + cache.clear_prefix(f"{base}:*")
+
+        def cache_info() -> dict:
+            info = {
+                "cache_prefix": cache.prefix,
+                "max_age": cache.max_age,
+                "func_id": func_id,
+            }
+            info.update(stats.snapshot())
+            return info
         
         # Add cache control methods to wrapper
         wrapper.cache = cache
-        wrapper.cache_clear = lambda: cache.clear_prefix()
-        wrapper.cache_info = lambda: {"cache_prefix": cache.prefix, "max_age": cache.max_age}
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        wrapper.cache_stats = stats
         
         return wrapper
     
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 新浪、腾讯等接口返回的宽松 JSON(JS 字面量) 快速解析
+支持未加引号的键、单引号字符串、尾随逗号、undefined、十六进制数字及 JSONP / var x = ... 包装
+先把文本规整为标准 JSON 再交给 json.loads(C 实现), 仅在注释等少见语法上退回 utils.demjson
+"""
+
+import json
+import logging
+import re
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<dq>"[^"\\]*(?:\\.[^"\\]*)*")
+  | (?P<sq>'[^'\\]*(?:\\.[^'\\]*)*')
+  | (?P<comma>,(?=\s*[\]}]))
+  | (?P<key>[A-Za-z_$][\w$]*)(?=\s*:)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<num>[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?))
+  | (?P<comment>/[/*])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_JSON_NUMBER_RE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?\Z")
+_SQ_ESCAPE_RE = re.compile(r"""\\(.)|(")""", re.DOTALL)
+_JSONP_RE = re.compile(
+    r"""^(?:/\*.*?\*/\s*)?(?:var\s+[\w$]+\s*=\s*|[\w$.]+(?:\[[^\]]*\])*\s*\()""",
+    re.DOTALL,
+)
+_WORDS = {
+    "true": "true",
+    "false": "false",
+    "null": "null",
+    "undefined": "null",
+    "NaN": "NaN",
+    "Infinity": "Infinity",
+}
+
+
+class _Unsupported(ValueError):
+    pass
+
+
+def _sq_escape(match: re.Match) -> str:
+    escaped, quote = match.groups()
+    if quote:
+        return '\\"'
+    return "'" if escaped == "'" else match.group()
+
+
+def _replace(match: re.Match) -> str:
+    kind = match.lastgroup
+    token = match.group()
+    if kind == "dq":
+        return token
+    if kind == "sq":
+        return '"' + _SQ_ESCAPE_RE.sub(_sq_escape, token[1:-1]) + '"'
+    if kind == "comma":
+        return ""
+    if kind == "key":
+        return '"' + token + '"'
+    if kind == "word":
+        if token in _WORDS:
+            return _WORDS[token]
+        raise _Unsupported(token)
+    if kind == "num":
+        sign = "-" if token[0] == "-" else ""
+        body = token.lstrip("+-")
+        if body[:2] in ("0x", "0X"):
+            return sign + str(int(body, 16))
+        if _JSON_NUMBER_RE.match(body):
+            mantissa, _, exponent = body.lower().partition("e")
+            if sign and mantissa == "0":
+                # 与 demjson 一致, -0 解析为 -0.0
+                return "-0.0"
+            if exponent and "." not in mantissa and not exponent.startswith("-"):
+                # demjson 将 1e3 这类无小数点、非负指数的数字解析为 int
+                if int(exponent) > 308:
+                    raise _Unsupported(token)
+                return sign + str(int(mantissa) * 10 ** int(exponent))
+            # 去掉 JS 允许的正号, 整数仍解析为 int
+            return sign + body
+        if "." not in body and "e" not in body.lower() and body.startswith("0"):
+            # 前导零在 JS 中有八进制歧义, 交给 demjson
+            raise _Unsupported(token)
+        return sign + repr(float(body))
+    raise _Unsupported(token)
+
+
+def strip_jsonp(text: str) -> str:
+    """
+    去掉 JSONP 回调、var x = 赋值及开头的注释, 返回其中的 JS 字面量
+    :param text: 接口返回的文本, 如 callback({...}); 或 var data = [...];
+    :type text: str
+    :return: JS 字面量文本
+    :rtype: str
+    """
+    text = text.strip().rstrip(";").rstrip()
+    match = _JSONP_RE.match(text)
+    if match is None:
+        return text
+    body = text[match.end() :]
+    if match.group().endswith("("):
+        body = body.rstrip()
+        if not body.endswith(")"):
+            return text
+        body = body[:-1]
+    return body.strip().rstrip(";")
+
+
+def to_json(text: str) -> str:
+    """
+    将宽松 JSON 规整为标准 JSON 文本
+    :param text: 宽松 JSON 文本
+    :type text: str
+    :return: 标准 JSON 文本
+    :rtype: str
+    """
+    return _TOKEN_RE.sub(_replace, text)
+
+
+def decode(txt: str, **kwargs) -> Any:
+    """
+    解析宽松 JSON, 可直接替换 demjson.decode
+    标准 JSON 直接使用 json.loads; 否则规整后再用 json.loads; 仍失败时退回 demjson.decode
+    :param txt: 接口返回的文本, 可带 JSONP 包装
+    :type txt: str
+    :return: 解析结果
+    :rtype: dict or list
+    """
+    if isinstance(txt, bytes):
+        txt = txt.decode(kwargs.pop("encoding", None) or "utf-8")
+    try:
+        return json.loads(txt, strict=False)
+    except ValueError:
+        pass
+    body = strip_jsonp(txt)
+    try:
+        return json.loads(to_json(body), strict=False)
+    except ValueError as e:
+        logger.debug(f"relaxed json fallback to demjson: {e}")
+    from . import demjson
+
+    return demjson.decode(body, **kwargs)
@@ -4,10 +4,14 @@ Date: 2025/12/31
 Desc: HTTP 请求工具函数
 """
 
+import atexit
 import logging
+import os
 import random
+import threading
 import time
 from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -21,6 +25,8 @@ except Exception:
     curl_requests = None
     _HAS_CURL_CFFI = False
 
+from .rate_limit import acquire
+
 
 DEFAULT_HEADERS: Dict[str, str] = {
     # NOTE(akshare): 模拟浏览器请求头，配合会话与 TLS 指纹提升稳定性
@@ -80,6 +86,179 @@ def get_tls_session(
     return session
 
 
+class SessionRegistry:
+    """
+    进程级 keep-alive Session 注册表（线程安全）
+    按 (类型, host, 指纹) 复用 Session，避免每次请求重复 TCP + TLS 握手；
+    fork 后子进程自动清空，防止与父进程共享 socket
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._host_pool_maxsize: Dict[str, int] = {}
+        self._sessions: Dict[Tuple[str, str, str], object] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        host: Optional[str] = None,
+    ) -> None:
+        """
+        设置连接池大小；指定 host 时仅作用于该 host，已创建的 Session 会被重建
+        :param pool_connections: 每个 Session 缓存的连接池数量
+        :type pool_connections: int
+        :param pool_maxsize: 每个连接池的最大连接数
+        :type pool_maxsize: int
+        :param host: 域名, 如 push2.eastmoney.com
+        :type host: str
+        """
+        with self._lock:
+            if host is not None:
+                if pool_maxsize is not None:
+                    self._host_pool_maxsize[host] = pool_maxsize
+                stale = [key for key in self._sessions if key[1] == host]
+            else:
+                if pool_connections is not None:
+                    self.pool_connections = pool_connections
+                if pool_maxsize is not None:
+                    self.pool_maxsize = pool_maxsize
+                stale = list(self._sessions)
+            sessions = [self._sessions.pop(key) for key in stale]
+        for session in sessions:
+            session.close()
+
+    def get(self, url: str) -> requests.Session:
+        """
+        获取 url 所在 host 的复用 Session
+        :param url: 请求地址
+        :type url: str
+        :return: Session
+        :rtype: requests.Session
+        """
+        host = urlsplit(url).netloc
+        key = ("requests", host, "")
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self._host_pool_maxsize.get(host, self.pool_maxsize),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                self._sessions[key] = session
+        return session
+
+    def get_tls(self, url: str, impersonate: str = "chrome120"):
+        """
+        获取 url 所在 host 的复用 TLS 指纹 Session（curl_cffi 内部按线程持有 curl 句柄）
+        :param url: 请求地址
+        :type url: str
+        :param impersonate: 浏览器指纹名称
+        :type impersonate: str
+        :return: Session 或 None（未安装 curl_cffi）
+        :rtype: curl_cffi.requests.Session | None
+        """
+        if not _HAS_CURL_CFFI:
+            return None
+        key = ("tls", urlsplit(url).netloc, impersonate)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = get_tls_session(impersonate=impersonate)
+                self._sessions[key] = session
+        return session
+
+    def discard(self, session) -> None:
+        """
+        移除并关闭出错的 Session，下次请求时重建
+        :param session: 需要移除的 Session
+        :type session: requests.Session
+        """
+        with self._lock:
+            keys = [key for key, value in self._sessions.items() if value is session]
+            for key in keys:
+                del self._sessions[key]
+        if keys:
+            session.close()
+
+    def close_all(self) -> None:
+        """
+        关闭并清空所有 Session
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    def _reset_after_fork(self) -> None:
+        # NOTE(akshare): 子进程不能复用父进程的连接，直接丢弃而不关闭 socket
+        self._lock = threading.Lock()
+        self._sessions = {}
+
+
+# NOTE(akshare): 进程级 Session 注册表，连接池大小可通过环境变量调整
+session_registry = SessionRegistry(
+    pool_connections=int(os.getenv("AKSHARE_POOL_CONNECTIONS", "10")),
+    pool_maxsize=int(os.getenv("AKSHARE_POOL_MAXSIZE", "10")),
+)
+atexit.register(session_registry.close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=session_registry._reset_after_fork)
+
+
+def configure_session_pool(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    host: Optional[str] = None,
+) -> None:
+    """
+    设置进程级 Session 连接池大小
+    :param pool_connections: 每个 Session 缓存的连接池数量
+    :type pool_connections: int
+    :param pool_maxsize: 每个连接池的最大连接数
+    :type pool_maxsize: int
+    :param host: 仅作用于指定域名
+    :type host: str
+    """
+    session_registry.configure(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, host=host
+    )
+
+
+def get_pooled_session(url: str) -> requests.Session:
+    """
+    获取 url 所在 host 的进程级复用 Session
+    :param url: 请求地址
+    :type url: str
+    :return: Session
+    :rtype: requests.Session
+    """
+    return session_registry.get(url)
+
+
+def get_pooled_tls_session(url: str, impersonate: str = "chrome120"):
+    """
+    获取 url 所在 host 的进程级复用 TLS 指纹 Session
+    :param url: 请求地址
+    :type url: str
+    :param impersonate: 浏览器指纹名称
+    :type impersonate: str
+    :return: Session 或 None（未安装 curl_cffi）
+    :rtype: curl_cffi.requests.Session | None
+    """
+    return session_registry.get_tls(url, impersonate=impersonate)
+
+
 def request_with_retry(
     url: str,
     params: Dict = None,
@@ -111,42 +290,39 @@ def request_with_retry(
     """
     last_exception = None
 
-    # NOTE(akshare): 允许复用外部 Session 保持 Cookie
-    own_session = session is None
-    if own_session:
-        session = get_session()
+    # NOTE(akshare): 允许复用外部 Session 保持 Cookie，未传入时使用进程级复用 Session
+    if session is None:
+        session = get_pooled_session(url)
 
-    try:
-        for attempt in range(max_retries):
-            try:
-                response = session.get(
-                    url,
-                    params=params,
-                    timeout=timeout,
-                    headers=headers,
-                    cookies=cookies,
-                )
-                response.raise_for_status()
-                return response
-
-            except (requests.RequestException, ValueError) as e:
-                last_exception = e
-                # NOTE(akshare): 输出失败日志，便于定位底层错误
-                logger.warning(
-                    "HTTP request failed (attempt %s/%s): %s",
-                    attempt + 1,
-                    max_retries,
-                    e,
-                    extra={"url": url, "params": params},
-                )
+    for attempt in range(max_retries):
+        try:
+            # NOTE(akshare): 按 host 令牌桶限速，替代固定的随机延迟
+            acquire(url)
+            response = session.get(
+                url,
+                params=params,
+                timeout=timeout,
+                headers=headers,
+                cookies=cookies,
+            )
+            response.raise_for_status()
+            return response
 
-                if attempt < max_retries - 1:
-                    # 指数退避 + 随机抖动
-                    delay = base_delay * (2**attempt) + random.uniform(*random_delay_range)
-                    time.sleep(delay)
-    finally:
-        if own_session and session is not None:
-            session.close()
+        except (requests.RequestException, ValueError) as e:
+            last_exception = e
+            # NOTE(akshare): 输出失败日志，便于定位底层错误
+            logger.warning(
+                "HTTP request failed (attempt %s/%s): %s",
+                attempt + 1,
+                max_retries,
+                e,
+                extra={"url": url, "params": params},
+            )
+
+            if attempt < max_retries - 1:
+                # 指数退避 + 随机抖动
+                delay = base_delay * (2**attempt) + random.uniform(*random_delay_range)
+                time.sleep(delay)
 
     raise last_exception
 
@@ -180,10 +356,10 @@ def request_with_retry_tls(
             cookies=cookies,
         )
 
-    # NOTE(akshare): 复用 TLS Session 保持 Cookie/连接状态
+    # NOTE(akshare): 复用 TLS Session 保持 Cookie/连接状态，未传入时使用进程级复用 Session
     own_session = session is None
     if own_session:
-        session = get_tls_session(headers=headers, impersonate=impersonate)
+        session = get_pooled_tls_session(url, impersonate=impersonate)
         if session is None:
             return request_with_retry(
                 url,
@@ -198,51 +374,50 @@ def request_with_retry_tls(
             )
 
     last_exception = None
-    try:
-        for attempt in range(max_retries):
-            try:
-                response = session.get(
+    for attempt in range(max_retries):
+        try:
+            # NOTE(akshare): 按 host 令牌桶限速，替代固定的随机延迟
+            acquire(url)
+            response = session.get(
+                url,
+                params=params,
+                timeout=timeout,
+                headers=headers,
+                cookies=cookies,
+            )
+            response.raise_for_status()
+            return response
+        except (requests.RequestException, ValueError) as e:
+            last_exception = e
+            # NOTE(akshare): 输出 TLS 失败日志，便于定位底层错误
+            logger.warning(
+                "TLS request failed (attempt %s/%s): %s",
+                attempt + 1,
+                max_retries,
+                e,
+                extra={"url": url, "params": params},
+            )
+            err_text = str(e)
+            # NOTE(akshare): curl_cffi 异常时回退到 requests
+            if "curl:" in err_text or err_text.startswith("curl:"):
+                if own_session:
+                    # NOTE(akshare): 丢弃可能已损坏的复用 Session，下次请求重建
+                    session_registry.discard(session)
+                return request_with_retry(
                     url,
                     params=params,
                     timeout=timeout,
+                    max_retries=max_retries,
+                    base_delay=base_delay,
+                    random_delay_range=random_delay_range,
+                    session=None,
                     headers=headers,
                     cookies=cookies,
                 )
-                response.raise_for_status()
-                return response
-            except (requests.RequestException, ValueError) as e:
-                last_exception = e
-                # NOTE(akshare): 输出 TLS 失败日志，便于定位底层错误
-                logger.warning(
-                    "TLS request failed (attempt %s/%s): %s",
-                    attempt + 1,
-                    max_retries,
-                    e,
-                    extra={"url": url, "params": params},
+            if attempt < max_retries - 1:
+                delay = base_delay * (2**attempt) + random.uniform(
+                    *random_delay_range
                 )
-                err_text = str(e)
-                # NOTE(akshare): curl_cffi 异常时回退到 requests
-                if "curl:" in err_text or err_text.startswith("curl:"):
-                    if own_session and session is not None:
-                        session.close()
-                    return request_with_retry(
-                        url,
-                        params=params,
-                        timeout=timeout,
-                        max_retries=max_retries,
-                        base_delay=base_delay,
-                        random_delay_range=random_delay_range,
-                        session=None,
-                        headers=headers,
-                        cookies=cookies,
-                    )
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2**attempt) + random.uniform(
-                        *random_delay_range
-                    )
-                    time.sleep(delay)
-    finally:
-        if own_session and session is not None:
-            session.close()
+                time.sleep(delay)
 
     raise last_exception
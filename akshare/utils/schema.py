@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 高频大表接口(实时行情、K 线、分时、分笔、龙虎榜、沪深港通)的输出字段类型注册表
+开启 set_compact_dtypes(True) 后, 注册表中的接口按字段类型返回紧凑的数据:
+重复的标签列(代码、名称、板块、买卖盘性质等)转为 Arrow 字符串或 category, 整数转为 Int64, 价格等转为 float32,
+datetime.date 及日期字符串转为 datetime64; 转换后的类型只由注册表决定, 与数据取值无关, 逐页或逐个代码获取的结果可直接拼接或写入同一个 Parquet 文件;
+默认关闭, 返回结果与原先一致
+"""
+
+import functools
+from typing import Callable, Dict, Optional, Union
+
+import pandas as pd
+
+from .context import config
+
+try:
+    import pyarrow  # noqa: F401
+
+    _STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    _STRING_DTYPE = "string"
+
+# 字段类型:
+# label: 重复出现的文本, 转为 Arrow 字符串(label_dtype="string") 或 category(label_dtype="category")
+# text: 不重复的文本, 转为 Arrow 字符串
+# int: 整数, 转为可含缺失值的 Int64; 无法解析的值为缺失值, 含小数时报错
+# float32: 浮点数, 转为 float32(约 7 位有效数字, 适用于价格、涨跌幅等); 无法解析的值为 NaN
+# datetime: datetime.date 或日期字符串, 转为 datetime64
+_SPOT_SCHEMA = {
+    "序号": "int",
+    "代码": "label",
+    "名称": "label",
+    "最新价": "float32",
+    "涨跌幅": "float32",
+    "涨跌额": "float32",
+    "成交量": "int",
+    "振幅": "float32",
+    "最高": "float32",
+    "最低": "float32",
+    "今开": "float32",
+    "昨收": "float32",
+    "开盘价": "float32",
+    "最高价": "float32",
+    "最低价": "float32",
+    "昨收价": "float32",
+    "买入": "float32",
+    "卖出": "float32",
+    "量比": "float32",
+    "换手率": "float32",
+    "市盈率": "float32",
+    "市盈率-动态": "float32",
+    "市净率": "float32",
+    "涨速": "float32",
+    "5分钟涨跌": "float32",
+    "60日涨跌幅": "float32",
+    "年初至今涨跌幅": "float32",
+    "时间戳": "label",
+}
+
+_KLINE_SCHEMA = {
+    "日期": "datetime",
+    "时间": "datetime",
+    "股票代码": "label",
+    "开盘": "float32",
+    "收盘": "float32",
+    "最高": "float32",
+    "最低": "float32",
+    "均价": "float32",
+    "最新价": "float32",
+    "成交量": "int",
+    "振幅": "float32",
+    "涨跌幅": "float32",
+    "涨跌额": "float32",
+    "换手率": "float32",
+    "date": "datetime",
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
+    "volume": "int",
+    "turnover": "float32",
+}
+
+_TICK_SCHEMA = {
+    "时间": "label",
+    "成交价": "float32",
+    "手数": "int",
+    "买卖盘性质": "label",
+    "成交时间": "label",
+    "成交价格": "float32",
+    "价格变动": "float32",
+    "成交量": "int",
+    "性质": "label",
+    "symbol": "label",
+    "name": "label",
+    "ticktime": "label",
+    "price": "float32",
+    "volume": "int",
+    "prev_price": "float32",
+    "kind": "label",
+}
+
+_LHB_SCHEMA = {
+    "序号": "int",
+    "代码": "label",
+    "名称": "label",
+    "上榜日": "datetime",
+    "解读": "label",
+    "收盘价": "float32",
+    "涨跌幅": "float32",
+    "净买额占总成交比": "float32",
+    "成交额占总成交比": "float32",
+    "换手率": "float32",
+    "上榜原因": "label",
+    "上榜后1日": "float32",
+    "上榜后2日": "float32",
+    "上榜后5日": "float32",
+    "上榜后10日": "float32",
+}
+
+_HSGT_SCHEMA = {
+    "序号": "int",
+    "代码": "label",
+    "名称": "label",
+    "今日收盘价": "float32",
+    "今日涨跌幅": "float32",
+    "今日持股-占流通股比": "float32",
+    "今日持股-占总股本比": "float32",
+    "所属板块": "label",
+    "日期": "datetime",
+}
+
+SCHEMA_REGISTRY: Dict[str, Dict[str, str]] = {
+    "stock_zh_a_spot_em": _SPOT_SCHEMA,
+    "stock_sh_a_spot_em": _SPOT_SCHEMA,
+    "stock_sz_a_spot_em": _SPOT_SCHEMA,
+    "stock_bj_a_spot_em": _SPOT_SCHEMA,
+    "stock_new_a_spot_em": _SPOT_SCHEMA,
+    "stock_cy_a_spot_em": _SPOT_SCHEMA,
+    "stock_kc_a_spot_em": _SPOT_SCHEMA,
+    "stock_zh_b_spot_em": _SPOT_SCHEMA,
+    "stock_hk_spot_em": _SPOT_SCHEMA,
+    "stock_hk_main_board_spot_em": _SPOT_SCHEMA,
+    "stock_us_spot_em": _SPOT_SCHEMA,
+    "stock_zh_a_spot": _SPOT_SCHEMA,
+    "stock_zh_a_hist": _KLINE_SCHEMA,
+    "stock_zh_a_hist_min_em": _KLINE_SCHEMA,
+    "stock_zh_a_hist_pre_min_em": _KLINE_SCHEMA,
+    "stock_hk_hist": _KLINE_SCHEMA,
+    "stock_hk_hist_min_em": _KLINE_SCHEMA,
+    "stock_us_hist": _KLINE_SCHEMA,
+    "stock_us_hist_min_em": _KLINE_SCHEMA,
+    "stock_zh_a_daily": _KLINE_SCHEMA,
+    "index_zh_a_hist": _KLINE_SCHEMA,
+    "index_zh_a_hist_min_em": _KLINE_SCHEMA,
+    "stock_intraday_em": _TICK_SCHEMA,
+    "stock_intraday_sina": _TICK_SCHEMA,
+    "stock_zh_a_tick_tx_js": _TICK_SCHEMA,
+    "stock_lhb_detail_em": _LHB_SCHEMA,
+    "stock_hsgt_hold_stock_em": _HSGT_SCHEMA,
+}
+
+
+def register_schema(name: str, schema: Dict[str, str]) -> None:
+    """
+    注册或覆盖接口的字段类型, 用于 compact_dtypes(df, name)
+    :param name: 接口名称, 如 "stock_zh_a_spot_em"
+    :type name: str
+    :param schema: {字段名: "label" | "text" | "int" | "float32" | "datetime"}
+    :type schema: dict
+    """
+    SCHEMA_REGISTRY[name] = dict(schema)
+
+
+def _to_int(column: pd.Series) -> pd.Series:
+    values = pd.to_numeric(column, errors="coerce")
+    try:
+        return values.astype("Int64")
+    except TypeError as e:
+        raise ValueError(f"字段 {column.name} 声明为 int, 但含有小数") from e
+
+
+def _compact_column(column: pd.Series, kind: str, label_dtype: str) -> pd.Series:
+    if kind == "int":
+        return _to_int(column)
+    if kind == "float32":
+        return pd.to_numeric(column, errors="coerce").astype("float32")
+    if kind == "datetime":
+        return pd.to_datetime(column, errors="coerce")
+    if kind == "label" and label_dtype == "category":
+        return column.astype("category")
+    if kind in {"label", "text"}:
+        return column.astype(_STRING_DTYPE)
+    return column
+
+
+def compact_dtypes(
+    df: pd.DataFrame,
+    schema: Union[str, Dict[str, str]],
+    label_dtype: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    按字段类型将数据转为紧凑类型, 节省内存
+    :param df: 需要转换的数据
+    :type df: pandas.DataFrame
+    :param schema: 注册表中的接口名称, 或 {字段名: 字段类型}
+    :type schema: str or dict
+    :param label_dtype: 标签列的类型, choice of {"string", "category"}; 默认为 set_compact_dtypes 中的设置
+    :type label_dtype: str
+    :return: 转换后的数据, 不在 schema 中的字段保持不变
+    :rtype: pandas.DataFrame
+    """
+    if isinstance(schema, str):
+        schema = SCHEMA_REGISTRY[schema]
+    if label_dtype is None:
+        label_dtype = config.label_dtype
+    df = df.copy()
+    # NOTE(akshare): 按位置处理, 兼容重复的字段名
+    for i, name in enumerate(df.columns):
+        kind = schema.get(name)
+        if kind is not None:
+            df.isetitem(i, _compact_column(df.iloc[:, i], kind, label_dtype))
+    return df
+
+
+def set_compact_dtypes(enabled: bool = True, label_dtype: str = "string") -> None:
+    """
+    开启或关闭注册表中接口的紧凑类型输出
+    :param enabled: 是否开启
+    :type enabled: bool
+    :param label_dtype: 标签列的类型, choice of {"string", "category"}; category 的取值集合随每次结果而定,
+    不同结果拼接时会退化为 object, 需要拼接或写入同一个 Parquet 文件时使用 "string"
+    :type label_dtype: str
+    """
+    if label_dtype not in {"category", "string"}:
+        raise ValueError('label_dtype 只能为 "category" 或 "string"')
+    config.compact_dtypes = enabled
+    config.label_dtype = label_dtype
+
+
+def typed_output(func: Callable) -> Callable:
+    """
+    接口装饰器, 开启 set_compact_dtypes 后按注册表中与接口同名的字段类型转换返回结果
+    逐页返回的接口(func.iter_pages)同样按页转换, 各页的标签列固定为 Arrow 字符串, 保证各页类型一致
+    :param func: 注册表中的接口
+    :type func: callable
+    :return: 包装后的接口
+    :rtype: callable
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        if config.compact_dtypes and isinstance(result, pd.DataFrame):
+            return compact_dtypes(result, name)
+        return result
+
+    if hasattr(func, "iter_pages"):
+
+        @functools.wraps(func.iter_pages)
+        def iter_pages(*args, **kwargs):
+            for temp_df in func.iter_pages(*args, **kwargs):
+                if config.compact_dtypes:
+                    temp_df = compact_dtypes(temp_df, name, label_dtype="string")
+                yield temp_df
+
+        wrapper.iter_pages = iter_pages
+    return wrapper
@@ -0,0 +1,798 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 新浪财经历史行情压缩格式解码, stock.cons.hk_js_decode 的 Python 实现
+新浪的 klc_kl.js / klc_td_sh.txt 等接口返回 6 bit 一个字符的变长位流, 原先每次调用都要启动 V8 执行解码脚本
+这里逐位移植该脚本(包括 JS 的 NaN / 整数位运算语义), 字符到位流的转换和结果列的组装用 NumPy 完成
+"""
+
+import math
+import re
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_NAN = float("nan")
+_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+# NOTE(akshare): 不在字母表中的字符在 JS 中 indexOf 为 -1, 参与位运算时相当于 6 个 1
+_LOOKUP = np.full(256, 63, dtype=np.uint8)
+_LOOKUP[np.frombuffer(_ALPHABET, dtype=np.uint8)] = np.arange(64, dtype=np.uint8)
+_EPOCH_DAY = 7657
+_POW2 = [2**i for i in range(64)]
+_SEGMENTS = [0, 3, 5, 6, 9, 10, 12, 15, 17, 18, 20, 23, 24, 27, 29, 30]
+_INT32_MASK = ~(3 << 30) & 0xFFFFFFFF
+_BIT30 = 1 << 30
+_JS_NUMBER_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\Z")
+
+
+class SinaDecodeError(ValueError):
+    """位流在记录中途结束, 原 JS 脚本此时会抛出 TypeError"""
+
+
+def _truthy(value) -> bool:
+    return bool(value) and value == value
+
+
+def _i32(value) -> int:
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return 0
+        value = int(value)
+    value &= 0xFFFFFFFF
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _floor(value):
+    if isinstance(value, float) and math.isfinite(value):
+        return math.floor(value)
+    return value
+
+
+def _jsmod(a, b):
+    if isinstance(a, float):
+        return math.fmod(a, b)
+    return a % b if a >= 0 else -(-a % b)
+
+
+def _js_str(value) -> str:
+    """JS 的 Number.prototype.toString()"""
+    if isinstance(value, int) and abs(value) < 10**21:
+        return str(value)
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "0"
+    if value.is_integer() and abs(value) < 1e21:
+        return str(int(value))
+    sign = "-" if value < 0 else ""
+    _, digits, exponent = Decimal(repr(abs(value))).as_tuple()
+    digits = "".join(map(str, digits))
+    stripped = digits.rstrip("0")
+    exponent += len(digits) - len(stripped)
+    digits = stripped
+    k = len(digits)
+    n = k + exponent
+    if k <= n <= 21:
+        return sign + digits + "0" * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + "." + digits[n:]
+    if -6 < n <= 0:
+        return sign + "0." + "0" * (-n) + digits
+    mantissa = digits[0] + ("." + digits[1:] if k > 1 else "")
+    return f"{sign}{mantissa}e{'+' if n - 1 >= 0 else '-'}{abs(n - 1)}"
+
+
+def _js_number(text: str) -> float:
+    """JS 的 Number(string)"""
+    text = text.strip()
+    if not text:
+        return 0
+    if _JS_NUMBER_RE.match(text):
+        return float(text)
+    if text in ("Infinity", "+Infinity"):
+        return math.inf
+    if text == "-Infinity":
+        return -math.inf
+    return _NAN
+
+
+def _char_at(text: str, index) -> str:
+    if isinstance(index, float):
+        index = int(index) if math.isfinite(index) else 0
+    return text[index] if 0 <= index < len(text) else ""
+
+
+def _to_T(t) -> List:
+    if not _truthy(t):
+        return [0, 0]
+    if t < 0:
+        e = _to_T(-t)
+        return [-e[0], -e[1]]
+    e = _jsmod(t, 3)
+    i = (t - e) / 3 if isinstance(t, float) else (t - e) // 3
+    n = [i, i]
+    if e:
+        n[int(e) - 1] += 1
+    return n
+
+
+def _E(t) -> str:
+    t = _js_str(t if _truthy(t) else 0)
+    i = t.lower().find("e")
+    if i > 0:
+        digits = []
+        e = _js_number(t[i + 1 :])
+        while e >= 0:
+            digits.append(_js_str(_floor(e * math.pow(10, -e) + 0.5)))
+            e -= 1
+        return "".join(digits)
+    return t
+
+
+_UNSET = object()
+_MAX_SAFE_INTEGER = 2**53
+_SHIFTS: Dict = {}
+
+
+def _shift(r, a) -> tuple:
+    """P 中把 2、5 的指数差补齐为 10 的幂: 返回 (小数点移动位数, 乘数)"""
+    n = [a[0] - r[0], a[1] - r[1]]
+    scale = 1
+    while n[0] < n[1]:
+        scale *= 5
+        n[1] -= 1
+    while n[1] < n[0]:
+        scale *= 2
+        n[0] -= 1
+    return n[0], scale
+
+
+def _P(t, e, i=_UNSET):
+    """按精度把整数还原为十进制数, 对应原脚本中的 P"""
+    if isinstance(e, list):
+        n, scale = _shift(e, _to_T(i) if i is not _UNSET else [0, 0])
+    else:
+        key = (e, i)
+        cached = _SHIFTS.get(key)
+        if cached is None:
+            cached = _shift(_to_T(e), _to_T(i) if i is not _UNSET else [0, 0])
+            if type(e) is int and (i is _UNSET or type(i) is int):
+                _SHIFTS[key] = cached
+        n, scale = cached
+    if type(t) is float and t.is_integer() and abs(t) < _MAX_SAFE_INTEGER:
+        t = int(t)
+    if type(t) is int and i is _UNSET and type(n) is int:
+        # 快速路径: 整数按十进制移位, 与原脚本的字符串运算结果相同(均为正确舍入)
+        t *= scale
+        if abs(t) < _MAX_SAFE_INTEGER and (t >= 0 or len(str(-t)) > -n):
+            return t / 10 ** (-n) if n < 0 else float(t * 10**n)
+        t //= scale
+    if scale > 1:
+        t = t * scale
+    t = _E(t)
+    if n < 0:
+        while len(t) + n <= 0:
+            t = "0" + t
+        n = int(n + len(t))
+        head = _js_number(t[:n])
+        if i is _UNSET:
+            return _js_number(_js_str(head) + "." + t[n:])
+        digit = _js_number(t[n : n + 1])
+        if digit > 5:
+            head += 1
+        elif digit == 5:
+            head += 1 if _js_number(t[n + 1 :]) > 0 else _i32(head) & 1
+        return head
+    if n > 0:
+        t += "0" * int(n)
+    return _js_number(t)
+
+
+class _Columns:
+    """逐行追加, 按 pandas.DataFrame(list_of_dicts) 的列顺序组装列"""
+
+    def __init__(self, date_keys=("date",)):
+        self.data: Dict = {}
+        self.size = 0
+        self.date_keys = date_keys
+
+    def append(self, row: Dict) -> None:
+        data = self.data
+        for key, value in row.items():
+            column = data.get(key)
+            if column is None:
+                column = data[key] = [_NAN] * self.size
+            column.append(value)
+        self.size += 1
+        if len(row) != len(data):
+            for column in data.values():
+                if len(column) < self.size:
+                    column.append(_NAN)
+
+    def set_first(self, key, value) -> None:
+        column = self.data.setdefault(key, [_NAN] * self.size)
+        column[0] = value
+
+
+class _Decoder:
+    def __init__(self, text: str):
+        codes = _LOOKUP[np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8)]
+        bits = np.unpackbits(codes[:, None], axis=1, bitorder="little")[:, :6]
+        self.buf = np.packbits(bits.ravel(), bitorder="little").tobytes() + bytes(8)
+        self.n = len(codes)
+        self.end = 6 * self.n
+        self.pos = 0
+        self.r: Dict = {}
+        self.s = 0
+
+    @property
+    def e(self) -> int:
+        return self.pos // 6
+
+    def y(self) -> int:
+        pos = self.pos
+        if pos >= self.end:
+            return 0
+        self.pos = pos + 1
+        return (self.buf[pos >> 3] >> (pos & 7)) & 1
+
+    def N(self) -> int:
+        t = self.y()
+        e = 1
+        while self.y():
+            e += 1
+        return e * (2 * t - 1)
+
+    def w(self, widths, signed=(), raw=()) -> List:
+        out = []
+        for s, width in enumerate(widths):
+            if not _truthy(width):
+                out.append(0)
+                continue
+            if self.pos >= self.end:
+                return out
+            if width <= 0:
+                u = 0
+            elif width <= 30:
+                pos = self.pos
+                width = int(width)
+                self.pos = pos + width
+                chunk = self.buf[pos >> 3 : ((pos + width - 1) >> 3) + 1]
+                u = (int.from_bytes(chunk, "little") >> (pos & 7)) & (_POW2[width] - 1)
+                if s < len(signed) and signed[s] and u >= _POW2[width - 1]:
+                    u -= _POW2[width]
+            else:
+                sign = signed[s] if s < len(signed) else 0
+                u = self.w([30, width - 30], [0, sign])
+                if not (s < len(raw) and raw[s]):
+                    u = _item(u, 0) + _num(_item(u, 1)) * _BIT30
+            out.append(u)
+        return out
+
+    def v(self, width, signed=0):
+        """读取单个字段, 等价于原脚本的 w([width], [signed])[0]"""
+        if not _truthy(width):
+            return 0
+        pos = self.pos
+        if pos >= self.end:
+            return _NAN
+        if width <= 0:
+            return 0
+        if width > 30:
+            return _item(self.w([width], [signed]), 0)
+        width = int(width)
+        self.pos = pos + width
+        chunk = self.buf[pos >> 3 : ((pos + width - 1) >> 3) + 1]
+        u = (int.from_bytes(chunk, "little") >> (pos & 7)) & (_POW2[width] - 1)
+        if signed and u >= _POW2[width - 1]:
+            u -= _POW2[width]
+        return u
+
+    def get(self, key):
+        return self.r.get(key, _NAN)
+
+    def S(self, t) -> float:
+        r = self.r
+        e = 0
+        while t > e:
+            r["d"] = self.get("d") + 1
+            n = _jsmod(r["d"], 7)
+            if n == 3 or n == 4:
+                r["d"] += 5 - n
+            e += 1
+        return _EPOCH_DAY + self.get("d")
+
+    def k(self, t) -> float:
+        r = self.r
+        n = r.get("wd")
+        n = n if _truthy(n) else 62
+        e = 0
+        while t > e:
+            while True:
+                r["d"] = self.get("d") + 1
+                if _i32(n) & (1 << int((_jsmod(r["d"], 7) + 10) % 7)):
+                    break
+            e += 1
+        return _EPOCH_DAY + self.get("d")
+
+    def x(self):
+        t = self.v(3)
+        if t == 1:
+            self.r["d"] = self.v(18, 1)
+            t = 0
+        elif not _truthy(t):
+            t = self.v(6)
+        return t
+
+    def decode(self) -> Optional[_Columns]:
+        u = self.w([12, 6])
+        self.s = 63 ^ _i32(_item(u, 1))
+        handler = {
+            1479: self._daily,
+            136: self._minute,
+            200: self._close,
+            139: self._dates,
+            197: self._matrix,
+            3466: self._kline,
+        }.get(_item(u, 0))
+        return handler() if handler else _Columns()
+
+    def _close(self) -> _Columns:
+        """收盘价序列"""
+        r, w, y = self.r, self.w, self.y
+        out = _Columns()
+        if self.s >= 1:
+            return out
+        r["d"] = self.v(18, 1) - 1
+        a = w([3, 3, 30, 6])
+        r["p"], r["ld"], r["cd"], r["c"] = (_item(a, i) for i in range(4))
+        r["m"] = math.pow(10, r["p"])
+        r["pc"] = r["cd"] / r["m"]
+        t = 0
+        while True:
+            d = 1
+            if y():
+                a = self.v(3)
+                if a == 0:
+                    d = self.v(6)
+                elif a == 1:
+                    r["d"] = self.v(18)
+                    d = 0
+                else:
+                    d = a
+            row = {"date": self.S(d)}
+            if y():
+                r["ld"] += self.N()
+            r["cd"] += _item(w([3 * r["ld"]], [1]), 0)
+            row["close"] = r["cd"] / r["m"]
+            out.append(row)
+            if not (
+                self.pos < self.end
+                and (self.e != self.n - 1 or 63 & (_i32(r["c"]) ^ (t + 1)))
+            ):
+                break
+            t += 1
+        out.set_first("prevclose", r["pc"])
+        return out
+
+    def _minute(self) -> _Columns:
+        """分时数据"""
+        r, w, y, s = self.r, self.w, self.y, self.s
+        out = _Columns()
+        rows = []
+        if s > 2:
+            return out
+        names = {"v": "volume", "p": "price", "a": "avg_price"}
+        r["d"] = self.v(18, 1) - 1
+        first_date = self.S(1)
+        a = w([3, 3, 4, 1, 1, 1, 5] if s < 1 else [4, 4, 4, 1, 1, 1, 3])
+        for t, key in enumerate(["la", "lp", "lv", "tv", "rv", "zv", "pp"]):
+            r[key] = _item(a, t)
+        r["m"] = math.pow(10, r["pp"])
+        if s >= 1:
+            a = w([3, 3])
+            r["c"] = _item(a, 0)
+            a = _item(a, 1)
+        else:
+            a = 5
+            r["c"] = 2
+        r["pc"] = self.v(6 * a)
+        prevclose = r["pc"] / r["m"]
+        r["cp"] = r["pc"]
+        r["da"] = 0
+        r["sa"] = r["sv"] = 0
+        t = 0
+        while self.pos < self.end and (self.e != self.n - 1 or 7 & (_i32(r["c"]) ^ t)):
+            row = {}
+            o = {}
+            f = y() if _truthy(r["tv"]) else 1
+            for i, m in enumerate(("v", "p", "a")):
+                if y() if f else 0:
+                    r["l" + m] += self.N()
+                u = y() if m == "v" and _truthy(r["rv"]) else 1
+                width = 3 * r["l" + m] + (7 * u if m == "v" else 0)
+                a = self.v(width, bool(i)) * (1 if u else 100)
+                o[m] = a
+                if m == "v":
+                    row[names[m]] = a
+                    if (
+                        not _truthy(a)
+                        and (s > 1 or 241 > t)
+                        and ((not y()) if _truthy(r["zv"]) else 1)
+                    ):
+                        o["p"] = 0
+                        break
+                elif m == "a":
+                    r["da"] = (0 if 1 > s else r["da"]) + o["a"]
+            r["sv"] += o["v"]
+            r["cp"] += o["p"]
+            row[names["p"]] = r["cp"] / r["m"]
+            # NOTE(akshare): 成交额累加按 JS 的双精度浮点计算, 避免极端数据下与原脚本结果不同
+            r["sa"] += float(o["v"]) * float(r["cp"])
+            if "a" not in o:
+                row[names["a"]] = rows[t - 1][names["a"]] if t else row[names["p"]]
+            elif _truthy(r["sv"]):
+                avg = _floor((r["sa"] * (2e3 / r["m"]) + r["sv"]) / r["sv"])
+                row[names["a"]] = ((_i32(avg) >> 1) + r["da"]) / 1e3
+            else:
+                row[names["a"]] = row[names["p"]] + r["da"] / 1e3
+            rows.append(row)
+            out.append(row)
+            t += 1
+        if not rows:
+            raise SinaDecodeError("empty minute payload")
+        out.set_first("date", first_date)
+        out.set_first("prevclose", prevclose)
+        return out
+
+    def _daily(self) -> _Columns:
+        """日线数据(旧格式)"""
+        r, w = self.r, self.w
+        out = _Columns()
+        if self.s >= 1:
+            return out
+        r.update(lv=0, ld=0, cd=0, cv=[0, 0])
+        r["p"] = self.v(6)
+        r["d"] = self.v(18, 1) - 1
+        r["m"] = math.pow(10, r["p"])
+        a = w([3, 3])
+        r["md"], r["mv"] = _item(a, 0), _item(a, 1)
+        while True:
+            a = w([6])
+            if not a:
+                break
+            i = {"c": a[0], "d": 1}
+            if 32 & i["c"]:
+                while True:
+                    a = _i32(self.v(6))
+                    if 63 == (16 | a):
+                        side = "x" if 16 & a else "u"
+                        a = w([3, 3])
+                        i[side + "_d"] = _item(a, 0) + r["md"]
+                        i[side + "_v"] = _item(a, 1) + r["mv"]
+                        break
+                    if 32 & a:
+                        kind = "d" if 8 & a else "v"
+                        side = "x" if 16 & a else "u"
+                        i[side + "_" + kind] = (7 & a) + r["m" + kind]
+                        break
+                    o = 15 & a
+                    if o == 0:
+                        i["d"] = self.v(6)
+                    elif o == 1:
+                        r["d"] = self.v(18)
+                        i["d"] = 0
+                    else:
+                        i["d"] = o
+                    if not 16 & a:
+                        break
+            row = {"date": self.S(i["d"])}
+            for o in ("v", "d"):
+                if "x_" + o in i:
+                    r["l" + o] = i["x_" + o]
+                if "u_" + o not in i:
+                    i["u_" + o] = r["l" + o]
+            widths = [i["u_d"], i["u_d"], i["u_d"], i["u_d"], i["u_v"]]
+            mask = _SEGMENTS[15 & i["c"]]
+            if 1 & _i32(i["u_v"]):
+                mask = 31 - mask
+            if 16 & i["c"]:
+                widths[4] += 2
+            for e in range(5):
+                if mask & (1 << (4 - e)):
+                    widths[e] += 1
+                widths[e] *= 3
+            d_v = w(widths, [1, 0, 0, 1, 1], [0, 0, 0, 0, 1])
+            if len(d_v) < 5:
+                raise SinaDecodeError("truncated daily payload")
+            o = r["cd"] + d_v[0]
+            row["open"] = o / r["m"]
+            row["high"] = (o + d_v[1]) / r["m"]
+            row["low"] = (o - d_v[2]) / r["m"]
+            row["close"] = (o + d_v[3]) / r["m"]
+            a = d_v[4]
+            if not isinstance(a, list):
+                a = [a, 0 if a >= 0 else -1]
+            a0, a1 = _item(a, 0), _item(a, 1)
+            r["cd"] = o + d_v[3]
+            cv0, cv1 = r["cv"]
+            carry = (
+                1
+                if ((_i32(cv0) & _INT32_MASK) + (_i32(a0) & _INT32_MASK)) & _BIT30
+                else 0
+            )
+            r["cv"] = [_i32(cv0 + a0) & _INT32_MASK, cv1 + a1 + carry]
+            row["volume"] = (_i32(r["cv"][0]) & (_BIT30 - 1)) + r["cv"][1] * _BIT30
+            out.append(row)
+        return out
+
+    def _dates(self) -> Optional[_Columns]:
+        """交易日序列"""
+        r, w, y = self.r, self.w, self.y
+        if self.s > 1:
+            return _Columns()
+        r["l"] = 0
+        n = -1
+        r["d"] = self.v(18) - 1
+        last = self.v(18)
+        days = None
+        while r["d"] < last:
+            day = self.S(1)
+            if 0 >= n:
+                if y():
+                    r["l"] += self.N()
+                n = _item(w([3 * r["l"]], [0]), 0) + 1
+                if days is None:
+                    days = [day]
+                    n -= 1
+            elif days is None:
+                raise SinaDecodeError("invalid date payload")
+            else:
+                days.append(day)
+            n -= 1
+        if days is None:
+            return None
+        out = _Columns(date_keys=(0,))
+        out.data[0] = days
+        out.size = len(days)
+        return out
+
+    def _matrix(self) -> _Columns:
+        """多列整数序列"""
+        r, w, y = self.r, self.w, self.y
+        out = _Columns()
+        if self.s >= 1:
+            return out
+        r["f"] = self.v(6)
+        r["c"] = self.v(6)
+        count = int(r["f"]) if _truthy(r["f"]) else 0
+        if count <= 0 and self.e < self.n - 1:
+            # NOTE(akshare): 原脚本在此情况下不消耗位流, 会无限追加空行
+            raise SinaDecodeError("matrix payload without columns")
+        dv = [0] * count
+        dl = [0] * count
+        t = 0
+        while self.pos < self.end and (self.e != self.n - 1 or 7 & (_i32(r["c"]) ^ t)):
+            row = {}
+            for i in range(count):
+                if y():
+                    dl[i] += self.N()
+                dv[i] += _item(w([3 * dl[i]], [1]), 0)
+                row[i] = dv[i]
+            out.append(row)
+            t += 1
+        return out
+
+    def _kline(self) -> Optional[_Columns]:
+        """日线数据(klc_kl.js 等当前使用的格式)"""
+        y, N, P = self.y, self.N, _P
+        r = self.r
+        r.update(
+            b_avp=1,
+            b_ph=0,
+            b_phx=0,
+            b_sep=0,
+            p_p=6,
+            p_v=0,
+            p_a=0,
+            p_e=0,
+            p_t=0,
+            l_o=3,
+            l_h=3,
+            l_l=3,
+            l_c=3,
+            l_v=5,
+            l_a=5,
+            l_e=3,
+            l_t=0,
+            u_p=0,
+            u_v=0,
+            u_a=0,
+            wd=62,
+            d=0,
+        )
+        out = _Columns()
+        if self.s > 0:
+            return out
+        last = None
+        while True:
+            if self.pos >= self.end:
+                return None
+            a = {"d": 1, "c": 0}
+            if y():
+                if y():
+                    if y():
+                        a["c"] += 1
+                        a["a"] = r["b_avp"]
+                        if y():
+                            r["b_avp"] ^= y()
+                            r["b_ph"] ^= y()
+                            r["b_phx"] ^= y()
+                            a["s"] = r["b_sep"]
+                            r["b_sep"] ^= y()
+                            if y():
+                                r["wd"] = self.v(7)
+                            if a["s"] ^ r["b_sep"]:
+                                if a["s"]:
+                                    r["u_p"] = self.get("u_c")
+                                else:
+                                    r["u_o"] = r["u_h"] = r["u_l"] = r["u_c"] = r["u_p"]
+                        u = 0
+                        while u < 3 + 2 * r["b_ph"]:
+                            if y():
+                                key = "pvaet"[u]
+                                o = r["p_" + key]
+                                r["p_" + key] += N()
+                                r["u_" + key] = P(
+                                    self.get("u_" + key), o, r["p_" + key]
+                                )
+                                if r["b_sep"] and not u:
+                                    for c in "ohlc":
+                                        r["u_" + c] = P(self.get("u_" + c), o, r["p_p"])
+                            u += 1
+                        if not r["b_avp"] and a["a"]:
+                            amount = last["amount"] if last is not None else 0
+                            r["u_a"] = P(amount if _truthy(amount) else 0, 0, r["p_a"])
+                    if y():
+                        a["c"] += 1
+                        for u in range(7 + r["b_ph"] + r["b_phx"]):
+                            if y():
+                                if u == 6:
+                                    a["d"] = self.x()
+                                else:
+                                    key = "l_" + "ohlcva*et"[u]
+                                    r[key] = self.get(key) + N()
+                    if y():
+                        a["c"] += 1
+                        l_o = r["l_o"] + (N() if y() else 0)
+                        o = self.v(3 * l_o, 1)
+                        if r["b_sep"]:
+                            a["p"] = self.get("u_c") + o
+                        else:
+                            r["u_p"] += o
+                            a["p"] = r["u_p"]
+                    if not a["c"]:
+                        break
+                else:
+                    if y():
+                        if y():
+                            if y():
+                                a["d"] = self.x()
+                            else:
+                                r["l_v"] += N()
+                        elif r["b_ph"] and y():
+                            key = "l_" + "et"[1 if r["b_phx"] and y() else 0]
+                            r[key] += N()
+                        else:
+                            r["l_a"] += N()
+                    else:
+                        key = "l_" + _char_at("ohlc", self.v(2))
+                        r[key] = self.get(key) + N()
+            for u in range(6 + r["b_ph"] + r["b_phx"]):
+                c = "ohlcvaet"[u]
+                sign = ((191 if r["b_sep"] else 185) >> u) & 1
+                a["v_" + c] = self.v(3 * self.get("l_" + c), sign)
+            p_p = r["p_p"]
+            row = {"date": self.k(a["d"])}
+            if _truthy(a.get("p", 0)):
+                row["prevclose"] = P(a["p"], p_p)
+            if r["b_sep"]:
+                for c, name in (
+                    ("o", "open"),
+                    ("h", "high"),
+                    ("l", "low"),
+                    ("c", "close"),
+                ):
+                    r["u_" + c] = self.get("u_" + c) + a["v_" + c]
+                    row[name] = P(r["u_" + c], p_p)
+            else:
+                a["o"] = r["u_p"] + a["v_o"]
+                row["open"] = P(a["o"], p_p)
+                row["high"] = P(a["o"] + a["v_h"], p_p)
+                row["low"] = P(a["o"] - a["v_l"], p_p)
+                r["u_p"] = a["o"] + a["v_c"]
+                row["close"] = P(r["u_p"], p_p)
+            r["u_v"] += a["v_v"]
+            row["volume"] = P(r["u_v"], r["p_v"])
+            if r["b_avp"]:
+                o = _to_T(p_p)
+                t = _to_T(r["p_v"])
+                if r["b_sep"]:
+                    avg = sum(self.get("u_" + c) for c in "ohlc") / 4
+                else:
+                    avg = a["o"] + (a["v_h"] - a["v_l"] + a["v_c"]) / 4
+                base = P(
+                    _floor(avg * r["u_v"] + 0.5), [o[0] + t[0], o[1] + t[1]], r["p_a"]
+                )
+                row["amount"] = P(base + a["v_a"], r["p_a"])
+            else:
+                r["u_a"] += a["v_a"]
+                row["amount"] = P(r["u_a"], r["p_a"])
+            if r["b_ph"]:
+                row["postVol"] = P(a["v_e"], r["p_e"])
+                extra = P(a["v_t"], r["p_t"]) if r["b_phx"] else 0
+                row["postAmt"] = P(
+                    _floor(row["postVol"] * row["close"] + extra + 0.5), 0
+                )
+            out.append(row)
+            last = row
+        return out
+
+
+def _num(value):
+    """数组参与算术运算时 JS 会先转为数字: [] 为 0, [x] 为 x, 其余为 NaN"""
+    if isinstance(value, list):
+        return _num(value[0]) if len(value) == 1 else (0 if not value else _NAN)
+    return value
+
+
+def _item(values, index):
+    if isinstance(values, list) and index < len(values):
+        return values[index]
+    return _NAN
+
+
+def _to_datetime(days) -> np.ndarray:
+    days = np.asarray(days, dtype="float64")
+    out = np.full(days.shape, np.datetime64("NaT"), dtype="datetime64[ms]")
+    # NOTE(akshare): 与 JS Date 的取值范围一致, 超出范围(Invalid Date)记为缺失
+    valid = np.isfinite(days) & (np.abs(days) <= 1e8)
+    out[valid] = days[valid].astype("int64").astype("datetime64[D]")
+    return out
+
+
+def hk_js_decode_columns(text: str) -> Dict:
+    """
+    解码新浪历史行情位流, 直接返回列
+    :param text: 接口返回的 var xxx="..."; 中引号内的内容
+    :type text: str
+    :return: {列名: numpy.ndarray}, 日期列为 datetime64[ms](UTC 0 点); 与 pd.DataFrame(JS 解码结果) 的列顺序一致
+    :rtype: dict
+    """
+    columns = _Decoder(text).decode()
+    if columns is None:
+        return {}
+    result = {}
+    for key, values in columns.data.items():
+        if key in columns.date_keys:
+            result[key] = _to_datetime(values)
+        else:
+            result[key] = np.asarray(values, dtype="float64")
+    return result
+
+
+def hk_js_decode_frame(text: str) -> pd.DataFrame:
+    """
+    解码新浪历史行情位流, 可替代 pd.DataFrame(MiniRacer().call("d", text))
+    :param text: 接口返回的 var xxx="..."; 中引号内的内容
+    :type text: str
+    :return: 解码结果, 日期列为不带时区的 datetime64
+    :rtype: pandas.DataFrame
+    """
+    return pd.DataFrame(hk_js_decode_columns(text))
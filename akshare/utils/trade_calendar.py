@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 交易日历
+akshare/file_fold/calendar.json 在进程内只加载一次, 以有序的 datetime64[D] 数组及哈希表索引;
+是否为交易日为 O(1), 前后交易日、偏移 n 个交易日及区间查询为 O(log n), 均支持直接传入整个数组
+"""
+
+import datetime
+import json
+import os
+import threading
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+def _calendar_path() -> str:
+    return os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "file_fold",
+        "calendar.json",
+    )
+
+
+def _is_scalar(day: Any) -> bool:
+    return isinstance(day, (str, datetime.date, np.datetime64)) or np.ndim(day) == 0
+
+
+def _to_datetime64(days: Any) -> np.ndarray:
+    """将日期数组转为 datetime64[D], 无法解析的为 NaT"""
+    if isinstance(days, np.ndarray) and days.dtype.kind == "M":
+        return days.astype("datetime64[D]")
+    # NOTE(akshare): ISO8601 同时支持 "YYYYMMDD" 与 "YYYY-MM-DD", 默认按第一个值推断格式会把另一种格式解析为 NaT
+    values = pd.to_datetime(
+        pd.Series(np.asarray(days, dtype=object)), format="ISO8601", errors="coerce"
+    )
+    return values.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+
+
+class TradeCalendar:
+    """
+    交易日历
+    日期可以是 "YYYYMMDD"、"YYYY-MM-DD"、datetime.date、datetime.datetime 或 numpy.datetime64;
+    单个日期的返回值与传入的类型一致("YYYYMMDD" 字符串、datetime.date 或 numpy.datetime64),
+    传入数组时返回 numpy 数组, 超出日历范围的为 NaT
+    """
+
+    def __init__(self, days: Iterable[Any]):
+        """
+        :param days: 交易日
+        :type days: list
+        """
+        self.days = np.unique(_to_datetime64(list(days)))
+        self.days = self.days[~np.isnat(self.days)]
+        self._ordinals = self.days.view("int64")
+        # NOTE(akshare): 交易日 -> 位置; 字符串单独建表, 各模块 "YYYYMMDD" in calendar 的判断无需解析日期
+        self._position = {day: i for i, day in enumerate(self._ordinals.tolist())}
+        self._strings = [
+            (_EPOCH + datetime.timedelta(days=day)).strftime("%Y%m%d")
+            for day in self._ordinals.tolist()
+        ]
+        self._string_position = {day: i for i, day in enumerate(self._strings)}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings)
+
+    def __contains__(self, day: Any) -> bool:
+        return self.is_trading_day(day)
+
+    @property
+    def first(self) -> datetime.date:
+        """日历中的第一个交易日"""
+        return self._to_date(0)
+
+    @property
+    def last(self) -> datetime.date:
+        """日历中的最后一个交易日"""
+        return self._to_date(len(self) - 1)
+
+    def to_list(self) -> list:
+        """
+        全部交易日
+        :return: "YYYYMMDD" 格式的交易日
+        :rtype: list
+        """
+        return list(self._strings)
+
+    def _to_date(self, pos: int) -> datetime.date:
+        return _EPOCH + datetime.timedelta(days=int(self._ordinals[pos]))
+
+    def _ordinal(self, day: Any) -> Optional[int]:
+        if isinstance(day, datetime.datetime):
+            day = day.date()
+        if isinstance(day, datetime.date):
+            return (day - _EPOCH).days
+        if isinstance(day, str):
+            pos = self._string_position.get(day)
+            if pos is not None:
+                return int(self._ordinals[pos])
+        value = _to_datetime64([day])[0]
+        return None if np.isnat(value) else int(value.view("int64"))
+
+    def _format(self, pos: int, like: Any) -> Any:
+        if isinstance(like, str):
+            return self._strings[pos]
+        if isinstance(like, np.datetime64):
+            return self.days[pos]
+        return self._to_date(pos)
+
+    def _take(self, pos: np.ndarray) -> np.ndarray:
+        valid = (pos >= 0) & (pos < len(self))
+        result = np.full(pos.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+        result[valid] = self.days[pos[valid]]
+        return result
+
+    def is_trading_day(self, day: Any) -> Any:
+        """
+        是否为交易日
+        :param day: 日期或日期数组
+        :type day: str or datetime.date or numpy.ndarray
+        :return: 是否为交易日
+        :rtype: bool or numpy.ndarray
+        """
+        if not _is_scalar(day):
+            values = _to_datetime64(day)
+            pos = np.searchsorted(self.days, values)
+            found = pos < len(self)
+            found[found] = self.days[pos[found]] == values[found]
+            return found
+        if isinstance(day, str) and day in self._string_position:
+            return True
+        return self._ordinal(day) in self._position
+
+    def offset(self, day: Any, n: int) -> Any:
+        """
+        向后(n > 0)或向前(n < 0)偏移 n 个交易日; 非交易日先按偏移方向取最近的交易日计为第 1 个
+        :param day: 日期或日期数组
+        :type day: str or datetime.date or numpy.ndarray
+        :param n: 偏移的交易日数; 为 0 时非交易日会报错(数组中为 NaT)
+        :type n: int
+        :return: 偏移后的交易日
+        :rtype: str or datetime.date or numpy.datetime64 or numpy.ndarray
+        """
+        if not _is_scalar(day):
+            values = _to_datetime64(day)
+            left = np.searchsorted(self.days, values, side="left")
+            right = np.searchsorted(self.days, values, side="right")
+            trading = left != right
+            if n > 0:
+                pos = np.where(trading, left + n, left + n - 1)
+            elif n < 0:
+                pos = left + n
+            else:
+                pos = np.where(trading, left, -1)
+            pos[np.isnat(values)] = -1
+            return self._take(pos)
+        ordinal = self._ordinal(day)
+        if ordinal is None:
+            raise ValueError(f"无法解析日期: {day}")
+        pos = self._position.get(ordinal)
+        if pos is None:
+            if n == 0:
+                raise ValueError(f"{day} 非交易日")
+            pos = int(np.searchsorted(self._ordinals, ordinal))
+            pos = pos + n - 1 if n > 0 else pos + n
+        else:
+            pos = pos + n
+        if not 0 <= pos < len(self):
+            raise ValueError(f"{day} 偏移 {n} 个交易日超出交易日历范围")
+        return self._format(pos, day)
+
+    def prev(self, day: Any) -> Any:
+        """
+        前一个交易日(不含当天), 参数同 offset
+        """
+        return self.offset(day, -1)
+
+    def next(self, day: Any) -> Any:
+        """
+        后一个交易日(不含当天), 参数同 offset
+        """
+        return self.offset(day, 1)
+
+    def latest(self, day: Any) -> Any:
+        """
+        不晚于当天的最近一个交易日, 参数同 offset
+        """
+        if not _is_scalar(day):
+            values = _to_datetime64(day)
+            pos = np.searchsorted(self.days, values, side="right") - 1
+            pos[np.isnat(values)] = -1
+            return self._take(pos)
+        if self.is_trading_day(day):
+            return self.offset(day, 0)
+        return self.offset(day, -1)
+
+    def range(self, start: Any, end: Any) -> np.ndarray:
+        """
+        区间内的交易日, 包含两端
+        :param start: 开始日期
+        :type start: str or datetime.date
+        :param end: 结束日期
+        :type end: str or datetime.date
+        :return: 交易日
+        :rtype: numpy.ndarray
+        """
+        start, end = _to_datetime64([start, end])
+        left = np.searchsorted(self.days, start, side="left")
+        right = np.searchsorted(self.days, end, side="right")
+        return self.days[left:right]
+
+    def range_dates(self, start: Any, end: Any) -> list:
+        """
+        区间内的交易日, 包含两端, 用于逐日循环
+        :param start: 开始日期
+        :type start: str or datetime.date
+        :param end: 结束日期
+        :type end: str or datetime.date
+        :return: 交易日
+        :rtype: list of datetime.date
+        """
+        return self.range(start, end).astype(datetime.date).tolist()
+
+
+_calendar: Optional[TradeCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trade_calendar() -> TradeCalendar:
+    """
+    进程级交易日历, calendar.json 只读取一次
+    :return: 交易日历
+    :rtype: TradeCalendar
+    """
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                with open(_calendar_path(), "r", encoding="utf-8") as f:
+                    _calendar = TradeCalendar(json.load(f))
+    return _calendar
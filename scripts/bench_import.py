@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: import akshare 的耗时与常驻内存基准
+每个场景在全新的子进程中重复运行, 输出耗时中位数、峰值 RSS 和已加载模块数
+python scripts/bench_import.py
+python scripts/bench_import.py --repeat 10 --json bench_import.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "lazy": "import akshare",
+    "lazy + stock_zh_a_hist": "import akshare; akshare.stock_zh_a_hist",
+    "eager (akshare._api)": "import akshare._api",
+}
+
+# NOTE(akshare): resource 模块仅在 POSIX 上可用; Linux 的 ru_maxrss 单位为 KB, macOS 为字节
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+except ImportError:
+    rss_mb = None
+print(elapsed, rss_mb, len(sys.modules))
+"""
+
+
+def run_scenario(statement: str, repeat: int) -> dict:
+    """
+    在子进程中重复执行导入语句
+    :param statement: 导入语句
+    :type statement: str
+    :param repeat: 重复次数
+    :type repeat: int
+    :return: 耗时中位数(秒)、峰值 RSS 中位数(MB) 和模块数
+    :rtype: dict
+    """
+    seconds, rss, modules = [], [], 0
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        seconds.append(float(output[0]))
+        if output[1] != "None":
+            rss.append(float(output[1]))
+        modules = int(output[2])
+    return {
+        "seconds": statistics.median(seconds),
+        "rss_mb": statistics.median(rss) if rss else None,
+        "modules": modules,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="import akshare 耗时与内存基准")
+    parser.add_argument("--repeat", type=int, default=5, help="每个场景的重复次数")
+    parser.add_argument("--json", help="将结果写入 JSON 文件, 便于跟踪历史变化")
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        results[name] = run_scenario(statement, args.repeat)
+        result = results[name]
+        rss = f"{result['rss_mb']:.1f} MB" if result["rss_mb"] is not None else "n/a"
+        print(
+            f"{name:<26} {result['seconds'] * 1000:8.1f} ms  "
+            f"{rss:>10}  {result['modules']:5d} modules"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 根据 akshare/_api.py 中的导入语句生成懒加载注册表 akshare/_registry.py
+python scripts/gen_lazy_registry.py          重新生成注册表
+python scripts/gen_lazy_registry.py --check  仅检查注册表是否与 _api.py 一致(用于 CI)
+"""
+
+import argparse
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+API_FILE = ROOT / "akshare" / "_api.py"
+REGISTRY_FILE = ROOT / "akshare" / "_registry.py"
+
+HEADER = '''#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Desc: 顶层接口懒加载注册表 {名称: 模块} 或 {名称: "模块:原名称"}
+本文件由 scripts/gen_lazy_registry.py 根据 akshare/_api.py 自动生成, 请勿手动修改
+"""
+'''
+
+
+def _is_import_error_guard(node: ast.Try) -> bool:
+    for handler in node.handlers:
+        names = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+        if any(isinstance(name, ast.Name) and name.id == "ImportError" for name in names):
+            return True
+    return False
+
+
+def _collect(nodes, exports: Dict[str, str], optional: Dict[str, str]) -> None:
+    for node in nodes:
+        if isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            target = optional if node.level == 0 else exports
+            for alias in node.names:
+                if alias.name == "*":
+                    raise ValueError(f"{module}: 不支持 import *")
+                name = alias.asname or alias.name
+                target[name] = module if alias.asname is None else f"{module}:{alias.name}"
+        elif isinstance(node, ast.Try) and _is_import_error_guard(node):
+            # try: from akqmt import xt_api 这类可选依赖
+            _collect(node.body, optional, optional)
+        elif isinstance(node, (ast.Import, ast.Try, ast.If, ast.Assign)):
+            raise ValueError(f"_api.py 第 {node.lineno} 行: 只允许 from ... import ... 语句")
+
+
+def build_registry(source: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    解析导入清单
+    :param source: _api.py 源码
+    :type source: str
+    :return: (包内接口, 可选的第三方接口)
+    :rtype: tuple
+    """
+    exports: Dict[str, str] = {}
+    optional: Dict[str, str] = {}
+    _collect(ast.parse(source).body, exports, optional)
+    return exports, optional
+
+
+def render(exports: Dict[str, str], optional: Dict[str, str]) -> str:
+    lines = [HEADER, "EXPORTS = {"]
+    lines += [f'    "{name}": "{module}",' for name, module in exports.items()]
+    lines += [
+        "}",
+        "",
+        "# NOTE(akshare): 第三方可选依赖, 未安装时访问会抛出 AttributeError",
+        "OPTIONAL_EXPORTS = {",
+    ]
+    lines += [f'    "{name}": "{module}",' for name, module in optional.items()]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="生成 akshare/_registry.py")
+    parser.add_argument("--check", action="store_true", help="注册表过期时返回非零")
+    args = parser.parse_args()
+    content = render(*build_registry(API_FILE.read_text(encoding="utf-8")))
+    if args.check:
+        current = REGISTRY_FILE.read_text(encoding="utf-8") if REGISTRY_FILE.exists() else ""
+        if current != content:
+            print("akshare/_registry.py 已过期, 请运行 python scripts/gen_lazy_registry.py")
+            return 1
+        return 0
+    REGISTRY_FILE.write_text(content, encoding="utf-8")
+    print(f"已写入 {len(content.splitlines())} 行到 {REGISTRY_FILE.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+期货交易所并发采集测试的公共工具
+"""
+
+import threading
+import time
+
+
+class FakeExchange:
+    """
+    模拟交易所请求: 记录每次请求及各交易所同时进行的请求数, 指定的 (交易所, 交易日) 请求失败或返回空结果
+    """
+
+    def __init__(self, delay: float = 0.0):
+        """
+        :param delay: 每次请求的耗时(秒), 用于观察并发数
+        :type delay: float
+        """
+        self.delay = delay
+        self.calls = []
+        self.fail = set()
+        self.empty = set()
+        self.running = {}
+        self.max_running = {}
+        self.lock = threading.Lock()
+
+    def request(self, market: str, date: str, result, empty=None):
+        """
+        记录 (market, date) 的请求; 在 fail 中时抛出 ConnectionError, 在 empty 中时返回 empty, 否则返回 result
+        """
+        key = (market, date)
+        with self.lock:
+            self.calls.append(key)
+            self.running[market] = self.running.get(market, 0) + 1
+            self.max_running[market] = max(
+                self.max_running.get(market, 0), self.running[market]
+            )
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if key in self.fail:
+                raise ConnectionError("timeout")
+            if key in self.empty:
+                return empty
+            return result
+        finally:
+            with self.lock:
+                self.running[market] -= 1
+
+    def recover(self):
+        """交易所恢复正常, 并清空请求记录"""
+        self.calls.clear()
+        self.fail.clear()
+        self.empty.clear()
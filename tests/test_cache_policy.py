@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+基于交易日历的缓存过期策略单元测试
+"""
+
+import datetime
+import unittest
+
+from akshare.utils.cache_policy import (
+    CHINA_TZ,
+    ExpiryPolicy,
+    intraday,
+    resolve_ttl,
+    until_next_close,
+)
+
+
+def _at(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=CHINA_TZ)
+
+
+class TestUntilNextClose(unittest.TestCase):
+    """测试日终数据过期策略"""
+
+    def test_weekend(self):
+        """测试周五收盘后写入的缓存有效至下周一收盘"""
+        policy = until_next_close("15:00")
+        self.assertEqual(policy.next_close(_at(2024, 5, 10, 16, 0)), _at(2024, 5, 13, 15, 0))
+        self.assertEqual(policy.ttl(_at(2024, 5, 11, 12, 0)), int(2.125 * 86400))
+
+    def test_holiday(self):
+        """测试跳过国庆假期"""
+        policy = until_next_close("17:00")
+        self.assertEqual(policy.next_close(_at(2024, 9, 30, 18, 0)), _at(2024, 10, 8, 17, 0))
+
+    def test_before_close_same_day(self):
+        """测试交易日收盘前写入的缓存当天收盘过期"""
+        policy = until_next_close("15:00")
+        self.assertEqual(policy.ttl(_at(2024, 5, 13, 14, 0)), 3600)
+
+
+class TestIntraday(unittest.TestCase):
+    """测试盘中快照过期策略"""
+
+    def test_trading_session(self):
+        """测试交易时段内使用短 TTL"""
+        self.assertEqual(intraday(30).ttl(_at(2024, 5, 13, 10, 0)), 30)
+
+    def test_session_end(self):
+        """测试临近时段结束时 TTL 不跨越收盘"""
+        self.assertEqual(intraday(60).ttl(_at(2024, 5, 13, 11, 29, 30)), 30)
+        self.assertEqual(intraday(60).ttl(_at(2024, 5, 13, 14, 59, 50)), 10)
+
+    def test_lunch_break(self):
+        """测试午间休市有效至下午开盘"""
+        self.assertEqual(intraday(30).ttl(_at(2024, 5, 13, 12, 0)), 3600)
+
+    def test_overnight_and_weekend(self):
+        """测试收盘后和周末有效至下一个交易日开盘"""
+        self.assertEqual(
+            intraday(30).ttl(_at(2024, 5, 10, 15, 30)),
+            int((_at(2024, 5, 13, 9, 15) - _at(2024, 5, 10, 15, 30)).total_seconds()),
+        )
+
+    def test_resolve_ttl(self):
+        """测试固定秒数原样返回"""
+        self.assertEqual(resolve_ttl(600), 600)
+        self.assertGreater(resolve_ttl(until_next_close()), 0)
+
+    def test_abstract_policy(self):
+        """测试过期策略基类不能直接实例化"""
+        with self.assertRaises(TypeError):
+            ExpiryPolicy()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -6,8 +6,21 @@ Desc: To test intention, just write test code here!
 """
 
 import pathlib
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
 
 from akshare.datasets import get_ths_js, get_crypto_info_csv
+from akshare.utils.func import (
+    concat_pages,
+    fetch_paginated_data,
+    iter_datacenter_pages,
+    iter_pages,
+    paginated,
+)
+from akshare.utils.request import SessionRegistry
 
 
 def test_path_func():
@@ -30,6 +43,113 @@ def test_zipfile_func():
     assert isinstance(temp_path, pathlib.Path)
 
 
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def _fake_paginated_request(url, params, **kwargs):
+    page = int(params.get("pn", 1))
+    # 后面的页面先返回，验证合并结果仍按页码排序
+    time.sleep(0.01 * (5 - page))
+    rows = [{"f3": 100 - page * 10 - i, "f12": f"{page}-{i}"} for i in range(2)]
+    return _FakeResponse({"data": {"total": 9, "diff": rows}})
+
+
+def test_fetch_paginated_data_concurrent():
+    """
+    test concurrent pagination keeps every page and page order
+    """
+    with patch("akshare.utils.func.request_with_retry", _fake_paginated_request):
+        concurrent_df = fetch_paginated_data("https://example.com/api", {"pn": 1})
+        serial_df = fetch_paginated_data(
+            "https://example.com/api", {"pn": 1}, max_workers=1
+        )
+    assert len(concurrent_df) == 10
+    assert concurrent_df["f12"].tolist() == serial_df["f12"].tolist()
+    assert concurrent_df["index"].tolist() == list(range(1, 11))
+
+
+def test_iter_pages_order_and_prefetch():
+    """
+    test pages are yielded in order with at most max_workers pages in flight
+    """
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def fetch_page(page):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01 * (6 - page))
+        with lock:
+            state["running"] -= 1
+        return pd.DataFrame({"page": [page]})
+
+    pages = [item["page"].iloc[0] for item in iter_pages(fetch_page, range(1, 6), 2)]
+    assert pages == [1, 2, 3, 4, 5]
+    assert state["peak"] <= 2
+
+
+def test_paginated_concat_once():
+    """
+    test paginated wrapper concatenates pages and keeps the page iterator
+    """
+
+    @paginated
+    def fake_pages(n):
+        for page in range(n):
+            yield pd.DataFrame({"page": [page, page]})
+
+    assert fake_pages(3)["page"].tolist() == [0, 0, 1, 1, 2, 2]
+    assert fake_pages(3).index.tolist() == list(range(6))
+    assert len(list(fake_pages.iter_pages(3))) == 3
+    assert fake_pages(0).empty
+    assert concat_pages([]).empty
+
+
+def test_iter_datacenter_pages_reuse_first_page():
+    """
+    test the first page is requested only once
+    """
+    requested = []
+
+    def fake_request(url, params=None, **kwargs):
+        requested.append(params["pageNumber"])
+        page = params["pageNumber"]
+        return _FakeResponse(
+            {"result": {"pages": 3, "data": [{"page": page}]}, "success": True}
+        )
+
+    with patch("akshare.utils.func.request_with_retry", fake_request):
+        pages = list(iter_datacenter_pages("https://example.com/api", {}))
+    assert requested == [1, 2, 3]
+    assert [item["page"].iloc[0] for item in pages] == [1, 2, 3]
+    with patch(
+        "akshare.utils.func.request_with_retry",
+        lambda *args, **kwargs: _FakeResponse({"result": None}),
+    ):
+        assert list(iter_datacenter_pages("https://example.com/api", {})) == []
+
+
+def test_session_registry_reuse():
+    """
+    test sessions are reused per host and rebuilt after configure
+    """
+    registry = SessionRegistry(pool_connections=2, pool_maxsize=2)
+    session = registry.get("https://push2.eastmoney.com/api/qt/clist/get")
+    assert registry.get("https://push2.eastmoney.com/api/qt/stock/get") is session
+    assert registry.get("https://hq.sinajs.cn/list=sh600000") is not session
+    registry.configure(pool_maxsize=8, host="push2.eastmoney.com")
+    rebuilt = registry.get("https://push2.eastmoney.com/api/qt/clist/get")
+    assert rebuilt is not session
+    assert rebuilt.get_adapter("https://push2.eastmoney.com")._pool_maxsize == 8
+    registry.close_all()
+
+
 if __name__ == "__main__":
     test_path_func()
     test_zipfile_func()
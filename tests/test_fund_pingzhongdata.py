@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+天天基金 pingzhongdata 脚本解析单元测试
+"""
+
+import datetime
+import unittest
+from unittest import mock
+
+from akshare.fund import fund_em
+
+DATA_TEXT = (
+    "/*2024-01-05 15:35:02*/var ishb=false;"
+    '/*基金或股票信息*/var fS_name = "华夏成长混合";var fS_code = "000001";'
+    '/*现费率*/var fund_Rate="0.15";var zqCodes = "019703,019704";'
+    "var Data_netWorthTrend = ["
+    '{"x":1704211200000,"y":1.012,"equityReturn":0.5,"unitMoney":""},'
+    '{"x":1704297600000,"y":1.002,"equityReturn":-0.99,"unitMoney":""}];'
+    "/*累计净值走势*/var Data_ACWorthTrend = [[1704211200000,3.512],[1704297600000,null]];"
+    "var Data_millionCopiesIncome = [];var Data_sevenDaysYearIncome=[];"
+    'var Data_rateInSimilarType = [{"x":1704211200000,"y":12,"sc":"900"}];'
+    "var Data_rateInSimilarPersent=[[1704211200000,98.67]];"
+    "var swithSameType = [['001;var x=1','a b'],['c']];"
+)
+
+
+class TestPingzhongdata(unittest.TestCase):
+    """测试不经过 V8 直接解析 pingzhongdata 脚本"""
+
+    def test_parse(self):
+        """测试 JSON 字面量与单引号字面量的解析"""
+        data_dict = fund_em._parse_pingzhongdata(DATA_TEXT)
+        self.assertIs(data_dict["ishb"], False)
+        self.assertEqual(data_dict["fS_code"], "000001")
+        self.assertEqual(data_dict["Data_ACWorthTrend"][1], [1704297600000, None])
+        self.assertEqual(data_dict["swithSameType"], [["001;var x=1", "a b"], ["c"]])
+        self.assertNotIn("x", data_dict)
+
+    def test_request(self):
+        """测试经过 akshare.request 请求(按 host 限速、全局代理)并设置超时"""
+        response = mock.Mock(text=DATA_TEXT)
+        with mock.patch.object(fund_em, "request_get", return_value=response) as get:
+            data_dict = fund_em._fund_pingzhongdata("000001")
+        self.assertEqual(data_dict["fS_code"], "000001")
+        self.assertEqual(get.call_args.kwargs["timeout"], 15)
+        response.raise_for_status.assert_called_once()
+
+    def test_bundle(self):
+        """测试一次获取全部指标, 与逐个指标获取的结果一致"""
+        data_dict = fund_em._parse_pingzhongdata(DATA_TEXT)
+        with mock.patch.object(
+            fund_em, "_fund_pingzhongdata", return_value=data_dict
+        ) as fetch:
+            bundle_dict = fund_em.fund_open_fund_info_em_bundle(symbol="000001")
+            self.assertEqual(fetch.call_count, 1)
+            for indicator, temp_df in bundle_dict.items():
+                self.assertTrue(
+                    temp_df.equals(
+                        fund_em.fund_open_fund_info_em(
+                            symbol="000001", indicator=indicator
+                        )
+                    )
+                )
+        temp_df = bundle_dict["单位净值走势"]
+        self.assertEqual(temp_df.columns.tolist(), ["净值日期", "单位净值", "日增长率"])
+        self.assertEqual(temp_df["净值日期"].iloc[0], datetime.date(2024, 1, 3))
+        self.assertTrue(bundle_dict["每万份收益"].empty)
+
+    def test_batch(self):
+        """测试多只基金的结果按基金代码顺序合并"""
+        data_dict = fund_em._parse_pingzhongdata(DATA_TEXT)
+        with mock.patch.object(
+            fund_em, "_fund_pingzhongdata", return_value=data_dict
+        ) as fetch:
+            result_dict, failed_df = fund_em.fund_open_fund_info_em_batch(
+                symbol_list=["000001", "110011", "000001"],
+                indicator_list=["累计净值走势", "每万份收益"],
+                max_workers=2,
+            )
+        self.assertEqual(fetch.call_count, 2)
+        self.assertTrue(failed_df.empty)
+        self.assertEqual(list(result_dict), ["累计净值走势", "每万份收益"])
+        temp_df = result_dict["累计净值走势"]
+        self.assertEqual(temp_df["基金代码"].tolist(), ["000001"] * 2 + ["110011"] * 2)
+        self.assertEqual(temp_df.columns.tolist(), ["基金代码", "净值日期", "累计净值"])
+        self.assertEqual(result_dict["每万份收益"].columns.tolist(), ["基金代码"])
+
+    def test_batch_failed(self):
+        """测试单只基金获取失败时其余结果照常返回, 失败的单独列出"""
+        data_dict = fund_em._parse_pingzhongdata(DATA_TEXT)
+
+        def fetch(symbol):
+            if symbol in ("110011", "000003"):
+                raise ConnectionError("timeout")
+            return data_dict
+
+        with mock.patch.object(fund_em, "_fund_pingzhongdata", side_effect=fetch):
+            result_dict, failed_df = fund_em.fund_open_fund_info_em_batch(
+                symbol_list=["000003", "000001", "110011"],
+                indicator_list=["累计净值走势"],
+                max_workers=2,
+            )
+        self.assertEqual(failed_df["symbol"].tolist(), ["000003", "110011"])
+        self.assertIn("timeout", failed_df["error"].iloc[0])
+        self.assertEqual(
+            result_dict["累计净值走势"]["基金代码"].tolist(), ["000001"] * 2
+        )
+
+    def test_batch_unknown_indicator(self):
+        """测试未知指标在请求前报错"""
+        with mock.patch.object(fund_em, "_fund_pingzhongdata") as fetch:
+            with self.assertRaises(ValueError):
+                fund_em.fund_open_fund_info_em_batch(
+                    symbol_list=["000001"], indicator_list=["单位净值"]
+                )
+        fetch.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
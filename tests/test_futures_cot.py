@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+会员持仓排名并发采集单元测试
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from akshare.futures import cot
+from akshare.utils.local_store import LocalFrameStore
+from tests.futures_fakes import FakeExchange
+
+
+def _rank_table(symbol: str) -> pd.DataFrame:
+    temp_df = pd.DataFrame({"rank": list(range(1, 21))})
+    for col in cot.intColumns:
+        temp_df[col] = 1
+    temp_df["symbol"] = symbol
+    return temp_df
+
+
+class TestRankSumBatch(unittest.TestCase):
+    """测试按交易所限制并发、失败单独列出及从本地仓库续采"""
+
+    def setUp(self):
+        self.exchange = FakeExchange(delay=0.01)
+        self.exchange.fail.add(("CFFEX", "20240103"))
+        # 交易所函数在请求失败时也可能返回空结果
+        self.exchange.empty.add(("DCE", "20240103"))
+
+    def _track(self, market, date, table_dict):
+        return self.exchange.request(market, date, table_dict, empty={})
+
+    def _patches(self):
+        def dce(date, vars_list):
+            return self._track(
+                "DCE", date.strftime("%Y%m%d"), {"m2405": _rank_table("M2405")}
+            )
+
+        def cffex(date, vars_list):
+            symbol = f"{vars_list[0]}2401"
+            return self._track(
+                "CFFEX", date.strftime("%Y%m%d"), {symbol: _rank_table(symbol)}
+            )
+
+        def gfex_contracts(symbol, date):
+            if ("GFEX", date) in self.exchange.empty:
+                return []
+            return [f"{symbol}2405", f"{symbol}2407"]
+
+        def gfex_data(symbol, contract_id, date):
+            return self._track("GFEX", date, _rank_table(contract_id.upper()))
+
+        return [
+            mock.patch.object(cot, "futures_dce_position_rank", dce),
+            mock.patch.object(cot, "get_cffex_rank_table", cffex),
+            mock.patch.object(cot, "__futures_gfex_contract_list", gfex_contracts),
+            mock.patch.object(cot, "__futures_gfex_contract_data", gfex_data),
+        ]
+
+    def _collect(self, store, start_day="20240102", end_day="20240103"):
+        patches = self._patches()
+        for patch in patches:
+            patch.start()
+        try:
+            return cot.get_rank_sum_batch(
+                start_day=start_day,
+                end_day=end_day,
+                vars_list=["M", "IF", "IH", "SI"],
+                max_concurrency={"cffex": 1},
+                store=store,
+            )
+        finally:
+            for patch in patches:
+                patch.stop()
+
+    def test_batch_resume(self):
+        """测试失败及结果为空的 (交易日, 交易所) 单独列出, 再次采集时只请求这些部分"""
+        with tempfile.TemporaryDirectory() as root:
+            temp_df, failed_df = self._collect(root)
+            self.assertEqual(
+                failed_df[["market", "date"]].values.tolist(),
+                [["DCE", "20240103"], ["CFFEX", "20240103"]],
+            )
+            self.assertEqual(failed_df["error"].iloc[0], "empty")
+            self.assertIn("timeout", failed_df["error"].iloc[1])
+            self.assertEqual(self.exchange.max_running["CFFEX"], 1)
+            # 20240103 的 IF 失败后, 同一交易所同一交易日排队中的 IH 不再请求
+            self.assertEqual(len(self.exchange.calls), 2 + 3 + 4)
+            self.assertEqual(
+                temp_df["date"].unique().tolist(), ["20240102", "20240103"]
+            )
+            self.assertEqual(
+                set(temp_df.loc[temp_df["date"] == "20240103", "variety"]), {"SI"}
+            )
+            # 合约行与品种合计行: 20240102 为 M2405、M; IF2401、IH2401、IF、IH; SI2405、SI2407
+            self.assertEqual((temp_df["date"] == "20240102").sum(), 8)
+
+            self.exchange.recover()
+            temp_df, failed_df = self._collect(LocalFrameStore(root))
+        self.assertTrue(failed_df.empty)
+        # 只重新采集失败的 (交易日, 交易所)
+        self.assertEqual(
+            sorted(self.exchange.calls),
+            [("CFFEX", "20240103"), ("CFFEX", "20240103"), ("DCE", "20240103")],
+        )
+        self.assertEqual(len(temp_df), 16)
+
+    def test_empty_before_start(self):
+        """测试交易所有数据之前的交易日结果为空不算失败"""
+        # 广期所尚无合约
+        self.exchange.empty.add(("GFEX", "20221221"))
+        temp_df, failed_df = self._collect(None, "20221221", "20221221")
+        self.assertEqual(failed_df["market"].tolist(), [])
+        self.assertEqual(set(temp_df["variety"]), {"M", "IF", "IH"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+期货日线行情多交易所并发获取单元测试
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from akshare.futures import futures_daily_bar
+from akshare.utils.local_store import LocalFrameStore
+from tests.futures_fakes import FakeExchange
+
+
+class TestFuturesDailyBatch(unittest.TestCase):
+    """测试只请求交易日、按交易所及日期排序合并并报告失败"""
+
+    def setUp(self):
+        self.exchange = FakeExchange()
+
+    def _fake_func(self, market):
+        def fetch(date):
+            temp_df = pd.DataFrame(
+                {"symbol": [f"{market}{date}", "efp"], "date": [date, date]}
+            )
+            # 交易所函数在请求失败时返回空表
+            return self.exchange.request(market, date, temp_df, empty=pd.DataFrame())
+
+        return fetch
+
+    def test_batch(self):
+        """测试结果与逐个交易所获取的顺序一致, 失败的单独列出"""
+        self.exchange.fail.add(("SHFE", "20240103"))
+        funcs = {market: self._fake_func(market) for market in ["CFFEX", "SHFE", "DCE"]}
+        with mock.patch.dict(futures_daily_bar.FUTURES_DAILY_FUNCS, funcs):
+            temp_df, failed_df = futures_daily_bar.get_futures_daily_batch(
+                start_date="20231229",
+                end_date="20240103",
+                market_list=["shfe", "CFFEX", "DCE"],
+                max_workers=4,
+                rate_limits={"SHFE": (100.0, 1.0)},
+            )
+        # 20231230 至 20240101 为非交易日, 不发出请求
+        self.assertEqual(len(self.exchange.calls), 9)
+        self.assertEqual(
+            temp_df["symbol"].tolist(),
+            ["SHFE20231229", "SHFE20240102"]
+            + [
+                f"{market}{date}"
+                for market in ["CFFEX", "DCE"]
+                for date in ["20231229", "20240102", "20240103"]
+            ],
+        )
+        self.assertEqual(
+            failed_df[["market", "date"]].values.tolist(), [["SHFE", "20240103"]]
+        )
+        self.assertIn("timeout", failed_df["error"].iloc[0])
+
+    def test_single_market(self):
+        """测试 get_futures_daily 同样只请求交易日"""
+        funcs = {"DCE": self._fake_func("DCE")}
+        with mock.patch.dict(futures_daily_bar.FUTURES_DAILY_FUNCS, funcs):
+            temp_df = futures_daily_bar.get_futures_daily(
+                start_date="20231229", end_date="20240102", market="dce"
+            )
+        self.assertEqual(
+            self.exchange.calls, [("DCE", "20231229"), ("DCE", "20240102")]
+        )
+        self.assertEqual(temp_df["symbol"].tolist(), ["DCE20231229", "DCE20240102"])
+        with self.assertRaises(ValueError):
+            futures_daily_bar.get_futures_daily_batch(market_list=["LME"])
+
+    def test_empty_reported(self):
+        """测试交易日返回空表时列为失败且不保存, 交易所成立前的空表不算失败"""
+        self.exchange.empty.update({("DCE", "20240102"), ("GFEX", "20221221")})
+        funcs = {market: self._fake_func(market) for market in ["DCE", "GFEX"]}
+        with tempfile.TemporaryDirectory() as root:
+            store = LocalFrameStore(root)
+            with mock.patch.dict(futures_daily_bar.FUTURES_DAILY_FUNCS, funcs):
+                temp_df, failed_df = futures_daily_bar.get_futures_daily_batch(
+                    "20221221", "20221222", market_list=["GFEX"], store=store
+                )
+                self.assertEqual(temp_df["symbol"].tolist(), ["GFEX20221222"])
+                self.assertTrue(failed_df.empty)
+                temp_df, failed_df = futures_daily_bar.get_futures_daily_batch(
+                    "20231229", "20240102", market_list=["DCE"], store=store
+                )
+                self.assertEqual(temp_df["symbol"].tolist(), ["DCE20231229"])
+                self.assertEqual(
+                    failed_df.values.tolist(), [["DCE", "20240102", "empty"]]
+                )
+                self.assertEqual(store.keys("futures_daily/DCE"), ["20231229"])
+                self.exchange.recover()
+                temp_df, failed_df = futures_daily_bar.get_futures_daily_batch(
+                    "20231229",
+                    "20240102",
+                    market_list=["DCE", "GFEX"],
+                    store=store,
+                    refresh_empty=False,
+                )
+        # DCE 只重新请求上次失败的交易日
+        self.assertCountEqual(
+            self.exchange.calls,
+            [("DCE", "20240102"), ("GFEX", "20231229"), ("GFEX", "20240102")],
+        )
+        self.assertTrue(failed_df.empty)
+        self.assertEqual(
+            temp_df["symbol"].tolist(),
+            [
+                "DCE20231229",
+                "DCE20240102",
+                "GFEX20231229",
+                "GFEX20240102",
+            ],
+        )
+
+    def test_store_refresh_empty(self):
+        """测试本地保存的空表默认重新获取, refresh_empty=False 时不再请求"""
+        funcs = {"GFEX": self._fake_func("GFEX")}
+        with tempfile.TemporaryDirectory() as root:
+            store = LocalFrameStore(root)
+            store.put("futures_daily/GFEX", "20221221", pd.DataFrame())
+            with mock.patch.dict(futures_daily_bar.FUTURES_DAILY_FUNCS, funcs):
+                futures_daily_bar.get_futures_daily_batch(
+                    "20221221",
+                    "20221221",
+                    market_list=["GFEX"],
+                    store=store,
+                    refresh_empty=False,
+                )
+                self.assertEqual(self.exchange.calls, [])
+                futures_daily_bar.get_futures_daily_batch(
+                    "20221221", "20221221", market_list=["GFEX"], store=store
+                )
+        self.assertEqual(self.exchange.calls, [("GFEX", "20221221")])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+注册仓单并发获取单元测试
+"""
+
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+import pandas as pd
+
+from akshare.futures import receipt
+from akshare.utils.local_store import LocalFrameStore
+from tests.futures_fakes import FakeExchange
+
+
+class TestReceipt(unittest.TestCase):
+    """测试按 (交易日, 交易所) 并发获取、按顺序合并、失败单独列出及本地缓存"""
+
+    def setUp(self):
+        self.exchange = FakeExchange()
+
+    def _fake_func(self, market):
+        def fetch(date, vars_list):
+            date = date.strftime("%Y%m%d")
+            temp_df = pd.DataFrame(
+                {
+                    "var": vars_list,
+                    "receipt": [1] * len(vars_list),
+                    "receipt_chg": [0] * len(vars_list),
+                    "date": date,
+                }
+            )
+            # 解析函数在请求失败时返回空表
+            return self.exchange.request(market, date, temp_df, empty=pd.DataFrame())
+
+        return fetch
+
+    def _get_receipt(self, vars_list, store=None, **kwargs):
+        funcs = {
+            "get_dce_receipt": self._fake_func("dce"),
+            "get_shfe_receipt_3": self._fake_func("shfe"),
+            "get_czce_receipt_3": self._fake_func("czce"),
+        }
+        with mock.patch.multiple(receipt, **funcs):
+            return receipt.get_receipt(
+                start_date="20251229",
+                end_date="20260105",
+                vars_list=vars_list,
+                store=store,
+                **kwargs,
+            )
+
+    def test_receipt(self):
+        """测试结果按日期及交易所排序, 已保存的 (交易日, 交易所) 不再请求"""
+        with tempfile.TemporaryDirectory() as root:
+            temp_df = self._get_receipt(["RB", "M", "CU"], store=root)
+            # 20251229 至 20260105 共 4 个交易日, 每个交易日请求大商所与上期所各一次
+            self.assertEqual(len(self.exchange.calls), 8)
+            self.assertEqual(temp_df["var"].tolist()[:4], ["M", "RB", "CU", "M"])
+            self.assertTrue(temp_df["date"].is_monotonic_increasing)
+
+            self.exchange.recover()
+            cached_df = self._get_receipt(["RB", "M"], store=root)
+            self.assertEqual(self.exchange.calls, [])
+            self.assertEqual(set(cached_df["var"]), {"RB", "M"})
+
+            # 本地没有 SR 所在的郑商所数据, 只请求郑商所
+            self._get_receipt(["RB", "SR"], store=root)
+            self.assertEqual({call[0] for call in self.exchange.calls}, {"czce"})
+            self.assertEqual(len(self.exchange.calls), 4)
+
+    def test_failed_and_empty(self):
+        """测试 return_failed 时出错及为空的单元单独列出且不保存, 下次获取时重新请求"""
+        self.exchange.fail.add(("shfe", "20251230"))
+        self.exchange.empty.add(("dce", "20251231"))
+        with tempfile.TemporaryDirectory() as root:
+            store = LocalFrameStore(root)
+            temp_df, failed_df = self._get_receipt(
+                ["RB", "M"], store=store, return_failed=True
+            )
+            self.assertEqual(
+                failed_df[["market", "date"]].values.tolist(),
+                [["shfe", "20251230"], ["dce", "20251231"]],
+            )
+            self.assertIn("timeout", failed_df["error"].iloc[0])
+            self.assertEqual(failed_df["error"].iloc[1], "empty")
+            self.assertEqual(len(temp_df), 8 - 2)
+            self.assertEqual(
+                store.keys("receipt/shfe"), ["20251229", "20251231", "20260105"]
+            )
+            self.assertEqual(
+                store.keys("receipt/dce"), ["20251229", "20251230", "20260105"]
+            )
+
+            self.exchange.recover()
+            temp_df, failed_df = self._get_receipt(
+                ["RB", "M"], store=store, return_failed=True
+            )
+            self.assertCountEqual(
+                self.exchange.calls, [("shfe", "20251230"), ("dce", "20251231")]
+            )
+            self.assertTrue(failed_df.empty)
+            self.assertEqual(len(temp_df), 8)
+
+    def test_default_raises(self):
+        """测试未设置 return_failed 时与以前一样抛出异常, 结果为空的部分以警告列出"""
+        self.exchange.fail.add(("shfe", "20251230"))
+        with self.assertRaises(ConnectionError):
+            self._get_receipt(["RB", "M"])
+
+        self.exchange.recover()
+        self.exchange.empty.add(("dce", "20251231"))
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            temp_df = self._get_receipt(["RB", "M"])
+        self.assertTrue(
+            any("仓单数据为空" in str(item.message) for item in warning_list)
+        )
+        self.assertEqual(len(temp_df), 8 - 1)
+
+    def test_store_refresh_empty(self):
+        """测试本地保存的空表默认重新获取, refresh_empty=False 时保留"""
+        with tempfile.TemporaryDirectory() as root:
+            store = LocalFrameStore(root)
+            empty_df = pd.DataFrame()
+            empty_df.attrs["vars_list"] = ["M"]
+            store.put("receipt/dce", "20260105", empty_df)
+            self._get_receipt(["M"], store=store, refresh_empty=False)
+            self.assertNotIn(("dce", "20260105"), self.exchange.calls)
+            self._get_receipt(["M"], store=store)
+            self.assertIn(("dce", "20260105"), self.exchange.calls)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+展期收益率面板计算单元测试
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from akshare.futures import futures_daily_bar, futures_roll_yield
+from akshare.utils.local_store import LocalFrameStore
+
+PANEL_DF = pd.DataFrame(
+    {
+        "date": ["20240102"] * 7 + ["20240103"] * 4,
+        "variety": ["RB", "RB", "RB", "SR", "SR", "IO", "IO"]
+        + ["RB", "RB", "CUefp", "AL"],
+        "symbol": [
+            "RB2405",
+            "RB2410",
+            "RB2401",
+            "SR405",
+            "SR409",
+            "IO2401-C-3000",
+            "IO2401-P-3000",
+            "RB2405",
+            "RB2410",
+            "CUefp",
+            "AL2402",
+        ],
+        "close": [3900, 3800, 3950, 6400, 6300, 10, 20, 3910, 3850, 70000, 19000],
+        "open_interest": [
+            2000000,
+            1000000,
+            10000,
+            500000,
+            600000,
+            100,
+            200,
+            1900000,
+            1100000,
+            10,
+            300000,
+        ],
+    }
+)
+
+
+class TestRollYieldPanel(unittest.TestCase):
+    """测试面板计算与逐个品种计算的结果一致"""
+
+    def test_parity(self):
+        """测试主力、次主力的选择及展期收益率与 get_roll_yield 一致"""
+        temp_df = futures_roll_yield.roll_yield_from_panel(PANEL_DF)
+        self.assertEqual(
+            temp_df[["date", "variety"]].values.tolist(),
+            [["20240102", "RB"], ["20240102", "SR"], ["20240103", "RB"]],
+        )
+        for row in temp_df.itertuples():
+            day_df = PANEL_DF[PANEL_DF["date"] == row.date]
+            ry, near_by, deferred = futures_roll_yield.get_roll_yield(
+                row.date, row.variety, df=day_df
+            )
+            self.assertAlmostEqual(row.roll_yield, ry)
+            self.assertEqual((row.near_by, row.deferred), (near_by, deferred))
+        self.assertEqual(temp_df["main"].tolist(), ["RB2405", "SR409", "RB2405"])
+        self.assertEqual(temp_df["months"].tolist(), [5, 4, 5])
+        # 郑商所 SR405 为 2024 年 5 月交割
+        self.assertEqual(temp_df["near_by_months"].tolist(), [4, 4, 4])
+
+    def test_store(self):
+        """测试日线数据保存在本地仓库后不再重复请求"""
+        calls = []
+
+        def fetch(date):
+            calls.append(date)
+            return PANEL_DF[PANEL_DF["date"] == date]
+
+        with tempfile.TemporaryDirectory() as root:
+            store = LocalFrameStore(root)
+            with mock.patch.dict(futures_daily_bar.FUTURES_DAILY_FUNCS, {"SHFE": fetch}):
+                first_df = futures_roll_yield.get_roll_yield_panel(
+                    "20240102", "20240103", market_list=["SHFE"], store=store
+                )
+                second_df = futures_roll_yield.get_roll_yield_panel(
+                    "20240102", "20240103", market_list=["SHFE"], store=root
+                )
+            self.assertEqual(sorted(calls), ["20240102", "20240103"])
+            self.assertEqual(store.keys("futures_daily/SHFE"), ["20240102", "20240103"])
+        pd.testing.assert_frame_equal(first_df, second_df)
+        self.assertEqual(len(first_df), 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+JS 上下文池单元测试
+"""
+
+import threading
+import unittest
+
+from akshare.utils.js_pool import JsContextPool, JsPoolTimeout, js_call
+
+
+class _FakeContext:
+    def __init__(self, source: str):
+        self.source = source
+
+    def call(self, name: str, *args):
+        if name == "boom":
+            raise RuntimeError("boom")
+        return f"{self.source}.{name}{args}"
+
+
+class TestJsContextPool(unittest.TestCase):
+    """测试上下文的借出、归还与复用"""
+
+    def setUp(self):
+        self.created = []
+
+        def factory(source):
+            ctx = _FakeContext(source)
+            self.created.append(ctx)
+            return ctx
+
+        self.pool = JsContextPool("ths", max_size=2, factory=factory)
+
+    def test_reuse(self):
+        """测试归还的上下文被复用, 脚本只 eval 一次"""
+        with self.pool.borrow() as first:
+            pass
+        with self.pool.borrow() as second:
+            self.assertIs(first, second)
+        self.assertEqual(self.pool.call("v", 1), "ths.v(1,)")
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.pool.idle, 1)
+
+    def test_max_size(self):
+        """测试上下文数量不超过上限, 超出时等待超时"""
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        self.assertIsNot(first, second)
+        with self.assertRaises(JsPoolTimeout):
+            self.pool.acquire(timeout=0.05)
+        self.pool.release(first)
+        self.assertIs(self.pool.acquire(timeout=0.05), first)
+
+    def test_discard_on_error(self):
+        """测试脚本执行出错时丢弃上下文"""
+        with self.assertRaises(RuntimeError):
+            self.pool.call("boom")
+        self.assertEqual(self.pool.size, 0)
+        self.pool.call("v")
+        self.assertEqual(len(self.created), 2)
+
+    def test_threads(self):
+        """测试多线程并发借用时同一上下文不会同时借给两个线程"""
+        in_use, errors = set(), []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                with self.pool.borrow() as ctx:
+                    with lock:
+                        if id(ctx) in in_use:
+                            errors.append(ctx)
+                        in_use.add(id(ctx))
+                    with lock:
+                        in_use.discard(id(ctx))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.created), 2)
+
+
+class TestBundledScripts(unittest.TestCase):
+    """测试内置脚本"""
+
+    def test_js_call(self):
+        """测试 ths.js 与 cninfo.js 可以通过上下文池调用"""
+        try:
+            import py_mini_racer  # noqa: F401
+        except ImportError:
+            self.skipTest("py_mini_racer 未安装")
+        self.assertTrue(js_call("ths.js", "v"))
+        self.assertTrue(js_call("cninfo.js", "getResCode1"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
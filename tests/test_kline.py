@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+东方财富 klines 解析单元测试
+"""
+
+import datetime
+import unittest
+
+import pandas as pd
+
+from akshare.utils.kline import parse_klines
+
+LINES = [
+    "2024-01-02,9.39,9.21,9.42,9.21,1158366,1075742252.45,2.30,-1.92,-0.18,0.60",
+    "2024-01-03,9.19,-,9.22,9.15,733610,673673613.92,0.76,,0.04,0.38",
+    "2024-01-04,9.19,9.11,abc,9.08,864510,790658064.65,1.63,-1.08,-0.10,0.45",
+]
+COLUMNS = [
+    "日期",
+    "开盘",
+    "收盘",
+    "最高",
+    "最低",
+    "成交量",
+    "成交额",
+    "振幅",
+    "涨跌幅",
+    "涨跌额",
+    "换手率",
+]
+
+
+def _split_parse(lines, columns, text_columns):
+    """原先逐行 split 再逐列 pd.to_numeric 的写法"""
+    temp_df = pd.DataFrame([item.split(",") for item in lines])
+    temp_df.columns = columns
+    for i, name in enumerate(columns):
+        if name not in text_columns:
+            temp_df.isetitem(i, pd.to_numeric(temp_df.iloc[:, i], errors="coerce"))
+    return temp_df
+
+
+class TestParseKlines(unittest.TestCase):
+    """测试 parse_klines 与原先 split 写法的结果一致"""
+
+    def test_same_as_split(self):
+        """测试 "-"、空值与非数字内容的处理"""
+        pd.testing.assert_frame_equal(
+            parse_klines(LINES, columns=COLUMNS, dtypes={"日期": "str"}),
+            _split_parse(LINES, COLUMNS, {"日期"}),
+        )
+
+    def test_duplicate_placeholder(self):
+        """测试重复的占位列名, 文本列保留原始内容"""
+        lines = [item + ",-,x" for item in LINES]
+        columns = COLUMNS + ["-", "-"]
+        pd.testing.assert_frame_equal(
+            parse_klines(lines, columns=columns, dtypes={"日期": "str", "-": "str"}),
+            _split_parse(lines, columns, {"日期", "-"}),
+        )
+
+    def test_date_kinds(self):
+        """测试 date 与 datetime 类型"""
+        temp_df = parse_klines(
+            ["2024-01-02 09:31,1.5", "2024-01-02 09:32,-"],
+            columns=["时间", "价格"],
+            dtypes={"时间": "datetime"},
+        )
+        self.assertEqual(temp_df["时间"].iloc[1], pd.Timestamp("2024-01-02 09:32"))
+        self.assertTrue(pd.isna(temp_df["价格"].iloc[1]))
+        temp_df = parse_klines(LINES, columns=COLUMNS, dtypes={"日期": "date"})
+        self.assertEqual(temp_df["日期"].iloc[0], datetime.date(2024, 1, 2))
+
+    def test_empty(self):
+        """测试空列表返回带列名的空表"""
+        temp_df = parse_klines([], columns=COLUMNS, dtypes={"日期": "str"})
+        self.assertTrue(temp_df.empty)
+        self.assertEqual(temp_df.columns.tolist(), COLUMNS)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+顶层接口懒加载单元测试
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import akshare
+from akshare._registry import EXPORTS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestLazyImport(unittest.TestCase):
+    """测试 akshare 顶层命名空间按需导入"""
+
+    def test_registry_up_to_date(self):
+        """测试注册表与 _api.py 一致"""
+        result = subprocess.run(
+            [sys.executable, "scripts/gen_lazy_registry.py", "--check"], cwd=ROOT
+        )
+        self.assertEqual(result.returncode, 0)
+
+    def test_import_is_lazy(self):
+        """测试 import akshare 不导入接口模块, 访问接口时只导入其所在模块"""
+        code = (
+            "import sys, akshare\n"
+            "assert 'akshare.stock_feature.stock_hist_em' not in sys.modules\n"
+            "assert 'bs4' not in sys.modules\n"
+            "akshare.stock_zh_a_hist\n"
+            "assert 'akshare.stock_feature.stock_hist_em' in sys.modules\n"
+            "assert 'akshare.bond.bond_gb_sina' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+    def test_namespace(self):
+        """测试 dir、__all__ 与属性访问"""
+        self.assertEqual(set(akshare.__all__), set(EXPORTS))
+        self.assertTrue(set(EXPORTS) <= set(dir(akshare)))
+        self.assertEqual(
+            akshare.bond_gb_zh_sina.__module__, "akshare.bond.bond_gb_sina"
+        )
+        self.assertIsNotNone(akshare.futures)
+        self.assertTrue({"stock", "futures", "utils"} <= set(dir(akshare)))
+        for name in ("importlib", "pkgutil", "TYPE_CHECKING"):
+            self.assertFalse(hasattr(akshare, name))
+        with self.assertRaises(AttributeError):
+            akshare.no_such_interface
+
+    def test_all_exports_resolve(self):
+        """测试注册表中的名称均可导入"""
+        namespace = {}
+        exec("from akshare import *", namespace)
+        self.assertTrue(set(EXPORTS) <= set(namespace))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
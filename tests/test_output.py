@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Arrow/Polars 输出格式单元测试
+"""
+
+import datetime
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+
+from akshare.utils import output as output_module
+from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
+from akshare.utils.output import filter_between, resolve_output, set_output_format
+
+KLINES = [
+    "2024-01-02,9.39,9.21,9.42,9.21,1158366,1075742252.45,2.24,-1.92,-0.18,0.60",
+    "2024-01-03,9.19,9.20,9.22,9.14,733610,673673613.92,0.87,-0.11,-0.01,-",
+    "2024-01-04,9.19,9.11,9.19,9.07,864017,787157364.77,1.30,-0.98,-0.09,0.45",
+]
+COLUMNS = ["日期", "开盘", "收盘", "最高", "最低", "成交量", "成交额", "振幅"]
+COLUMNS += ["涨跌幅", "涨跌额", "换手率"]
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def _fake_paginated_request(url, params, **kwargs):
+    page = int(params.get("pn", 1))
+    rows = [{"f3": 100 - page * 10 - i, "f12": f"{page}-{i}"} for i in range(2)]
+    if page == 3:
+        rows[0]["f3"] = "-"
+    return _FakeResponse({"data": {"total": 6, "diff": rows}})
+
+
+class TestOutput(unittest.TestCase):
+    """测试不经过 pandas 直接构建 Arrow 数据"""
+
+    def tearDown(self):
+        set_output_format("pandas")
+
+    def test_parse_klines(self):
+        """测试 K 线解析为 Arrow 数据, 与 pandas 结果一致"""
+        table = parse_klines(
+            KLINES, columns=COLUMNS, dtypes={"日期": "date"}, output="arrow"
+        )
+        self.assertEqual(table.schema.field("日期").type, pa.date32())
+        self.assertEqual(table.schema.field("成交量").type, pa.int64())
+        self.assertIsNone(table.column("换手率")[1].as_py())
+        temp_df = parse_klines(KLINES, columns=COLUMNS, dtypes={"日期": "date"})
+        pd.testing.assert_frame_equal(table.to_pandas(), temp_df, check_dtype=False)
+
+    def test_filter_between(self):
+        """测试按日期筛选包含两端, 与 pandas 的部分字符串切片一致"""
+        table = parse_klines(
+            KLINES, columns=COLUMNS, dtypes={"日期": "date"}, output="arrow"
+        )
+        table = filter_between(table, "日期", "20240103", "20240104")
+        self.assertEqual(
+            table.column("日期").to_pylist(),
+            [datetime.date(2024, 1, 3), datetime.date(2024, 1, 4)],
+        )
+        table = pa.table({"时间": ["2024-01-02 09:31", "2024-01-02 09:32", "-"]})
+        table = filter_between(table, "时间", "2024-01-02 09:31", "2024-01-02 09:31")
+        self.assertEqual(table.num_rows, 1)
+
+    def test_fetch_paginated_data(self):
+        """测试分页数据直接合并为 Arrow 数据, 排序及序号与 pandas 结果一致"""
+        with mock.patch(
+            "akshare.utils.func.request_with_retry", _fake_paginated_request
+        ):
+            table = fetch_paginated_data(
+                "https://example.com/api", {"pn": 1}, output="arrow"
+            )
+            temp_df = fetch_paginated_data("https://example.com/api", {"pn": 1})
+            # 未传入 output 时使用 set_output_format 中的设置
+            set_output_format("arrow")
+            default_table = fetch_paginated_data("https://example.com/api", {"pn": 1})
+            pandas_df = fetch_paginated_data(
+                "https://example.com/api", {"pn": 1}, output="pandas"
+            )
+        self.assertIsInstance(temp_df, pd.DataFrame)
+        self.assertTrue(default_table.equals(table))
+        self.assertIsInstance(pandas_df, pd.DataFrame)
+        self.assertIsInstance(table, pa.Table)
+        self.assertEqual(table.column_names, ["index", "f3", "f12"])
+        self.assertEqual(table.column("f12").to_pylist(), temp_df["f12"].tolist())
+        self.assertEqual(table.column("index").to_pylist(), list(range(1, 7)))
+        self.assertIsNone(table.column("f3")[-1].as_py())
+
+    def test_resolve_output(self):
+        """测试全局设置及缺少依赖时的报错"""
+        set_output_format("arrow")
+        self.assertEqual(resolve_output(), "arrow")
+        self.assertEqual(resolve_output("pandas"), "pandas")
+        with self.assertRaises(ValueError):
+            set_output_format("numpy")
+        with mock.patch.object(output_module, "pl", None):
+            with self.assertRaises(ImportError):
+                resolve_output("polars")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
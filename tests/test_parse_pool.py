@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+解析进程池单元测试
+"""
+
+import io
+import os
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from akshare.utils import parse_pool
+
+HTML_TEXT = (
+    "<table><tr><th>代码</th><th>名称</th></tr>"
+    + "".join(f"<tr><td>{i}</td><td>名称{i}</td></tr>" for i in range(200))
+    + "</table>"
+)
+
+
+class TestParsePool(unittest.TestCase):
+    """测试解析进程池及在当前线程解析的回退"""
+
+    def setUp(self):
+        self.workers = parse_pool._max_workers
+
+    def tearDown(self):
+        parse_pool.set_parse_workers(self.workers)
+
+    @unittest.skipIf("AKSHARE_PARSE_WORKERS" in os.environ, "已通过环境变量设置进程数")
+    def test_disabled_by_default(self):
+        """测试默认不启用进程池, 较大的数据也在当前线程解析"""
+        self.assertEqual(parse_pool.DEFAULT_PARSE_WORKERS, 0)
+        parse_pool.set_parse_workers(parse_pool.DEFAULT_PARSE_WORKERS)
+        with mock.patch.object(parse_pool, "INLINE_PARSE_SIZE", 0):
+            temp_df = parse_pool.read_html(HTML_TEXT)[0]
+        self.assertIsNone(parse_pool._executor)
+        self.assertEqual(temp_df.shape, (200, 2))
+        parse_pool.set_parse_workers()
+        self.assertEqual(parse_pool._max_workers, min(4, os.cpu_count() or 1))
+
+    def test_inline_small_payload(self):
+        """测试较小的数据不创建进程池"""
+        parse_pool.set_parse_workers(2)
+        temp_df = parse_pool.read_html(HTML_TEXT)[0]
+        self.assertIsNone(parse_pool._executor)
+        self.assertEqual(temp_df.shape, (200, 2))
+
+    def test_process_pool(self):
+        """测试较大的数据在子进程解析, 结果及异常与当前线程解析一致"""
+        parse_pool.set_parse_workers(1)
+        with mock.patch.object(parse_pool, "INLINE_PARSE_SIZE", 0):
+            temp_df = parse_pool.read_html(HTML_TEXT)[0]
+            self.assertIsNotNone(parse_pool._executor)
+            self.assertEqual(
+                parse_pool._executor._mp_context.get_start_method(), "forkserver"
+            )
+            with self.assertRaises(ValueError):
+                parse_pool.read_html("<p>没有表格</p>")
+        pd.testing.assert_frame_equal(temp_df, pd.read_html(io.StringIO(HTML_TEXT))[0])
+
+    def test_fallback(self):
+        """测试无法创建进程池时在当前线程解析"""
+        parse_pool.set_parse_workers(2)
+        with mock.patch.object(parse_pool, "INLINE_PARSE_SIZE", 0):
+            with mock.patch.object(
+                parse_pool, "ProcessPoolExecutor", side_effect=OSError("no semaphore")
+            ):
+                with self.assertWarns(UserWarning):
+                    temp_df = parse_pool.read_html(HTML_TEXT)[0]
+        self.assertEqual(temp_df.shape, (200, 2))
+        self.assertEqual(parse_pool._max_workers, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+按 host 令牌桶限速单元测试
+"""
+
+import unittest
+
+from akshare.utils.rate_limit import (
+    LocalTokenBucketBackend,
+    RateGovernor,
+)
+
+try:
+    import redis
+    from akshare.utils.rate_limit import RedisTokenBucketBackend
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class TestRateGovernor(unittest.TestCase):
+    """测试进程内令牌桶"""
+
+    def test_burst_then_wait(self):
+        """测试桶容量内不等待, 超出后按速率排队"""
+        backend = LocalTokenBucketBackend()
+        self.assertEqual(backend.reserve("host", rate=10, burst=2), 0)
+        self.assertEqual(backend.reserve("host", rate=10, burst=2), 0)
+        wait = backend.reserve("host", rate=10, burst=2)
+        self.assertAlmostEqual(wait, 0.1, delta=0.02)
+        wait = backend.reserve("host", rate=10, burst=2)
+        self.assertAlmostEqual(wait, 0.2, delta=0.02)
+
+    def test_suffix_rule(self):
+        """测试规则按域名后缀匹配, 未配置的 host 不限速"""
+        governor = RateGovernor(limits={"eastmoney.com": (5, 5)})
+        self.assertEqual(
+            governor.get_limit("push2.eastmoney.com"), ("eastmoney.com", 5, 5)
+        )
+        self.assertIsNone(governor.get_limit("hq.sinajs.cn"))
+        governor.configure("hq.sinajs.cn", 2)
+        self.assertEqual(governor.get_limit("hq.sinajs.cn"), ("hq.sinajs.cn", 2, 2))
+        governor.configure("hq.sinajs.cn", None)
+        self.assertEqual(governor.acquire("https://hq.sinajs.cn/list=sh600000"), 0)
+
+    def test_acquire_waits(self):
+        """测试 acquire 实际阻塞等待"""
+        governor = RateGovernor(limits={"example.com": (20, 1)})
+        governor.acquire("https://example.com/a")
+        self.assertGreater(governor.acquire("https://example.com/b"), 0)
+
+
+@unittest.skipIf(not REDIS_AVAILABLE, "Redis not available")
+class TestRedisTokenBucket(unittest.TestCase):
+    """测试 Redis 共享令牌桶"""
+
+    def setUp(self):
+        self.client = redis.from_url("redis://localhost:6379/15")
+        try:
+            self.client.ping()
+        except Exception:
+            self.skipTest("Redis server not running")
+        self.client.delete("test_rl:rl:host")
+
+    def tearDown(self):
+        self.client.delete("test_rl:rl:host")
+
+    def test_shared_budget(self):
+        """测试两个后端实例共享同一份额度"""
+        first = RedisTokenBucketBackend(redis_client=self.client, prefix="test_rl")
+        second = RedisTokenBucketBackend(redis_client=self.client, prefix="test_rl")
+        self.assertEqual(first.reserve("host", rate=10, burst=1), 0)
+        self.assertGreater(second.reserve("host", rate=10, burst=1), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
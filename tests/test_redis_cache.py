@@ -4,6 +4,7 @@
 Redis Cache 单元测试
 """
 
+import threading
 import unittest
 import time
 import pandas as pd
@@ -13,7 +14,9 @@ from unittest.mock import patch
 try:
     import redis
     from akshare.utils.redis_cache import (
+        LocalLRU,
         RedisLRUCache, 
+        SingleFlight,
         lru_cache, 
         cached_function,
         configure_default_cache,
@@ -258,6 +261,369 @@ class TestCachedFunction(unittest.TestCase):
         self.assertEqual(call_count, 1)  # 不应该重新调用
 
 
+@unittest.skipIf(not REDIS_AVAILABLE, "Redis not available")
+class TestSingleFlight(unittest.TestCase):
+    """测试缓存失效时的单飞（防击穿）"""
+
+    def setUp(self):
+        self.cache = RedisLRUCache(
+            redis_url='redis://localhost:6379/15',
+            prefix='test_single_flight',
+            max_age=10,
+            func_key='slow',
+        )
+
+    def tearDown(self):
+        try:
+            self.cache.clear_prefix()
+        except Exception:
+            pass
+
+    def _run_concurrently(self, funcs):
+        results = []
+        threads = [
+            threading.Thread(target=lambda f=f: results.append(f())) for f in funcs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_threads_share_one_call(self):
+        """测试同进程多线程只执行一次"""
+        call_count = 0
+
+        @lru_cache(cache_instance=self.cache)
+        def slow_function():
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.3)
+            return "value"
+
+        results = self._run_concurrently([slow_function] * 8)
+        self.assertEqual(results, ["value"] * 8)
+        self.assertEqual(call_count, 1)
+
+    def test_workers_share_one_call(self):
+        """测试共享 Redis 的多个 worker（独立装饰器实例）只执行一次"""
+        call_count = 0
+
+        def slow_function():
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.3)
+            return "value"
+
+        workers = [
+            lru_cache(cache_instance=self.cache)(slow_function) for _ in range(4)
+        ]
+        results = self._run_concurrently(workers)
+        self.assertEqual(results, ["value"] * 4)
+        self.assertEqual(call_count, 1)
+
+    def test_waiters_get_copies(self):
+        """测试等待的线程各自得到结果的副本, 修改返回值不影响其他调用方"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def load():
+            started.set()
+            time.sleep(0.3)
+            return pd.DataFrame({'value': [1, 2]})
+
+        def call():
+            temp_df = flight.do('key', load)
+            before = temp_df['value'].tolist()
+            temp_df.loc[0, 'value'] += 100
+            return before, temp_df
+
+        def wait_then_call():
+            started.wait()
+            return call()
+
+        results = self._run_concurrently([call, wait_then_call, wait_then_call])
+        self.assertEqual(len({id(temp_df) for _, temp_df in results}), 3)
+        self.assertEqual([before for before, _ in results], [[1, 2]] * 3)
+
+    def test_error_propagates(self):
+        """测试异常传递给所有等待线程且锁被释放"""
+        @lru_cache(cache_instance=self.cache)
+        def failing_function():
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                failing_function()
+            except ValueError as e:
+                errors.append(e)
+
+        self._run_concurrently([call] * 3)
+        self.assertEqual(len(errors), 3)
+        key = self.cache._generate_cache_key(failing_function.__wrapped__, (), {})
+        self.assertFalse(self.cache.is_locked(key))
+
+
+@unittest.skipIf(not REDIS_AVAILABLE, "Redis not available")
+class TestTwoTierCache(unittest.TestCase):
+    """测试进程内 L1 缓存"""
+
+    def setUp(self):
+        self.writer = RedisLRUCache(
+            redis_url='redis://localhost:6379/15',
+            prefix='test_l1',
+            max_age=10,
+            l1_max_bytes=1 << 20,
+        )
+        self.reader = RedisLRUCache(
+            redis_url='redis://localhost:6379/15',
+            prefix='test_l1',
+            max_age=10,
+            l1_max_bytes=1 << 20,
+        )
+
+    def tearDown(self):
+        try:
+            self.writer.clear_prefix()
+        except Exception:
+            pass
+
+    def test_l1_hit_returns_copy(self):
+        """测试 L1 命中时不访问 Redis 且返回独立副本"""
+        df = pd.DataFrame({'code': ['000001', '600000'], 'value': [1, 2]})
+        self.writer.set('test_l1:df', df)
+        first = self.reader.get('test_l1:df')
+        with patch.object(self.reader, '_get_redis_client') as mock_client:
+            second = self.reader.get('test_l1:df')
+            mock_client.assert_not_called()
+        pd.testing.assert_frame_equal(second, df)
+        second.loc[0, 'value'] = 100
+        pd.testing.assert_frame_equal(self.reader.get('test_l1:df'), first)
+
+    def test_l1_ttl_capped_by_redis(self):
+        """测试 L1 过期时间不超过 Redis 剩余时间"""
+        self.writer.set('test_l1:short', 'value', expire=1)
+        self.assertEqual(self.reader.get('test_l1:short'), 'value')
+        time.sleep(1.2)
+        self.assertIsNone(self.reader.get('test_l1:short'))
+
+    def test_clear_invalidates_other_process(self):
+        """测试 cache_clear 通过 pub/sub 清除其他进程的 L1"""
+        self.writer.set('test_l1:key', 'old')
+        self.assertEqual(self.reader.get('test_l1:key'), 'old')
+        time.sleep(0.2)  # 等待订阅建立
+        self.writer.clear_prefix()
+        time.sleep(0.2)
+        self.assertIsNone(self.reader.get('test_l1:key'))
+
+    def test_bypass_l1_until_subscribed(self):
+        """测试订阅失败时不使用 L1, 且不会每次读取都重新订阅"""
+        self.writer.set('test_l1:key', 'old')
+        client = self.reader._get_redis_client()
+        with patch.object(client, 'pubsub', side_effect=ConnectionError('down')) as mock_pubsub:
+            self.assertEqual(self.reader.get('test_l1:key'), 'old')
+            self.writer.clear_prefix()
+            self.assertIsNone(self.reader.get('test_l1:key'))
+            self.assertEqual(mock_pubsub.call_count, 1)
+        self.assertEqual(len(self.reader.l1._entries), 0)
+
+    def test_invalidation_during_read(self):
+        """测试读取 Redis 期间收到失效通知时, 读到的旧值不写入 L1"""
+        self.writer.set('test_l1:key', 'old')
+        self.reader.get('test_l1:missing')  # 建立订阅
+        deserialize = self.reader.deserialize
+
+        def racing_deserialize(data):
+            self.reader.l1.invalidate('test_l1:*')
+            return deserialize(data)
+
+        with patch.object(self.reader, 'deserialize', side_effect=racing_deserialize):
+            self.assertEqual(self.reader.get('test_l1:key'), 'old')
+        self.assertIsNone(self.reader.l1.get('test_l1:key'))
+
+    def test_local_lru_byte_bound(self):
+        """测试 L1 按字节数淘汰最久未使用的条目"""
+        l1 = LocalLRU(max_bytes=100)
+        l1.set('a', 'A', nbytes=40, ttl=10)
+        l1.set('b', 'B', nbytes=40, ttl=10)
+        l1.get('a')
+        l1.set('c', 'C', nbytes=40, ttl=10)
+        self.assertEqual(l1.get('a'), 'A')
+        self.assertIsNone(l1.get('b'))
+        self.assertLessEqual(l1.current_bytes, 100)
+
+
+try:
+    import pyarrow  # noqa: F401
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+
+@unittest.skipIf(not (REDIS_AVAILABLE and ARROW_AVAILABLE), "pyarrow not available")
+class TestArrowSerializer(unittest.TestCase):
+    """测试 Arrow IPC 列式序列化"""
+
+    def setUp(self):
+        self.cache = RedisLRUCache(
+            redis_url='redis://localhost:6379/15',
+            prefix='test_arrow',
+            max_age=10,
+            serialize_method='arrow',
+        )
+
+    def test_dataframe_round_trip(self):
+        """测试 DataFrame 以 Arrow 格式写入并完整读回"""
+        df = pd.DataFrame(
+            {'代码': ['000001', '600000'], '名称': ['平安银行', '浦发银行'], '最新价': [10.5, None]},
+            index=[3, 4],
+        )
+        payload = self.cache.serialize(df)
+        self.assertEqual(payload[:1], b'A')
+        pd.testing.assert_frame_equal(self.cache.deserialize(payload), df)
+
+    def test_pickle_fallback(self):
+        """测试非 DataFrame 及无法转为 Arrow 的数据回退到 pickle"""
+        mixed = pd.DataFrame({'x': [1, 'a']})
+        for value in [{'000001': 0}, mixed]:
+            payload = self.cache.serialize(value)
+            self.assertEqual(payload[:1], b'P')
+        self.assertEqual(self.cache.deserialize(self.cache.serialize({'a': 1})), {'a': 1})
+
+    def test_reads_legacy_pickle(self):
+        """测试可读取 pickle 序列化方式写入的旧缓存"""
+        legacy = RedisLRUCache(redis_url='redis://localhost:6379/15', prefix='test_arrow')
+        df = pd.DataFrame({'a': [1, 2]})
+        pd.testing.assert_frame_equal(self.cache.deserialize(legacy.serialize(df)), df)
+
+
+@unittest.skipIf(not REDIS_AVAILABLE, "Redis not available")
+class TestCacheObservability(unittest.TestCase):
+    """测试缓存统计与按函数清除"""
+
+    def setUp(self):
+        self.cache = RedisLRUCache(
+            redis_url='redis://localhost:6379/15',
+            prefix='test_stats',
+            max_age=10,
+        )
+
+    def tearDown(self):
+        try:
+            self.cache.clear_prefix()
+        except Exception:
+            pass
+
+    def test_counters(self):
+        """测试命中、未命中和字节数统计"""
+        @lru_cache(cache_instance=self.cache, func_key='stats:square')
+        def square(x):
+            return x * x
+
+        square(3)
+        square(3)
+        square(4)
+        info = square.cache_info()
+        self.assertEqual(info['func_id'], 'stats:square')
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 2)
+        self.assertEqual(info['loads'], 2)
+        self.assertGreater(info['bytes_written'], 0)
+        self.assertAlmostEqual(info['hit_rate'], 1 / 3)
+
+    def test_cache_clear_only_own_keys(self):
+        """测试 cache_clear 只清除本函数的键"""
+        @lru_cache(cache_instance=self.cache, func_key='stats:a')
+        def func_a(x):
+            return x
+
+        @lru_cache(cache_instance=self.cache, func_key='stats:ab')
+        def func_ab(x):
+            return x
+
+        func_a(1)
+        func_ab(1)
+        func_a.cache_clear()
+        keys = [key.decode() for key in self.cache.scan_keys()]
+        self.assertEqual(len(keys), 1)
+        self.assertTrue(keys[0].startswith('test_stats:stats:ab:'))
+
+    def test_cache_clear_keeps_locks(self):
+        """测试 cache_clear 不删除正在重算的锁"""
+        @lru_cache(cache_instance=self.cache, func_key='stats:locked')
+        def func_locked(x):
+            return x
+
+        func_locked(1)
+        key = 'test_stats:stats:locked:pending'
+        token = self.cache.acquire_lock(key, 30)
+        self.assertTrue(token)
+        try:
+            self.assertEqual(func_locked.cache_clear(), 1)
+            self.assertTrue(self.cache.is_locked(key))
+            self.assertIsNone(self.cache.acquire_lock(key, 30))
+        finally:
+            self.cache.release_lock(key, token)
+        self.assertFalse(self.cache.is_locked(key))
+
+    def test_clear_prefix_in_batches(self):
+        """测试 SCAN + UNLINK 分批清除"""
+        for i in range(25):
+            self.cache.set(f'test_stats:batch:{i}', i)
+        self.assertEqual(self.cache.clear_prefix('test_stats:batch:*', batch_size=10), 25)
+        self.assertEqual(list(self.cache.scan_keys('test_stats:batch:*')), [])
+
+
+@unittest.skipIf(not REDIS_AVAILABLE, "Redis not available")
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """测试过期后先返回旧值并后台刷新"""
+
+    def setUp(self):
+        self.cache = RedisLRUCache(
+            redis_url='redis://localhost:6379/15',
+            prefix='test_swr',
+            max_age=1,
+        )
+
+    def tearDown(self):
+        try:
+            self.cache.clear_prefix()
+        except Exception:
+            pass
+
+    def test_stale_value_then_refresh(self):
+        """测试软过期后立即返回旧值, 后台只刷新一次"""
+        call_count = 0
+
+        @lru_cache(cache_instance=self.cache, func_key='swr', stale_ttl=10)
+        def slow_function():
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.2)
+            return call_count
+
+        self.assertEqual(slow_function(), 1)
+        time.sleep(1.1)
+        results = []
+        for _ in range(5):
+            start = time.monotonic()
+            results.append(slow_function())
+            # 旧值直接返回, 不等待 0.2 秒的重新计算
+            self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(results, [1] * 5)
+        # 等待后台刷新写入新值
+        deadline = time.monotonic() + 5
+        while slow_function.cache_info()['refreshes'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(slow_function(), 2)
+        self.assertEqual(call_count, 2)
+        self.assertEqual(slow_function.cache_info()['refreshes'], 1)
+
+
 class TestFallbackBehavior(unittest.TestCase):
     """测试降级行为（当Redis不可用时）"""
     
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+宽松 JSON 解析单元测试
+"""
+
+import math
+import unittest
+
+from akshare.utils import demjson, relaxed_json
+
+
+class TestRelaxedJson(unittest.TestCase):
+    """测试与 demjson 的解析结果一致"""
+
+    def test_sina_spot(self):
+        """测试新浪行情中未加引号的键"""
+        text = (
+            '[{symbol:"sh600000",code:"600000",name:"浦发银行",trade:"10.340",'
+            "pricechange:-0.05,changepercent:-0.481,volume:25146834,per:5.1},"
+            '{symbol:"sh600004",name:"白云\\"机场",ticktime:"15:00:00",pb:.44}]'
+        )
+        self.assertEqual(relaxed_json.decode(text), demjson.decode(text))
+
+    def test_relaxed_syntax(self):
+        """测试单引号、尾随逗号、undefined、十六进制和 NaN"""
+        result = relaxed_json.decode(
+            "{a:'it\\'s \"ok\"', b:[1,2,], c:undefined, $d:0x1F, e:NaN, "
+            '"f":{"g":"x,h:1"},}'
+        )
+        self.assertEqual(result["a"], 'it\'s "ok"')
+        self.assertEqual(result["b"], [1, 2])
+        self.assertIsNone(result["c"])
+        self.assertEqual(result["$d"], 31)
+        self.assertTrue(math.isnan(result["e"]))
+        self.assertEqual(result["f"], {"g": "x,h:1"})
+
+    def test_numbers(self):
+        """测试正号、指数等数字与 demjson 的取值和类型一致"""
+        text = "[+1, +1.5, +0, -0, 1e3, +2E2, 1.5e1, 1e-1, 1., .5, -.5, +0x10]"
+        result = relaxed_json.decode(text)
+        expected = demjson.decode(text)
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            [type(value) for value in result], [type(value) for value in expected]
+        )
+        self.assertEqual(relaxed_json.decode("{a:+1}"), {"a": 1})
+        self.assertIsInstance(relaxed_json.decode("{a:+1}")["a"], int)
+
+    def test_jsonp(self):
+        """测试 JSONP 回调和 var 赋值包装"""
+        self.assertEqual(
+            relaxed_json.decode(
+                "/*<script>location.href='//sina.com';</script>*/\n"
+                "IO.XSRV2.CallbackList['abc']({a:1,b:\"(x)\"});"
+            ),
+            {"a": 1, "b": "(x)"},
+        )
+        self.assertEqual(relaxed_json.decode("var data = [1, 2];\n"), [1, 2])
+
+    def test_fallback(self):
+        """测试注释等少见语法退回 demjson"""
+        self.assertEqual(relaxed_json.decode("{a:1 // comment\n}"), {"a": 1})
+        self.assertEqual(relaxed_json.decode('{"a":007}'), {"a": 7})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+紧凑类型输出单元测试
+"""
+
+import datetime
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from akshare.utils.context import config
+from akshare.utils.func import paginated
+from akshare.utils.schema import compact_dtypes, set_compact_dtypes, typed_output
+
+KLINE_DF = pd.DataFrame(
+    {
+        "日期": [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)],
+        "股票代码": ["000001", "000001"],
+        "开盘": [9.39, 1785.12],
+        "成交量": [1158366.0, 733610.0],
+        "成交额": [1075742252.45, 673673613.92],
+        "换手率": [0.6, np.nan],
+    }
+)
+
+
+class TestCompactDtypes(unittest.TestCase):
+    """测试按字段类型转换为紧凑类型"""
+
+    def tearDown(self):
+        set_compact_dtypes(False)
+
+    def test_compact(self):
+        """测试标签、整数、浮点数与日期的转换"""
+        temp_df = compact_dtypes(KLINE_DF, "stock_zh_a_hist", label_dtype="category")
+        self.assertEqual(temp_df["日期"].dtype.kind, "M")
+        self.assertEqual(temp_df["股票代码"].dtype, "category")
+        self.assertEqual(temp_df["开盘"].dtype, "float32")
+        self.assertEqual(temp_df["成交量"].dtype, "Int64")
+        self.assertEqual(temp_df["换手率"].dtype, "float32")
+        # 不在 schema 中的字段保持不变
+        self.assertEqual(temp_df["成交额"].dtype, "float64")
+        self.assertEqual(KLINE_DF["开盘"].dtype, "float64")
+        np.testing.assert_allclose(temp_df["开盘"], KLINE_DF["开盘"], atol=5e-4)
+
+    def test_fixed_dtypes(self):
+        """测试转换后的类型与取值无关"""
+        schema = {"a": "int", "b": "float32", "c": "label"}
+        small_df = pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5], "c": ["x", "y"]})
+        large_df = pd.DataFrame(
+            {"a": [3e9, np.nan], "b": ["-", 12345678.9], "c": ["z", "z"]}
+        )
+        small_df = compact_dtypes(small_df, schema)
+        large_df = compact_dtypes(large_df, schema)
+        pd.testing.assert_series_equal(small_df.dtypes, large_df.dtypes)
+        self.assertEqual(large_df["a"].tolist(), [3000000000, pd.NA])
+        self.assertTrue(np.isnan(large_df["b"].iloc[0]))
+        self.assertEqual(pd.concat([small_df, large_df])["c"].dtype.name, "string")
+        with self.assertRaises(ValueError):
+            compact_dtypes(pd.DataFrame({"a": [1.5]}), schema)
+
+    def test_typed_output(self):
+        """测试默认关闭, 开启后接口及其 iter_pages 均返回紧凑类型"""
+
+        @typed_output
+        @paginated
+        def stock_zh_a_hist():
+            yield KLINE_DF.iloc[:1]
+            yield KLINE_DF.iloc[1:]
+
+        pd.testing.assert_frame_equal(stock_zh_a_hist(), KLINE_DF)
+        set_compact_dtypes(True)
+        self.assertEqual(config.label_dtype, "string")
+        self.assertEqual(stock_zh_a_hist()["开盘"].dtype, "float32")
+        self.assertEqual(stock_zh_a_hist()["股票代码"].dtype.name, "string")
+        # 各页类型一致, category 设置下标签列同样为 Arrow 字符串
+        set_compact_dtypes(True, label_dtype="category")
+        self.assertEqual(stock_zh_a_hist()["股票代码"].dtype, "category")
+        first_df, second_df = stock_zh_a_hist.iter_pages()
+        pd.testing.assert_series_equal(first_df.dtypes, second_df.dtypes)
+        self.assertEqual(first_df["股票代码"].dtype.name, "string")
+        self.assertEqual(first_df["成交量"].dtype, "Int64")
+        with self.assertRaises(ValueError):
+            set_compact_dtypes(True, label_dtype="object")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
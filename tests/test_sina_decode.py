@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+新浪历史行情位流解码单元测试
+"""
+
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from akshare.utils.sina_decode import hk_js_decode_columns, hk_js_decode_frame
+
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+def _field(value: int, width: int) -> list:
+    value &= (1 << width) - 1
+    return [(value >> i) & 1 for i in range(width)]
+
+
+def _kline_payload(rows: int, seed: int) -> str:
+    """构造 3466 类型(日 K 线)的位流: 每行 开高低收 9 位、量额 15 位, 以 11000 结束"""
+    rng = random.Random(seed)
+    bits = _field(3466, 12) + _field(63, 6)
+    for _ in range(rows):
+        bits += [0]
+        for width, low, high in ((9, -200, 200),) * 4 + ((15, -2000, 2000),) * 2:
+            bits += _field(rng.randint(low, high), width)
+    bits += [1, 1, 0, 0, 0]
+    return _encode(bits)
+
+
+def _random_payload(type_code: int, seed: int) -> str:
+    """构造指定类型的位流: 类型头之后为随机位"""
+    rng = random.Random(seed)
+    bits = _field(type_code, 12) + _field(63, 6)
+    if type_code == 197:
+        # 列数为 0 时原脚本不会结束, 这里保证至少 1 列
+        bits += _field(rng.randint(1, 5), 6)
+    bits += [rng.randint(0, 1) for _ in range(rng.randint(40, 400))]
+    return _encode(bits)
+
+
+def _encode(bits: list) -> str:
+    bits = bits + [0] * (-len(bits) % 6)
+    return "".join(
+        _ALPHABET[sum(bit << j for j, bit in enumerate(bits[i : i + 6]))]
+        for i in range(0, len(bits), 6)
+    )
+
+
+def _js_frame(js_code, text: str, date_column="date") -> pd.DataFrame:
+    """按原 JS 解码, 并转换为与 hk_js_decode_frame 相同的列类型"""
+    temp_df = pd.DataFrame(js_code.call("d", text))
+    for column in temp_df.columns:
+        if column == date_column:
+            temp_df[column] = (
+                pd.to_datetime(temp_df[column])
+                .dt.tz_localize(None)
+                .astype("datetime64[ms]")
+            )
+        else:
+            temp_df[column] = temp_df[column].astype("float64")
+    return temp_df
+
+
+class TestHkJsDecode(unittest.TestCase):
+    """测试 hk_js_decode 的 Python 实现"""
+
+    def test_kline(self):
+        """测试日 K 线解码结果"""
+        temp_df = hk_js_decode_frame("K2/4bkGGWJivE6VDhNnUwpAh8b0YgPGdPDPWYA")
+        self.assertEqual(
+            temp_df.columns.tolist(),
+            ["date", "open", "high", "low", "close", "volume", "amount"],
+        )
+        self.assertEqual(
+            temp_df["date"].dt.strftime("%Y-%m-%d").tolist(),
+            ["1990-12-20", "1990-12-21", "1990-12-24"],
+        )
+        np.testing.assert_allclose(temp_df["open"], [-1.32, -2.47, -2.99])
+        np.testing.assert_allclose(temp_df["high"], [0.13, np.nan, -2.75])
+        np.testing.assert_allclose(temp_df["amount"], [265, 179, -3655])
+
+    def test_columns(self):
+        """测试按列返回 numpy 数组"""
+        columns = hk_js_decode_columns(_kline_payload(20, 3))
+        self.assertEqual(columns["date"].dtype, np.dtype("datetime64[ms]"))
+        self.assertEqual(columns["close"].dtype, np.dtype("float64"))
+        self.assertEqual(len(columns["close"]), 20)
+
+    def test_unknown_type(self):
+        """测试未知类型返回空表"""
+        self.assertTrue(hk_js_decode_frame("AAAA").empty)
+
+    def test_same_as_js(self):
+        """测试与原 JS 解码结果一致"""
+        try:
+            import py_mini_racer
+        except ImportError:
+            self.skipTest("py_mini_racer 未安装")
+        from akshare.stock.cons import hk_js_decode
+
+        js_code = py_mini_racer.MiniRacer()
+        js_code.eval(hk_js_decode)
+        for seed in range(5):
+            text = _kline_payload(200, seed)
+            pd.testing.assert_frame_equal(
+                hk_js_decode_frame(text), _js_frame(js_code, text), check_dtype=False
+            )
+
+    def test_other_types_same_as_js(self):
+        """测试其余类型与 hk_js_decode 及 zh_js_decode 的解码结果一致"""
+        try:
+            import py_mini_racer
+        except ImportError:
+            self.skipTest("py_mini_racer 未安装")
+        from akshare.stock.cons import hk_js_decode, zh_js_decode
+
+        for type_code in (1479, 136, 200, 139, 197):
+            compared = 0
+            for seed in range(20):
+                with self.subTest(type_code=type_code, seed=seed):
+                    text = _random_payload(type_code, seed)
+                    frames = []
+                    for source in (hk_js_decode, zh_js_decode):
+                        js_code = py_mini_racer.MiniRacer()
+                        js_code.eval(source)
+                        try:
+                            frames.append(
+                                _js_frame(
+                                    js_code, text, 0 if type_code == 139 else "date"
+                                )
+                            )
+                        except Exception:
+                            # 原脚本对部分随机位流会抛错
+                            frames.append(None)
+                    if frames[0] is None:
+                        self.assertIsNone(frames[1])
+                        continue
+                    pd.testing.assert_frame_equal(frames[0], frames[1])
+                    if frames[0].empty:
+                        continue
+                    pd.testing.assert_frame_equal(
+                        hk_js_decode_frame(text),
+                        frames[0],
+                        check_dtype=False,
+                        check_column_type=False,
+                    )
+                    compared += 1
+            self.assertGreater(compared, 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
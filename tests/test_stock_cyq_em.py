@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+筹码分布计算单元测试
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from akshare.stock_feature import stock_cyq_em as cyq
+
+KLINE = pd.DataFrame(
+    {
+        "date": [f"2020-01-{day:02d}" for day in range(1, 13)],
+        "open": [10.01, 9.97, 10.0, 9.9, 9.61, 9.5, 9.38, 9.69, 9.54, 9.58, 9.58, 9.79],
+        "close": [
+            10.02,
+            10.04,
+            9.75,
+            9.78,
+            9.73,
+            9.56,
+            9.41,
+            9.77,
+            9.63,
+            9.53,
+            9.8,
+            9.69,
+        ],
+        "high": [
+            10.02,
+            10.13,
+            10.06,
+            9.91,
+            9.75,
+            9.57,
+            9.53,
+            9.78,
+            9.76,
+            9.73,
+            9.89,
+            9.81,
+        ],
+        "low": [9.95, 9.77, 9.68, 9.66, 9.6, 9.45, 9.36, 9.63, 9.54, 9.46, 9.44, 9.62],
+        "hsl": [1.07, 1.81, 4.51, 3.38, 1.35, 1.26, 1.5, 5.05, 1.14, 1.39, 2.71, 0.0],
+    }
+)
+
+# 东方财富 CYQCalculator(JS) 对 KLINE 最后 3 天的计算结果
+EXPECTED = {
+    None: [
+        [
+            0.12556055409486644,
+            9.73,
+            9.46,
+            10.0,
+            0.027749229188078154,
+            9.56,
+            9.92,
+            0.01848049281314175,
+        ],
+        [
+            0.7013538925502963,
+            9.72,
+            9.47,
+            9.99,
+            0.0267214799588901,
+            9.56,
+            9.9,
+            0.017471736896197323,
+        ],
+        [
+            0.3934932975185453,
+            9.72,
+            9.47,
+            9.99,
+            0.0267214799588901,
+            9.56,
+            9.9,
+            0.017471736896197323,
+        ],
+    ],
+    5: [
+        [
+            0.25700738911229154,
+            9.66,
+            9.42,
+            9.75,
+            0.01721439749608764,
+            9.49,
+            9.73,
+            0.012486992715920835,
+        ],
+        [
+            0.9819031410605233,
+            9.68,
+            9.43,
+            9.76,
+            0.017196456487754044,
+            9.52,
+            9.74,
+            0.011422637590861925,
+        ],
+        [
+            0.5462991975209791,
+            9.69,
+            9.54,
+            9.77,
+            0.011910926980838966,
+            9.59,
+            9.74,
+            0.00775995861355408,
+        ],
+    ],
+}
+
+
+class TestCyqCompute(unittest.TestCase):
+    """测试向量化筹码分布与原 JS 实现一致"""
+
+    def test_same_as_js(self):
+        """测试全部历史与指定 lookback 的结果"""
+        for lookback, expected in EXPECTED.items():
+            temp_df = cyq._cyq_compute([KLINE], lookback=lookback)[0]
+            self.assertEqual(len(temp_df), len(KLINE))
+            np.testing.assert_array_equal(
+                temp_df.iloc[-3:, 1:].to_numpy(dtype="float64"), expected
+            )
+
+    def test_to_precision12(self):
+        """测试 12 位有效数字舍入, 正好一半时取较大值"""
+        values = np.array([0.0, 86481754083.25, 1.0000000000005, -2.5e-5, 1 / 3])
+        np.testing.assert_array_equal(
+            cyq._to_precision12(values),
+            [0.0, 86481754083.3, 1.00000000000, -2.5e-5, 0.333333333333],
+        )
+
+    def test_batch(self):
+        """测试批量计算与逐只计算结果一致"""
+        kline_dict = {
+            "000001": KLINE,
+            "600000": KLINE.iloc[:7],
+            "000002": KLINE.iloc[:0],
+        }
+        with mock.patch.object(
+            cyq,
+            "_stock_cyq_em_kline",
+            side_effect=lambda symbol, *_: kline_dict[symbol],
+        ):
+            temp_df = cyq.stock_cyq_em_batch(list(kline_dict), max_workers=2)
+        self.assertEqual(temp_df["代码"].tolist(), ["000001"] * 12 + ["600000"] * 7)
+        pd.testing.assert_frame_equal(
+            temp_df[temp_df["代码"] == "600000"].iloc[:, 1:].reset_index(drop=True),
+            cyq._cyq_compute([KLINE.iloc[:7]])[0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+新浪财经-A股实时行情分页单元测试
+"""
+
+import json
+import unittest
+from unittest import mock
+
+from akshare.stock import stock_zh_a_sina
+
+_FIELDS = [
+    "symbol",
+    "code",
+    "name",
+    "trade",
+    "pricechange",
+    "changepercent",
+    "buy",
+    "sell",
+    "settlement",
+    "open",
+    "high",
+    "low",
+    "volume",
+    "amount",
+    "ticktime",
+    "per",
+    "pb",
+    "mktcap",
+    "nmc",
+    "turnoverratio",
+]
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class TestStockZhASpot(unittest.TestCase):
+    """测试总页数计算及跳过空页"""
+
+    def _fake_get(self, total, pages):
+        def get(url, params=None, **kwargs):
+            if params is None:
+                return _FakeResponse(f'"{total}"')
+            return _FakeResponse(pages[params["page"] - 1])
+
+        return get
+
+    def test_page_count(self):
+        """测试总数为 80 的整数倍时不多请求一页"""
+        for total, page_count in ((160, 2), (161, 3), (0, 0)):
+            with mock.patch.object(
+                stock_zh_a_sina.requests, "get", self._fake_get(total, [])
+            ):
+                self.assertEqual(stock_zh_a_sina._get_zh_a_page_count(), page_count)
+
+    def test_empty_last_page(self):
+        """测试最后一页为空或 null 时不报错"""
+        row = {field: "1" for field in _FIELDS}
+        row.update({"symbol": "sh600000", "name": "浦发银行", "ticktime": "15:00:00"})
+        pages = [json.dumps([row]), "null", "[]"]
+        with mock.patch.object(
+            stock_zh_a_sina.requests, "get", self._fake_get(161, pages)
+        ):
+            temp_df = stock_zh_a_sina.stock_zh_a_spot()
+            page_list = list(stock_zh_a_sina.stock_zh_a_spot.iter_pages())
+        self.assertEqual(temp_df["代码"].tolist(), ["sh600000"])
+        self.assertEqual(temp_df["最新价"].tolist(), [1.0])
+        self.assertEqual(len(page_list), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
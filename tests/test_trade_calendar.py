@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+交易日历单元测试
+"""
+
+import datetime
+import unittest
+
+import numpy as np
+
+from akshare.futures import cons
+from akshare.utils.trade_calendar import TradeCalendar, get_trade_calendar
+
+CALENDAR = TradeCalendar(["20231228", "20231229", "20240102", "20240103", "20240104"])
+
+
+class TestTradeCalendar(unittest.TestCase):
+    """测试交易日查询, 单个日期与数组结果一致"""
+
+    def test_scalar(self):
+        """测试返回值类型与传入的日期类型一致"""
+        self.assertIn("20240102", CALENDAR)
+        self.assertNotIn("20240101", CALENDAR)
+        self.assertIn(datetime.datetime(2024, 1, 2, 15, 0), CALENDAR)
+        self.assertEqual(CALENDAR.prev("20240102"), "20231229")
+        self.assertEqual(CALENDAR.next("20240101"), "20240102")
+        self.assertEqual(CALENDAR.prev("2024-01-01"), "20231229")
+        self.assertEqual(
+            CALENDAR.offset(datetime.date(2023, 12, 30), 2), datetime.date(2024, 1, 3)
+        )
+        self.assertEqual(
+            CALENDAR.latest(np.datetime64("2024-01-01")), np.datetime64("2023-12-29")
+        )
+        with self.assertRaises(ValueError):
+            CALENDAR.offset("20240101", 0)
+        with self.assertRaises(ValueError):
+            CALENDAR.next("20240104")
+
+    def test_vectorized(self):
+        """测试数组与逐个日期的结果一致, 超出范围为 NaT"""
+        days = np.arange(
+            np.datetime64("2023-12-27"),
+            np.datetime64("2024-01-06"),
+            dtype="datetime64[D]",
+        )
+        for n in (-2, -1, 1, 2):
+            result = CALENDAR.offset(days, n)
+            for day, value in zip(days, result):
+                try:
+                    expected = CALENDAR.offset(day, n)
+                except ValueError:
+                    self.assertTrue(np.isnat(value))
+                else:
+                    self.assertEqual(value, expected)
+        np.testing.assert_array_equal(
+            CALENDAR.is_trading_day(days), [day in CALENDAR for day in days]
+        )
+        self.assertEqual(
+            CALENDAR.range_dates("20231229", "2024-01-03"),
+            [
+                datetime.date(2023, 12, 29),
+                datetime.date(2024, 1, 2),
+                datetime.date(2024, 1, 3),
+            ],
+        )
+
+    def test_cons(self):
+        """测试 calendar.json 只加载一次, 原有函数结果不变"""
+        self.assertIs(get_trade_calendar(), get_trade_calendar())
+        self.assertEqual(cons.get_calendar(), get_trade_calendar().to_list())
+        self.assertEqual(cons.last_trading_day("20240102"), "20231229")
+        self.assertFalse(cons.last_trading_day("20240101"))
+        self.assertEqual(
+            cons.get_latest_data_date(datetime.datetime(2024, 1, 1, 18)), "20231229"
+        )
+        self.assertEqual(
+            cons.get_latest_data_date(datetime.datetime(2024, 1, 2, 10)), "20231229"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)